@@ -0,0 +1,97 @@
+"""Run the benchmark suite and compare results against a baseline.
+
+Examples:
+    python -m benchmarks list
+    python -m benchmarks run --output .benchmarks/baseline.json
+    python -m benchmarks run -k flow cache --compare .benchmarks/baseline.json
+    python -m benchmarks compare .benchmarks/baseline.json .benchmarks/current.json --markdown
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+from benchmarks import caching, embedding, engine, evaluation, memory, serialization, streaming  # noqa: F401
+from benchmarks.core import DEFAULT_THRESHOLD, compare, format_comparison, format_results, run, select
+from dynamiq.utils.logger import logger
+
+
+def load_results(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_results(results: dict, path: str) -> None:
+    if directory := os.path.dirname(path):
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def report_comparison(baseline: dict, current: dict, threshold: float, markdown: bool) -> int:
+    comparisons = compare(baseline, current, threshold=threshold)
+    print(format_comparison(comparisons, markdown=markdown))
+    regressions = [item.name for item in comparisons if item.status == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regressions above {threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="List benchmarks.")
+    list_parser.add_argument("-k", dest="patterns", nargs="*", help="Benchmark name patterns.")
+
+    run_parser = subparsers.add_parser("run", help="Run benchmarks.")
+    run_parser.add_argument("-k", dest="patterns", nargs="*", help="Benchmark name patterns.")
+    run_parser.add_argument("--repeat", type=int, default=5, help="Number of timing samples.")
+    run_parser.add_argument("--scale", type=float, default=1.0, help="Multiplier of calls in one sample.")
+    run_parser.add_argument("--output", help="Path to save results as JSON.")
+    run_parser.add_argument("--compare", dest="baseline", help="Path of baseline results to compare with.")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    run_parser.add_argument("--markdown", action="store_true", help="Print the comparison as a markdown table.")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare saved results.")
+    compare_parser.add_argument("baseline", help="Path of baseline results.")
+    compare_parser.add_argument("current", help="Path of current results.")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    compare_parser.add_argument("--markdown", action="store_true", help="Print the comparison as a markdown table.")
+
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for bench in select(args.patterns):
+            print(f"{bench.name:<45} {bench.description}")
+        return 0
+
+    if args.command == "compare":
+        return report_comparison(load_results(args.baseline), load_results(args.current), args.threshold, args.markdown)
+
+    # Node run logs would dominate the measured time
+    logger.setLevel(logging.WARNING)
+
+    benchmarks = select(args.patterns)
+    if not benchmarks:
+        parser.error(f"No benchmarks match {args.patterns}.")
+
+    def on_result(result):
+        print(f"{result.name:<45} {result.median_ms:>10.3f} ms {result.peak_memory_kb:>10.1f} KiB", file=sys.stderr)
+
+    results = run(benchmarks, repeat=args.repeat, scale=args.scale, on_result=on_result)
+    if args.output:
+        save_results(results, args.output)
+
+    if args.baseline:
+        return report_comparison(load_results(args.baseline), results, args.threshold, args.markdown)
+
+    print(format_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
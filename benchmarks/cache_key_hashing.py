@@ -0,0 +1,85 @@
+"""Benchmark of cache key generation cost against node input payload size.
+
+Compares the canonical hasher used by `WorkflowCacheManager.get_key` with the previous
+`format_value` + sorted JSON + SHA-256 key generation.
+
+Run with `python -m benchmarks.cache_key_hashing`.
+"""
+
+import argparse
+import hashlib
+import random
+import timeit
+
+from dynamiq.cache.hashing import canonical_hash
+from dynamiq.components.serializers import JsonSerializer
+from dynamiq.prompts import Message, Prompt
+from dynamiq.types import Document
+from dynamiq.utils import format_value
+
+EMBEDDING_SIZE = 1536
+
+
+def make_payload(n_documents: int) -> tuple[dict, dict]:
+    rnd = random.Random(n_documents)  # nosec B311
+    documents = [
+        Document(
+            content=" ".join(rnd.choice(["alpha", "beta", "gamma", "delta"]) for _ in range(200)),
+            metadata={"source": f"doc_{idx}.pdf", "page": idx},
+            embedding=[rnd.uniform(-1, 1) for _ in range(EMBEDDING_SIZE)],
+        )
+        for idx in range(n_documents)
+    ]
+    input_data = {"query": "What is LLM?", "documents": documents}
+    kwargs = {"prompt": Prompt(messages=[Message(content="Answer the {{query}} using {{documents}}")])}
+    return input_data, kwargs
+
+
+def sort_dict(d: dict) -> dict:
+    return {k: sort_dict(v) if isinstance(v, dict) else v for k, v in sorted(d.items())}
+
+
+def legacy_key(serializer: JsonSerializer, input_data: dict, kwargs: dict) -> str:
+    input_hash = hashlib.sha256(serializer.dumps(format_value(sort_dict(input_data))[0]).encode()).hexdigest()
+    kwargs_hash = hashlib.sha256(serializer.dumps(format_value(sort_dict(kwargs))[0]).encode()).hexdigest()
+    return f"entity:{input_hash}:{kwargs_hash}"
+
+
+def canonical_key(input_data: dict, kwargs: dict) -> str:
+    return f"entity:{canonical_hash(input_data)}:{canonical_hash(kwargs)}"
+
+
+def run(sizes: list[int], number: int) -> list[dict]:
+    serializer = JsonSerializer()
+    results = []
+    for size in sizes:
+        input_data, kwargs = make_payload(size)
+        legacy = min(timeit.repeat(lambda: legacy_key(serializer, input_data, kwargs), number=number, repeat=3))
+        canonical = min(timeit.repeat(lambda: canonical_key(input_data, kwargs), number=number, repeat=3))
+        results.append(
+            {
+                "documents": size,
+                "legacy_ms": legacy / number * 1000,
+                "canonical_ms": canonical / number * 1000,
+                "speedup": legacy / canonical,
+            }
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 1, 10, 50])
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'documents':>10} {'legacy ms':>12} {'canonical ms':>14} {'speedup':>9}")
+    for result in run(args.sizes, args.number):
+        print(
+            f"{result['documents']:>10} {result['legacy_ms']:>12.3f} "
+            f"{result['canonical_ms']:>14.3f} {result['speedup']:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
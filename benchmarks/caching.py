@@ -0,0 +1,61 @@
+"""Node output caching benchmarks with a fakeredis backend."""
+
+import contextlib
+from unittest import mock
+
+from fakeredis import FakeRedis
+
+from benchmarks.cache_key_hashing import canonical_key, make_payload
+from benchmarks.core import benchmark
+from benchmarks.engine import INPUT_DATA, check
+from benchmarks.mocks import make_llm, mock_providers
+from dynamiq.cache.backends import RedisCache
+from dynamiq.cache.config import RedisCacheConfig
+from dynamiq.cache.managers import CacheManager
+from dynamiq.nodes.node import CachingConfig
+from dynamiq.runnables import RunnableConfig
+
+
+@contextlib.contextmanager
+def cached_llm_run():
+    """Create an LLM node with caching enabled and a run config with a fakeredis cache backend."""
+    node = make_llm()
+    node.caching = CachingConfig(enabled=True)
+    config = RunnableConfig(cache=RedisCacheConfig(host="localhost", port=6379, db=0))
+    redis = FakeRedis()
+    CacheManager.clear_shared()
+    with (
+        mock_providers(),
+        mock.patch("dynamiq.cache.backends.RedisCache.from_config", return_value=RedisCache(client=redis)),
+    ):
+        try:
+            yield node, config, redis
+        finally:
+            CacheManager.clear_shared()
+
+
+@benchmark(group="cache", number=200)
+def hit():
+    """LLM node run served from the cache."""
+    with cached_llm_run() as (node, config, _):
+        check(node.run_sync(input_data=INPUT_DATA, config=config))
+        yield lambda: check(node.run_sync(input_data=INPUT_DATA, config=config))
+
+
+@benchmark(group="cache", number=200)
+def miss():
+    """LLM node run that misses the cache and stores the output."""
+    with cached_llm_run() as (node, config, redis):
+
+        def run():
+            redis.flushdb()
+            check(node.run_sync(input_data=INPUT_DATA, config=config))
+
+        yield run
+
+
+@benchmark(group="cache", number=20)
+def key_hashing():
+    """Cache key of a node input with 10 embedded documents."""
+    input_data, kwargs = make_payload(10)
+    yield lambda: canonical_key(input_data, kwargs)
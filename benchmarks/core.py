@@ -0,0 +1,322 @@
+"""Benchmark registry, runner and regression comparison."""
+
+import contextlib
+import fnmatch
+import platform
+import statistics
+import sys
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator
+
+DEFAULT_THRESHOLD = 0.1
+# Peak memory changes below this size are allocation noise
+MIN_MEMORY_CHANGE_KB = 16
+
+
+@dataclass
+class Benchmark:
+    """Registered benchmark.
+
+    Attributes:
+        name (str): Unique benchmark name in the `group.function` form.
+        group (str): Benchmark group.
+        factory (Callable): Generator function that prepares the measured operation, yields it and
+            cleans up after the measurements.
+        number (int): Number of operation calls in one timing sample.
+        description (str): First line of the benchmark docstring.
+    """
+
+    name: str
+    group: str
+    factory: Callable[[], Iterator[Callable[[], Any]]]
+    number: int
+    description: str
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of a benchmark.
+
+    Attributes:
+        name (str): Benchmark name.
+        group (str): Benchmark group.
+        number (int): Number of operation calls in one timing sample.
+        repeat (int): Number of timing samples.
+        median_ms (float): Median time of one operation call in milliseconds.
+        min_ms (float): Minimum time of one operation call in milliseconds.
+        stdev_ms (float): Standard deviation of the samples in milliseconds.
+        peak_memory_kb (float): Peak memory allocated by one operation call in kilobytes.
+    """
+
+    name: str
+    group: str
+    number: int
+    repeat: int
+    median_ms: float
+    min_ms: float
+    stdev_ms: float
+    peak_memory_kb: float
+
+
+@dataclass
+class Comparison:
+    """Comparison of a benchmark result against the baseline.
+
+    Attributes:
+        name (str): Benchmark name.
+        baseline_ms (float | None): Baseline median time in milliseconds.
+        current_ms (float | None): Current median time in milliseconds.
+        baseline_memory_kb (float | None): Baseline peak memory in kilobytes.
+        current_memory_kb (float | None): Current peak memory in kilobytes.
+        status (str): One of `regression`, `improvement`, `unchanged`, `new` or `missing`.
+    """
+
+    name: str
+    baseline_ms: float | None
+    current_ms: float | None
+    baseline_memory_kb: float | None
+    current_memory_kb: float | None
+    status: str
+
+    @property
+    def time_ratio(self) -> float | None:
+        """Current to baseline time ratio."""
+        if self.baseline_ms and self.current_ms is not None:
+            return self.current_ms / self.baseline_ms
+        return None
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(group: str, number: int = 100):
+    """Register a benchmark.
+
+    The decorated generator function prepares the operation to measure, yields it as a callable
+    without arguments and cleans up after the measurements.
+
+    Args:
+        group (str): Benchmark group.
+        number (int): Number of operation calls in one timing sample.
+    """
+
+    def decorator(factory: Callable[[], Iterator[Callable[[], Any]]]):
+        name = f"{group}.{factory.__name__}"
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark '{name}' is already registered.")
+        description = (factory.__doc__ or "").strip().splitlines()
+        BENCHMARKS[name] = Benchmark(
+            name=name,
+            group=group,
+            factory=factory,
+            number=number,
+            description=description[0] if description else "",
+        )
+        return factory
+
+    return decorator
+
+
+def select(patterns: list[str] | None = None) -> list[Benchmark]:
+    """Select registered benchmarks by name patterns.
+
+    Args:
+        patterns (list[str] | None): Shell-style patterns or substrings of benchmark names. All benchmarks
+            are selected if empty.
+
+    Returns:
+        list[Benchmark]: Selected benchmarks ordered by name.
+    """
+    benchmarks = sorted(BENCHMARKS.values(), key=lambda bench: bench.name)
+    if not patterns:
+        return benchmarks
+    return [
+        bench
+        for bench in benchmarks
+        if any(fnmatch.fnmatch(bench.name, pattern) or pattern in bench.name for pattern in patterns)
+    ]
+
+
+def run_benchmark(bench: Benchmark, repeat: int = 5, scale: float = 1.0) -> BenchmarkResult:
+    """Measure a benchmark.
+
+    Args:
+        bench (Benchmark): Benchmark to run.
+        repeat (int): Number of timing samples.
+        scale (float): Multiplier of the number of calls in one sample.
+
+    Returns:
+        BenchmarkResult: Benchmark measurements.
+    """
+    number = max(1, int(bench.number * scale))
+    with contextlib.contextmanager(bench.factory)() as operation:
+        operation()
+
+        samples = [total / number * 1000 for total in timeit.repeat(operation, number=number, repeat=repeat)]
+
+        tracemalloc.start()
+        try:
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=bench.name,
+        group=bench.group,
+        number=number,
+        repeat=repeat,
+        median_ms=statistics.median(samples),
+        min_ms=min(samples),
+        stdev_ms=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        peak_memory_kb=peak / 1024,
+    )
+
+
+def run(
+    benchmarks: list[Benchmark],
+    repeat: int = 5,
+    scale: float = 1.0,
+    on_result: Callable[[BenchmarkResult], None] | None = None,
+) -> dict[str, Any]:
+    """Run benchmarks and collect results with the environment description.
+
+    Args:
+        benchmarks (list[Benchmark]): Benchmarks to run.
+        repeat (int): Number of timing samples.
+        scale (float): Multiplier of the number of calls in one sample.
+        on_result (Callable[[BenchmarkResult], None] | None): Called after each benchmark.
+
+    Returns:
+        dict[str, Any]: Results report that can be saved as JSON.
+    """
+    results = {}
+    for bench in benchmarks:
+        result = run_benchmark(bench, repeat=repeat, scale=scale)
+        results[bench.name] = asdict(result)
+        if on_result:
+            on_result(result)
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> list[Comparison]:
+    """Compare results reports.
+
+    A benchmark regresses if its median time or peak memory grows by more than the threshold.
+    Peak memory growth below MIN_MEMORY_CHANGE_KB is ignored.
+
+    Args:
+        baseline (dict[str, Any]): Baseline results report.
+        current (dict[str, Any]): Current results report.
+        threshold (float): Relative change treated as significant.
+
+    Returns:
+        list[Comparison]: Comparisons ordered by benchmark name.
+    """
+    baseline_results = baseline.get("benchmarks", {})
+    current_results = current.get("benchmarks", {})
+    comparisons = []
+    for name in sorted(baseline_results.keys() | current_results.keys()):
+        base = baseline_results.get(name)
+        cur = current_results.get(name)
+        if base is None:
+            status = "new"
+        elif cur is None:
+            status = "missing"
+        else:
+            time_change = _relative_change(base["median_ms"], cur["median_ms"])
+            memory_change = _relative_change(base["peak_memory_kb"], cur["peak_memory_kb"])
+            memory_grown = cur["peak_memory_kb"] - base["peak_memory_kb"] > MIN_MEMORY_CHANGE_KB
+            if time_change > threshold or (memory_change > threshold and memory_grown):
+                status = "regression"
+            elif time_change < -threshold:
+                status = "improvement"
+            else:
+                status = "unchanged"
+
+        comparisons.append(
+            Comparison(
+                name=name,
+                baseline_ms=base["median_ms"] if base else None,
+                current_ms=cur["median_ms"] if cur else None,
+                baseline_memory_kb=base["peak_memory_kb"] if base else None,
+                current_memory_kb=cur["peak_memory_kb"] if cur else None,
+                status=status,
+            )
+        )
+    return comparisons
+
+
+def _relative_change(baseline: float, current: float) -> float:
+    if baseline <= 0:
+        return 0.0
+    return (current - baseline) / baseline
+
+
+def format_results(results: dict[str, Any]) -> str:
+    """Format a results report as a text table.
+
+    Args:
+        results (dict[str, Any]): Results report.
+
+    Returns:
+        str: Text table.
+    """
+    lines = [f"{'benchmark':<45} {'median ms':>11} {'min ms':>10} {'stdev ms':>10} {'peak KiB':>10}"]
+    for name, result in results["benchmarks"].items():
+        lines.append(
+            f"{name:<45} {result['median_ms']:>11.3f} {result['min_ms']:>10.3f} "
+            f"{result['stdev_ms']:>10.3f} {result['peak_memory_kb']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(comparisons: list[Comparison], markdown: bool = False) -> str:
+    """Format comparisons as a text or markdown table.
+
+    Args:
+        comparisons (list[Comparison]): Comparisons to format.
+        markdown (bool): Whether to render a markdown table, e.g. for a PR comment.
+
+    Returns:
+        str: Formatted table.
+    """
+
+    def fmt(value: float | None, spec: str) -> str:
+        return "-" if value is None else format(value, spec)
+
+    header = ("benchmark", "baseline ms", "current ms", "ratio", "baseline KiB", "current KiB", "status")
+    rows = [
+        (
+            item.name,
+            fmt(item.baseline_ms, ".3f"),
+            fmt(item.current_ms, ".3f"),
+            fmt(item.time_ratio, ".2f"),
+            fmt(item.baseline_memory_kb, ".1f"),
+            fmt(item.current_memory_kb, ".1f"),
+            item.status,
+        )
+        for item in comparisons
+    ]
+    if markdown:
+        lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+        lines.extend("| " + " | ".join(row) + " |" for row in rows)
+        return "\n".join(lines)
+
+    widths = [max(len(row[idx]) for row in [header, *rows]) for idx in range(len(header))]
+    lines = []
+    for row in [header, *rows]:
+        cells = [row[0].ljust(widths[0])] + [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])]
+        lines.append("  ".join(cells))
+    return "\n".join(lines)
@@ -0,0 +1,98 @@
+"""Embedding benchmarks: batch dispatch and caching of document embedding with a mocked provider latency."""
+
+import asyncio
+import os
+import tempfile
+import time
+
+from litellm import EmbeddingResponse, Usage
+
+from benchmarks.core import benchmark
+from dynamiq import connections
+from dynamiq.cache import EmbeddingCacheConfig, SQLiteCacheConfig
+from dynamiq.cache.embeddings import EmbeddingCache
+from dynamiq.components.embedders.openai import OpenAIEmbedder
+from dynamiq.types import Document
+
+DOCUMENTS = 1024
+BATCH_SIZE = 32
+# Round trip time of an embedding request, the provider work is not simulated
+PROVIDER_LATENCY = 0.002
+
+
+def _response(input: list[str]) -> EmbeddingResponse:
+    response = EmbeddingResponse()
+    response["data"] = [{"embedding": [0.1] * 8} for _ in input]
+    response["model"] = "text-embedding-3-small"
+    response["usage"] = Usage(prompt_tokens=len(input), completion_tokens=0, total_tokens=len(input))
+    return response
+
+
+def _embedding(model: str, input: list[str], **kwargs) -> EmbeddingResponse:
+    time.sleep(PROVIDER_LATENCY)
+    return _response(input)
+
+
+async def _aembedding(model: str, input: list[str], **kwargs) -> EmbeddingResponse:
+    await asyncio.sleep(PROVIDER_LATENCY)
+    return _response(input)
+
+
+def make_embedder(**kwargs) -> OpenAIEmbedder:
+    """Create an OpenAI embedder component with the mocked provider."""
+    embedder = OpenAIEmbedder(connection=connections.OpenAI(api_key="api_key"), batch_size=BATCH_SIZE, **kwargs)
+    embedder._embedding = _embedding
+    embedder._aembedding = _aembedding
+    return embedder
+
+
+def make_documents(count: int = DOCUMENTS) -> list[Document]:
+    return [Document(content=f"Document {idx} about embeddings.") for idx in range(count)]
+
+
+@benchmark(group="embedding", number=5)
+def embed_documents_sequential():
+    """embed_documents of 1024 documents in 32 batches sent one by one."""
+    embedder = make_embedder(max_concurrent_batches=1)
+    documents = make_documents()
+    yield lambda: embedder.embed_documents(documents)
+
+
+@benchmark(group="embedding", number=5)
+def embed_documents_concurrent():
+    """embed_documents of 1024 documents in 32 batches with 4 batches in flight."""
+    embedder = make_embedder(max_concurrent_batches=4)
+    documents = make_documents()
+    yield lambda: embedder.embed_documents(documents)
+
+
+@benchmark(group="embedding", number=5)
+def aembed_documents_concurrent():
+    """aembed_documents of 1024 documents in 32 batches with 4 batches in flight."""
+    embedder = make_embedder(max_concurrent_batches=4)
+    documents = make_documents()
+    yield lambda: asyncio.run(embedder.aembed_documents(documents))
+
+
+@benchmark(group="embedding", number=5)
+def embed_documents_cached():
+    """embed_documents of 1024 documents served from the in-process embedding cache."""
+    embedder = make_embedder(max_concurrent_batches=4, cache=EmbeddingCacheConfig())
+    documents = make_documents()
+    embedder.embed_documents(documents)
+    yield lambda: embedder.embed_documents(documents)
+    EmbeddingCache.clear_shared()
+
+
+@benchmark(group="embedding", number=5)
+def embed_documents_cached_sqlite():
+    """embed_documents of 1024 documents served from the SQLite embedding cache without a local LRU."""
+    with tempfile.TemporaryDirectory() as directory:
+        config = EmbeddingCacheConfig(
+            local_cache=None, backend=SQLiteCacheConfig(db_path=os.path.join(directory, "cache.db"))
+        )
+        embedder = make_embedder(max_concurrent_batches=4, cache=config)
+        documents = make_documents()
+        embedder.embed_documents(documents)
+        yield lambda: embedder.embed_documents(documents)
+        EmbeddingCache.clear_shared()
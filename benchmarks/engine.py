@@ -0,0 +1,132 @@
+"""Execution engine benchmarks: node overhead, flow throughput on wide and deep DAGs, Map fan-out and callbacks."""
+
+import asyncio
+from typing import Any
+
+from benchmarks.core import benchmark
+from benchmarks.mocks import make_embedder, make_llm, mock_providers
+from dynamiq.callbacks import TracingCallbackHandler
+from dynamiq.flows import Flow
+from dynamiq.nodes import NodeGroup
+from dynamiq.nodes.node import Node
+from dynamiq.nodes.operators import Map
+from dynamiq.runnables import RunnableConfig, RunnableStatus
+
+DAG_SIZE = 16
+MAP_SIZE = 32
+INPUT_DATA = {"question": "What is LLM?"}
+
+
+class EchoNode(Node):
+    """Node without work, to measure the framework overhead."""
+
+    group: NodeGroup = NodeGroup.UTILS
+
+    def execute(self, input_data: dict[str, Any], config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
+        return dict(input_data)
+
+
+def make_wide_flow(size: int = DAG_SIZE) -> Flow:
+    """Create a flow of independent LLM nodes."""
+    return Flow(nodes=[make_llm(name=f"LLM-{idx}") for idx in range(size)])
+
+
+def make_deep_flow(size: int = DAG_SIZE) -> Flow:
+    """Create a flow with a chain of LLM nodes."""
+    nodes = [make_llm(name="LLM-0")]
+    for idx in range(1, size):
+        nodes.append(make_llm(name=f"LLM-{idx}").inputs(question=nodes[-1].outputs.content).depends_on(nodes[-1]))
+    return Flow(nodes=nodes)
+
+
+def check(result):
+    if result.status != RunnableStatus.SUCCESS:
+        raise RuntimeError(f"Benchmark run failed: {result.output}")
+    return result
+
+
+@benchmark(group="node", number=500)
+def run_sync_overhead():
+    """Node.run_sync of a node without work."""
+    node = EchoNode()
+    yield lambda: check(node.run_sync(input_data=INPUT_DATA))
+
+
+@benchmark(group="node", number=200)
+def llm_run_sync():
+    """Node.run_sync of an LLM node with a mocked provider."""
+    node = make_llm()
+    with mock_providers():
+        yield lambda: check(node.run_sync(input_data=INPUT_DATA))
+
+
+@benchmark(group="node", number=200)
+def embedder_run_sync():
+    """Node.run_sync of a text embedder node with a mocked provider."""
+    node = make_embedder()
+    with mock_providers():
+        yield lambda: check(node.run_sync(input_data={"query": INPUT_DATA["question"]}))
+
+
+@benchmark(group="flow", number=10)
+def run_sync_wide():
+    """Flow.run_sync of independent LLM nodes."""
+    flow = make_wide_flow()
+    with mock_providers():
+        yield lambda: check(flow.run_sync(input_data=INPUT_DATA))
+
+
+@benchmark(group="flow", number=10)
+def run_sync_deep():
+    """Flow.run_sync of a chain of LLM nodes."""
+    flow = make_deep_flow()
+    with mock_providers():
+        yield lambda: check(flow.run_sync(input_data=INPUT_DATA))
+
+
+@benchmark(group="flow", number=10)
+def run_async_wide():
+    """Flow.run_async of independent LLM nodes."""
+    flow = make_wide_flow()
+    with mock_providers():
+        yield lambda: check(asyncio.run(flow.run_async(input_data=INPUT_DATA)))
+
+
+@benchmark(group="flow", number=10)
+def run_async_deep():
+    """Flow.run_async of a chain of LLM nodes."""
+    flow = make_deep_flow()
+    with mock_providers():
+        yield lambda: check(asyncio.run(flow.run_async(input_data=INPUT_DATA)))
+
+
+@benchmark(group="map", number=10)
+def fan_out():
+    """Map of a text embedder node over a list of inputs."""
+    node = Map(node=make_embedder(), max_workers=8)
+    input_data = {"input": [{"query": f"Question {idx}"} for idx in range(MAP_SIZE)]}
+    with mock_providers():
+        yield lambda: check(node.run_sync(input_data=input_data))
+
+
+def run_traced(runnable, tracing: TracingCallbackHandler):
+    tracing.runs.clear()
+    return check(runnable.run_sync(input_data=INPUT_DATA, config=RunnableConfig(callbacks=[tracing])))
+
+
+@benchmark(group="callbacks", number=200)
+def llm_with_tracing():
+    """Node.run_sync of an LLM node with a tracing callback."""
+    node = make_llm()
+    tracing = TracingCallbackHandler()
+    with mock_providers():
+        yield lambda: run_traced(node, tracing)
+
+
+@benchmark(group="callbacks", number=10)
+def flow_with_tracing():
+    """Flow.run_sync of independent LLM nodes with a tracing callback."""
+    flow = make_wide_flow()
+    tracing = TracingCallbackHandler()
+    with mock_providers():
+        yield lambda: run_traced(flow, tracing)
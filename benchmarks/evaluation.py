@@ -0,0 +1,95 @@
+"""Evaluation benchmarks: batch scoring of the non-LLM metrics."""
+
+import random
+
+from benchmarks.core import benchmark
+from dynamiq.evaluations.metrics import (
+    BleuScoreEvaluator,
+    ExactMatchEvaluator,
+    RougeScoreEvaluator,
+    StringSimilarityEvaluator,
+)
+from dynamiq.evaluations.python_evaluator import PythonEvaluator
+from dynamiq.nodes.tools.python import PythonProcessPool, PythonProcessPoolConfig
+
+PAIRS = 10_000
+STEMS = [
+    "answer", "question", "context", "retrieve", "generate", "evaluate", "measure", "score", "model", "document",
+    "language", "system", "engineer", "perform", "bench", "train", "predict", "compute", "process", "index",
+    "search", "rank", "embed", "token", "sentence", "summar", "translat", "reason", "verif", "support",
+]  # fmt: skip
+SUFFIXES = ["", "s", "ed", "ing", "er", "ers", "ation", "ations", "ly"]
+PYTHON_METRIC_CODE = """
+def evaluate(answer, expected):
+    answer_words = answer.lower().split()
+    expected_words = set(expected.lower().split())
+    matches = [word for word in answer_words if word in expected_words]
+    return len(matches) / max(len(answer_words), 1)
+"""
+
+
+def make_text(rng: random.Random) -> str:
+    """Create a text of one to three sentences with 6-14 inflected words each."""
+    sentences = []
+    for _ in range(rng.randint(1, 3)):
+        words = [rng.choice(STEMS) + rng.choice(SUFFIXES) for _ in range(rng.randint(6, 14))]
+        sentences.append(" ".join(words).capitalize() + rng.choice([".", "!", "?"]))
+    return " ".join(sentences)
+
+
+def make_pairs(count: int = PAIRS) -> tuple[list[str], list[str]]:
+    """Create reference and answer texts."""
+    rng = random.Random(0)  # nosec B311
+    return [make_text(rng) for _ in range(count)], [make_text(rng) for _ in range(count)]
+
+
+@benchmark(group="evaluation", number=1)
+def exact_match_run():
+    """ExactMatchEvaluator.run of 10k pairs."""
+    evaluator = ExactMatchEvaluator()
+    ground_truth_answers, answers = make_pairs()
+    yield lambda: evaluator.run(ground_truth_answers=ground_truth_answers, answers=answers)
+
+
+@benchmark(group="evaluation", number=1)
+def string_similarity_run():
+    """StringSimilarityEvaluator.run of 10k pairs with the Levenshtein distance."""
+    evaluator = StringSimilarityEvaluator()
+    ground_truth_answers, answers = make_pairs()
+    yield lambda: evaluator.run(ground_truth_answers=ground_truth_answers, answers=answers)
+
+
+@benchmark(group="evaluation", number=1)
+def bleu_score_run():
+    """BleuScoreEvaluator.run of 10k pairs in one process."""
+    evaluator = BleuScoreEvaluator()
+    ground_truth_answers, answers = make_pairs()
+    yield lambda: evaluator.run(ground_truth_answers=ground_truth_answers, answers=answers)
+
+
+@benchmark(group="evaluation", number=1)
+def rouge_score_run():
+    """RougeScoreEvaluator.run of 10k pairs with ROUGE-L in one process."""
+    evaluator = RougeScoreEvaluator()
+    ground_truth_answers, answers = make_pairs()
+    yield lambda: evaluator.run(ground_truth_answers=ground_truth_answers, answers=answers)
+
+
+@benchmark(group="evaluation", number=1)
+def python_evaluator_run():
+    """PythonEvaluator.run of 10k rows in the calling thread."""
+    evaluator = PythonEvaluator(code=PYTHON_METRIC_CODE)
+    ground_truth_answers, answers = make_pairs()
+    rows = [{"answer": answer, "expected": expected} for expected, answer in zip(ground_truth_answers, answers)]
+    yield lambda: evaluator.run(input_data_list=rows)
+
+
+@benchmark(group="evaluation", number=1)
+def python_evaluator_process_pool_run():
+    """PythonEvaluator.run of 10k rows in warm worker processes, one per CPU."""
+    evaluator = PythonEvaluator(code=PYTHON_METRIC_CODE, process_pool=PythonProcessPoolConfig())
+    ground_truth_answers, answers = make_pairs()
+    rows = [{"answer": answer, "expected": expected} for expected, answer in zip(ground_truth_answers, answers)]
+    evaluator.run(input_data_list=rows)
+    yield lambda: evaluator.run(input_data_list=rows)
+    PythonProcessPool.clear_shared()
@@ -0,0 +1,94 @@
+"""Benchmark of the cold import time of dynamiq modules with a time budget.
+
+Every sample imports the module in a fresh interpreter, so results include module loading that later
+imports in the same process skip. Exits with code 1 if the median import time of any module exceeds
+the budget, so it can guard cold start in CI.
+
+Run with `python -m benchmarks.import_time`.
+"""
+
+import argparse
+import re
+import statistics
+import subprocess  # nosec B404
+import sys
+
+DEFAULT_MODULES = ["dynamiq", "dynamiq.serializers.loaders.yaml"]
+DEFAULT_BUDGET_SECONDS = 1.0
+IMPORT_TIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def measure(module: str) -> tuple[float, dict[str, float]]:
+    """Import a module in a fresh interpreter.
+
+    Args:
+        module (str): Module to import.
+
+    Returns:
+        tuple[float, dict[str, float]]: Import time in seconds and import times in seconds of third-party
+            packages by name, counting imports made directly by dynamiq modules.
+    """
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Imported modules are listed after the modules they import, with a smaller indent than them
+    rows = [
+        (int(match[2]) / 1e6, len(match[3]), match[4])
+        for line in result.stderr.splitlines()
+        if (match := IMPORT_TIME_RE.match(line))
+    ]
+    total = next((cumulative for cumulative, _, name in rows if name == module), 0.0)
+    packages = {}
+    parents = []
+    for cumulative, indent, name in reversed(rows):
+        while parents and parents[-1][0] >= indent:
+            parents.pop()
+        parent = parents[-1][1] if parents else ""
+        if parent.startswith("dynamiq") and not name.startswith("dynamiq"):
+            package = name.split(".")[0]
+            packages[package] = packages.get(package, 0.0) + cumulative
+        parents.append((indent, name))
+    return total, packages
+
+
+def run(modules: list[str], repeat: int) -> list[dict]:
+    results = []
+    for module in modules:
+        samples = []
+        packages = {}
+        for _ in range(repeat):
+            total, sample_packages = measure(module)
+            samples.append(total)
+            for name, seconds in sample_packages.items():
+                packages.setdefault(name, []).append(seconds)
+        slowest = sorted(((name, statistics.median(values)) for name, values in packages.items()), key=lambda x: -x[1])
+        results.append({"module": module, "median_s": statistics.median(samples), "slowest": slowest[:5]})
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_SECONDS, help="Budget in seconds.")
+    args = parser.parse_args()
+
+    over_budget = []
+    print(f"{'module':<40} {'median s':>9}  slowest third-party imports")
+    for result in run(args.modules, args.repeat):
+        slowest = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in result["slowest"])
+        print(f"{result['module']:<40} {result['median_s']:>9.3f}  {slowest}")
+        if result["median_s"] > args.budget:
+            over_budget.append(result["module"])
+
+    if over_budget:
+        print(f"\nImport time above the {args.budget}s budget: {', '.join(over_budget)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
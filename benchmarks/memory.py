@@ -0,0 +1,114 @@
+"""Memory benchmarks: BM25 search of the in-memory and SQLite backends."""
+
+import atexit
+import contextlib
+import functools
+import os
+import random
+import tempfile
+from typing import Iterator
+
+from benchmarks.core import benchmark
+from dynamiq.memory.backends import InMemory, SQLite
+from dynamiq.prompts import Message, MessageRole
+
+MEMORY_SIZE = 100_000
+VOCABULARY = [f"term{idx}" for idx in range(5000)]
+
+
+def make_memory(size: int = MEMORY_SIZE) -> InMemory:
+    """Create an in-memory backend with random messages of 20 terms."""
+    rng = random.Random(0)  # nosec B311
+    backend = InMemory()
+    for idx in range(size):
+        content = " ".join(rng.choices(VOCABULARY, k=20))
+        backend.add(Message(role=MessageRole.USER, content=content, metadata={"timestamp": idx, "user": idx % 10}))
+    return backend
+
+
+@benchmark(group="memory", number=100)
+def in_memory_search():
+    """InMemory.search of a three term query with a limit."""
+    backend = make_memory()
+    yield lambda: backend.search("term1 term42 term999", limit=5)
+
+
+@benchmark(group="memory", number=100)
+def in_memory_search_filtered():
+    """InMemory.search of a three term query with a limit and a metadata filter."""
+    backend = make_memory()
+    yield lambda: backend.search("term1 term42 term999", filters={"user": 3}, limit=5)
+
+
+@benchmark(group="memory", number=1000)
+def in_memory_add():
+    """InMemory.add of a message to a backend with indexed messages."""
+    backend = make_memory(size=10_000)
+    message = Message(role=MessageRole.USER, content=" ".join(VOCABULARY[:20]))
+    yield lambda: backend.add(message)
+
+
+SQLITE_MEMORY_SIZE = 1_000_000
+SQLITE_BATCH_SIZE = 10_000
+
+
+def fill_sqlite(backend: SQLite, size: int) -> None:
+    """Add random messages of 20 terms to a SQLite backend in batches."""
+    rng = random.Random(0)  # nosec B311
+    for start in range(0, size, SQLITE_BATCH_SIZE):
+        backend.add_many(
+            [
+                Message(
+                    role=MessageRole.USER,
+                    content=" ".join(rng.choices(VOCABULARY, k=20)),
+                    metadata={"timestamp": idx, "user_id": f"user-{idx % 1000}"},
+                )
+                for idx in range(start, min(start + SQLITE_BATCH_SIZE, size))
+            ]
+        )
+
+
+@functools.cache
+def get_sqlite_memory_path() -> str:
+    """Create a database with 1M messages once per run, as filling it takes minutes."""
+    directory = tempfile.TemporaryDirectory()
+    atexit.register(directory.cleanup)
+    path = os.path.join(directory.name, "memory.db")
+    backend = SQLite(db_path=path)
+    fill_sqlite(backend, SQLITE_MEMORY_SIZE)
+    backend.close()
+    return path
+
+
+@contextlib.contextmanager
+def sqlite_memory() -> Iterator[SQLite]:
+    """Open a SQLite backend with 1M messages."""
+    backend = SQLite(db_path=get_sqlite_memory_path())
+    try:
+        yield backend
+    finally:
+        backend.close()
+
+
+@benchmark(group="memory", number=100)
+def sqlite_search():
+    """SQLite.search of a three term query with a limit in 1M messages."""
+    with sqlite_memory() as backend:
+        yield lambda: backend.search("term1 term42 term999", limit=5)
+
+
+@benchmark(group="memory", number=100)
+def sqlite_search_by_user():
+    """SQLite.search of the recent messages of a user in 1M messages."""
+    with sqlite_memory() as backend:
+        yield lambda: backend.search(filters={"user_id": "user-42"}, limit=20)
+
+
+@benchmark(group="memory", number=10)
+def sqlite_add_many():
+    """SQLite.add_many of 100 messages."""
+    messages = [Message(role=MessageRole.USER, content=" ".join(VOCABULARY[:20])) for _ in range(100)]
+    with tempfile.TemporaryDirectory() as directory:
+        backend = SQLite(db_path=os.path.join(directory, "memory.db"))
+        yield lambda: backend.add_many(messages)
+        backend.close()
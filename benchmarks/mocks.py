@@ -0,0 +1,82 @@
+"""Mocked LLM and embedding providers, so benchmarks measure only the framework overhead."""
+
+import contextlib
+import functools
+from typing import Iterator
+from unittest import mock
+
+from litellm import EmbeddingResponse, ModelResponse
+from litellm.types.utils import Delta
+
+from dynamiq import connections, prompts
+from dynamiq.nodes.embedders import OpenAITextEmbedder
+from dynamiq.nodes.llms import OpenAI
+
+LLM_RESPONSE_TEXT = "LLM stands for Large Language Model."
+EMBEDDING_SIZE = 1536
+STREAM_CHUNKS = 100
+
+
+@functools.cache
+def _stream_chunks(size: int = STREAM_CHUNKS) -> list[ModelResponse]:
+    # Chunks are created once, as building litellm models would dominate the streaming benchmarks
+    chunks = []
+    for idx in range(size):
+        chunk = ModelResponse(stream=True)
+        chunk.choices[0].delta = Delta(role="assistant", content=f" token{idx}")
+        chunks.append(chunk)
+    return chunks
+
+
+def _completion(*args, **kwargs) -> ModelResponse | Iterator[ModelResponse]:
+    if kwargs.get("stream"):
+        return iter(_stream_chunks())
+
+    response = ModelResponse()
+    response["choices"][0]["message"]["content"] = LLM_RESPONSE_TEXT
+    return response
+
+
+async def _acompletion(*args, **kwargs) -> ModelResponse:
+    return _completion(*args, **kwargs)
+
+
+def _embedding(*args, **kwargs) -> EmbeddingResponse:
+    response = EmbeddingResponse()
+    response["data"] = [{"embedding": [0.1] * EMBEDDING_SIZE} for _ in kwargs.get("input", [None])]
+    response["model"] = kwargs.get("model")
+    response["usage"] = {"prompt_tokens": 6, "completion_tokens": 0, "total_tokens": 6}
+    return response
+
+
+async def _aembedding(*args, **kwargs) -> EmbeddingResponse:
+    return _embedding(*args, **kwargs)
+
+
+@contextlib.contextmanager
+def mock_providers() -> Iterator[None]:
+    """Replace LLM completion and embedding calls with local responses."""
+    with (
+        mock.patch("dynamiq.nodes.llms.base.BaseLLM._completion", side_effect=_completion),
+        mock.patch("dynamiq.nodes.llms.base.BaseLLM._acompletion", side_effect=_acompletion),
+        mock.patch("dynamiq.components.embedders.base.BaseEmbedder._embedding", side_effect=_embedding),
+        mock.patch("dynamiq.components.embedders.base.BaseEmbedder._aembedding", side_effect=_aembedding),
+    ):
+        yield
+
+
+def make_llm(name: str = "LLM") -> OpenAI:
+    """Create an OpenAI node with a templated prompt."""
+    return OpenAI(
+        name=name,
+        model="gpt-4o-mini",
+        connection=connections.OpenAI(api_key="api_key"),
+        prompt=prompts.Prompt(messages=[prompts.Message(role="user", content="{{question}}")]),
+    )
+
+
+def make_embedder(name: str = "Embedder") -> OpenAITextEmbedder:
+    """Create an OpenAI text embedder node."""
+    return OpenAITextEmbedder(
+        name=name, model="text-embedding-3-small", connection=connections.OpenAI(api_key="api_key")
+    )
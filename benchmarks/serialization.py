@@ -0,0 +1,53 @@
+"""Workflow YAML loading benchmarks."""
+
+import os
+import tempfile
+
+from benchmarks.core import benchmark
+from dynamiq.serializers.loaders.yaml import WorkflowYAMLLoader
+
+NODES_COUNT = 20
+
+CONNECTIONS_YAML = """
+connections:
+  openai-conn:
+    type: dynamiq.connections.OpenAI
+    api_key: api_key
+"""
+
+NODE_YAML = """
+  llm-{idx}:
+    type: dynamiq.nodes.llms.OpenAI
+    name: LLM-{idx}
+    model: gpt-4o-mini
+    connection: openai-conn
+    prompt:
+      messages:
+        - role: user
+          content: "{{{{question}}}}"
+    input_transformer:
+      selector:
+        question: "$.question"
+"""
+
+
+def make_workflow_yaml(nodes_count: int = NODES_COUNT) -> str:
+    """Create workflow YAML with a flow of LLM nodes."""
+    nodes = "".join(NODE_YAML.format(idx=idx) for idx in range(nodes_count))
+    node_ids = "".join(f"      - llm-{idx}\n" for idx in range(nodes_count))
+    return (
+        f"{CONNECTIONS_YAML}\nnodes:{nodes}\n"
+        f"flows:\n  flow:\n    nodes:\n{node_ids}\n"
+        "workflows:\n  workflow:\n    flow: flow\n"
+    )
+
+
+@benchmark(group="yaml", number=5)
+def load():
+    """WorkflowYAMLLoader.load of a workflow with LLM nodes."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "workflow.yaml")
+        with open(path, "w") as f:
+            f.write(make_workflow_yaml())
+
+        yield lambda: WorkflowYAMLLoader.load(file_path=path, init_components=True)
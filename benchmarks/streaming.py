@@ -0,0 +1,83 @@
+"""Streaming benchmarks: dispatch of LLM chunks to streaming queue handlers.
+
+Events per second on one core are `1000 / median_ms` for the handler benchmarks and
+`STREAM_CHUNKS * 1000 / median_ms` for the LLM node benchmarks.
+"""
+
+from uuid import uuid4
+
+from benchmarks.core import benchmark
+from benchmarks.engine import INPUT_DATA, check
+from benchmarks.mocks import make_llm, mock_providers
+from dynamiq.callbacks.streaming import StreamingIteratorCallbackHandler
+from dynamiq.runnables import RunnableConfig
+from dynamiq.types.streaming import StreamingConfig, StreamingOverflowPolicy
+
+NODE = {"id": "node", "streaming": {"event": "streaming"}}
+CHUNK = {
+    "id": "chunk",
+    "object": "chat.completion.chunk",
+    "choices": [{"index": 0, "finish_reason": None, "delta": {"content": " token", "role": "assistant"}}],
+}
+
+
+def drain(handler: StreamingIteratorCallbackHandler) -> None:
+    while not handler.queue.empty():
+        handler.queue.get_nowait()
+
+
+def dispatch(handler: StreamingIteratorCallbackHandler, run_id) -> None:
+    handler.on_node_execute_stream(NODE, CHUNK, run_id=run_id)
+    if handler.queue.qsize() >= 1000:
+        drain(handler)
+
+
+@benchmark(group="streaming", number=5000)
+def queue_handler_chunk():
+    """StreamingIteratorCallbackHandler dispatch of one chunk."""
+    handler = StreamingIteratorCallbackHandler()
+    run_id = uuid4()
+    yield lambda: dispatch(handler, run_id)
+
+
+@benchmark(group="streaming", number=5000)
+def queue_handler_chunk_coalesced():
+    """StreamingIteratorCallbackHandler dispatch of one chunk coalesced by a time window."""
+    handler = StreamingIteratorCallbackHandler(coalesce_interval=0.05)
+    run_id = uuid4()
+    yield lambda: dispatch(handler, run_id)
+
+
+@benchmark(group="streaming", number=5000)
+def queue_handler_chunk_dropped():
+    """StreamingIteratorCallbackHandler dispatch of one chunk to a full queue with the drop policy."""
+    handler = StreamingIteratorCallbackHandler(max_queue_size=1, overflow_policy=StreamingOverflowPolicy.DROP_NEW)
+    run_id = uuid4()
+    dispatch(handler, run_id)
+    yield lambda: dispatch(handler, run_id)
+
+
+def run_streamed(node, handler: StreamingIteratorCallbackHandler):
+    result = check(node.run_sync(input_data=INPUT_DATA, config=RunnableConfig(callbacks=[handler])))
+    drain(handler)
+    return result
+
+
+@benchmark(group="streaming", number=20)
+def llm_stream():
+    """Node.run_sync of an LLM node streaming chunks to a queue handler."""
+    node = make_llm()
+    node.streaming = StreamingConfig(enabled=True)
+    handler = StreamingIteratorCallbackHandler()
+    with mock_providers():
+        yield lambda: run_streamed(node, handler)
+
+
+@benchmark(group="streaming", number=20)
+def llm_stream_coalesced():
+    """Node.run_sync of an LLM node streaming chunks to a queue handler with coalescing."""
+    node = make_llm()
+    node.streaming = StreamingConfig(enabled=True)
+    handler = StreamingIteratorCallbackHandler(coalesce_interval=0.05)
+    with mock_providers():
+        yield lambda: run_streamed(node, handler)
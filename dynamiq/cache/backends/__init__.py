@@ -1,2 +1,6 @@
 from .base import BaseCache
+from .file import FileCache
+from .memory import InMemoryCache, InMemoryCacheStats
 from .redis import RedisCache
+from .sqlite import SQLiteCache
+from .tiered import TieredCache
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from dynamiq.cache.config import CacheConfig
 
@@ -59,12 +59,13 @@ class BaseCache(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def set(self, key: str, value: dict):
+    def set(self, key: str, value: dict, ttl: int | None = None):
         """Set value in cache.
 
         Args:
             key (str): Cache key.
             value (dict): Value to cache.
+            ttl (int | None): Time-to-live for cache entry.
 
         Raises:
             NotImplementedError: If not implemented.
@@ -82,3 +83,26 @@ class BaseCache(ABC):
             NotImplementedError: If not implemented.
         """
         raise NotImplementedError
+
+    def get_many(self, keys: list[str]) -> list[Any]:
+        """Retrieve multiple values from cache.
+
+        Args:
+            keys (list[str]): Cache keys.
+
+        Returns:
+            list[Any]: Cached values in the order of keys. Missing values are None.
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, values: dict[str, Any], ttl: int | None = None) -> Any:
+        """Set multiple values in cache.
+
+        Args:
+            values (dict[str, Any]): Values to cache by key.
+            ttl (int | None): Time-to-live for cache entries.
+
+        Returns:
+            Any: Results of cache set operations.
+        """
+        return [self.set(key, value, ttl=ttl) for key, value in values.items()]
@@ -0,0 +1,123 @@
+import hashlib
+import os
+import struct
+import tempfile
+import time
+from typing import Any
+
+from dynamiq.cache.backends import BaseCache
+from dynamiq.cache.config import FileCacheConfig
+
+# Entry header: expiration timestamp (0 if the entry does not expire) and value type
+_HEADER = struct.Struct("<dc")
+_BYTES = b"b"
+_STR = b"s"
+
+
+class FileCache(BaseCache):
+    """Cache backend storing every entry as a file in a local directory.
+
+    Files are named by the key digest and spread over 256 subdirectories. Writes go to a temporary file that
+    replaces the entry atomically, so concurrent readers never see partial values.
+
+    Attributes:
+        client (str): Directory of the cache files.
+    """
+
+    def __init__(self, client: str):
+        """Initialize FileCache.
+
+        Args:
+            client (str): Directory of the cache files. It is created if it does not exist.
+        """
+        super().__init__(client=client)
+        os.makedirs(client, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: FileCacheConfig):
+        """Create FileCache instance from configuration.
+
+        Args:
+            config (FileCacheConfig): File cache configuration.
+
+        Returns:
+            FileCache: File cache instance.
+        """
+        return cls(client=config.directory)
+
+    def get(self, key: str) -> Any:
+        """Retrieve value from file cache.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Cached value or None.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        expires_at, value_type = _HEADER.unpack_from(data)
+        if expires_at and expires_at <= time.time():
+            self._remove(path)
+            return None
+        value = data[_HEADER.size :]
+        return value.decode() if value_type == _STR else value
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Set value in file cache.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to cache, bytes or a string.
+            ttl (int | None): Time-to-live for cache entry in seconds.
+
+        Returns:
+            bool: Whether the value was stored.
+        """
+        if isinstance(value, str):
+            value_type, value = _STR, value.encode()
+        else:
+            value_type = _BYTES
+        header = _HEADER.pack(time.time() + ttl if ttl else 0.0, value_type)
+
+        path = self._get_path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(value)
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        return True
+
+    def delete(self, key: str) -> int:
+        """Delete value from file cache.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            int: Number of deleted entries.
+        """
+        return int(self._remove(self._get_path(key)))
+
+    def _get_path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.client, digest[:2], digest)
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
@@ -0,0 +1,242 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel, computed_field
+
+from dynamiq.cache.backends import BaseCache
+from dynamiq.cache.config import LocalCacheConfig
+
+
+class InMemoryCacheStats(BaseModel):
+    """
+    Snapshot of in-memory cache counters.
+
+    Attributes:
+        entries (int): Number of stored entries.
+        size_bytes (int): Total size of stored values in bytes.
+        hits (int): Number of lookups that found a value.
+        misses (int): Number of lookups that found nothing or an expired value.
+        evictions (int): Number of entries evicted to respect size limits.
+        expirations (int): Number of entries dropped after their TTL.
+    """
+
+    entries: int
+    size_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+    @computed_field
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Entry(NamedTuple):
+    value: Any
+    size: int
+    expires_at: float | None
+
+
+class InMemoryCache(BaseCache):
+    """In-process LRU cache backend with TTL and entries/bytes limits.
+
+    Attributes:
+        client (OrderedDict): Storage of entries ordered from least to most recently used.
+        max_entries (int): Maximum number of entries.
+        max_bytes (int | None): Maximum total size of stored values in bytes.
+        ttl (int | None): Default time-to-live for entries in seconds.
+    """
+
+    def __init__(
+        self,
+        client: OrderedDict | None = None,
+        max_entries: int = 1024,
+        max_bytes: int | None = None,
+        ttl: int | None = None,
+    ):
+        """Initialize InMemoryCache.
+
+        Args:
+            client (OrderedDict | None): Storage of entries. A new one is created if None.
+            max_entries (int): Maximum number of entries.
+            max_bytes (int | None): Maximum total size of stored values in bytes.
+            ttl (int | None): Default time-to-live for entries in seconds.
+        """
+        super().__init__(client=client if client is not None else OrderedDict())
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._size_bytes = sum(entry.size for entry in self.client.values())
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @classmethod
+    def from_config(cls, config: LocalCacheConfig):
+        """Create InMemoryCache instance from configuration.
+
+        Args:
+            config (LocalCacheConfig): In-memory cache configuration.
+
+        Returns:
+            InMemoryCache: In-memory cache instance.
+        """
+        return cls(max_entries=config.max_entries, max_bytes=config.max_bytes, ttl=config.ttl)
+
+    def get(self, key: str) -> Any:
+        """Retrieve value from in-memory cache.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Cached value or None.
+        """
+        with self._lock:
+            return self._get(key, now=time.monotonic())
+
+    def get_many(self, keys: list[str]) -> list[Any]:
+        """Retrieve multiple values from in-memory cache.
+
+        Args:
+            keys (list[str]): Cache keys.
+
+        Returns:
+            list[Any]: Cached values in the order of keys. Missing values are None.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [self._get(key, now=now) for key in keys]
+
+    def set(self, key: str, value: Any, ttl: int | None = None, size: int | None = None) -> bool:
+        """Set value in in-memory cache.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to cache.
+            ttl (int | None): Time-to-live for cache entry. Capped by the cache default TTL.
+            size (int | None): Size of the value in bytes. Measured from the value if None.
+
+        Returns:
+            bool: Whether the value was stored. Values larger than max_bytes are not stored.
+        """
+        with self._lock:
+            return self._set(key, value, ttl=ttl, now=time.monotonic(), size=size)
+
+    def set_many(
+        self, values: dict[str, Any], ttl: int | None = None, sizes: dict[str, int] | None = None
+    ) -> list[bool]:
+        """Set multiple values in in-memory cache.
+
+        Args:
+            values (dict[str, Any]): Values to cache by key.
+            ttl (int | None): Time-to-live for cache entries.
+            sizes (dict[str, int] | None): Sizes of the values in bytes by key. Measured from the values if None.
+
+        Returns:
+            list[bool]: Whether each value was stored.
+        """
+        now = time.monotonic()
+        sizes = sizes or {}
+        with self._lock:
+            return [self._set(key, value, ttl=ttl, now=now, size=sizes.get(key)) for key, value in values.items()]
+
+    def delete(self, key: str) -> int:
+        """Delete value from in-memory cache.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            int: Number of deleted entries.
+        """
+        with self._lock:
+            if (entry := self.client.pop(key, None)) is None:
+                return 0
+            self._size_bytes -= entry.size
+            return 1
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self.client.clear()
+            self._size_bytes = 0
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def get_stats(self) -> InMemoryCacheStats:
+        """
+        Get a snapshot of cache counters.
+
+        Returns:
+            InMemoryCacheStats: Current cache counters.
+        """
+        with self._lock:
+            return InMemoryCacheStats(
+                entries=len(self.client),
+                size_bytes=self._size_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
+
+    def _get(self, key: str, now: float) -> Any:
+        if (entry := self.client.get(key)) is None:
+            self._misses += 1
+            return None
+
+        if entry.expires_at is not None and entry.expires_at <= now:
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self.client.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    def _set(self, key: str, value: Any, ttl: int | None, now: float, size: int | None = None) -> bool:
+        if size is None:
+            size = self.get_size(value)
+        if key in self.client:
+            self._remove(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+
+        ttl = min(filter(None, (ttl, self.ttl)), default=None)
+        self.client[key] = _Entry(value=value, size=size, expires_at=now + ttl if ttl else None)
+        self._size_bytes += size
+
+        while len(self.client) > self.max_entries or (self.max_bytes is not None and self._size_bytes > self.max_bytes):
+            self._remove(next(iter(self.client)))
+            self._evictions += 1
+
+        return True
+
+    def _remove(self, key: str) -> None:
+        self._size_bytes -= self.client.pop(key).size
+
+    @staticmethod
+    def get_size(value: Any) -> int:
+        """Measure the size of a value in bytes.
+
+        Args:
+            value (Any): Cached value.
+
+        Returns:
+            int: Size of strings and bytes, or the shallow object size of other values.
+        """
+        if isinstance(value, str):
+            return len(value.encode())
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return len(value)
+        return sys.getsizeof(value)
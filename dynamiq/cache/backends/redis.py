@@ -19,7 +19,7 @@ class RedisCache(BaseCache):
         """
         from redis import Redis
 
-        return cls(client=Redis(**config.to_dict()))
+        return cls(client=Redis(**config.client_params))
 
     def get(self, key: str) -> Any:
         """Retrieve value from Redis cache.
@@ -57,3 +57,36 @@ class RedisCache(BaseCache):
             Any: Result of cache delete operation.
         """
         return self.client.delete(key)
+
+    def get_many(self, keys: list[str]) -> list[Any]:
+        """Retrieve multiple values from Redis cache with a single MGET.
+
+        Args:
+            keys (list[str]): Cache keys.
+
+        Returns:
+            list[Any]: Cached values in the order of keys. Missing values are None.
+        """
+        if not keys:
+            return []
+        return self.client.mget(keys)
+
+    def set_many(self, values: dict[str, Any], ttl: int | None = None) -> Any:
+        """Set multiple values in Redis cache in one round trip.
+
+        Args:
+            values (dict[str, Any]): Values to cache by key.
+            ttl (int | None): Time-to-live for cache entries.
+
+        Returns:
+            Any: Result of cache set operation.
+        """
+        if not values:
+            return []
+        if ttl is None:
+            return self.client.mset(values)
+
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value in values.items():
+            pipeline.setex(key, ttl, value)
+        return pipeline.execute()
@@ -0,0 +1,149 @@
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from dynamiq.cache.backends import BaseCache
+from dynamiq.cache.config import SQLiteCacheConfig
+
+# SQLite limits the number of parameters of a statement
+MAX_KEYS_PER_QUERY = 500
+
+
+class SQLiteCache(BaseCache):
+    """SQLite cache backend for caches persisted on a single host.
+
+    Entries are stored in a table with an optional expiration time. Expired entries are ignored on reads,
+    replaced on writes and removed with `clear_expired`.
+
+    Attributes:
+        client (sqlite3.Connection): Connection to the cache database shared by threads.
+        table_name (str): Name of the cache table.
+    """
+
+    def __init__(self, client: sqlite3.Connection, table_name: str = "cache"):
+        """Initialize SQLiteCache.
+
+        Args:
+            client (sqlite3.Connection): Connection to the cache database. It must allow use from other
+                threads if the cache is shared by threads.
+            table_name (str): Name of the cache table. It is created if it does not exist.
+        """
+        if not table_name.isidentifier():
+            raise ValueError(f"Invalid table name: '{table_name}'")
+        super().__init__(client=client)
+        self.table_name = table_name
+        self._lock = threading.Lock()
+        with self._lock, self.client:
+            self.client.execute(
+                f"CREATE TABLE IF NOT EXISTS {table_name} "  # nosec B608
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL) WITHOUT ROWID"
+            )
+
+    @classmethod
+    def from_config(cls, config: SQLiteCacheConfig):
+        """Create SQLiteCache instance from configuration.
+
+        Args:
+            config (SQLiteCacheConfig): SQLite cache configuration.
+
+        Returns:
+            SQLiteCache: SQLite cache instance.
+        """
+        client = sqlite3.connect(config.db_path, check_same_thread=False)
+        client.execute("PRAGMA journal_mode=WAL")
+        client.execute("PRAGMA synchronous=NORMAL")
+        return cls(client=client)
+
+    def get(self, key: str) -> Any:
+        """Retrieve value from SQLite cache.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Cached value or None.
+        """
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: list[str]) -> list[Any]:
+        """Retrieve multiple values from SQLite cache with one query per 500 keys.
+
+        Args:
+            keys (list[str]): Cache keys.
+
+        Returns:
+            list[Any]: Cached values in the order of keys. Missing values are None.
+        """
+        found = {}
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(keys), MAX_KEYS_PER_QUERY):
+                chunk = keys[start : start + MAX_KEYS_PER_QUERY]
+                rows = self.client.execute(
+                    f"SELECT key, value FROM {self.table_name} "  # nosec B608
+                    f"WHERE key IN ({','.join('?' * len(chunk))}) AND (expires_at IS NULL OR expires_at > ?)",
+                    (*chunk, now),
+                )
+                found.update(rows)
+        return [found.get(key) for key in keys]
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        """Set value in SQLite cache.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to cache, bytes or a string.
+            ttl (int | None): Time-to-live for cache entry in seconds.
+
+        Returns:
+            bool: Whether the value was stored.
+        """
+        self.set_many({key: value}, ttl=ttl)
+        return True
+
+    def set_many(self, values: dict[str, Any], ttl: int | None = None) -> list[bool]:
+        """Set multiple values in SQLite cache in one transaction.
+
+        Args:
+            values (dict[str, Any]): Values to cache by key.
+            ttl (int | None): Time-to-live for cache entries in seconds.
+
+        Returns:
+            list[bool]: Whether each value was stored.
+        """
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock, self.client:
+            self.client.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value, expires_at) VALUES (?, ?, ?)",  # nosec B608
+                [(key, value, expires_at) for key, value in values.items()],
+            )
+        return [True] * len(values)
+
+    def delete(self, key: str) -> int:
+        """Delete value from SQLite cache.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            int: Number of deleted entries.
+        """
+        with self._lock, self.client:
+            return self.client.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,)).rowcount  # nosec B608
+
+    def clear_expired(self) -> int:
+        """Remove expired entries.
+
+        Returns:
+            int: Number of removed entries.
+        """
+        with self._lock, self.client:
+            return self.client.execute(
+                f"DELETE FROM {self.table_name} WHERE expires_at <= ?", (time.time(),)  # nosec B608
+            ).rowcount
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock, self.client:
+            self.client.execute(f"DELETE FROM {self.table_name}")  # nosec B608
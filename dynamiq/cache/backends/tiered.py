@@ -0,0 +1,158 @@
+from typing import Any, Callable
+
+from dynamiq.cache.backends import BaseCache
+from dynamiq.cache.backends.memory import InMemoryCache
+from dynamiq.cache.config import CacheConfig
+
+
+class TieredCache(BaseCache):
+    """Two-level cache with an in-process first level in front of a remote backend.
+
+    Reads are served from the local cache when possible and fill it on remote hits. Writes and
+    deletes go through to both levels. Entries filled from the remote backend use the local TTL,
+    as the remaining remote TTL is not known.
+
+    With `decode` and `encode` set, the local cache keeps decoded values, so local hits skip decoding and
+    values are encoded only for the remote backend. Decoded values are shared between readers and must not
+    be mutated. Their size is counted as the size of their remote payload. Without them, both levels store
+    the same payloads.
+
+    Attributes:
+        local (InMemoryCache): First level in-process cache.
+        remote (BaseCache): Second level cache backend.
+        decode (Callable[[Any], Any] | None): Function decoding remote payloads into local values.
+        encode (Callable[[Any], Any] | None): Function encoding local values into remote payloads.
+        client (Any): Client of the remote backend.
+    """
+
+    def __init__(
+        self,
+        local: InMemoryCache,
+        remote: BaseCache,
+        decode: Callable[[Any], Any] | None = None,
+        encode: Callable[[Any], Any] | None = None,
+    ):
+        """Initialize TieredCache.
+
+        Args:
+            local (InMemoryCache): First level in-process cache.
+            remote (BaseCache): Second level cache backend.
+            decode (Callable[[Any], Any] | None): Function decoding remote payloads into local values.
+            encode (Callable[[Any], Any] | None): Function encoding local values into remote payloads.
+
+        Raises:
+            ValueError: If only one of `decode` and `encode` is set.
+        """
+        if (decode is None) != (encode is None):
+            raise ValueError("TieredCache requires both decode and encode functions or neither.")
+        super().__init__(client=remote.client)
+        self.local = local
+        self.remote = remote
+        self.decode = decode
+        self.encode = encode
+
+    @property
+    def is_decoding(self) -> bool:
+        """Whether the local cache keeps decoded values."""
+        return self.decode is not None
+
+    @classmethod
+    def from_config(cls, config: CacheConfig):
+        """TieredCache is built from existing cache instances.
+
+        Args:
+            config (CacheConfig): Cache configuration.
+
+        Raises:
+            NotImplementedError: Always.
+        """
+        raise NotImplementedError("TieredCache must be created from local and remote cache instances.")
+
+    def get(self, key: str) -> Any:
+        """Retrieve value from the local cache, falling back to the remote backend.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Cached value, decoded if the cache is decoding.
+        """
+        if (value := self.local.get(key)) is not None:
+            return value
+
+        if (payload := self.remote.get(key)) is None:
+            return None
+        value = self.decode(payload) if self.is_decoding else payload
+        self.local.set(key, value, size=self.local.get_size(payload))
+        return value
+
+    def get_many(self, keys: list[str]) -> list[Any]:
+        """Retrieve multiple values, fetching only local misses from the remote backend.
+
+        Args:
+            keys (list[str]): Cache keys.
+
+        Returns:
+            list[Any]: Cached values in the order of keys, decoded if the cache is decoding. Missing values are None.
+        """
+        values = self.local.get_many(keys)
+        missed = [idx for idx, value in enumerate(values) if value is None]
+        if not missed:
+            return values
+
+        payloads = self.remote.get_many([keys[idx] for idx in missed])
+        filled, sizes = {}, {}
+        for idx, payload in zip(missed, payloads):
+            if payload is None:
+                continue
+            values[idx] = self.decode(payload) if self.is_decoding else payload
+            filled[keys[idx]] = values[idx]
+            sizes[keys[idx]] = self.local.get_size(payload)
+        if filled:
+            self.local.set_many(filled, sizes=sizes)
+
+        return values
+
+    def set(self, key: str, value: Any, ttl: int | None = None) -> Any:
+        """Set value in both cache levels.
+
+        Args:
+            key (str): Cache key.
+            value (Any): Value to cache, encoded for the remote backend if the cache is decoding.
+            ttl (int | None): Time-to-live for cache entry.
+
+        Returns:
+            Any: Result of the remote set operation.
+        """
+        payload = self.encode(value) if self.is_decoding else value
+        res = self.remote.set(key, payload, ttl=ttl)
+        self.local.set(key, value, ttl=ttl, size=self.local.get_size(payload))
+        return res
+
+    def set_many(self, values: dict[str, Any], ttl: int | None = None) -> Any:
+        """Set multiple values in both cache levels.
+
+        Args:
+            values (dict[str, Any]): Values to cache by key, encoded for the remote backend if the cache is decoding.
+            ttl (int | None): Time-to-live for cache entries.
+
+        Returns:
+            Any: Result of the remote set operation.
+        """
+        payloads = {key: self.encode(value) for key, value in values.items()} if self.is_decoding else values
+        res = self.remote.set_many(payloads, ttl=ttl)
+        sizes = {key: self.local.get_size(payload) for key, payload in payloads.items()}
+        self.local.set_many(values, ttl=ttl, sizes=sizes)
+        return res
+
+    def delete(self, key: str) -> Any:
+        """Delete value from both cache levels.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Any: Result of the remote delete operation.
+        """
+        self.local.delete(key)
+        return self.remote.delete(key)
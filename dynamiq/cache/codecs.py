@@ -1,4 +1,9 @@
 import base64
+import struct
+import zlib
+from typing import Any
+
+from dynamiq.cache.config import CacheCompression
 
 
 class BaseCodec:
@@ -51,3 +56,101 @@ class Base64Codec(BaseCodec):
             str: The decoded string.
         """
         return base64.b64decode(value).decode()
+
+
+class BinaryCodec(BaseCodec):
+    """Binary encoding with a versioned header and optional compression.
+
+    Encoded values start with a header of magic bytes, format version and compression algorithm.
+    Values without the header are decoded as Base64, so entries written by Base64Codec remain readable.
+
+    Attributes:
+        compression (CacheCompression): Compression algorithm for large values.
+        compression_threshold (int): Minimal value size in bytes to compress.
+    """
+
+    MAGIC = b"\x93DQ"
+    VERSION = 1
+    _HEADER = struct.Struct("<3sBB")
+    _COMPRESSION_IDS = {
+        CacheCompression.NONE: 0,
+        CacheCompression.ZLIB: 1,
+        CacheCompression.ZSTD: 2,
+    }
+    _COMPRESSIONS_BY_ID = {idx: compression for compression, idx in _COMPRESSION_IDS.items()}
+
+    def __init__(
+        self,
+        compression: CacheCompression = CacheCompression.NONE,
+        compression_threshold: int = 1024,
+    ):
+        """Initialize BinaryCodec.
+
+        Args:
+            compression (CacheCompression): Compression algorithm for large values.
+            compression_threshold (int): Minimal value size in bytes to compress.
+        """
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+
+    def encode(self, value: str | bytes) -> bytes:
+        """Encode a value with the binary header.
+
+        Args:
+            value (str | bytes): The value to encode.
+
+        Returns:
+            bytes: The encoded value.
+        """
+        if isinstance(value, str):
+            value = value.encode()
+
+        compression = CacheCompression.NONE
+        if self.compression != CacheCompression.NONE and len(value) >= self.compression_threshold:
+            compression = self.compression
+            value = self._compress(value, compression)
+
+        return self._HEADER.pack(self.MAGIC, self.VERSION, self._COMPRESSION_IDS[compression]) + value
+
+    def decode(self, value: str | bytes) -> bytes | str:
+        """Decode a binary encoded or a legacy Base64 encoded value.
+
+        Args:
+            value (str | bytes): The value to decode.
+
+        Returns:
+            bytes | str: The decoded payload. Legacy Base64 values are returned as strings.
+
+        Raises:
+            ValueError: If the value has an unsupported format version.
+        """
+        if isinstance(value, str) or not value.startswith(self.MAGIC):
+            return base64.b64decode(value).decode()
+
+        _, version, compression_id = self._HEADER.unpack_from(value)
+        if version != self.VERSION or compression_id not in self._COMPRESSIONS_BY_ID:
+            raise ValueError(f"Unsupported cache value format: version {version}, compression {compression_id}.")
+
+        payload = memoryview(value)[self._HEADER.size :]
+        compression = self._COMPRESSIONS_BY_ID[compression_id]
+        if compression == CacheCompression.NONE:
+            return bytes(payload)
+        return self._decompress(payload, compression)
+
+    @staticmethod
+    def _get_zstd() -> Any:
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("Zstd cache compression requires the 'zstandard' package.") from e
+        return zstandard
+
+    def _compress(self, value: bytes, compression: CacheCompression) -> bytes:
+        if compression == CacheCompression.ZSTD:
+            return self._get_zstd().ZstdCompressor().compress(value)
+        return zlib.compress(value)
+
+    def _decompress(self, value: memoryview, compression: CacheCompression) -> bytes:
+        if compression == CacheCompression.ZSTD:
+            return self._get_zstd().ZstdDecompressor().decompress(value)
+        return zlib.decompress(value)
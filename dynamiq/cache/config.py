@@ -1,6 +1,6 @@
 import enum
 from typing import Literal
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from dynamiq.connections import RedisConnection
 
@@ -8,6 +8,41 @@ from dynamiq.connections import RedisConnection
 class CacheBackend(str, enum.Enum):
     """Enumeration for cache backends."""
     Redis = "Redis"
+    InMemory = "InMemory"
+    SQLite = "SQLite"
+    File = "File"
+
+
+class CacheCodec(str, enum.Enum):
+    """Enumeration for cache value encodings."""
+    Base64 = "Base64"
+    Binary = "Binary"
+
+
+class CacheCompression(str, enum.Enum):
+    """Enumeration for compression algorithms of binary encoded cache values."""
+    NONE = "none"
+    ZLIB = "zlib"
+    ZSTD = "zstd"
+
+
+class EmbeddingCachePrecision(str, enum.Enum):
+    """Enumeration for float precisions of cached embeddings."""
+    FLOAT64 = "float64"
+    FLOAT32 = "float32"
+
+
+class LocalCacheConfig(BaseModel):
+    """Configuration for the in-process cache storage.
+
+    Attributes:
+        max_entries (int): Maximum number of entries. Least recently used entries are evicted first.
+        max_bytes (int | None): Maximum total size of stored values in bytes. Unbounded if None.
+        ttl (int | None): Optional time-to-live for entries in seconds.
+    """
+    max_entries: int = Field(default=1024, gt=0)
+    max_bytes: int | None = Field(default=64 * 1024 * 1024, gt=0)
+    ttl: int | None = None
 
 
 class CacheConfig(BaseModel):
@@ -17,10 +52,19 @@ class CacheConfig(BaseModel):
         backend (CacheBackend): The cache backend to use.
         namespace (str | None): Optional namespace for cache keys.
         ttl (int | None): Optional time-to-live for cache entries.
+        local_cache (LocalCacheConfig | None): Optional in-process cache used as a write-through
+            first level in front of the backend.
+        codec (CacheCodec): Encoding of cached values. Binary encoding also reads Base64 entries.
+        compression (CacheCompression): Compression of binary encoded values.
+        compression_threshold (int): Minimal binary encoded value size in bytes to compress.
     """
     backend: CacheBackend
     namespace: str | None = None
     ttl: int | None = None
+    local_cache: LocalCacheConfig | None = None
+    codec: CacheCodec = CacheCodec.Base64
+    compression: CacheCompression = CacheCompression.NONE
+    compression_threshold: int = 1024
 
     def to_dict(self, **kwargs) -> dict:
         """Convert config to dictionary.
@@ -33,11 +77,89 @@ class CacheConfig(BaseModel):
         """
         return self.model_dump(**kwargs)
 
+    @property
+    def shared_key(self) -> str:
+        """Key of configs that can share cache clients. Instance ids are ignored."""
+        return self.model_dump_json(exclude={"id"})
+
 
 class RedisCacheConfig(CacheConfig, RedisConnection):
     """Configuration for Redis cache.
 
     Attributes:
         backend (Literal[CacheBackend.Redis]): The Redis cache backend.
+        max_connections (int | None): Maximum size of the client connection pool.
     """
     backend: Literal[CacheBackend.Redis] = CacheBackend.Redis
+    max_connections: int | None = None
+
+    @property
+    def client_params(self) -> dict:
+        """Parameters of the Redis client.
+
+        Returns:
+            dict: Redis client parameters.
+        """
+        return {
+            "host": self.host,
+            "port": self.port,
+            "db": self.db,
+            "username": self.username,
+            "password": self.password,
+            "max_connections": self.max_connections,
+        }
+
+
+class InMemoryCacheConfig(CacheConfig, LocalCacheConfig):
+    """Configuration for the standalone in-process cache.
+
+    Attributes:
+        backend (Literal[CacheBackend.InMemory]): The in-memory cache backend.
+    """
+    backend: Literal[CacheBackend.InMemory] = CacheBackend.InMemory
+
+
+class SQLiteCacheConfig(CacheConfig):
+    """Configuration for the persistent SQLite cache of a single host.
+
+    Attributes:
+        backend (Literal[CacheBackend.SQLite]): The SQLite cache backend.
+        db_path (str): Path of the SQLite database file.
+    """
+    backend: Literal[CacheBackend.SQLite] = CacheBackend.SQLite
+    db_path: str = "dynamiq_cache.db"
+
+
+class FileCacheConfig(CacheConfig):
+    """Configuration for the persistent cache storing entries as local files.
+
+    Attributes:
+        backend (Literal[CacheBackend.File]): The file cache backend.
+        directory (str): Directory of the cache files.
+    """
+    backend: Literal[CacheBackend.File] = CacheBackend.File
+    directory: str = ".dynamiq_cache"
+
+
+class EmbeddingCacheConfig(BaseModel):
+    """Configuration for the cache of text embeddings.
+
+    Attributes:
+        local_cache (LocalCacheConfig | None): In-process LRU cache of embeddings. Disabled if None.
+        backend (RedisCacheConfig | SQLiteCacheConfig | FileCacheConfig | None): Optional persistent
+            cache shared across processes or runs.
+        namespace (str): Prefix of cache keys.
+        ttl (int | None): Optional time-to-live for cached embeddings in seconds.
+        precision (EmbeddingCachePrecision): Float precision of stored embeddings. float64 keeps the provider
+            values exact. float32 halves the stored size, but cache hits return rounded values.
+    """
+    local_cache: LocalCacheConfig | None = Field(default_factory=LocalCacheConfig)
+    backend: RedisCacheConfig | SQLiteCacheConfig | FileCacheConfig | None = None
+    namespace: str = "embeddings"
+    ttl: int | None = None
+    precision: EmbeddingCachePrecision = EmbeddingCachePrecision.FLOAT64
+
+    @property
+    def shared_key(self) -> str:
+        """Key of configs that can share caches."""
+        return self.model_dump_json()
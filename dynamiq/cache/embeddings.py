@@ -0,0 +1,212 @@
+import hashlib
+import sys
+import threading
+from array import array
+from functools import partial
+from typing import ClassVar
+
+from dynamiq.cache.backends import BaseCache, FileCache, InMemoryCache, RedisCache, SQLiteCache, TieredCache
+from dynamiq.cache.config import CacheBackend, EmbeddingCacheConfig, EmbeddingCachePrecision
+from dynamiq.cache.hashing import DIGEST_SIZE, canonical_hash
+
+
+# Array type codes of the embedding precisions
+_TYPECODES = {EmbeddingCachePrecision.FLOAT64: "d", EmbeddingCachePrecision.FLOAT32: "f"}
+
+
+def pack_embedding(
+    embedding: list[float], precision: EmbeddingCachePrecision = EmbeddingCachePrecision.FLOAT64
+) -> bytes:
+    """Pack an embedding as little-endian float values.
+
+    Args:
+        embedding (list[float]): Embedding vector.
+        precision (EmbeddingCachePrecision): Float precision of packed values.
+
+    Returns:
+        bytes: Packed embedding.
+    """
+    values = array(_TYPECODES[precision], embedding)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def unpack_embedding(data: bytes, precision: EmbeddingCachePrecision = EmbeddingCachePrecision.FLOAT64) -> list[float]:
+    """Unpack an embedding packed with `pack_embedding`.
+
+    Args:
+        data (bytes): Packed embedding.
+        precision (EmbeddingCachePrecision): Float precision of packed values.
+
+    Returns:
+        list[float]: Embedding vector.
+    """
+    values = array(_TYPECODES[precision])
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """Cache of text embeddings keyed by the text and the embedding model settings.
+
+    Embeddings are stored as packed float64 or float32 values in an in-process LRU cache, a persistent backend
+    or both.
+    With both, the LRU keeps unpacked embeddings, lookups are served by it first and persistent hits are
+    unpacked once and copied into it.
+
+    Attributes:
+        BACKENDS_BY_TYPE (dict[CacheBackend, type[BaseCache]]): Mapping of persistent backends.
+        cache (BaseCache): Cache storing packed embeddings.
+        namespace (str): Prefix of cache keys.
+        ttl (int | None): Time-to-live for cached embeddings in seconds.
+        precision (EmbeddingCachePrecision): Float precision of packed embeddings.
+    """
+
+    BACKENDS_BY_TYPE: ClassVar[dict[CacheBackend, type[BaseCache]]] = {
+        CacheBackend.Redis: RedisCache,
+        CacheBackend.SQLite: SQLiteCache,
+        CacheBackend.File: FileCache,
+    }
+
+    _shared: ClassVar[dict[str, "EmbeddingCache"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        cache: BaseCache,
+        namespace: str = "embeddings",
+        ttl: int | None = None,
+        precision: EmbeddingCachePrecision = EmbeddingCachePrecision.FLOAT64,
+    ):
+        """Initialize EmbeddingCache.
+
+        Args:
+            cache (BaseCache): Cache storing packed embeddings.
+            namespace (str): Prefix of cache keys.
+            ttl (int | None): Time-to-live for cached embeddings in seconds.
+            precision (EmbeddingCachePrecision): Float precision of packed embeddings.
+        """
+        self.cache = cache
+        self.namespace = namespace
+        self.ttl = ttl
+        self.precision = precision
+
+    @classmethod
+    def from_config(cls, config: EmbeddingCacheConfig) -> "EmbeddingCache":
+        """Create EmbeddingCache instance from configuration.
+
+        Args:
+            config (EmbeddingCacheConfig): Embedding cache configuration.
+
+        Returns:
+            EmbeddingCache: Embedding cache instance.
+
+        Raises:
+            ValueError: If neither a local cache nor a backend is configured.
+        """
+        local = InMemoryCache.from_config(config.local_cache) if config.local_cache is not None else None
+        if config.backend is None:
+            if local is None:
+                raise ValueError("Embedding cache requires a local cache or a backend.")
+            cache = local
+        else:
+            cache = cls.BACKENDS_BY_TYPE[config.backend.backend].from_config(config.backend)
+            if local is not None:
+                cache = TieredCache(
+                    local=local,
+                    remote=cache,
+                    decode=partial(unpack_embedding, precision=config.precision),
+                    encode=partial(pack_embedding, precision=config.precision),
+                )
+        return cls(cache=cache, namespace=config.namespace, ttl=config.ttl, precision=config.precision)
+
+    @classmethod
+    def get_shared(cls, config: EmbeddingCacheConfig) -> "EmbeddingCache":
+        """Get a process-wide embedding cache for the configuration, creating it on first use.
+
+        Args:
+            config (EmbeddingCacheConfig): Embedding cache configuration.
+
+        Returns:
+            EmbeddingCache: Shared embedding cache.
+        """
+        key = config.shared_key
+        if (cache := cls._shared.get(key)) is None:
+            with cls._shared_lock:
+                if (cache := cls._shared.get(key)) is None:
+                    cache = cls.from_config(config)
+                    cls._shared[key] = cache
+        return cache
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        """Drop all shared embedding caches."""
+        with cls._shared_lock:
+            cls._shared.clear()
+
+    @property
+    def _is_decoding(self) -> bool:
+        """Whether the cache keeps unpacked embeddings in memory and packs them only for its backend."""
+        return isinstance(self.cache, TieredCache) and self.cache.is_decoding
+
+    @property
+    def is_local(self) -> bool:
+        """Whether lookups are served from process memory only."""
+        return isinstance(self.cache, InMemoryCache)
+
+    def get_keys(
+        self,
+        texts: list[str],
+        model: str,
+        dimensions: int | None = None,
+        input_type: str | None = None,
+        truncate: str | None = None,
+    ) -> list[str]:
+        """Build the cache keys of text embeddings.
+
+        Model settings and the storage precision are hashed once and key the hash of every text.
+
+        Args:
+            texts (list[str]): Embedded texts.
+            model (str): Embedding model name.
+            dimensions (int | None): Number of embedding dimensions.
+            input_type (str | None): Type of the embedded input.
+            truncate (str | None): Truncation of texts exceeding the model input length.
+
+        Returns:
+            list[str]: Cache keys in the order of texts.
+        """
+        settings = bytes.fromhex(canonical_hash((model, dimensions, input_type, truncate, self.precision.value)))
+        prefix = f"{self.namespace}:"
+        return [
+            prefix + hashlib.blake2b(text.encode(), digest_size=DIGEST_SIZE, key=settings).hexdigest() for text in texts
+        ]
+
+    def get_many(self, keys: list[str]) -> list[list[float] | None]:
+        """Retrieve multiple embeddings.
+
+        Args:
+            keys (list[str]): Cache keys.
+
+        Returns:
+            list[list[float] | None]: Embeddings in the order of keys. Missing embeddings are None.
+        """
+        values = self.cache.get_many(keys)
+        if self._is_decoding:
+            return [list(value) if value is not None else None for value in values]
+        return [unpack_embedding(value, self.precision) if value is not None else None for value in values]
+
+    def set_many(self, embeddings: dict[str, list[float]]) -> None:
+        """Store multiple embeddings.
+
+        Args:
+            embeddings (dict[str, list[float]]): Embeddings by cache key.
+        """
+        if self._is_decoding:
+            self.cache.set_many({key: list(value) for key, value in embeddings.items()}, ttl=self.ttl)
+        else:
+            packed = {key: pack_embedding(value, self.precision) for key, value in embeddings.items()}
+            self.cache.set_many(packed, ttl=self.ttl)
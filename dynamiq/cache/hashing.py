@@ -0,0 +1,216 @@
+import enum
+import hashlib
+import struct
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from datetime import date, datetime
+from functools import partial
+from io import BytesIO
+from types import ModuleType
+from typing import Any, Callable
+from uuid import UUID
+
+from pydantic import BaseModel
+
+DIGEST_SIZE = 32
+MEMOIZE_MIN_SIZE = 4096
+MEMOIZE_MAX_BYTES = 16 * 1024 * 1024
+
+_LENGTH = struct.Struct("<Q")
+_FLOAT = struct.Struct("<d")
+
+
+class _DigestMemo:
+    """
+    LRU memo of digests of large immutable values.
+
+    Repeated values are looked up by their cached Python hash. Memoized values are kept alive by the memo, so
+    it is bounded by their total size rather than by the number of entries.
+
+    Attributes:
+        max_bytes (int): Maximum total size in bytes of memoized values.
+        hits (int): Number of digests found in the memo.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self._digests: OrderedDict[str | bytes, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def digest(self, value: str | bytes) -> bytes:
+        """Get the digest of a value, computing it on a miss."""
+        with self._lock:
+            if (digest := self._digests.get(value)) is not None:
+                self._digests.move_to_end(value)
+                self.hits += 1
+                return digest
+
+        data = value.encode() if isinstance(value, str) else value
+        digest = hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+        size = sys.getsizeof(value)
+        if size > self.max_bytes:
+            return digest
+
+        with self._lock:
+            if value not in self._digests:
+                self._digests[value] = digest
+                self._size += size
+            while self._size > self.max_bytes:
+                evicted, _ = self._digests.popitem(last=False)
+                self._size -= sys.getsizeof(evicted)
+        return digest
+
+    def clear(self) -> None:
+        """Drop all memoized digests and reset counters."""
+        with self._lock:
+            self._digests.clear()
+            self._size = 0
+            self.hits = 0
+
+
+_digest_memo = _DigestMemo(MEMOIZE_MAX_BYTES)
+
+
+class CanonicalHasher:
+    """
+    Streaming hasher over a canonical, type-tagged encoding of Python values.
+
+    Values are fed to BLAKE2b without materialising JSON. Dict keys are ordered, so key order does not
+    change the digest. Float lists are hashed as packed float64 arrays. Pydantic models are hashed by
+    their declared fields and extras. Functions are hashed by their module and qualified name, and methods
+    also by their instance. Lambdas and closures are refused, as their name does not identify their code
+    or captured values. Large strings and bytes are hashed once and memoized.
+
+    Attributes:
+        digest_size (int): Size of the digest in bytes.
+    """
+
+    def __init__(self, digest_size: int = DIGEST_SIZE):
+        self.digest_size = digest_size
+        self._hash = hashlib.blake2b(digest_size=digest_size)
+
+    def update(self, value: Any) -> "CanonicalHasher":
+        """
+        Feed a value to the hasher.
+
+        Args:
+            value (Any): The value to hash.
+
+        Returns:
+            CanonicalHasher: The hasher instance.
+        """
+        self._update(value)
+        return self
+
+    def hexdigest(self) -> str:
+        """Get the digest of all values fed so far as a hex string."""
+        return self._hash.hexdigest()
+
+    def _write(self, tag: bytes, data: bytes = b"") -> None:
+        self._hash.update(tag)
+        self._hash.update(_LENGTH.pack(len(data)))
+        self._hash.update(data)
+
+    def _update(self, value: Any) -> None:
+        # bool and enums are checked first as they are subclasses of int and str
+        if value is None:
+            self._hash.update(b"N")
+        elif isinstance(value, bool):
+            self._hash.update(b"T" if value else b"F")
+        elif isinstance(value, enum.Enum):
+            self._hash.update(b"E")
+            self._update(value.value)
+        elif isinstance(value, str):
+            if len(value) >= MEMOIZE_MIN_SIZE:
+                self._write(b"s", _digest_memo.digest(value))
+            else:
+                self._write(b"S", value.encode())
+        elif isinstance(value, int):
+            self._write(b"I", str(value).encode())
+        elif isinstance(value, float):
+            self._hash.update(b"D")
+            self._hash.update(_FLOAT.pack(value))
+        elif isinstance(value, dict):
+            self._update_dict(value)
+        elif isinstance(value, (list, tuple)):
+            self._update_sequence(value)
+        elif isinstance(value, BaseModel):
+            self._update_model(value)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            if len(value) >= MEMOIZE_MIN_SIZE and isinstance(value, bytes):
+                self._write(b"b", _digest_memo.digest(value))
+            else:
+                self._write(b"B", bytes(value))
+        elif isinstance(value, BytesIO):
+            self._write(b"O", value.getvalue())
+        elif isinstance(value, (set, frozenset)):
+            digests = sorted(CanonicalHasher(self.digest_size).update(item)._hash.digest() for item in value)
+            self._write(b"U", b"".join(digests))
+        elif isinstance(value, (UUID, datetime, date)):
+            self._write(b"X", str(value).encode())
+        elif isinstance(value, Exception):
+            self._write(b"R", f"{type(value).__name__}:{value}".encode())
+        elif isinstance(value, partial):
+            self._hash.update(b"P")
+            self._update((value.func, value.args, value.keywords))
+        elif callable(value) and hasattr(value, "__qualname__"):
+            self._update_callable(value)
+        else:
+            self._write(b"Z", f"{type(value).__qualname__}:{value}".encode())
+
+    def _update_dict(self, value: dict) -> None:
+        self._write(b"{", _LENGTH.pack(len(value)))
+        try:
+            items = sorted(value.items())
+        except TypeError:
+            items = sorted(value.items(), key=lambda item: str(item[0]))
+        for key, item in items:
+            self._update(key)
+            self._update(item)
+
+    def _update_sequence(self, value: list | tuple) -> None:
+        if value and all(type(item) is float for item in value):
+            floats = array("d", value)
+            if sys.byteorder == "big":
+                floats.byteswap()
+            self._write(b"d", floats.tobytes())
+            return
+
+        self._write(b"[", _LENGTH.pack(len(value)))
+        for item in value:
+            self._update(item)
+
+    def _update_model(self, value: BaseModel) -> None:
+        self._write(b"M", type(value).__qualname__.encode())
+        fields = type(value).model_fields
+        self._write(b"{", _LENGTH.pack(len(fields)))
+        for name in sorted(fields):
+            self._update(name)
+            self._update(getattr(value, name))
+        if extra := value.model_extra:
+            self._update_dict(extra)
+
+    def _update_callable(self, value: Callable) -> None:
+        if getattr(value, "__name__", None) == "<lambda>" or getattr(value, "__closure__", None):
+            raise TypeError(f"Lambdas and closures can not be hashed by name: {value.__qualname__}.")
+
+        self._write(b"C", f"{value.__module__}.{value.__qualname__}".encode())
+        if (owner := getattr(value, "__self__", None)) is not None and not isinstance(owner, ModuleType):
+            self._update(owner)
+
+
+def canonical_hash(value: Any) -> str:
+    """
+    Hash a value with its canonical encoding.
+
+    Args:
+        value (Any): The value to hash.
+
+    Returns:
+        str: Hex digest of the value.
+    """
+    return CanonicalHasher().update(value).hexdigest()
@@ -1,9 +1,10 @@
-from typing import Any, Callable
+import threading
+from typing import Any, Callable, ClassVar
 
-from dynamiq.cache.backends import BaseCache, RedisCache
-from dynamiq.cache.codecs import Base64Codec
-from dynamiq.cache.config import CacheBackend, CacheConfig
-from dynamiq.components.serializers import JsonSerializer
+from dynamiq.cache.backends import BaseCache, FileCache, InMemoryCache, RedisCache, SQLiteCache, TieredCache
+from dynamiq.cache.codecs import Base64Codec, BinaryCodec
+from dynamiq.cache.config import CacheBackend, CacheCodec, CacheConfig
+from dynamiq.components.serializers import BinarySerializer, JsonSerializer
 
 
 class CacheManager:
@@ -12,7 +13,7 @@ class CacheManager:
     Attributes:
         CACHE_BACKENDS_BY_TYPE (dict[CacheBackend, BaseCache]): Mapping of backends.
         cache_backend (BaseCache): Selected cache backend.
-        cache (BaseCache): Cache instance.
+        cache (BaseCache): Cache instance. With a local cache, decoded values are kept in memory.
         serializer (Any): Serializer instance.
         codec (Any): Codec instance.
         namespace (str | None): Cache namespace.
@@ -20,8 +21,14 @@ class CacheManager:
     """
     CACHE_BACKENDS_BY_TYPE: dict[CacheBackend, BaseCache] = {
         CacheBackend.Redis: RedisCache,
+        CacheBackend.InMemory: InMemoryCache,
+        CacheBackend.SQLite: SQLiteCache,
+        CacheBackend.File: FileCache,
     }
 
+    _shared: ClassVar[dict[tuple[type, str], "CacheManager"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         config: CacheConfig,
@@ -35,13 +42,52 @@ class CacheManager:
             serializer (Any | None): Serializer instance.
             codec (Any | None): Codec instance.
         """
+        if config.codec == CacheCodec.Binary:
+            self.serializer = serializer or BinarySerializer()
+            self.codec = codec or BinaryCodec(
+                compression=config.compression, compression_threshold=config.compression_threshold
+            )
+        else:
+            self.serializer = serializer or JsonSerializer()
+            self.codec = codec or Base64Codec()
         self.cache_backend = self.CACHE_BACKENDS_BY_TYPE.get(config.backend)
         self.cache = self.cache_backend.from_config(config)
-        self.serializer = serializer or JsonSerializer()
-        self.codec = codec or Base64Codec()
+        if config.local_cache is not None and not isinstance(self.cache, InMemoryCache):
+            self.cache = TieredCache(
+                local=InMemoryCache.from_config(config.local_cache),
+                remote=self.cache,
+                decode=self._decode_value,
+                encode=self._encode_value,
+            )
         self.namespace = config.namespace
         self.ttl = config.ttl
 
+    @classmethod
+    def get_shared(cls, config: CacheConfig) -> "CacheManager":
+        """Get a process-wide manager for the configuration, creating it on first use.
+
+        Shared managers keep their backend client, and so its connection pool, alive across calls.
+
+        Args:
+            config (CacheConfig): Cache configuration.
+
+        Returns:
+            CacheManager: Shared cache manager.
+        """
+        key = (cls, config.shared_key)
+        if (manager := cls._shared.get(key)) is None:
+            with cls._shared_lock:
+                if (manager := cls._shared.get(key)) is None:
+                    manager = cls(config=config)
+                    cls._shared[key] = manager
+        return manager
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        """Drop all shared managers."""
+        with cls._shared_lock:
+            cls._shared.clear()
+
     def get(
         self,
         key: str,
@@ -63,12 +109,41 @@ class CacheManager:
         loads = loads_func or self.serializer.loads
         decode = decode_func or self.codec.decode
         ns_key = self._get_key(key, namespace=self._get_namespace(namespace))
+        if self._uses_decoded_cache(loads_func, decode_func):
+            return self.cache.get(ns_key)
 
-        if (res := self.cache.get(ns_key)) is not None:
-            res = loads(decode(self.cache.get(key=ns_key)))
+        if (res := self._payload_cache.get(ns_key)) is not None:
+            res = loads(decode(res))
 
         return res
 
+    def get_many(
+        self,
+        keys: list[str],
+        namespace: str | None = None,
+        loads_func: Callable[[Any], Any] | None = None,
+        decode_func: Callable[[Any], Any] | None = None,
+    ) -> list[Any]:
+        """Retrieve multiple values from cache in one round trip.
+
+        Args:
+            keys (list[str]): Cache keys.
+            namespace (str | None): Cache namespace.
+            loads_func (Callable[[Any], Any] | None): Function to deserialize.
+            decode_func (Callable[[Any], Any] | None): Function to decode.
+
+        Returns:
+            list[Any]: Cached values in the order of keys. Missing values are None.
+        """
+        loads = loads_func or self.serializer.loads
+        decode = decode_func or self.codec.decode
+        namespace = self._get_namespace(namespace)
+        ns_keys = [self._get_key(key, namespace=namespace) for key in keys]
+        if self._uses_decoded_cache(loads_func, decode_func):
+            return self.cache.get_many(ns_keys)
+
+        return [loads(decode(res)) if res is not None else None for res in self._payload_cache.get_many(ns_keys)]
+
     def set(
         self,
         key: str,
@@ -95,8 +170,44 @@ class CacheManager:
         encode = encode_func or self.codec.encode
         ns_key = self._get_key(key, namespace=self._get_namespace(namespace))
         ttl = ttl or self.ttl
+        if self._uses_decoded_cache(dumps_func, encode_func):
+            return self.cache.set(key=ns_key, value=value, ttl=ttl)
 
-        res = self.cache.set(key=ns_key, value=encode(dumps(value)), ttl=ttl)
+        res = self._payload_cache.set(key=ns_key, value=encode(dumps(value)), ttl=ttl)
+        self._drop_decoded([ns_key])
+
+        return res
+
+    def set_many(
+        self,
+        values: dict[str, Any],
+        ttl: int | None = None,
+        namespace: str | None = None,
+        dumps_func: Callable[[Any], Any] | None = None,
+        encode_func: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Set multiple values in cache in one round trip.
+
+        Args:
+            values (dict[str, Any]): Values to cache by key.
+            ttl (int | None): Time-to-live for cache entries.
+            namespace (str | None): Cache namespace.
+            dumps_func (Callable[[Any], Any] | None): Function to serialize.
+            encode_func (Callable[[Any], Any] | None): Function to encode.
+
+        Returns:
+            Any: Result of cache set operation.
+        """
+        dumps = dumps_func or self.serializer.dumps
+        encode = encode_func or self.codec.encode
+        namespace = self._get_namespace(namespace)
+        ttl = ttl or self.ttl
+        ns_values = {self._get_key(key, namespace=namespace): value for key, value in values.items()}
+        if self._uses_decoded_cache(dumps_func, encode_func):
+            return self.cache.set_many(ns_values, ttl=ttl)
+
+        res = self._payload_cache.set_many({key: encode(dumps(value)) for key, value in ns_values.items()}, ttl=ttl)
+        self._drop_decoded(list(ns_values))
 
         return res
 
@@ -119,6 +230,40 @@ class CacheManager:
 
         return res
 
+    def _decode_value(self, payload: Any) -> Any:
+        """Decode and deserialize a stored payload."""
+        return self.serializer.loads(self.codec.decode(payload))
+
+    def _encode_value(self, value: Any) -> Any:
+        """Serialize and encode a value for storage."""
+        return self.codec.encode(self.serializer.dumps(value))
+
+    def _uses_decoded_cache(self, *funcs: Callable[[Any], Any] | None) -> bool:
+        """Check whether values go through a cache keeping decoded values in memory.
+
+        Calls with custom serialization or codec functions use the stored payloads instead.
+
+        Args:
+            *funcs (Callable[[Any], Any] | None): Custom functions of the call.
+
+        Returns:
+            bool: True if the cache decodes values itself and no custom functions are set.
+        """
+        return isinstance(self.cache, TieredCache) and self.cache.is_decoding and all(f is None for f in funcs)
+
+    @property
+    def _payload_cache(self) -> BaseCache:
+        """Cache level storing encoded payloads."""
+        if isinstance(self.cache, TieredCache) and self.cache.is_decoding:
+            return self.cache.remote
+        return self.cache
+
+    def _drop_decoded(self, keys: list[str]) -> None:
+        """Drop decoded values overwritten through the payload cache."""
+        if self._payload_cache is not self.cache:
+            for key in keys:
+                self.cache.local.delete(key)
+
     def _get_namespace(self, namespace: str | None = None) -> str | None:
         """Get effective namespace.
 
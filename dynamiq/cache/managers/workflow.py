@@ -2,8 +2,8 @@ import hashlib
 from typing import Any
 
 from dynamiq.cache.config import CacheConfig
+from dynamiq.cache.hashing import canonical_hash
 from dynamiq.cache.managers import CacheManager
-from dynamiq.utils import format_value
 
 
 class WorkflowCacheManager(CacheManager):
@@ -76,6 +76,9 @@ class WorkflowCacheManager(CacheManager):
     def get_key(self, entity_id: str, input_data: dict, **kwargs) -> str:
         """Generate cache key for entity.
 
+        Inputs are hashed with a canonical encoding, so keys do not depend on dict key order
+        or on the cache value codec.
+
         Args:
             entity_id (str): Entity identifier.
             input_data (dict): Input data for the entity.
@@ -84,11 +87,7 @@ class WorkflowCacheManager(CacheManager):
         Returns:
             str: Generated cache key.
         """
-        input_data_formatted = format_value(self._sort_dict(input_data))[0]
-        input_data_hash = self.hash(self.serializer.dumps(input_data_formatted))
-        kwargs_formatted = format_value(self._sort_dict(kwargs))[0]
-        kwargs_hash = self.hash(self.serializer.dumps(kwargs_formatted))
-        return f"{entity_id}:{input_data_hash}:{kwargs_hash}"
+        return f"{entity_id}:{canonical_hash(input_data)}:{canonical_hash(kwargs)}"
 
     @staticmethod
     def hash(data: str) -> str:
@@ -101,14 +100,3 @@ class WorkflowCacheManager(CacheManager):
             str: SHA-256 hash.
         """
         return hashlib.sha256(data.encode()).hexdigest()
-
-    def _sort_dict(self, d: dict) -> dict:
-        """Recursively sort dictionary keys, including nested dictionaries.
-
-        Args:
-            d (dict): Dictionary to sort.
-
-        Returns:
-            dict: Sorted dictionary.
-        """
-        return {k: self._sort_dict(v) if isinstance(v, dict) else v for k, v in sorted(d.items())}
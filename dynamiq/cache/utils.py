@@ -1,3 +1,5 @@
+import asyncio
+import inspect
 from functools import wraps
 from typing import Any, Callable
 
@@ -13,6 +15,7 @@ FUNC_KWARGS_TO_REMOVE = (
     "run_id",
     "parent_run_id",
     "wf_run_id",
+    "content_handler",
 )
 
 
@@ -44,6 +47,50 @@ def cache_wf_entity(
         Returns:
             Callable: Wrapped function.
         """
+        def get_cache_params(args: tuple, kwargs: dict) -> tuple[dict, dict]:
+            input_data = kwargs.pop("input_data", args[0] if args else {})
+            input_data = dict(input_data) if isinstance(input_data, BaseModel) else input_data
+            cleaned_kwargs = {k: v for k, v in kwargs.items() if k not in func_kwargs_to_remove}
+            return input_data, cleaned_kwargs
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> tuple[Any, bool]:
+                """Async wrapper function to handle caching. Cache backend calls run in a worker thread.
+
+                Args:
+                    *args (Any): Positional arguments.
+                    **kwargs (Any): Keyword arguments.
+
+                Returns:
+                    tuple[Any, bool]: Function output and cache status.
+                """
+                cache_manager = None
+                input_data, cleaned_kwargs = get_cache_params(args, kwargs)
+                if cache_enabled and cache_config:
+                    logger.debug(f"Entity_id {entity_id}: cache used")
+                    cache_manager = cache_manager_cls.get_shared(cache_config)
+                    if output := await asyncio.to_thread(
+                        cache_manager.get_entity_output, entity_id=entity_id, input_data=input_data, **cleaned_kwargs
+                    ):
+                        return output, True
+
+                output = await func(*args, **kwargs)
+
+                if cache_manager:
+                    await asyncio.to_thread(
+                        cache_manager.set_entity_output,
+                        entity_id=entity_id,
+                        input_data=input_data,
+                        output_data=output,
+                        **cleaned_kwargs,
+                    )
+
+                return output, False
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> tuple[Any, bool]:
             """Wrapper function to handle caching.
@@ -57,13 +104,10 @@ def cache_wf_entity(
             """
             cache_manager = None
             from_cache = False
-            input_data = kwargs.pop("input_data", args[0] if args else {})
-            input_data = dict(input_data) if isinstance(input_data, BaseModel) else input_data
-
-            cleaned_kwargs = {k: v for k, v in kwargs.items() if k not in func_kwargs_to_remove}
+            input_data, cleaned_kwargs = get_cache_params(args, kwargs)
             if cache_enabled and cache_config:
                 logger.debug(f"Entity_id {entity_id}: cache used")
-                cache_manager = cache_manager_cls(config=cache_config)
+                cache_manager = cache_manager_cls.get_shared(cache_config)
                 if output := cache_manager.get_entity_output(
                     entity_id=entity_id, input_data=input_data, **cleaned_kwargs
                 ):
@@ -1,3 +1,3 @@
-from .base import BaseCallbackHandler, NodeCallbackHandler
+from .base import BaseCallbackHandler, NodeCallbackEvent, NodeCallbackHandler
 from .streaming import AsyncStreamingIteratorCallbackHandler, StreamingQueueCallbackHandler
 from .tracing import TracingCallbackHandler
@@ -1,10 +1,49 @@
 from abc import ABC
-from typing import Any
+from enum import Enum
+from functools import lru_cache
+from typing import Any, ClassVar
 from uuid import UUID
 
 
+class NodeCallbackEvent(str, Enum):
+    """Node callback events named after the handler hooks."""
+
+    NODE_START = "on_node_start"
+    NODE_END = "on_node_end"
+    NODE_ERROR = "on_node_error"
+    NODE_SKIP = "on_node_skip"
+    NODE_EXECUTE_START = "on_node_execute_start"
+    NODE_EXECUTE_END = "on_node_execute_end"
+    NODE_EXECUTE_ERROR = "on_node_execute_error"
+    NODE_EXECUTE_RUN = "on_node_execute_run"
+    NODE_EXECUTE_STREAM = "on_node_execute_stream"
+
+
 class NodeCallbackHandler(ABC):
-    """Abstract class for node callback handlers."""
+    """Abstract class for node callback handlers.
+
+    Nodes dispatch only the events a handler needs. By default these are the hooks the handler
+    overrides. Set `handled_events` to declare them explicitly.
+
+    Attributes:
+        handled_events (set[NodeCallbackEvent] | None): Node events dispatched to the handler.
+            If None, events are detected from the overridden hooks.
+    """
+
+    handled_events: ClassVar[set[NodeCallbackEvent] | None] = None
+
+    def handles_event(self, event: NodeCallbackEvent) -> bool:
+        """Check whether the node event should be dispatched to the handler.
+
+        Args:
+            event (NodeCallbackEvent): Node callback event.
+
+        Returns:
+            bool: True if the handler needs the event.
+        """
+        if self.handled_events is not None:
+            return event in self.handled_events
+        return event in get_overridden_events(type(self))
 
     def on_node_start(self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any):
         """Called when the node starts.
@@ -175,6 +214,23 @@ class BaseCallbackHandler(NodeCallbackHandler, ABC):
         pass
 
 
+@lru_cache(maxsize=None)
+def get_overridden_events(handler_cls: type[NodeCallbackHandler]) -> frozenset[NodeCallbackEvent]:
+    """Get node events whose hooks are overridden by the handler class.
+
+    Args:
+        handler_cls (type[NodeCallbackHandler]): Callback handler class.
+
+    Returns:
+        frozenset[NodeCallbackEvent]: Events with overridden hooks.
+    """
+    return frozenset(
+        event
+        for event in NodeCallbackEvent
+        if getattr(handler_cls, event.value, None) is not getattr(NodeCallbackHandler, event.value)
+    )
+
+
 def get_entity_id(entity_name: str, kwargs: dict) -> UUID:
     """Retrieve entity ID from kwargs.
 
@@ -1,36 +1,94 @@
 import asyncio
 import threading
-from queue import Queue
+import time
+from queue import Full, Queue
 from typing import Any, AsyncIterator, Iterator
 
 from dynamiq.callbacks import BaseCallbackHandler
 from dynamiq.callbacks.base import get_run_id
-from dynamiq.types.streaming import StreamingEventMessage
+from dynamiq.types.streaming import StreamingEventMessage, StreamingOverflowPolicy
 from dynamiq.utils import format_value
 from dynamiq.utils.logger import logger
 
 
+def merge_stream_chunks(previous: Any, current: Any) -> dict | None:
+    """Merge two text chunks of a stream into one chunk.
+
+    The merged chunk is the current chunk with the content of both chunks. Chunks with tool calls or
+    from different agent steps are not merged.
+
+    Args:
+        previous (Any): Earlier chunk data.
+        current (Any): Later chunk data.
+
+    Returns:
+        dict | None: Merged chunk data, or None if the chunks can not be merged.
+    """
+    try:
+        if len(previous["choices"]) != 1 or len(current["choices"]) != 1:
+            return None
+        previous_delta = previous["choices"][0]["delta"]
+        current_delta = current["choices"][0]["delta"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+    if not isinstance(previous_delta.get("content"), str) or not isinstance(current_delta.get("content"), str):
+        return None
+    if any(previous_delta.get(key) or current_delta.get(key) for key in ("tool_calls", "function_call")):
+        return None
+    if any(previous_delta.get(key) != current_delta.get(key) for key in ("source", "step")):
+        return None
+
+    delta = {**current_delta, "content": previous_delta["content"] + current_delta["content"]}
+    if "role" in delta:
+        delta["role"] = previous_delta.get("role") or current_delta.get("role")
+    return {**current, "choices": [{**current["choices"][0], "delta": delta}]}
+
+
 class StreamingQueueCallbackHandler(BaseCallbackHandler):
     """Callback handler for streaming events to a queue.
 
+    Node chunks are put to a bounded queue according to the overflow policy. Chunks of a stream can also be
+    coalesced by a time window to reduce the number of events. A held chunk is sent with the next chunk of
+    its stream or when the node finishes. Workflow output and custom events are never dropped or merged.
+
     Attributes:
         queue (asyncio.Queue | Queue | None): Queue for streaming events.
         done_event (asyncio.Event | threading.Event | None): Event to signal completion.
+        overflow_policy (StreamingOverflowPolicy): Behaviour when the queue is full.
+        block_timeout (float | None): Maximum time in seconds a chunk waits for a free queue slot. The chunk is
+            dropped after the timeout. Waits without limit if None.
+        coalesce_interval (float | None): Minimum time in seconds between events of a stream. Chunks arriving
+            earlier are merged into one event. Chunks are not merged by time if None.
+        dropped (int): Number of dropped events.
     """
 
     def __init__(
         self,
         queue: asyncio.Queue | Queue | None = None,
         done_event: asyncio.Event | threading.Event | None = None,
+        overflow_policy: StreamingOverflowPolicy = StreamingOverflowPolicy.BLOCK,
+        block_timeout: float | None = None,
+        coalesce_interval: float | None = None,
     ) -> None:
         """Initialize StreamingQueueCallbackHandler.
 
         Args:
             queue (asyncio.Queue | Queue | None): Queue for streaming events.
             done_event (asyncio.Event | threading.Event | None): Event to signal completion.
+            overflow_policy (StreamingOverflowPolicy): Behaviour when the queue is full.
+            block_timeout (float | None): Maximum time in seconds a chunk waits for a free queue slot.
+            coalesce_interval (float | None): Minimum time in seconds between events of a stream.
         """
         self.queue = queue
         self.done_event = done_event
+        self.overflow_policy = StreamingOverflowPolicy(overflow_policy)
+        self.block_timeout = block_timeout
+        self.coalesce_interval = coalesce_interval
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str | None, str], StreamingEventMessage] = {}
+        self._last_sent: dict[tuple[str | None, str], float] = {}
 
     def on_workflow_start(
         self, serialized: dict[str, Any], prompts: list[str], **kwargs: Any
@@ -54,14 +112,41 @@ class StreamingQueueCallbackHandler(BaseCallbackHandler):
             chunk (dict[str, Any] | None): Stream chunk data.
             **kwargs (Any): Additional arguments.
         """
-        event = kwargs.get("event") or StreamingEventMessage(
+        if event := kwargs.get("event"):
+            self.send_to_queue(event)
+            return
+
+        event = StreamingEventMessage(
             run_id=str(get_run_id(kwargs)),
             wf_run_id=kwargs.get("wf_run_id"),
             entity_id=serialized.get("id"),
             data=format_value(chunk)[0],
             event=serialized.get("streaming", {}).get("event"),
         )
-        self.send_to_queue(event)
+        if self.coalesce_interval is None and self.overflow_policy != StreamingOverflowPolicy.COALESCE:
+            self._put_chunk(event)
+        else:
+            self._coalesce(event)
+
+    def on_node_end(self, serialized: dict[str, Any], output_data: dict[str, Any], **kwargs: Any) -> None:
+        """Called when the node ends.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            output_data (dict[str, Any]): Output data from the node.
+            **kwargs (Any): Additional arguments.
+        """
+        self.flush(entity_id=serialized.get("id"))
+
+    def on_node_error(self, serialized: dict[str, Any], error: BaseException, **kwargs: Any) -> None:
+        """Called when the node errors.
+
+        Args:
+            serialized (dict[str, Any]): Serialized node data.
+            error (BaseException): Error encountered.
+            **kwargs (Any): Additional arguments.
+        """
+        self.flush(entity_id=serialized.get("id"))
 
     def on_workflow_end(
         self, serialized: dict[str, Any], output_data: dict[str, Any], **kwargs: Any
@@ -73,6 +158,7 @@ class StreamingQueueCallbackHandler(BaseCallbackHandler):
             output_data (dict[str, Any]): Output data from the workflow.
             **kwargs (Any): Additional arguments.
         """
+        self.flush()
         event = StreamingEventMessage(
             run_id=str(get_run_id(kwargs)),
             wf_run_id=kwargs.get("wf_run_id"),
@@ -93,11 +179,95 @@ class StreamingQueueCallbackHandler(BaseCallbackHandler):
             error (BaseException): Error encountered.
             **kwargs (Any): Additional arguments.
         """
+        self.flush()
         self.done_event.set()
 
+    def flush(self, entity_id: str | None = None) -> None:
+        """Send chunks held by coalescing.
+
+        Args:
+            entity_id (str | None): ID of the node to send chunks of. Chunks of all nodes are sent if None.
+        """
+        with self._lock:
+            keys = [key for key in self._pending.keys() | self._last_sent.keys() if entity_id in (None, key[0])]
+            events = [event for key in keys if (event := self._pending.pop(key, None)) is not None]
+            for key in keys:
+                self._last_sent.pop(key, None)
+
+        for event in events:
+            self._put_chunk(event)
+
     def send_to_queue(self, event: StreamingEventMessage):
-        """Send the event to the queue."""
-        self.queue.put_nowait(event)
+        """Send the event to the queue, waiting for a free slot of a bounded queue without a timeout."""
+        if not isinstance(self.queue, Queue):
+            self.queue.put_nowait(event)
+            return
+
+        self.queue.put(event)
+
+    def offer_to_queue(self, event: StreamingEventMessage) -> bool:
+        """Send the event to the queue if it has a free slot.
+
+        Args:
+            event (StreamingEventMessage): Event to send.
+
+        Returns:
+            bool: Whether the event was sent.
+        """
+        try:
+            self.queue.put_nowait(event)
+        except (Full, asyncio.QueueFull):
+            return False
+        return True
+
+    def _put_chunk(self, event: StreamingEventMessage) -> None:
+        if self.overflow_policy == StreamingOverflowPolicy.DROP_NEW:
+            if not self.offer_to_queue(event):
+                self._drop(event)
+        elif not isinstance(self.queue, Queue):
+            self.send_to_queue(event)
+        else:
+            # Only chunks wait for a slot with the timeout, workflow output and custom events wait without limit
+            try:
+                self.queue.put(event, timeout=self.block_timeout)
+            except Full:
+                self._drop(event)
+
+    def _coalesce(self, event: StreamingEventMessage) -> None:
+        key = (event.entity_id, event.run_id)
+        now = time.monotonic()
+        with self._lock:
+            pending = self._pending.pop(key, None)
+            last_sent = self._last_sent.get(key)
+
+        if pending is not None:
+            if (data := merge_stream_chunks(pending.data, event.data)) is not None:
+                event = event.model_copy(update={"data": data})
+            else:
+                self._put_chunk(pending)
+
+        hold = self.coalesce_interval is not None and last_sent is not None and now - last_sent < self.coalesce_interval
+        if not hold:
+            if self.overflow_policy == StreamingOverflowPolicy.COALESCE:
+                hold = not self.offer_to_queue(event)
+            else:
+                self._put_chunk(event)
+
+        with self._lock:
+            if hold:
+                self._pending[key] = event
+            else:
+                self._last_sent[key] = now
+
+    def _drop(self, event: StreamingEventMessage) -> None:
+        with self._lock:
+            self.dropped += 1
+            dropped = self.dropped
+        # Only the first drop is a warning, as a slow consumer drops many chunks in a row
+        if dropped == 1:
+            logger.warning(f"Streaming queue is full. Events of {event.entity_id} are dropped.")
+        else:
+            logger.debug(f"Streaming queue is full. Event of {event.entity_id} is dropped.")
 
 
 class StreamingIteratorCallbackHandler(StreamingQueueCallbackHandler):
@@ -107,18 +277,32 @@ class StreamingIteratorCallbackHandler(StreamingQueueCallbackHandler):
         self,
         queue: Queue | None = None,
         done_event: threading.Event | None = None,
+        max_queue_size: int = 0,
+        overflow_policy: StreamingOverflowPolicy = StreamingOverflowPolicy.BLOCK,
+        block_timeout: float | None = None,
+        coalesce_interval: float | None = None,
     ) -> None:
         """Initialize StreamingIteratorCallbackHandler.
 
         Args:
             queue (Queue | None): Queue for streaming events.
             done_event (threading.Event | None): Event to signal completion.
+            max_queue_size (int): Maximum size of the created queue. Unbounded if 0.
+            overflow_policy (StreamingOverflowPolicy): Behaviour when the queue is full.
+            block_timeout (float | None): Maximum time in seconds a chunk waits for a free queue slot.
+            coalesce_interval (float | None): Minimum time in seconds between events of a stream.
         """
         if queue is None:
-            queue = Queue()
+            queue = Queue(maxsize=max_queue_size)
         if done_event is None:
             done_event = threading.Event()
-        super().__init__(queue, done_event)
+        super().__init__(
+            queue,
+            done_event,
+            overflow_policy=overflow_policy,
+            block_timeout=block_timeout,
+            coalesce_interval=coalesce_interval,
+        )
         self._iterator = self._iter_queue_events()
 
     def _iter_queue_events(self) -> Iterator[StreamingEventMessage]:
@@ -159,19 +343,28 @@ class AsyncStreamingIteratorCallbackHandler(StreamingQueueCallbackHandler):
         queue: asyncio.Queue | None = None,
         done_event: asyncio.Event | None = None,
         loop: asyncio.AbstractEventLoop | None = None,
+        max_queue_size: int = 0,
+        overflow_policy: StreamingOverflowPolicy = StreamingOverflowPolicy.BLOCK,
+        coalesce_interval: float | None = None,
     ) -> None:
         """Initialize AsyncStreamingIteratorCallbackHandler.
 
+        Producers are not blocked by a full queue, as they may run in the event loop. Events wait for
+        a free slot in the loop with the block policy.
+
         Args:
             queue (asyncio.Queue | None): Queue for streaming events.
             done_event (asyncio.Event | None): Event to signal completion.
             loop (asyncio.AbstractEventLoop | None): Event loop.
+            max_queue_size (int): Maximum size of the created queue. Unbounded if 0.
+            overflow_policy (StreamingOverflowPolicy): Behaviour when the queue is full.
+            coalesce_interval (float | None): Minimum time in seconds between events of a stream.
         """
         if queue is None:
-            queue = asyncio.Queue()
+            queue = asyncio.Queue(maxsize=max_queue_size)
         if done_event is None:
             done_event = asyncio.Event()
-        super().__init__(queue, done_event)
+        super().__init__(queue, done_event, overflow_policy=overflow_policy, coalesce_interval=coalesce_interval)
         self._iterator = self._iter_queue_events()
         self.loop = loop or asyncio.get_event_loop()
 
@@ -179,6 +372,22 @@ class AsyncStreamingIteratorCallbackHandler(StreamingQueueCallbackHandler):
         """Send the event to the queue."""
         asyncio.run_coroutine_threadsafe(self.queue.put(event), self.loop)
 
+    def offer_to_queue(self, event: StreamingEventMessage) -> bool:
+        """Send the event to the queue if it has a free slot.
+
+        The queue size is checked outside the event loop, so a few events may still wait for a slot.
+
+        Args:
+            event (StreamingEventMessage): Event to send.
+
+        Returns:
+            bool: Whether the event was sent.
+        """
+        if self.queue.full():
+            return False
+        self.send_to_queue(event)
+        return True
+
     async def _iter_queue_events(self) -> AsyncIterator[StreamingEventMessage]:
         """Async iterate over queue events.
 
@@ -1,6 +1,6 @@
 import json
 import traceback
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from enum import Enum
 from functools import cached_property
@@ -58,10 +58,12 @@ class ExecutionRun:
     def to_dict(self) -> dict:
         """Convert ExecutionRun to dictionary.
 
+        Nested values are shared with the execution run instead of being deep-copied.
+
         Returns:
             dict: Dictionary representation of ExecutionRun.
         """
-        return asdict(self)
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 @dataclass
@@ -106,10 +108,14 @@ class Run:
     def to_dict(self) -> dict:
         """Convert Run to dictionary.
 
+        Nested values are shared with the run instead of being deep-copied.
+
         Returns:
             dict: Dictionary representation of Run.
         """
-        return asdict(self)
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["executions"] = [execution.to_dict() for execution in self.executions]
+        return data
 
     def to_json(self) -> str:
         """Convert Run to JSON string.
@@ -131,6 +137,9 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
         runs (dict[UUID, Run]): Dictionary of runs.
         tags (list[str]): List of tags.
         installed_pkgs (list[str]): List of installed packages.
+        export_completed_runs (bool): Whether completed runs are sent to the client as soon as they finish
+            and removed from runs. Keeps memory bounded in long-lived services, best used with
+            a BatchTracingClient. By default all runs are kept and sent when the workflow ends.
     """
     source_id: str | None = Field(default_factory=generate_uuid)
     trace_id: str | None = Field(default_factory=generate_uuid)
@@ -139,6 +148,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
     runs: dict[UUID, Run] = {}
     tags: list[str] = []
     metadata: dict = {}
+    export_completed_runs: bool = False
 
     installed_pkgs: list[str] = Field(
         ["dynamiq"],
@@ -177,12 +187,15 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
 
         from dynamiq.nodes import NodeGroup
 
+        # Serialized node is shared between handlers and events of the run, so it is copied before changes
+        serialized = dict(serialized)
+
         # Handle runtime LLM prompt override
         if serialized.get("group") == NodeGroup.LLMS:
             prompt = kwargs.get("prompt") or serialized.get("prompt")
             if isinstance(prompt, BaseModel):
                 prompt = prompt.model_dump()
-            serialized["prompt"] = prompt
+            serialized["prompt"] = dict(prompt) if isinstance(prompt, dict) else prompt
 
         truncate_metadata = {}
         formatted_input, truncate_metadata.setdefault("truncated", {})["input"] = format_value(
@@ -260,7 +273,9 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
         )
         run.status = RunStatus.SUCCEEDED
 
-        self.flush()
+        self._complete_run(run.id)
+        if not self.export_completed_runs:
+            self.flush()
 
     def on_workflow_error(
         self, serialized: dict[str, Any], error: BaseException, **kwargs: Any
@@ -279,6 +294,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             "message": str(error),
             "traceback": traceback.format_exc(),
         }
+        self._complete_run(run.id)
 
     def on_flow_start(
         self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any
@@ -327,6 +343,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             output_data, truncate_enabled=True
         )
         run.status = RunStatus.SUCCEEDED
+        self._complete_run(run.id)
 
     def on_flow_error(
         self, serialized: dict[str, Any], error: BaseException, **kwargs: Any
@@ -345,6 +362,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             "message": str(error),
             "traceback": traceback.format_exc(),
         }
+        self._complete_run(run.id)
 
     def on_node_start(
         self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any
@@ -378,6 +396,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
         )
         run.status = RunStatus.SUCCEEDED
         run.metadata["is_output_from_cache"] = kwargs.get("is_output_from_cache", False)
+        self._complete_run(run.id)
 
     def on_node_error(
         self, serialized: dict[str, Any], error: BaseException, **kwargs: Any
@@ -400,6 +419,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
             "message": str(error),
             "traceback": traceback.format_exc(),
         }
+        self._complete_run(run.id)
 
     def on_node_skip(
         self,
@@ -425,6 +445,7 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
         run.end_time = run.start_time
         run.status = RunStatus.SKIPPED
         run.metadata["skip"] = format_value(skip_data)[0]
+        self._complete_run(run.id)
 
     def on_node_execute_start(
         self, serialized: dict[str, Any], input_data: dict[str, Any], **kwargs: Any
@@ -501,10 +522,21 @@ class TracingCallbackHandler(BaseModel, BaseCallbackHandler):
         if prompt_messages := kwargs.get("prompt_messages"):
             run.metadata["node"]["prompt"]["messages"] = prompt_messages
 
+    def _complete_run(self, run_id: UUID):
+        """Send the completed run to the client and remove it from runs if runs are exported on completion.
+
+        Args:
+            run_id (UUID): Run ID.
+        """
+        if self.export_completed_runs and self.client and (run := self.runs.pop(run_id, None)):
+            self.client.trace([run])
+
     def flush(self):
         """Flush the runs to the tracing client."""
         if self.client:
             self.client.trace([run for run in self.runs.values()])
+            if self.export_completed_runs:
+                self.runs.clear()
 
 
 def ensure_run(run_id: UUID, runs: dict[UUID, Run]) -> Run:
@@ -1 +1,3 @@
 from .base import BaseTracingClient
+from .batch import BatchTracingClient, BatchTracingClientStats, OverflowPolicy
+from .file import FileTracingClient
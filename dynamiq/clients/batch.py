@@ -0,0 +1,234 @@
+import atexit
+import queue
+import threading
+import time
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from dynamiq.clients.base import BaseTracingClient
+from dynamiq.utils.logger import logger
+
+if TYPE_CHECKING:
+    from dynamiq.callbacks.tracing import Run
+
+
+class OverflowPolicy(str, Enum):
+    """Behaviour of the batch tracing client when its queue is full."""
+
+    BLOCK = "block"
+    DROP_NEW = "drop_new"
+    DROP_OLDEST = "drop_oldest"
+
+
+class BatchTracingClientStats(BaseModel):
+    """
+    Snapshot of batch tracing client counters.
+
+    Attributes:
+        queued (int): Number of runs waiting for export.
+        exported (int): Number of runs sent to the client.
+        failed (int): Number of runs in batches the client failed to send.
+        dropped (int): Number of runs dropped because the queue was full.
+    """
+
+    queued: int
+    exported: int
+    failed: int
+    dropped: int
+
+
+class BatchTracingClient(BaseTracingClient):
+    """
+    Tracing client that exports runs in batches from a background thread.
+
+    Runs are put to a bounded queue and returned immediately. The worker thread sends them to the wrapped
+    client when a batch is full or after the flush interval. When the queue is full, the overflow policy
+    decides whether tracing blocks or drops runs.
+
+    Attributes:
+        client (BaseTracingClient): Client that sends batches of runs.
+        max_queue_size (int): Maximum number of queued runs.
+        max_batch_size (int): Maximum number of runs in a batch.
+        flush_interval (float): Maximum time in seconds a queued run waits for export.
+        overflow_policy (OverflowPolicy): Behaviour when the queue is full.
+        block_timeout (float | None): Maximum time in seconds to wait for a queue slot with the block policy.
+            The run is dropped after the timeout. Waits without limit if None.
+    """
+
+    def __init__(
+        self,
+        client: BaseTracingClient,
+        max_queue_size: int = 2048,
+        max_batch_size: int = 128,
+        flush_interval: float = 5.0,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEW,
+        block_timeout: float | None = None,
+    ):
+        if max_queue_size < 1 or max_batch_size < 1:
+            raise ValueError("max_queue_size and max_batch_size must be positive.")
+
+        self.client = client
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = OverflowPolicy(overflow_policy)
+        self.block_timeout = block_timeout
+
+        self._queue: queue.Queue["Run"] = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._wakeup = threading.Event()
+        self._pending = 0
+        self._exported = 0
+        self._failed = 0
+        self._dropped = 0
+        self._worker: threading.Thread | None = None
+        self._is_shutdown = False
+
+    def trace(self, runs: list["Run"]) -> None:
+        """Queue runs for export.
+
+        Args:
+            runs (list[Run]): Runs to export.
+        """
+        if self._is_shutdown:
+            logger.warning(f"BatchTracingClient is shut down. {len(runs)} runs are dropped.")
+            return
+
+        self._ensure_worker()
+        for run in runs:
+            self._put(run)
+
+        if self._queue.qsize() >= self.max_batch_size:
+            self._wakeup.set()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Export all queued runs and wait until they are sent.
+
+        Args:
+            timeout (float | None): Maximum time to wait in seconds. Waits without limit if None.
+
+        Returns:
+            bool: True if all queued runs were processed before the timeout.
+        """
+        self._wakeup.set()
+        with self._done:
+            return self._done.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Export queued runs and stop the worker thread.
+
+        Args:
+            timeout (float | None): Maximum time to wait in seconds. Waits without limit if None.
+        """
+        if self._is_shutdown:
+            return
+        self._is_shutdown = True
+        if self._worker is None:
+            return
+
+        self._wakeup.set()
+        self._worker.join(timeout=timeout)
+        atexit.unregister(self.shutdown)
+
+    def get_stats(self) -> BatchTracingClientStats:
+        """
+        Get a snapshot of export counters.
+
+        Returns:
+            BatchTracingClientStats: Current export counters.
+        """
+        with self._lock:
+            return BatchTracingClientStats(
+                queued=self._pending,
+                exported=self._exported,
+                failed=self._failed,
+                dropped=self._dropped,
+            )
+
+    def _ensure_worker(self) -> None:
+        # The worker is started lazily, so clients created before a fork still export in child processes
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name="dynamiq-tracing-exporter", daemon=True)
+            self._worker.start()
+        atexit.register(self.shutdown)
+
+    def _put(self, run: "Run") -> None:
+        with self._lock:
+            self._pending += 1
+
+        try:
+            if self.overflow_policy == OverflowPolicy.BLOCK:
+                self._queue.put(run, timeout=self.block_timeout)
+                return
+
+            try:
+                self._queue.put_nowait(run)
+                return
+            except queue.Full:
+                if self.overflow_policy == OverflowPolicy.DROP_NEW:
+                    raise
+
+            self._drop(self._queue.get_nowait())
+            self._queue.put_nowait(run)
+        except (queue.Full, queue.Empty):
+            self._drop(run)
+
+    def _drop(self, run: "Run") -> None:
+        with self._done:
+            self._pending -= 1
+            self._dropped += 1
+            self._done.notify_all()
+        logger.warning(f"Tracing queue is full. Run {run.id} is dropped.")
+
+    def _run(self) -> None:
+        while True:
+            batch = self._get_batch()
+            if batch:
+                self._export(batch)
+            elif self._is_shutdown:
+                return
+
+    def _get_batch(self) -> list["Run"]:
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except queue.Empty:
+                pass
+
+            # Flush and shutdown requests export the drained queue without waiting for the interval
+            if self._wakeup.is_set() or self._is_shutdown:
+                self._wakeup.clear()
+                break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._wakeup.wait(timeout=remaining)
+
+        return batch
+
+    def _export(self, batch: list["Run"]) -> None:
+        try:
+            self.client.trace(batch)
+            failed = False
+        except Exception as e:
+            logger.error(f"Failed to export {len(batch)} tracing runs: {e}")
+            failed = True
+
+        with self._done:
+            self._pending -= len(batch)
+            if failed:
+                self._failed += len(batch)
+            else:
+                self._exported += len(batch)
+            self._done.notify_all()
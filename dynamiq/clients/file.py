@@ -0,0 +1,41 @@
+import sys
+import threading
+from typing import TYPE_CHECKING, TextIO
+
+from dynamiq.clients.base import BaseTracingClient
+
+if TYPE_CHECKING:
+    from dynamiq.callbacks.tracing import Run
+
+
+class FileTracingClient(BaseTracingClient):
+    """
+    Tracing client that writes runs as JSON lines to a local file or stdout.
+
+    Attributes:
+        path (str | None): Path of the file runs are appended to. Runs are written to stdout if None.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def trace(self, runs: list["Run"]) -> None:
+        """Write runs as JSON lines.
+
+        Args:
+            runs (list[Run]): Runs to write.
+        """
+        lines = "".join(f"{run.to_json()}\n" for run in runs)
+        with self._lock:
+            if self.path is None:
+                self._write(sys.stdout, lines)
+                return
+
+            with open(self.path, "a", encoding="utf-8") as f:
+                self._write(f, lines)
+
+    @staticmethod
+    def _write(stream: TextIO, lines: str) -> None:
+        stream.write(lines)
+        stream.flush()
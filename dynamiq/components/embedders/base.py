@@ -1,9 +1,31 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable
 
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr
 
+from dynamiq.cache.config import EmbeddingCacheConfig
+from dynamiq.cache.embeddings import EmbeddingCache
 from dynamiq.connections import BaseConnection
 from dynamiq.types import Document
+from dynamiq.utils.logger import logger
+from dynamiq.utils.utils import get_retry_delay, is_rate_limit_error
+
+# Rough number of characters in a token, used to pack batches without a model tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a text.
+
+    Args:
+        text (str): Text to estimate.
+
+    Returns:
+        int: Approximate number of tokens.
+    """
+    return len(text) // CHARS_PER_TOKEN + 1
 
 
 class BaseEmbedder(BaseModel):
@@ -30,6 +52,14 @@ class BaseEmbedder(BaseModel):
             "search_document", "search_query", "classification" and "clustering".
         dimensions(int):he number of dimensions the resulting output embeddings should have.
             Only supported in OpenAI/Azure text-embedding-3 and later models.
+        max_batch_tokens (int | None): The approximate maximum number of tokens in a single batch. Batches are
+            packed by the number of documents only if None.
+        max_concurrent_batches (int): The maximum number of batches embedded at the same time.
+        max_retries (int): The number of retries of a batch rejected by the provider rate limit.
+        retry_delay (float): The initial delay in seconds before retrying a rate limited batch. The delay doubles
+            with every retry unless the provider sets the Retry-After header.
+        embedding_cache (EmbeddingCacheConfig | None): The cache of text embeddings. Only texts missing in the
+            cache are sent to the provider. Embeddings are not cached if None.
 
     """
     model: str
@@ -43,15 +73,25 @@ class BaseEmbedder(BaseModel):
     input_type: str | None = None
     dimensions: int | None = None
     client: Any | None = None
+    max_batch_tokens: int | None = Field(default=None, ge=1)
+    max_concurrent_batches: int = Field(default=4, ge=1)
+    max_retries: int = Field(default=3, ge=0)
+    retry_delay: float = Field(default=1.0, ge=0)
+    embedding_cache: EmbeddingCacheConfig | None = None
 
     _embedding: Callable = PrivateAttr()
+    _aembedding: Callable = PrivateAttr()
+    _cache: EmbeddingCache | None = PrivateAttr(default=None)
 
     def __init__(self, *args, **kwargs):
         # Import in runtime to save memory
         super().__init__(**kwargs)
-        from litellm import embedding
+        from litellm import aembedding, embedding
 
         self._embedding = embedding
+        self._aembedding = aembedding
+        if self.embedding_cache is not None:
+            self._cache = EmbeddingCache.get_shared(self.embedding_cache)
 
     @property
     def embed_params(self) -> dict:
@@ -60,6 +100,25 @@ class BaseEmbedder(BaseModel):
             params = {"client": self.client}
         return params
 
+    @property
+    def aembed_params(self) -> dict:
+        """Embedding params for async calls. Initialized sync clients are replaced with connection params."""
+        params = self.embed_params
+        if params.pop("client", None) is not None:
+            params = self.connection.conn_params | params
+        return params
+
+    def _prepare_text_to_embed(self, text: str) -> str:
+        if not isinstance(text, str):
+            msg = (
+                "TextEmbedder expects a string as input."
+                "In case you want to embed a list of Documents, please use the DocumentEmbedder."
+            )
+            raise TypeError(msg)
+
+        text_to_embed = self.prefix + text + self.suffix
+        return text_to_embed.replace("\n", " ")
+
     def embed_text(self, text: str) -> dict:
         """
         Embeds a single string using the Embedder model specified during the initialization of the component.
@@ -72,15 +131,10 @@ class BaseEmbedder(BaseModel):
                 - 'embedding': A list representing the embedding vector of the input text.
                 - 'meta': A dictionary with metadata information about the model usage.
         """
-        if not isinstance(text, str):
-            msg = (
-                "TextEmbedder expects a string as input."
-                "In case you want to embed a list of Documents, please use the DocumentEmbedder."
-            )
-            raise TypeError(msg)
-
-        text_to_embed = self.prefix + text + self.suffix
-        text_to_embed = text_to_embed.replace("\n", " ")
+        text_to_embed = self._prepare_text_to_embed(text)
+        if self._cache is not None:
+            embeddings, meta = self._embed_texts_batch(texts_to_embed=[text_to_embed], batch_size=1)
+            return {"embedding": embeddings[0], "meta": meta}
 
         response = self._embedding(
             model=self.model, input=[text_to_embed], **self.embed_params
@@ -90,6 +144,31 @@ class BaseEmbedder(BaseModel):
 
         return {"embedding": response.data[0]["embedding"], "meta": meta}
 
+    async def aembed_text(self, text: str) -> dict:
+        """
+        Asynchronously embeds a single string using the Embedder model.
+
+        Args:
+            text (str): The text string to be embedded.
+
+        Returns:
+            dict: A dictionary containing:
+                - 'embedding': A list representing the embedding vector of the input text.
+                - 'meta': A dictionary with metadata information about the model usage.
+        """
+        text_to_embed = self._prepare_text_to_embed(text)
+        if self._cache is not None:
+            embeddings, meta = await self._aembed_texts_batch(texts_to_embed=[text_to_embed], batch_size=1)
+            return {"embedding": embeddings[0], "meta": meta}
+
+        response = await self._aembedding(
+            model=self.model, input=[text_to_embed], **self.aembed_params
+        )
+
+        meta = {"model": response.model, "usage": dict(response.usage)}
+
+        return {"embedding": response.data[0]["embedding"], "meta": meta}
+
     def _prepare_documents_to_embed(self, documents: list[Document]) -> list[str]:
         """
         Prepare the texts to embed by concatenating the Document text with the metadata fields to embed.
@@ -114,43 +193,199 @@ class BaseEmbedder(BaseModel):
             texts_to_embed.append(text_to_embed)
         return texts_to_embed
 
+    def _split_into_batches(self, texts_to_embed: list[str], batch_size: int) -> list[list[str]]:
+        """
+        Split texts into batches of at most `batch_size` texts and about `max_batch_tokens` tokens.
+        A text longer than `max_batch_tokens` gets a batch of its own.
+        """
+        if self.max_batch_tokens is None:
+            return [texts_to_embed[i : i + batch_size] for i in range(0, len(texts_to_embed), batch_size)]
+
+        batches = []
+        batch: list[str] = []
+        batch_tokens = 0
+        for text in texts_to_embed:
+            text_tokens = estimate_tokens(text)
+            if batch and (len(batch) >= batch_size or batch_tokens + text_tokens > self.max_batch_tokens):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += text_tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _embed_batch(self, batch: list[str], embed_params: dict) -> Any:
+        """
+        Embed a batch of texts, retrying if the provider rate limit is exceeded.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._embedding(model=self.model, input=batch, **embed_params)
+            except Exception as e:
+                if attempt == self.max_retries or not is_rate_limit_error(e):
+                    raise
+                delay = get_retry_delay(e, attempt, self.retry_delay)
+                logger.warning(f"Embedding rate limit exceeded, retrying batch in {delay:.2f}s. Error: {e}")
+                time.sleep(delay)
+
+    async def _aembed_batch(self, batch: list[str], embed_params: dict) -> Any:
+        """
+        Asynchronously embed a batch of texts, retrying if the provider rate limit is exceeded.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self._aembedding(model=self.model, input=batch, **embed_params)
+            except Exception as e:
+                if attempt == self.max_retries or not is_rate_limit_error(e):
+                    raise
+                delay = get_retry_delay(e, attempt, self.retry_delay)
+                logger.warning(f"Embedding rate limit exceeded, retrying batch in {delay:.2f}s. Error: {e}")
+                await asyncio.sleep(delay)
+
+    def _merge_batch_responses(self, responses: list[Any]) -> tuple[list[list[float]], dict[str, Any]]:
+        all_embeddings = []
+        meta: dict[str, Any] = {}
+        for response in responses:
+            all_embeddings.extend(el["embedding"] for el in response.data)
+            self._update_batch_meta(meta, response)
+        return all_embeddings, meta
+
+    def _get_cache_keys(self, texts: list[str]) -> list[str]:
+        return self._cache.get_keys(
+            texts, model=self.model, dimensions=self.dimensions, input_type=self.input_type, truncate=self.truncate
+        )
+
+    @staticmethod
+    def _get_missed_texts(texts: list[str], keys: list[str], cached: list[list[float] | None]) -> dict[str, str]:
+        """Texts missing in the cache by cache key. Repeated texts are embedded once."""
+        return {key: text for text, key, embedding in zip(texts, keys, cached) if embedding is None}
+
+    def _merge_cached_embeddings(
+        self,
+        keys: list[str],
+        cached: list[list[float] | None],
+        embedded: dict[str, list[float]],
+        meta: dict[str, Any],
+    ) -> tuple[list[list[float]], dict[str, Any]]:
+        embeddings = [embedding if embedding is not None else embedded[key] for key, embedding in zip(keys, cached)]
+        if not meta:
+            meta = {"model": self.model, "usage": {"prompt_tokens": 0, "total_tokens": 0}}
+        meta["cache_hits"] = sum(embedding is not None for embedding in cached)
+        return embeddings, meta
+
     def _embed_texts_batch(
         self, texts_to_embed: list[str], batch_size: int
     ) -> tuple[list[list[float]], dict[str, Any]]:
         """
-        Embed a list of texts in batches.
+        Embed a list of texts in batches, sending only texts missing in the cache to the provider.
         """
-        all_embeddings = []
-        meta: dict[str, Any] = {}
-        embed_params = self.embed_params
-        for i in range(0, len(texts_to_embed), batch_size):
-            batch = texts_to_embed[i : i + batch_size]
-            response = self._embedding(model=self.model, input=batch, **embed_params)
-            embeddings = [el["embedding"] for el in response.data]
-            all_embeddings.extend(embeddings)
-
-            if "model" not in meta:
-                meta["model"] = response.model
-            if "usage" not in meta:
-                meta["usage"] = dict(response.usage)
+        if self._cache is None:
+            return self._embed_uncached_texts_batch(texts_to_embed, batch_size)
+
+        keys = self._get_cache_keys(texts_to_embed)
+        cached = self._cache.get_many(keys)
+        missed = self._get_missed_texts(texts_to_embed, keys, cached)
+        embedded, meta = {}, {}
+        if missed:
+            embeddings, meta = self._embed_uncached_texts_batch(list(missed.values()), batch_size)
+            embedded = dict(zip(missed, embeddings))
+            self._cache.set_many(embedded)
+
+        return self._merge_cached_embeddings(keys, cached, embedded, meta)
+
+    async def _aembed_texts_batch(
+        self, texts_to_embed: list[str], batch_size: int
+    ) -> tuple[list[list[float]], dict[str, Any]]:
+        """
+        Asynchronously embed a list of texts in batches, sending only texts missing in the cache to the provider.
+
+        Lookups in a persistent cache run in a worker thread to keep the event loop responsive.
+        """
+        if self._cache is None:
+            return await self._aembed_uncached_texts_batch(texts_to_embed, batch_size)
+
+        keys = self._get_cache_keys(texts_to_embed)
+        if self._cache.is_local:
+            cached = self._cache.get_many(keys)
+        else:
+            cached = await asyncio.to_thread(self._cache.get_many, keys)
+        missed = self._get_missed_texts(texts_to_embed, keys, cached)
+        embedded, meta = {}, {}
+        if missed:
+            embeddings, meta = await self._aembed_uncached_texts_batch(list(missed.values()), batch_size)
+            embedded = dict(zip(missed, embeddings))
+            if self._cache.is_local:
+                self._cache.set_many(embedded)
             else:
-                meta["usage"]["prompt_tokens"] += response.usage.prompt_tokens
-                meta["usage"]["total_tokens"] += response.usage.total_tokens
+                await asyncio.to_thread(self._cache.set_many, embedded)
 
-        return all_embeddings, meta
+        return self._merge_cached_embeddings(keys, cached, embedded, meta)
 
-    def embed_documents(self, documents: list[Document]) -> dict:
+    def _embed_uncached_texts_batch(
+        self, texts_to_embed: list[str], batch_size: int
+    ) -> tuple[list[list[float]], dict[str, Any]]:
         """
-        Embeds a list of documents and returns the embedded documents along with meta information.
+        Embed a list of texts in batches.
 
-        Args:
-            documents (list[Document]): The documents to be embedded.
+        Up to `max_concurrent_batches` batches are sent at the same time. Embeddings are returned in the order
+        of the texts.
+        """
+        batches = self._split_into_batches(texts_to_embed, batch_size)
+        embed_params = self.embed_params
+        max_workers = min(self.max_concurrent_batches, len(batches))
+        if max_workers <= 1:
+            responses = [self._embed_batch(batch, embed_params) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dynamiq-embedder") as executor:
+                futures = [executor.submit(self._embed_batch, batch, embed_params) for batch in batches]
+                try:
+                    responses = [future.result() for future in futures]
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        return self._merge_batch_responses(responses)
+
+    async def _aembed_uncached_texts_batch(
+        self, texts_to_embed: list[str], batch_size: int
+    ) -> tuple[list[list[float]], dict[str, Any]]:
+        """
+        Asynchronously embed a list of texts in batches.
 
-        Returns:
-            dict: A dictionary containing:
-                - 'documents' (list[Document]): The input documents with their embeddings populated.
-                - 'meta' (dict): Metadata information about the embedding process.
+        Up to `max_concurrent_batches` batches are sent at the same time. Embeddings are returned in the order
+        of the texts.
         """
+        batches = self._split_into_batches(texts_to_embed, batch_size)
+        embed_params = self.aembed_params
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+
+        async def embed_batch(batch: list[str]) -> Any:
+            async with semaphore:
+                return await self._aembed_batch(batch, embed_params)
+
+        tasks = [asyncio.ensure_future(embed_batch(batch)) for batch in batches]
+        try:
+            responses = await asyncio.gather(*tasks)
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return self._merge_batch_responses(responses)
+
+    @staticmethod
+    def _update_batch_meta(meta: dict[str, Any], response: Any) -> None:
+        if "model" not in meta:
+            meta["model"] = response.model
+        if "usage" not in meta:
+            meta["usage"] = dict(response.usage)
+        else:
+            meta["usage"]["prompt_tokens"] += response.usage.prompt_tokens
+            meta["usage"]["total_tokens"] += response.usage.total_tokens
+
+    def _validate_documents(self, documents: list[Document]) -> None:
         if (
             not isinstance(documents, list)
             or documents
@@ -162,6 +397,20 @@ class BaseEmbedder(BaseModel):
             )
             raise TypeError(msg)
 
+    def embed_documents(self, documents: list[Document]) -> dict:
+        """
+        Embeds a list of documents and returns the embedded documents along with meta information.
+
+        Args:
+            documents (list[Document]): The documents to be embedded.
+
+        Returns:
+            dict: A dictionary containing:
+                - 'documents' (list[Document]): The input documents with their embeddings populated.
+                - 'meta' (dict): Metadata information about the embedding process.
+        """
+        self._validate_documents(documents)
+
         if not documents:
             # return early if we were passed an empty list
             return {"documents": [], "meta": {}}
@@ -176,3 +425,31 @@ class BaseEmbedder(BaseModel):
             doc.embedding = emb
 
         return {"documents": documents, "meta": meta}
+
+    async def aembed_documents(self, documents: list[Document]) -> dict:
+        """
+        Asynchronously embeds a list of documents and returns the embedded documents along with meta information.
+
+        Args:
+            documents (list[Document]): The documents to be embedded.
+
+        Returns:
+            dict: A dictionary containing:
+                - 'documents' (list[Document]): The input documents with their embeddings populated.
+                - 'meta' (dict): Metadata information about the embedding process.
+        """
+        self._validate_documents(documents)
+
+        if not documents:
+            return {"documents": [], "meta": {}}
+
+        texts_to_embed = self._prepare_documents_to_embed(documents=documents)
+
+        embeddings, meta = await self._aembed_texts_batch(
+            texts_to_embed=texts_to_embed, batch_size=self.batch_size
+        )
+
+        for doc, emb in zip(documents, embeddings):
+            doc.embedding = emb
+
+        return {"documents": documents, "meta": meta}
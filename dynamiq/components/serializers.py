@@ -1,6 +1,11 @@
 import json
+import struct
+import sys
+from array import array
 from typing import Any
 
+from pydantic import BaseModel
+
 from dynamiq.utils import JsonWorkflowEncoder
 
 
@@ -134,3 +139,88 @@ class JsonPickleSerializer(BaseSerializer):
         import jsonpickle
 
         return jsonpickle.decode(value)  # nosec
+
+
+class BinarySerializer(BaseSerializer):
+    """
+    Serializer that converts values to a compact binary format.
+
+    The value structure is stored as JSON, while lists of floats (e.g. embeddings) are moved out of it
+    and stored as packed little-endian float64 arrays. JSON strings produced by JsonSerializer are still
+    accepted by `loads`.
+
+    Attributes:
+        min_floats_to_pack (int): Minimal length of float lists to store as packed arrays.
+    """
+
+    FLOAT_ARRAY_KEY = "\x00f64"
+    _LENGTH = struct.Struct("<I")
+
+    def __init__(self, min_floats_to_pack: int = 8):
+        self.min_floats_to_pack = min_floats_to_pack
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Serialize the given value to bytes.
+
+        Args:
+            value (Any): The value to be serialized.
+
+        Returns:
+            bytes: Length of the JSON structure, the JSON structure and packed float arrays.
+        """
+        buffers: list[bytes] = []
+        offset = 0
+
+        def pack(item: Any) -> Any:
+            nonlocal offset
+            if isinstance(item, BaseModel):
+                item = item.model_dump()
+            if isinstance(item, dict):
+                return {k: pack(v) for k, v in item.items()}
+            if isinstance(item, (list, tuple)):
+                if len(item) >= self.min_floats_to_pack and all(type(v) is float for v in item):
+                    floats = array("d", item)
+                    if sys.byteorder == "big":
+                        floats.byteswap()
+                    buffers.append(floats.tobytes())
+                    marker = {self.FLOAT_ARRAY_KEY: [offset, len(item)]}
+                    offset += len(buffers[-1])
+                    return marker
+                return [pack(v) for v in item]
+            return item
+
+        structure = json.dumps(pack(value), cls=JsonWorkflowEncoder, separators=(",", ":")).encode()
+        return b"".join((self._LENGTH.pack(len(structure)), structure, *buffers))
+
+    def loads(self, value: bytes | str | None) -> Any:
+        """
+        Deserialize the given bytes to a Python object.
+
+        Args:
+            value (bytes | str | None): Serialized bytes, a JSON string, or None.
+
+        Returns:
+            Any: The deserialized Python object, or None if the input is None.
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return json.loads(value)
+
+        data = memoryview(value)
+        (structure_length,) = self._LENGTH.unpack_from(data)
+        start = self._LENGTH.size + structure_length
+        structure = data[self._LENGTH.size : start]
+
+        def unpack(item: dict) -> Any:
+            if (position := item.get(self.FLOAT_ARRAY_KEY)) is None or len(item) != 1:
+                return item
+            offset, count = position
+            floats = array("d")
+            floats.frombytes(data[start + offset : start + offset + count * floats.itemsize])
+            if sys.byteorder == "big":
+                floats.byteswap()
+            return floats.tolist()
+
+        return json.loads(bytes(structure), object_hook=unpack)
@@ -1,2 +1,3 @@
 from .connections import *
 from .storages import *
+from .pool import ConnectionPool, ConnectionPoolException, ConnectionPoolTimeout
@@ -7,11 +7,13 @@ from typing import TYPE_CHECKING, Any, Literal
 from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
+from dynamiq.connections.pool import ConnectionPool
 from dynamiq.utils import generate_uuid
 from dynamiq.utils.env import get_env_var
 from dynamiq.utils.logger import logger
 
 if TYPE_CHECKING:
+    import httpx
     from chromadb import ClientAPI as ChromaClient
     from openai import OpenAI as OpenAIClient
     from pinecone import Pinecone as PineconeClient
@@ -149,6 +151,81 @@ class HttpApiKey(BaseApiKeyConnection):
         }
 
 
+class BasePooledConnection(BaseConnection):
+    """
+    Represents a base class for database connections that can be shared through a connection pool.
+
+    Pool settings left at their defaults are not serialized, so connections without a pool keep their shape.
+
+    Attributes:
+        pool_enabled (bool): Whether nodes supporting connection pools use a pool of connections. Nodes use
+            a single connection if False.
+        pool_min_size (int): Number of connections opened when the pool is created.
+        pool_max_size (int): Maximum number of open connections in the pool.
+        pool_timeout (float): Maximum time in seconds to wait for a pooled connection.
+        pool_check (bool): Whether to health check pooled connections before reuse.
+        pool_check_idle_time (float): Minimum time in seconds a pooled connection is idle before it is health
+            checked on reuse.
+    """
+
+    pool_enabled: bool = False
+    pool_min_size: int = Field(default=0, ge=0)
+    pool_max_size: int = Field(default=10, ge=1)
+    pool_timeout: float = Field(default=30.0, gt=0)
+    pool_check: bool = True
+    pool_check_idle_time: float = Field(default=30.0, ge=0)
+
+    def to_dict(self, **kwargs) -> dict:
+        """Converts the connection instance to a dictionary without pool settings left at their defaults.
+
+        Returns:
+            dict: A dictionary representation of the connection instance.
+        """
+        data = super().to_dict(**kwargs)
+        for name in BasePooledConnection.model_fields.keys() - BaseConnection.model_fields.keys():
+            if name not in self.model_fields_set:
+                data.pop(name, None)
+        return data
+
+    @abstractmethod
+    def check_connection(self, conn: Any) -> None:
+        """Checks that a pooled connection is usable.
+
+        Args:
+            conn (Any): Connection to check.
+
+        Raises:
+            Exception: If the connection is broken.
+        """
+        raise NotImplementedError
+
+    def reset_connection(self, conn: Any) -> None:
+        """Prepares a connection returned to the pool for reuse.
+
+        Args:
+            conn (Any): Connection to reset.
+        """
+        pass
+
+    def connect_pool(self) -> ConnectionPool:
+        """Creates a pool of connections.
+
+        Returns:
+            ConnectionPool: Pool opening connections with `connect`.
+        """
+        pool = ConnectionPool(
+            connect=self.connect,
+            check=self.check_connection if self.pool_check else None,
+            reset=self.reset_connection,
+            min_size=self.pool_min_size,
+            max_size=self.pool_max_size,
+            timeout=self.pool_timeout,
+            check_idle_time=self.pool_check_idle_time,
+        )
+        logger.debug(f"Created pool of up to {self.pool_max_size} connections for {self.type}.")
+        return pool
+
+
 class Http(BaseConnection):
     """
     Represents a connection to an API.
@@ -181,6 +258,20 @@ class Http(BaseConnection):
 
         return requests
 
+    def connect_async(self) -> "httpx.AsyncClient":
+        """
+        Creates an async HTTP client for the API.
+
+        The client follows redirects like the requests module returned by `connect`. The connection url,
+        headers, params and data are applied per request, the same way for sync and async calls.
+
+        Returns:
+            httpx.AsyncClient: An async HTTP client. The caller is responsible for closing it.
+        """
+        import httpx
+
+        return httpx.AsyncClient(follow_redirects=True)
+
 
 class OpenAI(BaseApiKeyConnection):
     """
@@ -893,7 +984,7 @@ class DeepSeek(BaseApiKeyConnection):
         pass
 
 
-class PostgreSQL(BaseConnection):
+class PostgreSQL(BasePooledConnection):
     host: str = Field(default_factory=partial(get_env_var, "POSTGRESQL_HOST", "localhost"))
     port: int = Field(default_factory=partial(get_env_var, "POSTGRESQL_PORT", 5432))
     database: str = Field(default_factory=partial(get_env_var, "POSTGRESQL_DATABASE", "db"))
@@ -922,6 +1013,29 @@ class PostgreSQL(BaseConnection):
         except Exception as e:
             raise ConnectionError(f"Failed to connect to PostgreSQL: {str(e)}")
 
+    def check_connection(self, conn: Any) -> None:
+        """Checks that a pooled connection is usable.
+
+        Args:
+            conn (psycopg.Connection): Connection to check.
+        """
+        if conn.closed:
+            raise ConnectionError("PostgreSQL connection is closed.")
+        conn.execute("SELECT 1")
+
+    def reset_connection(self, conn: Any) -> None:
+        """Rolls back a transaction left open on a connection returned to the pool.
+
+        Args:
+            conn (psycopg.Connection): Connection to reset.
+        """
+        from psycopg.pq import TransactionStatus
+
+        if conn.closed:
+            raise ConnectionError("PostgreSQL connection is closed.")
+        if conn.info.transaction_status != TransactionStatus.IDLE:
+            conn.rollback()
+
     @property
     def conn_params(self) -> str:
         """
@@ -1006,7 +1120,7 @@ class Jina(Http):
         return super().connect()
 
 
-class MySQL(BaseConnection):
+class MySQL(BasePooledConnection):
     host: str = Field(default_factory=partial(get_env_var, "MYSQL_HOST", "localhost"))
     port: int = Field(default_factory=partial(get_env_var, "MYSQL_PORT", 3306))
     database: str = Field(default_factory=partial(get_env_var, "MYSQL_DATABASE", "db"))
@@ -1028,6 +1142,23 @@ class MySQL(BaseConnection):
         except mysql.connector.Error as e:
             raise ConnectionError(f"Failed to connect to MySQL: {str(e)}")
 
+    def check_connection(self, conn: Any) -> None:
+        """Checks that a pooled connection is usable.
+
+        Args:
+            conn (mysql.connector.MySQLConnection): Connection to check.
+        """
+        conn.ping(reconnect=False)
+
+    def reset_connection(self, conn: Any) -> None:
+        """Rolls back a transaction left open on a connection returned to the pool.
+
+        Args:
+            conn (mysql.connector.MySQLConnection): Connection to reset.
+        """
+        if conn.in_transaction:
+            conn.rollback()
+
     @property
     def cursor_params(self) -> dict:
         return {"dictionary": True}
@@ -18,11 +18,13 @@ class ConnectionClientInitType(str, enum.Enum):
     """Enumeration of connection client initialization types."""
     DEFAULT = "DEFAULT"
     VECTOR_STORE = "VECTOR_STORE"
+    POOL = "POOL"
 
 
 CONNECTION_METHOD_BY_INIT_TYPE = {
     ConnectionClientInitType.DEFAULT: "connect",
     ConnectionClientInitType.VECTOR_STORE: "connect_to_vector_store",
+    ConnectionClientInitType.POOL: "connect_pool",
 }
 
 
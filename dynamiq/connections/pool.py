@@ -0,0 +1,233 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from dynamiq.utils.logger import logger
+
+
+class ConnectionPoolException(Exception):
+    """Exception raised for errors in connection pools."""
+
+    pass
+
+
+class ConnectionPoolTimeout(ConnectionPoolException):
+    """Exception raised when no pooled connection becomes available in time."""
+
+    pass
+
+
+class ConnectionPoolStats(BaseModel):
+    """
+    Snapshot of connection pool counters.
+
+    Attributes:
+        size (int): Number of open connections, idle and in use.
+        idle (int): Number of connections waiting in the pool.
+        discarded (int): Number of connections closed after a failed health check or reset.
+    """
+
+    size: int
+    idle: int
+    discarded: int
+
+
+def _validate_pool_size(min_size: int, max_size: int) -> None:
+    if max_size < 1:
+        raise ValueError("max_size must be positive.")
+    if not 0 <= min_size <= max_size:
+        raise ValueError("min_size must be between 0 and max_size.")
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of database connections.
+
+    Connections are opened on demand up to the maximum size and returned to the pool after use, so concurrent
+    threads query on separate connections without paying the connect cost per call. Connections are reset
+    when returned and health checked before reuse if they were idle for a while. Broken connections are closed
+    and replaced. Pooled drivers are blocking and nodes call them from executor threads in async runs too, so
+    there is no asyncio pool.
+
+    Attributes:
+        connect (Callable[[], Any]): Opens a new connection.
+        check (Callable[[Any], None] | None): Raises if a connection is broken. Connections are not checked
+            if None.
+        check_idle_time (float): Minimum time in seconds a connection is idle before it is checked. Recently
+            returned connections are reused without a check to save a round trip per checkout.
+        reset (Callable[[Any], None] | None): Prepares a returned connection for reuse, e.g. rolls back an
+            open transaction. Raises if the connection can't be reused.
+        min_size (int): Number of connections opened when the pool is created.
+        max_size (int): Maximum number of open connections.
+        timeout (float): Maximum time in seconds to wait for a connection.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        check: Callable[[Any], None] | None = None,
+        reset: Callable[[Any], None] | None = None,
+        min_size: int = 0,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        check_idle_time: float = 0.0,
+    ):
+        _validate_pool_size(min_size, max_size)
+
+        self.connect = connect
+        self.check = check
+        self.reset = reset
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_idle_time = check_idle_time
+
+        # Idle connections with the monotonic time they were returned at
+        self._idle: deque[tuple[Any, float]] = deque()
+        self._size = 0
+        self._discarded = 0
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._closed = False
+
+        for _ in range(min_size):
+            self._size += 1
+            self._idle.append((self._open(), time.monotonic()))
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool is closed."""
+        return self._closed
+
+    def getconn(self, timeout: float | None = None) -> Any:
+        """Take a connection from the pool.
+
+        The connection must be returned with `putconn`.
+
+        Args:
+            timeout (float | None): Maximum time to wait in seconds. Uses the pool timeout if None.
+
+        Returns:
+            Any: Healthy connection.
+
+        Raises:
+            ConnectionPoolTimeout: If all connections are in use until the timeout.
+            ConnectionPoolException: If the pool is closed.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._available:
+                idle = self._take(deadline, timeout)
+            if idle is None:
+                return self._open()
+            conn, returned_at = idle
+            if time.monotonic() - returned_at < self.check_idle_time or self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+
+    def putconn(self, conn: Any) -> None:
+        """Return a connection to the pool.
+
+        Args:
+            conn (Any): Connection taken with `getconn`.
+        """
+        if self.reset is not None:
+            try:
+                self.reset(conn)
+            except Exception as e:
+                logger.warning(f"Pooled connection reset failed, the connection is discarded. Error: {e}")
+                self._discard(conn)
+                return
+
+        with self._available:
+            if not self._closed:
+                self._idle.append((conn, time.monotonic()))
+                self._available.notify()
+                return
+        self._discard(conn)
+
+    @contextmanager
+    def connection(self, timeout: float | None = None):
+        """Context manager that takes a connection from the pool and returns it on exit.
+
+        Args:
+            timeout (float | None): Maximum time to wait in seconds. Uses the pool timeout if None.
+
+        Yields:
+            Any: Healthy connection.
+        """
+        conn = self.getconn(timeout=timeout)
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def close(self) -> None:
+        """Close idle connections and stop lending connections. Connections in use are closed on return."""
+        with self._available:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._available.notify_all()
+        for conn in idle:
+            self._discard(conn)
+
+    def get_stats(self) -> ConnectionPoolStats:
+        """
+        Get a snapshot of pool counters.
+
+        Returns:
+            ConnectionPoolStats: Current pool counters.
+        """
+        with self._lock:
+            return ConnectionPoolStats(size=self._size, idle=len(self._idle), discarded=self._discarded)
+
+    def _take(self, deadline: float, timeout: float) -> tuple[Any, float] | None:
+        # Returns an idle connection with its return time or None after reserving a slot for a new one
+        while True:
+            if self._closed:
+                raise ConnectionPoolException("Connection pool is closed.")
+            if self._idle:
+                # The most recently used connection is the least likely to be dropped by the server
+                return self._idle.pop()
+            if self._size < self.max_size:
+                self._size += 1
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise ConnectionPoolTimeout(f"No connection available in the pool of {self.max_size} in {timeout}s.")
+            self._available.wait(remaining)
+
+    def _open(self) -> Any:
+        try:
+            return self.connect()
+        except Exception:
+            with self._available:
+                self._size -= 1
+                self._available.notify()
+            raise
+
+    def _is_healthy(self, conn: Any) -> bool:
+        if self.check is None:
+            return True
+        try:
+            self.check(conn)
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled connection health check failed, the connection is replaced. Error: {e}")
+            return False
+
+    def _discard(self, conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug(f"Failed to close pooled connection. Error: {e}")
+        with self._available:
+            self._size -= 1
+            self._discarded += 1
+            self._available.notify()
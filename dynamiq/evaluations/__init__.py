@@ -1,3 +1,4 @@
+from .checkpoint import CheckpointConfig, EvaluationCheckpoint
 from .base_evaluator import BaseEvaluator
 from .llm_evaluator import LLMEvaluator
 from .python_evaluator import PythonEvaluator
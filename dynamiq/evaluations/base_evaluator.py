@@ -1,7 +1,24 @@
+from concurrent.futures import ProcessPoolExecutor
 from functools import cached_property
+from typing import Any, Callable
 
 from pydantic import BaseModel, ConfigDict, computed_field
 
+from dynamiq.evaluations.checkpoint import EvaluationCheckpoint, ResultT, get_llm_settings
+
+CHECKPOINT_EXCLUDED_FIELDS = {"name", "llm", "max_concurrency", "checkpoint"}
+MIN_PAIRS_PER_PROCESS = 10_000
+
+
+def _score_pairs_chunk(
+    evaluator_type: type["BaseEvaluator"],
+    evaluator_data: dict[str, Any],
+    ground_truth_answers: list[str],
+    answers: list[str],
+) -> list[float]:
+    """Score pairs with a copy of the evaluator in a worker process."""
+    return evaluator_type(**evaluator_data)._score_pairs(ground_truth_answers, answers)
+
 
 class BaseEvaluator(BaseModel):
     """
@@ -35,3 +52,95 @@ class BaseEvaluator(BaseModel):
             list[float]: Scores for each reference/answer pair.
         """
         raise NotImplementedError("Subclasses must implement this method.")
+
+    def get_checkpoint_settings(self) -> dict[str, Any]:
+        """
+        Get the evaluator settings that change its results.
+
+        Returns:
+            dict[str, Any]: Evaluator fields and LLM settings.
+        """
+        settings = self.model_dump(exclude=CHECKPOINT_EXCLUDED_FIELDS)
+        if (llm := getattr(self, "llm", None)) is not None:
+            settings["llm"] = get_llm_settings(llm)
+        return settings
+
+    def _run_with_checkpoint(
+        self,
+        checkpoint: EvaluationCheckpoint | None,
+        inputs: dict[str, list[Any]],
+        evaluate: Callable[..., list[ResultT]],
+        result_type: "type[ResultT]",
+        **run_settings: Any,
+    ) -> list[ResultT]:
+        """
+        Evaluate samples, skipping samples with results stored in the checkpoint.
+
+        Args:
+            checkpoint (EvaluationCheckpoint | None): Checkpoint of results. All samples are evaluated if None.
+            inputs (dict[str, list[Any]]): Input lists of the samples by name.
+            evaluate (Callable[..., list[ResultT]]): Evaluates samples given their input lists as keyword
+                arguments.
+            result_type (type[ResultT]): Model of results.
+            **run_settings: Run parameters that change the results.
+
+        Returns:
+            list[ResultT]: Results in the order of the samples.
+        """
+        if checkpoint is None:
+            return evaluate(**inputs)
+        return checkpoint.run(
+            kind=self.type,
+            settings={**self.get_checkpoint_settings(), **run_settings},
+            inputs=inputs,
+            evaluate=evaluate,
+            result_type=result_type,
+        )
+
+    def _score_pairs(self, ground_truth_answers: list[str], answers: list[str]) -> list[float]:
+        """
+        Score reference/answer pairs in the current process.
+        Must be overridden by evaluators scored in worker processes.
+
+        Args:
+            ground_truth_answers (list[str]): List of reference answers.
+            answers (list[str]): List of candidate answers.
+
+        Returns:
+            list[float]: Scores for each reference/answer pair.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    def _score_pairs_in_processes(
+        self, ground_truth_answers: list[str], answers: list[str], workers: int
+    ) -> list[float]:
+        """
+        Score reference/answer pairs split across worker processes.
+
+        Every process scores at least `MIN_PAIRS_PER_PROCESS` pairs, so small batches are scored in the current
+        process without the cost of starting workers.
+
+        Args:
+            ground_truth_answers (list[str]): List of reference answers.
+            answers (list[str]): List of candidate answers.
+            workers (int): Maximum number of worker processes.
+
+        Returns:
+            list[float]: Scores for each reference/answer pair in order.
+        """
+        processes = min(workers, len(answers) // MIN_PAIRS_PER_PROCESS)
+        if processes <= 1:
+            return self._score_pairs(ground_truth_answers, answers)
+
+        chunk_size = -(-len(answers) // processes)
+        bounds = range(0, len(answers), chunk_size)
+        evaluator_data = self.model_dump(exclude={"type"})
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            chunks = executor.map(
+                _score_pairs_chunk,
+                [type(self)] * len(bounds),
+                [evaluator_data] * len(bounds),
+                [ground_truth_answers[start : start + chunk_size] for start in bounds],
+                [answers[start : start + chunk_size] for start in bounds],
+            )
+            return [score for chunk in chunks for score in chunk]
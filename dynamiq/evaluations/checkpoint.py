@@ -0,0 +1,222 @@
+import json
+import threading
+from typing import Any, Callable, ClassVar, TypeVar
+
+from pydantic import BaseModel, Field
+
+from dynamiq.cache.backends import BaseCache, FileCache, SQLiteCache
+from dynamiq.cache.config import CacheBackend, FileCacheConfig, SQLiteCacheConfig
+from dynamiq.cache.hashing import canonical_hash
+
+LLM_SETTINGS = (
+    "model",
+    "temperature",
+    "max_tokens",
+    "top_p",
+    "seed",
+    "presence_penalty",
+    "frequency_penalty",
+    "thinking_enabled",
+    "budget_tokens",
+    "inference_mode",
+)
+
+ResultT = TypeVar("ResultT", bound=BaseModel)
+
+
+class CheckpointConfig(BaseModel):
+    """Configuration for checkpoints of evaluation runs.
+
+    Attributes:
+        backend (SQLiteCacheConfig | FileCacheConfig): Local store of evaluation results.
+        namespace (str): Prefix of checkpoint keys.
+        chunk_size (int): Number of samples evaluated between checkpoint writes.
+        memoize_judgments (bool): Whether single LLM judgments are stored and reused across metrics and runs.
+        ttl (int | None): Optional time-to-live for stored results in seconds.
+    """
+
+    backend: SQLiteCacheConfig | FileCacheConfig = Field(
+        default_factory=lambda: SQLiteCacheConfig(db_path="dynamiq_evaluations.db")
+    )
+    namespace: str = "evaluations"
+    chunk_size: int = Field(default=100, ge=1)
+    memoize_judgments: bool = True
+    ttl: int | None = None
+
+    @property
+    def shared_key(self) -> str:
+        """Key of configs that can share the store."""
+        return self.backend.model_dump_json()
+
+
+def get_llm_settings(llm: Any) -> dict[str, Any]:
+    """Get the LLM settings that change evaluation results.
+
+    Args:
+        llm (Any): LLM node.
+
+    Returns:
+        dict[str, Any]: LLM settings by name.
+    """
+    return {name: getattr(llm, name, None) for name in LLM_SETTINGS}
+
+
+class EvaluationCheckpoint:
+    """Store of evaluation results persisted on local disk.
+
+    Results are keyed by their kind, the hash of the settings that produced them and the hash of their inputs,
+    so reruns with the same settings skip already evaluated inputs.
+
+    Attributes:
+        BACKENDS_BY_TYPE (dict[CacheBackend, type[BaseCache]]): Mapping of store backends.
+        cache (BaseCache): Cache storing results as JSON strings.
+        namespace (str): Prefix of checkpoint keys.
+        chunk_size (int): Number of samples evaluated between checkpoint writes.
+        memoize_judgments (bool): Whether single LLM judgments are stored.
+        ttl (int | None): Time-to-live for stored results in seconds.
+    """
+
+    BACKENDS_BY_TYPE: ClassVar[dict[CacheBackend, type[BaseCache]]] = {
+        CacheBackend.SQLite: SQLiteCache,
+        CacheBackend.File: FileCache,
+    }
+
+    _shared_caches: ClassVar[dict[str, BaseCache]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        cache: BaseCache,
+        namespace: str = "evaluations",
+        chunk_size: int = 100,
+        memoize_judgments: bool = True,
+        ttl: int | None = None,
+    ):
+        """Initialize EvaluationCheckpoint.
+
+        Args:
+            cache (BaseCache): Cache storing results as JSON strings.
+            namespace (str): Prefix of checkpoint keys.
+            chunk_size (int): Number of samples evaluated between checkpoint writes.
+            memoize_judgments (bool): Whether single LLM judgments are stored.
+            ttl (int | None): Time-to-live for stored results in seconds.
+        """
+        self.cache = cache
+        self.namespace = namespace
+        self.chunk_size = chunk_size
+        self.memoize_judgments = memoize_judgments
+        self.ttl = ttl
+
+    @classmethod
+    def from_config(cls, config: CheckpointConfig, cache: BaseCache | None = None) -> "EvaluationCheckpoint":
+        """Create EvaluationCheckpoint instance from configuration.
+
+        Args:
+            config (CheckpointConfig): Checkpoint configuration.
+            cache (BaseCache | None): Existing store of the configured backend. A new one is created if None.
+
+        Returns:
+            EvaluationCheckpoint: Checkpoint instance.
+        """
+        if cache is None:
+            cache = cls.BACKENDS_BY_TYPE[config.backend.backend].from_config(config.backend)
+        return cls(
+            cache=cache,
+            namespace=config.namespace,
+            chunk_size=config.chunk_size,
+            memoize_judgments=config.memoize_judgments,
+            ttl=config.ttl,
+        )
+
+    @classmethod
+    def get_shared(cls, config: CheckpointConfig) -> "EvaluationCheckpoint":
+        """Get a checkpoint sharing the store of the configured backend with the rest of the process.
+
+        Args:
+            config (CheckpointConfig): Checkpoint configuration.
+
+        Returns:
+            EvaluationCheckpoint: Checkpoint instance.
+        """
+        key = config.shared_key
+        with cls._shared_lock:
+            if (cache := cls._shared_caches.get(key)) is None:
+                cache = cls.BACKENDS_BY_TYPE[config.backend.backend].from_config(config.backend)
+                cls._shared_caches[key] = cache
+        return cls.from_config(config, cache=cache)
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        """Drop all shared stores."""
+        with cls._shared_lock:
+            cls._shared_caches.clear()
+
+    def get_keys(self, kind: str, settings: Any, items: list[Any]) -> list[str]:
+        """Build the checkpoint keys of results.
+
+        Args:
+            kind (str): Kind of results, e.g. the evaluator type.
+            settings (Any): Settings that change the results.
+            items (list[Any]): Inputs of the results.
+
+        Returns:
+            list[str]: Checkpoint keys in the order of items.
+        """
+        settings_hash = canonical_hash((kind, settings))
+        return [f"{self.namespace}:{kind}:{canonical_hash((settings_hash, item))}" for item in items]
+
+    def get_many(self, keys: list[str]) -> list[Any]:
+        """Retrieve multiple results.
+
+        Args:
+            keys (list[str]): Checkpoint keys.
+
+        Returns:
+            list[Any]: Results in the order of keys. Missing results are None.
+        """
+        return [json.loads(value) if value is not None else None for value in self.cache.get_many(keys)]
+
+    def set_many(self, results: dict[str, Any]) -> None:
+        """Store multiple results.
+
+        Args:
+            results (dict[str, Any]): JSON serializable results by checkpoint key.
+        """
+        self.cache.set_many({key: json.dumps(value) for key, value in results.items()}, ttl=self.ttl)
+
+    def run(
+        self,
+        kind: str,
+        settings: Any,
+        inputs: dict[str, list[Any]],
+        evaluate: Callable[..., list[ResultT]],
+        result_type: type[ResultT],
+    ) -> list[ResultT]:
+        """Evaluate samples missing in the checkpoint and store their results.
+
+        Missing samples are evaluated in chunks of `chunk_size`. Results of every chunk are stored before
+        the next chunk is evaluated, so a failed run keeps the results of completed chunks.
+
+        Args:
+            kind (str): Kind of results, e.g. the evaluator type.
+            settings (Any): Settings that change the results.
+            inputs (dict[str, list[Any]]): Input lists of the samples by name.
+            evaluate (Callable[..., list[ResultT]]): Evaluates samples given their input lists as keyword
+                arguments. Results are in the order of the samples.
+            result_type (type[ResultT]): Model of results.
+
+        Returns:
+            list[ResultT]: Results in the order of the samples.
+        """
+        samples = [dict(zip(inputs, values)) for values in zip(*inputs.values())]
+        keys = self.get_keys(kind, settings, samples)
+        results = [result_type.model_validate(result) if result else None for result in self.get_many(keys)]
+        missing = [idx for idx, result in enumerate(results) if result is None]
+
+        for start in range(0, len(missing), self.chunk_size):
+            chunk = missing[start : start + self.chunk_size]
+            chunk_results = evaluate(**{name: [values[idx] for idx in chunk] for name, values in inputs.items()})
+            for idx, result in zip(chunk, chunk_results):
+                results[idx] = result
+            self.set_many({keys[idx]: result.model_dump(mode="json") for idx, result in zip(chunk, chunk_results)})
+        return results
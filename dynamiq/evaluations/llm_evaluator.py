@@ -1,10 +1,15 @@
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from warnings import warn
 
+from dynamiq.evaluations.checkpoint import EvaluationCheckpoint, get_llm_settings
 from dynamiq.nodes import Node
 from dynamiq.prompts import Message, Prompt
 from dynamiq.utils.json_parser import parse_llm_json_output
+from dynamiq.utils.logger import logger
+from dynamiq.utils.utils import get_retry_delay, is_rate_limit_error
 
 STRINGS_TO_OMIT_FROM_LLM_EVALUATOR_OUTPUT = ("```json", "```")
 
@@ -62,6 +67,10 @@ class LLMEvaluator:
         raise_on_failure: bool = True,
         llm: Node,
         strings_to_omit_from_llm_output: tuple[str] = STRINGS_TO_OMIT_FROM_LLM_EVALUATOR_OUTPUT,
+        max_concurrency: int = 1,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        checkpoint: EvaluationCheckpoint | None = None,
     ):
         """
         Initializes an instance of LLMEvaluator.
@@ -82,7 +91,15 @@ class LLMEvaluator:
                 unsuccessful API call.
             llm (Node): The LLM node to use for evaluation.
             strings_to_omit_from_llm_output (Tuple[str]): A tuple of strings to omit from the LLM output.
+            max_concurrency (int): The maximum number of inputs evaluated at the same time. Results keep
+                the order of the inputs.
+            max_retries (int): The number of retries of an LLM call rejected by the provider rate limit.
+            retry_delay (float): The initial delay in seconds before retrying a rate limited LLM call.
+            checkpoint (Optional[EvaluationCheckpoint]): The store of judgments. Inputs judged before with the
+                same prompt and LLM settings are not sent to the LLM again. Judgments are not stored if None.
         """
+        if max_concurrency < 1:
+            raise ValueError("LLM evaluator expects max_concurrency to be positive.")
         if inputs is None:
             inputs = []
         if examples is None:
@@ -113,6 +130,10 @@ class LLMEvaluator:
 
         self.llm = llm
         self.strings_to_omit_from_llm_output = strings_to_omit_from_llm_output
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.checkpoint = checkpoint if checkpoint is not None and checkpoint.memoize_judgments else None
 
     @staticmethod
     def _validate_init_parameters(
@@ -198,37 +219,122 @@ class LLMEvaluator:
             # If no inputs are provided, create a list with a single empty dictionary
             list_of_input_data = [{}]
 
-        results: list[dict[str, Any]] = []
-        errors = 0
+        results = self._evaluate_inputs(list_of_input_data)
+        errors = sum(result is None for result in results)
 
-        for input_data in list_of_input_data:
-            # Pass the prompt and input_data to LLM
+        if errors > 0:
+            msg = f"LLM evaluator failed for {errors} out of {len(list_of_input_data)} inputs."
+            warn(msg)
+
+        return {"results": results}
+
+    def _evaluate_inputs(self, list_of_input_data: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        """
+        Evaluates inputs, reusing judgments stored in the checkpoint.
+
+        Args:
+            list_of_input_data (List[Dict[str, Any]]): The inputs to evaluate.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Parsed results in the order of the inputs. Failed inputs are None.
+        """
+        if self.checkpoint is None:
+            return self._evaluate_uncached_inputs(list_of_input_data, [None] * len(list_of_input_data))
+
+        settings = {
+            "template": self.prompt.messages[0].content,
+            "outputs": [outp["name"] for outp in self.outputs],
+            "llm": get_llm_settings(self.llm),
+        }
+        keys = self.checkpoint.get_keys("judgment", settings, list_of_input_data)
+        results = self.checkpoint.get_many(keys)
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        if missing:
+            missing_results = self._evaluate_uncached_inputs(
+                [list_of_input_data[idx] for idx in missing], [keys[idx] for idx in missing]
+            )
+            for idx, result in zip(missing, missing_results):
+                results[idx] = result
+        return results
+
+    def _evaluate_uncached_inputs(
+        self, list_of_input_data: list[dict[str, Any]], keys: list[str | None]
+    ) -> list[dict[str, Any] | None]:
+        """
+        Evaluates inputs with up to `max_concurrency` LLM calls at the same time.
+
+        Args:
+            list_of_input_data (List[Dict[str, Any]]): The inputs to evaluate.
+            keys (List[Optional[str]]): Checkpoint keys of the inputs. Results without a key are not stored.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Parsed results in the order of the inputs. Failed inputs are None.
+        """
+        max_workers = min(self.max_concurrency, len(list_of_input_data))
+        if max_workers <= 1:
+            return [self._evaluate_input(input_data, key) for input_data, key in zip(list_of_input_data, keys)]
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dynamiq-evaluator") as executor:
+            futures = [
+                executor.submit(self._evaluate_input, input_data, key)
+                for input_data, key in zip(list_of_input_data, keys)
+            ]
             try:
-                result = self.llm.execute(input_data=input_data, prompt=self.prompt)
-            except Exception as e:
-                msg = f"Error while generating response for input {input_data}: {e}"
-                if self.raise_on_failure:
-                    raise ValueError(msg)
-                warn(msg)
-                results.append(None)
-                errors += 1
-                continue
+                return [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
 
-            expected_output_keys = [outp["name"] for outp in self.outputs]
-            content = self._cleanup_output_content(result["content"])
+    def _evaluate_input(self, input_data: dict[str, Any], key: str | None = None) -> dict[str, Any] | None:
+        """
+        Evaluates a single input and stores the judgment as soon as it is parsed.
 
-            parsed_result = self._parse_and_validate_json_output(expected_keys=expected_output_keys, content=content)
-            if parsed_result is not None:
-                results.append(parsed_result)
-            else:
-                results.append(None)
-                errors += 1
+        Args:
+            input_data (Dict[str, Any]): The input to evaluate.
+            key (Optional[str]): Checkpoint key of the input. The result is not stored if None.
 
-        if errors > 0:
-            msg = f"LLM evaluator failed for {errors} out of {len(list_of_input_data)} inputs."
+        Returns:
+            Optional[Dict[str, Any]]: The parsed result or None if the evaluation failed.
+
+        Raises:
+            ValueError: If the evaluation fails and raise_on_failure is True.
+        """
+        try:
+            result = self._execute_llm(input_data)
+        except Exception as e:
+            msg = f"Error while generating response for input {input_data}: {e}"
+            if self.raise_on_failure:
+                raise ValueError(msg)
             warn(msg)
+            return None
 
-        return {"results": results}
+        expected_output_keys = [outp["name"] for outp in self.outputs]
+        content = self._cleanup_output_content(result["content"])
+        parsed_result = self._parse_and_validate_json_output(expected_keys=expected_output_keys, content=content)
+        if key is not None and parsed_result is not None:
+            self.checkpoint.set_many({key: parsed_result})
+        return parsed_result
+
+    def _execute_llm(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Executes the LLM, retrying calls rejected by the provider rate limit.
+
+        Args:
+            input_data (Dict[str, Any]): The prompt input.
+
+        Returns:
+            Dict[str, Any]: The LLM output.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.llm.execute(input_data=input_data, prompt=self.prompt)
+            except Exception as e:
+                if attempt == self.max_retries or not is_rate_limit_error(e):
+                    raise
+                delay = get_retry_delay(e, attempt, self.retry_delay)
+                logger.warning(f"LLM evaluator rate limit exceeded, retrying in {delay:.2f}s. Error: {e}")
+                time.sleep(delay)
 
     def _prepare_prompt_template(self) -> str:
         """
@@ -1,5 +1,8 @@
+from functools import partial
+
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 from dynamiq.evaluations import BaseEvaluator
+from dynamiq.evaluations.checkpoint import CheckpointConfig, EvaluationCheckpoint
 from dynamiq.evaluations.llm_evaluator import LLMEvaluator
 from dynamiq.nodes.llms import BaseLLM
 from dynamiq.utils.logger import logger
@@ -41,6 +44,21 @@ class ClassifyStatementOutput(BaseModel):
     reasoning: str = Field(description="Explanation for why the statement is or is not supported")
 
 
+class ClassifyStatementsInput(BaseModel):
+    """
+    Input model for classifying the candidate statements of several questions.
+    """
+    questions: list[str] = Field(description="The questions for context")
+    statements_list: list[list[str]] = Field(description="Candidate statements to classify for each question")
+    reference_texts: list[str] = Field(description="The reference text for each question")
+
+    @model_validator(mode="after")
+    def check_equal_length(self):
+        if len(self.questions) != len(self.statements_list) or len(self.questions) != len(self.reference_texts):
+            raise ValueError("Questions, statements and reference texts must have the same length.")
+        return self
+
+
 class RunInput(BaseModel):
     """
     Input model for running the evaluator.
@@ -116,15 +134,31 @@ class AnswerCorrectnessEvaluator(BaseEvaluator):
         - F1 Score  = 2 * (Precision * Recall) / (Precision + Recall)
 
     The evaluator outputs both the final score and detailed reasoning explaining each step.
+
+    Statements are classified in batches of up to `statements_per_prompt` statements per LLM call,
+    and the LLM calls of all questions run with up to `max_concurrency` calls at the same time.
+
+    Attributes:
+        llm (BaseLLM): The language model to use for evaluation.
+        max_concurrency (int): The maximum number of LLM calls at the same time.
+        checkpoint (CheckpointConfig | None): Local store of per-sample results and LLM judgments.
+            Reruns skip stored samples. Results are kept in memory only if None.
+        statements_per_prompt (int): The maximum number of statements classified in a single LLM call.
     """
     name: str = "AnswerCorrectness"
     llm: BaseLLM
+    max_concurrency: int = Field(default=8, ge=1)
+    checkpoint: CheckpointConfig | None = None
+    statements_per_prompt: int = Field(default=10, ge=1)
 
+    _checkpoint: EvaluationCheckpoint | None = PrivateAttr(default=None)
     _statement_extractor: LLMEvaluator = PrivateAttr()
     _statement_classifier: LLMEvaluator = PrivateAttr()
 
     def __init__(self, **data):
         super().__init__(**data)
+        if self.checkpoint is not None:
+            self._checkpoint = EvaluationCheckpoint.get_shared(self.checkpoint)
         self._initialize_evaluators()
 
     def _initialize_evaluators(self):
@@ -179,59 +213,72 @@ class AnswerCorrectnessEvaluator(BaseEvaluator):
                 },
             ],
             llm=self.llm,
+            max_concurrency=self.max_concurrency,
+            checkpoint=self._checkpoint,
         )
 
         classify_instructions = (
-            "Given a question, an answer statement, and a reference text, determine if the answer statement "
-            "is supported by the reference text. Explain briefly why the statement is or is not supported. "
-            "Return a JSON object with keys 'reasoning' (a short explanation) and 'match' (true/false)"
+            "Given a question, a list of answer statements, and a reference text, determine for each answer "
+            "statement if it is supported by the reference text. Explain briefly why each statement is or is not "
+            "supported. Return a JSON object with key 'classifications': a list with one object per answer "
+            "statement, in the same order, with keys 'statement', 'reasoning' (a short explanation) "
+            "and 'match' (true/false)."
         )
         self._statement_classifier = LLMEvaluator(
             instructions=classify_instructions.strip(),
             inputs=[
                 {"name": "question", "type": str},
-                {"name": "answer_statement", "type": str},
+                {"name": "answer_statements", "type": list[str]},
                 {"name": "reference_text", "type": str},
             ],
-            outputs=[{"name": "match", "type": bool}, {"name": "reasoning", "type": str}],
+            outputs=[{"name": "classifications", "type": list[dict]}],
             examples=[
                 {
                     "inputs": {
                         "question": "What is the capital of France?",
-                        "answer_statement": "The capital of France is Paris.",
+                        "answer_statements": [
+                            "The capital of France is Paris.",
+                            "Paris is known for its rich history.",
+                        ],
                         "reference_text": "Paris is the capital of France.",
                     },
                     "outputs": {
-                        "reasoning": "The statement exactly matches the core fact in the reference.",
-                        "match": True,
-                    },
-                },
-                {
-                    "inputs": {
-                        "question": "What is the capital of France?",
-                        "answer_statement": "Paris is known for its rich history.",
-                        "reference_text": "The capital of France is Paris.",
-                    },
-                    "outputs": {
-                        "reasoning": "The statement includes extra details about history "
-                        "that are not present in reference.",
-                        "match": False,
+                        "classifications": [
+                            {
+                                "statement": "The capital of France is Paris.",
+                                "reasoning": "The statement exactly matches the core fact in the reference.",
+                                "match": True,
+                            },
+                            {
+                                "statement": "Paris is known for its rich history.",
+                                "reasoning": "The statement includes extra details about history "
+                                "that are not present in reference.",
+                                "match": False,
+                            },
+                        ]
                     },
                 },
                 {
                     "inputs": {
                         "question": "Who developed the theory of relativity?",
-                        "answer_statement": "The theory was developed by Albert Einstein.",
+                        "answer_statements": ["The theory was developed by Albert Einstein."],
                         "reference_text": "The theory of relativity was developed by Albert Einstein.",
                     },
                     "outputs": {
-                        "reasoning": "The statement conveys the same core fact as the reference "
-                        "despite wording differences.",
-                        "match": True,
+                        "classifications": [
+                            {
+                                "statement": "The theory was developed by Albert Einstein.",
+                                "reasoning": "The statement conveys the same core fact as the reference "
+                                "despite wording differences.",
+                                "match": True,
+                            }
+                        ]
                     },
                 },
             ],
             llm=self.llm,
+            max_concurrency=self.max_concurrency,
+            checkpoint=self._checkpoint,
         )
 
     def _get_unique_candidates(self, candidates: list[str]) -> list[str]:
@@ -261,17 +308,72 @@ class AnswerCorrectnessEvaluator(BaseEvaluator):
             all_stmts.append(self._get_unique_candidates(stmts))
         return all_stmts
 
+    def classify_statements(
+        self, questions: list[str], statements_list: list[list[str]], ref_texts: list[str]
+    ) -> list[list[tuple[bool, str]]]:
+        """
+        Run the classification evaluator for the candidate statements of several questions at once.
+        Statements of a question are sent in batches of up to `statements_per_prompt` statements.
+        Returns a list of (match, explanation) tuples per question in the order of the statements.
+        """
+        input_data = ClassifyStatementsInput(
+            questions=questions, statements_list=statements_list, reference_texts=ref_texts
+        )
+        rows = []
+        for idx, (question, statements, ref_text) in enumerate(
+            zip(input_data.questions, input_data.statements_list, input_data.reference_texts)
+        ):
+            for start in range(0, len(statements), self.statements_per_prompt):
+                rows.append((idx, question, statements[start : start + self.statements_per_prompt], ref_text))
+
+        classified: list[list[tuple[bool, str]]] = [[] for _ in input_data.questions]
+        if not rows:
+            return classified
+
+        results = self._statement_classifier.run(
+            question=[row[1] for row in rows],
+            answer_statements=[row[2] for row in rows],
+            reference_text=[row[3] for row in rows],
+        )
+        for (idx, _, statements, _), result in zip(rows, results["results"]):
+            classified[idx].extend(self._parse_classifications(statements, result))
+        return classified
+
+    @staticmethod
+    def _parse_classifications(statements: list[str], result: dict | None) -> list[tuple[bool, str]]:
+        """
+        Align classifications returned for a batch with its statements.
+        Classifications are matched on their returned statement text, compared lowercased and stripped.
+        Classifications without a statement text are matched by their position in the batch.
+        Statements without a classification count as not matched.
+        """
+        items = (result or {}).get("classifications") or []
+        if not isinstance(items, list):
+            items = [items]
+        items = [item if isinstance(item, dict) else {} for item in items]
+        by_statement = {}
+        for item in items:
+            if isinstance(item.get("statement"), str):
+                by_statement.setdefault(item["statement"].strip().lower(), item)
+
+        classified = []
+        for idx, statement in enumerate(statements):
+            item = by_statement.get(statement.strip().lower())
+            if item is None and idx < len(items) and items[idx] and not items[idx].get("statement"):
+                item = items[idx]
+            if item is None:
+                classified.append((False, "No classification returned for the statement."))
+            else:
+                classified.append((bool(item.get("match", False)), item.get("reasoning", "")))
+        return classified
+
     def classify_statement(self, question: str, answer_stmt: str, ref_text: str) -> tuple[bool, str]:
         """
         Run the classification evaluator.
         The ref_text is the string of candidate statements from the ground truth answer.
         Returns a tuple (match, explanation).
         """
-        data = {"question": [question], "answer_statement": [answer_stmt], "reference_text": [ref_text]}
-        result = self._statement_classifier.run(**data)
-        m = bool(result["results"][0].get("match", False))
-        expl = result["results"][0].get("reasoning", "")
-        return m, expl
+        return self.classify_statements([question], [[answer_stmt]], [ref_text])[0][0]
 
     def _join_candidates(self, candidates: list[str]) -> str:
         """
@@ -287,11 +389,8 @@ class AnswerCorrectnessEvaluator(BaseEvaluator):
         Classify each candidate statement against the ground truth answer.
         Returns a list of tuples (statement, match, explanation).
         """
-        outs = []
-        for stmt in candidates:
-            m, expl = self.classify_statement(question, stmt, ref_text)
-            outs.append((stmt, m, expl))
-        return outs
+        classified = self.classify_statements([question], [candidates], [ref_text])[0]
+        return [(stmt, m, expl) for stmt, (m, expl) in zip(candidates, classified)]
 
     def _build_reasoning(
         self,
@@ -398,6 +497,12 @@ class AnswerCorrectnessEvaluator(BaseEvaluator):
         ans_class = self._evaluate_candidates(question, unique_ans, gt_text)
         ans_text = self._join_candidates(unique_ans)
         gt_class = self._evaluate_candidates(question, unique_gt, ans_text)
+        return self._score(ans_class, gt_class)
+
+    def _score(self, ans_class: list[tuple[str, bool, str]], gt_class: list[tuple[str, bool, str]]) -> RunResult:
+        """
+        Compute Precision, Recall and F1 Score from the classified statements of a question.
+        """
         tp = sum(1 for _, m, _ in ans_class if m)
         fp = len(ans_class) - tp
         fn = sum(1 for _, m, _ in gt_class if not m)
@@ -426,16 +531,9 @@ class AnswerCorrectnessEvaluator(BaseEvaluator):
         Returns:
           RunResult: The evaluation result with score and reasoning.
         """
-        # Extract candidate statements for answer and ground truth
-        ans_candidates = self.extract_statements([question], [answer])[0]
-        gt_candidates = self.extract_statements([question], [ground_truth_answer])[0]
-        result = self._evaluate_question(question, ans_candidates, gt_candidates)
-        if verbose:
-            logger.debug(f"Question: {question}")
-            logger.debug(f"Answer: {self._join_candidates(ans_candidates)}")
-            logger.debug(f"Ground Truth Answer: {self._join_candidates(gt_candidates)}")
-            logger.debug(result.reasoning)
-        return result
+        return self.run(
+            questions=[question], answers=[answer], ground_truth_answers=[ground_truth_answer], verbose=verbose
+        ).results[0]
 
     def run(
         self, questions: list[str], answers: list[str], ground_truth_answers: list[str], verbose: bool = False
@@ -448,6 +546,8 @@ class AnswerCorrectnessEvaluator(BaseEvaluator):
           3) Compute Precision, Recall, and F1 Score.
           4) Generate detailed and easy-to-understand reasoning that explains the metrics.
 
+        Every step evaluates all questions at once, with up to `max_concurrency` LLM calls at the same time.
+
         Args:
           questions (list[str]): List of questions.
           answers (list[str]): List of answers.
@@ -460,13 +560,56 @@ class AnswerCorrectnessEvaluator(BaseEvaluator):
         run_input = RunInput(
             questions=questions, answers=answers, ground_truth_answers=ground_truth_answers, verbose=verbose
         )
+        out_results = self._run_with_checkpoint(
+            self._checkpoint,
+            inputs={
+                "questions": run_input.questions,
+                "answers": run_input.answers,
+                "ground_truth_answers": run_input.ground_truth_answers,
+            },
+            evaluate=partial(self._evaluate, verbose=run_input.verbose),
+            result_type=RunResult,
+        )
+        return RunOutput(results=out_results)
+
+    def _evaluate(
+        self, questions: list[str], answers: list[str], ground_truth_answers: list[str], verbose: bool = False
+    ) -> list[RunResult]:
+        """
+        Evaluate the answer correctness of questions missing in the checkpoint.
+
+        Args:
+          questions (list[str]): List of questions.
+          answers (list[str]): List of answers.
+          ground_truth_answers (list[str]): List of ground truth answers.
+          verbose (bool): Flag for verbose logging.
+
+        Returns:
+          list[RunResult]: Results in the order of the questions.
+        """
+        num_questions = len(questions)
+        # Statements of all answers and ground truth answers are extracted in one run
+        candidates = self.extract_statements(questions * 2, answers + ground_truth_answers)
+        ans_candidates, gt_candidates = candidates[:num_questions], candidates[num_questions:]
+
+        # Answer statements are classified against the ground truth and vice versa, for all questions at once
+        classify_questions, statements_list, ref_texts = [], [], []
+        for question, ans_stmts, gt_stmts in zip(questions, ans_candidates, gt_candidates):
+            classify_questions.extend([question, question])
+            statements_list.extend([ans_stmts, gt_stmts])
+            ref_texts.extend([self._join_candidates(gt_stmts), self._join_candidates(ans_stmts)])
+        classified = self.classify_statements(classify_questions, statements_list, ref_texts)
+
         out_results = []
-        for i in range(len(run_input.questions)):
-            result = self.run_single(
-                question=run_input.questions[i],
-                answer=run_input.answers[i],
-                ground_truth_answer=run_input.ground_truth_answers[i],
-                verbose=run_input.verbose,
-            )
+        for idx, question in enumerate(questions):
+            ans_stmts, gt_stmts = ans_candidates[idx], gt_candidates[idx]
+            ans_class = [(stmt, m, expl) for stmt, (m, expl) in zip(ans_stmts, classified[2 * idx])]
+            gt_class = [(stmt, m, expl) for stmt, (m, expl) in zip(gt_stmts, classified[2 * idx + 1])]
+            result = self._score(ans_class, gt_class)
+            if verbose:
+                logger.debug(f"Question: {question}")
+                logger.debug(f"Answer: {self._join_candidates(ans_stmts)}")
+                logger.debug(f"Ground Truth Answer: {self._join_candidates(gt_stmts)}")
+                logger.debug(result.reasoning)
             out_results.append(result)
-        return RunOutput(results=out_results)
+        return out_results
@@ -1,10 +1,15 @@
 import re
 from typing import Callable
 
-from pydantic import BaseModel, PrivateAttr, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from dynamiq.evaluations import BaseEvaluator
 
+# Split on ., !, or ? followed by whitespace or end of string
+SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+|(?<=[.!?])$")
+PUNCTUATION_RE = re.compile(r"[^\w\s]")
+MAX_NGRAM_ORDER = 4
+
 
 class RunInput(BaseModel):
     """
@@ -74,11 +79,15 @@ class BleuScoreEvaluator(BaseEvaluator):
 
     Attributes:
         name (str): Name of the metric. Defaults to "BleuScore".
+        workers (int): Number of processes scoring pairs in `run`. Small batches are scored in the calling process.
     """
     name: str = "BleuScore"
+    workers: int = Field(default=1, ge=1)
 
-    # Private attribute to store the sacrebleu corpus_bleu function.
+    # Private attributes to store the sacrebleu corpus_bleu function and BLEU helpers.
     _corpus_bleu: Callable = PrivateAttr()
+    _compute_bleu: Callable = PrivateAttr()
+    _extract_ngrams: Callable = PrivateAttr()
 
     def __init__(self, **data):
         """
@@ -94,9 +103,12 @@ class BleuScoreEvaluator(BaseEvaluator):
         Raises:
             ImportError: If sacrebleu is not installed.
         """
-        from sacrebleu import corpus_bleu
+        from sacrebleu import BLEU, corpus_bleu
+        from sacrebleu.metrics.helpers import extract_all_word_ngrams
 
         self._corpus_bleu = corpus_bleu
+        self._compute_bleu = BLEU.compute_bleu
+        self._extract_ngrams = extract_all_word_ngrams
 
     def run_single(self, ground_truth_answer: str, answer: str) -> float:
         """
@@ -160,8 +172,7 @@ class BleuScoreEvaluator(BaseEvaluator):
         Returns:
             list[str]: List of sentences.
         """
-        # Split on ., !, or ? followed by whitespace or end of string
-        sentences = re.split(r"(?<=[.!?])\s+|(?<=[.!?])$", text)
+        sentences = SENTENCE_BOUNDARY_RE.split(text)
         return [s.strip() for s in sentences if s.strip()]
 
     def _clean_sentence(self, sentence: str) -> str:
@@ -178,7 +189,7 @@ class BleuScoreEvaluator(BaseEvaluator):
         cleaned = sentence.strip()
 
         # Remove all punctuation
-        cleaned = re.sub(r"[^\w\s]", "", cleaned)
+        cleaned = PUNCTUATION_RE.sub("", cleaned)
 
         return cleaned.strip()
 
@@ -186,6 +197,9 @@ class BleuScoreEvaluator(BaseEvaluator):
         """
         Compute BLEU scores for each ground_truth_answer/answer pair in batch.
 
+        Scores match `run_single`. Sentence statistics are extracted directly instead of building a sacrebleu
+        corpus per pair, and large batches are split across `workers` processes.
+
         Args:
             ground_truth_answers (list[str]): List of reference answers.
             answers (list[str]): List of candidate answers.
@@ -195,11 +209,61 @@ class BleuScoreEvaluator(BaseEvaluator):
         """
         # Validate batch input.
         input_data = RunInput(ground_truth_answers=ground_truth_answers, answers=answers)
-        scores = []
+        return self._score_pairs_in_processes(input_data.ground_truth_answers, input_data.answers, self.workers)
+
+    def _score_pairs(self, ground_truth_answers: list[str], answers: list[str]) -> list[float]:
+        """
+        Compute BLEU scores of pairs in the current process.
+
+        Args:
+            ground_truth_answers (list[str]): List of reference answers.
+            answers (list[str]): List of candidate answers.
+
+        Returns:
+            list[float]: List of computed BLEU scores.
+        """
+        return [self._score_pair(gt, ans) for gt, ans in zip(ground_truth_answers, answers)]
+
+    def _score_pair(self, ground_truth_answer: str, answer: str) -> float:
+        """
+        Compute the BLEU score of a pair like sacrebleu `corpus_bleu` in `run_single`.
+
+        sacrebleu pairs hypothesis sentences with reference streams of one sentence each, so only the first
+        answer sentence is scored, against every reference sentence. Cleaned sentences contain only word
+        characters and whitespace, on which the 13a tokenizer only separates underscores.
 
-        for gt, ans in zip(input_data.ground_truth_answers, input_data.answers):
-            score = self.run_single(ground_truth_answer=gt, answer=ans)
-            scores.append(score)
+        Args:
+            ground_truth_answer (str): The reference answer.
+            answer (str): The candidate answer.
 
-        output_data = RunOutput(scores=scores)
-        return output_data.scores
+        Returns:
+            float: The computed BLEU score.
+        """
+        references = self._process_text_for_bleu(ground_truth_answer)
+        hypotheses = self._process_text_for_bleu(answer)
+        if not references or not hypotheses:
+            # sacrebleu rejects empty corpora
+            return self.run_single(ground_truth_answer=ground_truth_answer, answer=answer)
+
+        ref_ngrams, ref_lens = None, []
+        for reference in references:
+            ngrams, ref_len = self._extract_ngrams(reference.replace("_", " _ "), 1, MAX_NGRAM_ORDER)
+            ref_lens.append(ref_len)
+            if ref_ngrams is None:
+                ref_ngrams = ngrams
+            else:
+                for ngram, count in ngrams.items():
+                    ref_ngrams[ngram] = max(ref_ngrams[ngram], count)
+
+        hyp_ngrams, hyp_len = self._extract_ngrams(hypotheses[0].replace("_", " _ "), 1, MAX_NGRAM_ORDER)
+        # The closest reference length, the shortest one on ties
+        ref_len = min(ref_lens, key=lambda length: (abs(hyp_len - length), length))
+
+        correct, total = [0] * MAX_NGRAM_ORDER, [0] * MAX_NGRAM_ORDER
+        for ngram, count in hyp_ngrams.items():
+            total[len(ngram) - 1] += count
+            if ngram in ref_ngrams:
+                correct[len(ngram) - 1] += min(count, ref_ngrams[ngram])
+
+        bleu = self._compute_bleu(correct, total, hyp_len, ref_len, smooth_method="exp")
+        return round(float(bleu.score / 100.0), 2)
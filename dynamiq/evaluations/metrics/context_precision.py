@@ -1,5 +1,8 @@
-from pydantic import BaseModel, PrivateAttr, field_validator, model_validator
+from functools import partial
+
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 from dynamiq.evaluations import BaseEvaluator
+from dynamiq.evaluations.checkpoint import CheckpointConfig, EvaluationCheckpoint
 from dynamiq.evaluations.llm_evaluator import LLMEvaluator
 from dynamiq.nodes.llms import BaseLLM
 from dynamiq.utils.logger import logger
@@ -88,15 +91,23 @@ class ContextPrecisionEvaluator(BaseEvaluator):
 
     Attributes:
         llm (BaseLLM): The language model to use for evaluation.
+        max_concurrency (int): The maximum number of LLM calls at the same time.
+        checkpoint (CheckpointConfig | None): Local store of per-sample results and LLM judgments.
+            Reruns skip stored samples. Results are kept in memory only if None.
     """
     name: str = "ContextPrecision"
     llm: BaseLLM
+    max_concurrency: int = Field(default=8, ge=1)
+    checkpoint: CheckpointConfig | None = None
 
-    # Private attribute (not a Pydantic model field)
+    # Private attributes (not Pydantic model fields)
+    _checkpoint: EvaluationCheckpoint | None = PrivateAttr(default=None)
     _context_precision_evaluator: LLMEvaluator = PrivateAttr()
 
     def __init__(self, **data):
         super().__init__(**data)
+        if self.checkpoint is not None:
+            self._checkpoint = EvaluationCheckpoint.get_shared(self.checkpoint)
         self._initialize_evaluator()
 
     def _initialize_evaluator(self):
@@ -189,6 +200,8 @@ class ContextPrecisionEvaluator(BaseEvaluator):
                 },
             ],
             llm=self.llm,
+            max_concurrency=self.max_concurrency,
+            checkpoint=self._checkpoint,
         )
 
     @staticmethod
@@ -257,16 +270,22 @@ class ContextPrecisionEvaluator(BaseEvaluator):
         reasoning_strings.append(f"Average Precision Score = {average_precision:.2f}")
         return "\n".join(reasoning_strings)
 
-    def run_single(
-        self, question: str, answer: str, contexts: list[str], verbose: bool = False
+    def _score(
+        self,
+        question: str,
+        answer: str,
+        contexts: list[str],
+        results: list[dict | None],
+        verbose: bool = False,
     ) -> ContextPrecisionRunResult:
         """
-        Evaluate the context precision for a single sample.
+        Compute the average precision and reasoning of a sample from the verdicts of its contexts.
 
         Args:
             question (str): The question.
             answer (str): The corresponding answer.
             contexts (list[str]): A list of contexts for this question.
+            results (list[dict | None]): Evaluation results of the contexts. Failed evaluations are None.
             verbose (bool): Flag to enable verbose logging.
 
         Returns:
@@ -274,11 +293,8 @@ class ContextPrecisionEvaluator(BaseEvaluator):
         """
         verdicts = []
         verdict_details = []
-        for context in contexts:
-            evaluation_result = self._context_precision_evaluator.run(
-                question=[question], answer=[answer], context=[context]
-            )
-            if ("results" not in evaluation_result) or (not evaluation_result["results"]):
+        for context, result_item in zip(contexts, results):
+            if not result_item:
                 default_verdict = 0
                 verdicts.append(default_verdict)
                 verdict_details.append("No results returned from evaluator.")
@@ -286,7 +302,6 @@ class ContextPrecisionEvaluator(BaseEvaluator):
                     logger.debug(f"Missing results for context: {context}. Defaulting verdict to {default_verdict}.")
                 continue
 
-            result_item = evaluation_result["results"][0]
             verdict_raw = result_item.get("verdict", "0")
             try:
                 verdict = int(verdict_raw) if not isinstance(verdict_raw, str) else int(verdict_raw.strip())
@@ -310,6 +325,23 @@ class ContextPrecisionEvaluator(BaseEvaluator):
             logger.debug("=" * 50)
         return ContextPrecisionRunResult(score=average_precision, reasoning=reasoning_text)
 
+    def run_single(
+        self, question: str, answer: str, contexts: list[str], verbose: bool = False
+    ) -> ContextPrecisionRunResult:
+        """
+        Evaluate the context precision for a single sample.
+
+        Args:
+            question (str): The question.
+            answer (str): The corresponding answer.
+            contexts (list[str]): A list of contexts for this question.
+            verbose (bool): Flag to enable verbose logging.
+
+        Returns:
+            ContextPrecisionRunResult: Contains the computed average precision score and detailed reasoning.
+        """
+        return self.run(questions=[question], answers=[answer], contexts_list=[contexts], verbose=verbose).results[0]
+
     def run(
         self,
         questions: list[str],
@@ -320,6 +352,9 @@ class ContextPrecisionEvaluator(BaseEvaluator):
         """
         Evaluate the context precision for each question.
 
+        The contexts of all questions are evaluated at once, with up to `max_concurrency` LLM calls
+        at the same time.
+
         Args:
             questions (list[str]): List of questions.
             answers (list[str]): List of corresponding answers.
@@ -336,13 +371,59 @@ class ContextPrecisionEvaluator(BaseEvaluator):
             contexts_list=contexts_list,
             verbose=verbose,
         )
+        results_output = self._run_with_checkpoint(
+            self._checkpoint,
+            inputs={
+                "questions": run_input.questions,
+                "answers": run_input.answers,
+                "contexts_list": run_input.contexts_list,
+            },
+            evaluate=partial(self._evaluate, verbose=run_input.verbose),
+            result_type=ContextPrecisionRunResult,
+        )
+        return ContextPrecisionOutput(results=results_output)
+
+    def _evaluate(
+        self, questions: list[str], answers: list[str], contexts_list: list[list[str]], verbose: bool = False
+    ) -> list[ContextPrecisionRunResult]:
+        """
+        Evaluate the context precision of questions missing in the checkpoint.
+
+        Args:
+            questions (list[str]): List of questions.
+            answers (list[str]): List of corresponding answers.
+            contexts_list (list[list[str]]): List of contexts per question.
+            verbose (bool): Flag to enable verbose logging (for internal logging only).
+
+        Returns:
+            list[ContextPrecisionRunResult]: Results in the order of the questions.
+        """
+        rows = [
+            (question, answer, context)
+            for question, answer, contexts in zip(questions, answers, contexts_list)
+            for context in contexts
+        ]
+        results = []
+        if rows:
+            row_questions, row_answers, row_contexts = map(list, zip(*rows))
+            evaluation_result = self._context_precision_evaluator.run(
+                question=row_questions, answer=row_answers, context=row_contexts
+            )
+            results = evaluation_result.get("results") or []
+
         results_output = []
-        for index in range(len(run_input.questions)):
-            question = run_input.questions[index]
-            answer = run_input.answers[index]
-            contexts = run_input.contexts_list[index]
-            result_single = self.run_single(
-                question=question, answer=answer, contexts=contexts, verbose=run_input.verbose
+        offset = 0
+        for question, answer, contexts in zip(questions, answers, contexts_list):
+            context_results = results[offset : offset + len(contexts)]
+            context_results += [None] * (len(contexts) - len(context_results))
+            offset += len(contexts)
+            results_output.append(
+                self._score(
+                    question=question,
+                    answer=answer,
+                    contexts=contexts,
+                    results=context_results,
+                    verbose=verbose,
+                )
             )
-            results_output.append(result_single)
-        return ContextPrecisionOutput(results=results_output)
+        return results_output
@@ -1,8 +1,10 @@
 import json
+from functools import partial
 from typing import Any
 
-from pydantic import BaseModel, PrivateAttr, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 from dynamiq.evaluations import BaseEvaluator
+from dynamiq.evaluations.checkpoint import CheckpointConfig, EvaluationCheckpoint
 from dynamiq.evaluations.llm_evaluator import LLMEvaluator
 from dynamiq.nodes.llms import BaseLLM
 from dynamiq.utils.logger import logger
@@ -93,14 +95,22 @@ class ContextRecallEvaluator(BaseEvaluator):
 
     Attributes:
         llm (BaseLLM): The language model to use for evaluation.
+        max_concurrency (int): The maximum number of LLM calls at the same time.
+        checkpoint (CheckpointConfig | None): Local store of per-sample results and LLM judgments.
+            Reruns skip stored samples. Results are kept in memory only if None.
     """
     name: str = "ContextRecall"
     llm: BaseLLM
+    max_concurrency: int = Field(default=8, ge=1)
+    checkpoint: CheckpointConfig | None = None
 
+    _checkpoint: EvaluationCheckpoint | None = PrivateAttr(default=None)
     _classification_evaluator: LLMEvaluator = PrivateAttr()
 
     def __init__(self, **data):
         super().__init__(**data)
+        if self.checkpoint is not None:
+            self._checkpoint = EvaluationCheckpoint.get_shared(self.checkpoint)
         self._initialize_evaluator()
 
     def _initialize_evaluator(self):
@@ -182,6 +192,8 @@ class ContextRecallEvaluator(BaseEvaluator):
                 },
             ],
             llm=self.llm,
+            max_concurrency=self.max_concurrency,
+            checkpoint=self._checkpoint,
         )
 
     def _build_reasoning(self, classifications: list[ClassificationItem], score: float) -> str:
@@ -215,43 +227,37 @@ class ContextRecallEvaluator(BaseEvaluator):
         lines.append(f"Context Recall Score = {score:.2f}")
         return "\n".join(lines)
 
-    def run_single(self, question: str, context: str, answer: str, verbose: bool = False) -> ContextRecallRunResult:
+    def _score(
+        self, question: str, context: str, answer: str, result: dict | None, verbose: bool = False
+    ) -> ContextRecallRunResult:
         """
-        Evaluate the context recall for a single sample.
+        Compute the context recall score and reasoning of a sample from its classification result.
 
         Args:
             question (str): The question.
             context (str): The context (already normalized as a single string).
             answer (str): The answer.
+            result (dict | None): Classification result of the sample. None if the evaluation failed.
             verbose (bool): Flag to enable verbose logging.
 
         Returns:
             ContextRecallRunResult: The computed context recall score and detailed reasoning.
         """
-        result = self._classification_evaluator.run(
-            question=[question],
-            context=[context],
-            answer=[answer],
-        )
-
         classifications = []
-        if "results" not in result or not result["results"]:
+        if not result:
             if verbose:
                 logger.debug(f"No results returned for question: {question}, context: {context}.")
+        elif "classifications" not in result or not result["classifications"]:
+            if verbose:
+                logger.debug(f"No classifications returned for question: {question}, context: {context}.")
         else:
-            first_result = result["results"][0]
-            if "classifications" not in first_result or not first_result["classifications"]:
-                if verbose:
-                    logger.debug(f"No classifications returned for question: {question}, context: {context}.")
-            else:
-                classifications_raw = first_result["classifications"]
-                for item in classifications_raw:
-                    classification_item = ClassificationItem(
-                        statement=item["statement"],
-                        reason=item["reason"],
-                        attributed=int(item["attributed"]),
-                    )
-                    classifications.append(classification_item)
+            for item in result["classifications"]:
+                classification_item = ClassificationItem(
+                    statement=item["statement"],
+                    reason=item["reason"],
+                    attributed=int(item["attributed"]),
+                )
+                classifications.append(classification_item)
 
         attributed_list = [item.attributed for item in classifications]
         num_sentences = len(attributed_list)
@@ -272,6 +278,21 @@ class ContextRecallEvaluator(BaseEvaluator):
 
         return ContextRecallRunResult(score=score, reasoning=reasoning_str)
 
+    def run_single(self, question: str, context: str, answer: str, verbose: bool = False) -> ContextRecallRunResult:
+        """
+        Evaluate the context recall for a single sample.
+
+        Args:
+            question (str): The question.
+            context (str): The context (already normalized as a single string).
+            answer (str): The answer.
+            verbose (bool): Flag to enable verbose logging.
+
+        Returns:
+            ContextRecallRunResult: The computed context recall score and detailed reasoning.
+        """
+        return self.run(questions=[question], contexts=[context], answers=[answer], verbose=verbose).results[0]
+
     def run(
         self,
         questions: list[str],
@@ -282,6 +303,8 @@ class ContextRecallEvaluator(BaseEvaluator):
         """
         Evaluate the context recall for each question.
 
+        All questions are classified at once, with up to `max_concurrency` LLM calls at the same time.
+
         Args:
             questions (list[str]): List of questions.
             contexts (list[str] or list[list[str]]): Either a single list of context strings or a list
@@ -298,13 +321,33 @@ class ContextRecallEvaluator(BaseEvaluator):
             answers=answers,
             verbose=verbose,
         )
-        results_output = []
-        for i in range(len(run_input.questions)):
-            question = run_input.questions[i]
-            context = run_input.contexts[i]
-            answer = run_input.answers[i]
-            result_single = self.run_single(
-                question=question, context=context, answer=answer, verbose=run_input.verbose
-            )
-            results_output.append(result_single)
+        results_output = self._run_with_checkpoint(
+            self._checkpoint,
+            inputs={"questions": run_input.questions, "contexts": run_input.contexts, "answers": run_input.answers},
+            evaluate=partial(self._evaluate, verbose=run_input.verbose),
+            result_type=ContextRecallRunResult,
+        )
         return ContextRecallOutput(results=results_output)
+
+    def _evaluate(
+        self, questions: list[str], contexts: list[str], answers: list[str], verbose: bool = False
+    ) -> list[ContextRecallRunResult]:
+        """
+        Evaluate the context recall of questions missing in the checkpoint.
+
+        Args:
+            questions (list[str]): List of questions.
+            contexts (list[str]): List of contexts, one per question.
+            answers (list[str]): List of answers.
+            verbose (bool): Flag to enable verbose logging (for internal logging only).
+
+        Returns:
+            list[ContextRecallRunResult]: Results in the order of the questions.
+        """
+        result = self._classification_evaluator.run(question=questions, context=contexts, answer=answers)
+        results = result.get("results") or []
+        results += [None] * (len(questions) - len(results))
+        return [
+            self._score(question=question, context=context, answer=answer, result=item, verbose=verbose)
+            for question, context, answer, item in zip(questions, contexts, answers, results)
+        ]
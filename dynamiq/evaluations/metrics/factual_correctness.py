@@ -1,7 +1,9 @@
+from functools import partial
 from typing import Any
 
-from pydantic import BaseModel, PrivateAttr, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 from dynamiq.evaluations import BaseEvaluator
+from dynamiq.evaluations.checkpoint import CheckpointConfig, EvaluationCheckpoint
 from dynamiq.evaluations.llm_evaluator import LLMEvaluator
 from dynamiq.nodes.llms import BaseLLM
 from dynamiq.utils.logger import logger
@@ -129,6 +131,9 @@ class FactualCorrectnessEvaluator(BaseEvaluator):
 
     Attributes:
         llm (BaseLLM): The language model to use for evaluation.
+        max_concurrency (int): The maximum number of LLM calls at the same time.
+        checkpoint (CheckpointConfig | None): Local store of per-sample results and LLM judgments.
+            Reruns skip stored samples. Results are kept in memory only if None.
         mode (str): Evaluation mode ('precision', 'recall', or 'f1').
         beta (float): Beta value for F-beta score.
         atomicity (str): Level of atomicity ('low' or 'high').
@@ -136,16 +141,21 @@ class FactualCorrectnessEvaluator(BaseEvaluator):
     """
     name: str = "FactualCorrectness"
     llm: BaseLLM
+    max_concurrency: int = Field(default=8, ge=1)
+    checkpoint: CheckpointConfig | None = None
     mode: str = "f1"
     beta: float = 1.0
     atomicity: str = "low"
     coverage: str = "low"
 
+    _checkpoint: EvaluationCheckpoint | None = PrivateAttr(default=None)
     _claim_decomposer: LLMEvaluator = PrivateAttr()
     _nli_evaluator: LLMEvaluator = PrivateAttr()
 
     def __init__(self, **data):
         super().__init__(**data)
+        if self.checkpoint is not None:
+            self._checkpoint = EvaluationCheckpoint.get_shared(self.checkpoint)
         self._initialize_evaluators()
 
     def _initialize_evaluators(self):
@@ -180,6 +190,8 @@ class FactualCorrectnessEvaluator(BaseEvaluator):
                 },
             ],
             llm=self.llm,
+            max_concurrency=self.max_concurrency,
+            checkpoint=self._checkpoint,
         )
 
         # NLI Evaluator
@@ -235,6 +247,8 @@ class FactualCorrectnessEvaluator(BaseEvaluator):
                 },
             ],
             llm=self.llm,
+            max_concurrency=self.max_concurrency,
+            checkpoint=self._checkpoint,
         )
 
     def decompose_claims(self, texts: list[str]) -> list[list[str]]:
@@ -390,75 +404,47 @@ class FactualCorrectnessEvaluator(BaseEvaluator):
         lines.extend(["", f"Final Score = {score:.2f}"])
         return "\n".join(lines)
 
-    def run_single(
-        self, answer: str, context: str, mode: str | None = None, beta: float | None = None, verbose: bool = False
+    def _score(
+        self,
+        answer: str,
+        context: str,
+        answer_claims: list[str],
+        context_claims: list[str],
+        context_verdicts: list[int],
+        answer_verdicts: list[int] | None,
+        mode: str,
+        beta: float,
+        verbose: bool = False,
     ) -> FactualCorrectnessRunResult:
         """
-        Evaluate the factual correctness for a single sample.
+        Compute the factual correctness score and reasoning of a sample from its claims and verdicts.
 
         Args:
             answer (str): The response text.
             context (str): The reference text.
-            mode (str | None): Evaluation mode ('precision', 'recall', or 'f1').
-            beta (float | None): Beta value for F-beta score.
+            answer_claims (list[str]): Claims decomposed from the answer.
+            context_claims (list[str]): Claims decomposed from the context.
+            context_verdicts (list[int]): Verdicts of the answer claims against the context.
+            answer_verdicts (list[int] | None): Verdicts of the context claims against the answer. None in
+                precision mode.
+            mode (str): Evaluation mode ('precision', 'recall', or 'f1').
+            beta (float): Beta value for F-beta score.
             verbose (bool): Flag for verbose logging.
 
         Returns:
             FactualCorrectnessRunResult: The computed factual correctness score and detailed reasoning.
         """
-        evaluation_mode = mode or self.mode
-        beta_value = beta or self.beta
-
-        answer_claims_list = self.decompose_claims([answer])
-        if not answer_claims_list or answer_claims_list[0] is None:
-            if verbose:
-                logger.debug(f"No claims decomposed for answer: {answer}. Using empty list.")
-            answer_claims = []
-        else:
-            answer_claims = answer_claims_list[0]
-
-        context_claims_list = self.decompose_claims([context])
-        if not context_claims_list or context_claims_list[0] is None:
-            if verbose:
-                logger.debug(f"No claims decomposed for context: {context}. Using empty list.")
-            context_claims = []
-        else:
-            context_claims = context_claims_list[0]
-
-        # Verify answer claims against context (precision part).
-        context_verdicts_list = self.verify_claims(premises=[context], claims_list=[answer_claims])
-        if not context_verdicts_list or context_verdicts_list[0] is None:
-            if verbose:
-                logger.debug(f"No verdicts returned when verifying answer claims against context for answer: {answer}")
-            context_verdicts = []
-        else:
-            context_verdicts = context_verdicts_list[0]
         tp = sum(context_verdicts)
         fp = len(context_verdicts) - tp
+        fn = sum(1 - v for v in answer_verdicts) if answer_verdicts is not None else 0
+        answer_verdicts = answer_verdicts or []
 
-        # For recall or F1, verify context claims against answer.
-        if evaluation_mode not in ("precision", "PRECISION"):
-            answer_verdicts_list = self.verify_claims(premises=[answer], claims_list=[context_claims])
-            if not answer_verdicts_list or answer_verdicts_list[0] is None:
-                if verbose:
-                    logger.debug(
-                        f"No verdicts returned when verifying context claims against answer for answer: {answer}"
-                    )
-                answer_verdicts = []
-                fn = 0
-            else:
-                answer_verdicts = answer_verdicts_list[0]
-                fn = sum(1 - v for v in answer_verdicts)
-        else:
-            answer_verdicts = []
-            fn = 0
-
-        if evaluation_mode == "precision":
+        if mode == "precision":
             computed_score = tp / (tp + fp + 1e-8)
-        elif evaluation_mode == "recall":
+        elif mode == "recall":
             computed_score = tp / (tp + fn + 1e-8)
         else:
-            computed_score = self.fbeta_score(tp, fp, fn, beta_value)
+            computed_score = self.fbeta_score(tp, fp, fn, beta)
 
         reasoning_text = self._build_reasoning(
             answer_claims=answer_claims,
@@ -469,8 +455,8 @@ class FactualCorrectnessEvaluator(BaseEvaluator):
             fp=fp,
             fn=fn,
             score=computed_score,
-            mode=evaluation_mode,
-            beta=beta_value,
+            mode=mode,
+            beta=beta,
         )
 
         if verbose:
@@ -485,6 +471,24 @@ class FactualCorrectnessEvaluator(BaseEvaluator):
 
         return FactualCorrectnessRunResult(score=round(computed_score, 2), reasoning=reasoning_text)
 
+    def run_single(
+        self, answer: str, context: str, mode: str | None = None, beta: float | None = None, verbose: bool = False
+    ) -> FactualCorrectnessRunResult:
+        """
+        Evaluate the factual correctness for a single sample.
+
+        Args:
+            answer (str): The response text.
+            context (str): The reference text.
+            mode (str | None): Evaluation mode ('precision', 'recall', or 'f1').
+            beta (float | None): Beta value for F-beta score.
+            verbose (bool): Flag for verbose logging.
+
+        Returns:
+            FactualCorrectnessRunResult: The computed factual correctness score and detailed reasoning.
+        """
+        return self.run(answers=[answer], contexts=[context], mode=mode, beta=beta, verbose=verbose).results[0]
+
     def run(
         self,
         answers: list[str],
@@ -505,6 +509,8 @@ class FactualCorrectnessEvaluator(BaseEvaluator):
         5) Generate detailed reasoning regarding the claim decomposition,
            verification, and final metric calculations with emojis.
 
+        Every step evaluates all samples at once, with up to `max_concurrency` LLM calls at the same time.
+
         Args:
             answers (list[str]): List of response texts.
             contexts (list[str] | list[list[str]]): List of context texts.
@@ -519,16 +525,65 @@ class FactualCorrectnessEvaluator(BaseEvaluator):
         evaluation_mode = run_input.mode or self.mode
         beta_value = run_input.beta or self.beta
 
-        results_output = []
-        for index in range(len(run_input.answers)):
-            answer_sample = run_input.answers[index]
-            context_sample = run_input.contexts[index]
-            result_single = self.run_single(
-                answer=answer_sample,
-                context=context_sample,
-                mode=evaluation_mode,
-                beta=beta_value,
-                verbose=run_input.verbose,
-            )
-            results_output.append(result_single)
+        results_output = self._run_with_checkpoint(
+            self._checkpoint,
+            inputs={"answers": run_input.answers, "contexts": run_input.contexts},
+            evaluate=partial(self._evaluate, mode=evaluation_mode, beta=beta_value, verbose=run_input.verbose),
+            result_type=FactualCorrectnessRunResult,
+            mode=evaluation_mode,
+            beta=beta_value,
+        )
         return RunOutput(results=results_output)
+
+    def _evaluate(
+        self, answers: list[str], contexts: list[str], mode: str, beta: float, verbose: bool = False
+    ) -> list[FactualCorrectnessRunResult]:
+        """
+        Evaluate the factual correctness of samples missing in the checkpoint.
+
+        Args:
+            answers (list[str]): List of response texts.
+            contexts (list[str]): List of context texts.
+            mode (str): Evaluation mode ('precision', 'recall', or 'f1').
+            beta (float): Beta value for F-beta score.
+            verbose (bool): Flag for verbose logging.
+
+        Returns:
+            list[FactualCorrectnessRunResult]: Results in the order of the samples.
+        """
+        num_samples = len(answers)
+        claims_list = self.decompose_claims(answers + contexts)
+        answer_claims_list, context_claims_list = claims_list[:num_samples], claims_list[num_samples:]
+
+        # Answer claims are verified against the context for precision. For recall or F1, context claims
+        # are also verified against the answer.
+        premises, claims_to_verify = list(contexts), list(answer_claims_list)
+        with_recall = mode not in ("precision", "PRECISION")
+        if with_recall:
+            premises += answers
+            claims_to_verify += context_claims_list
+        verdicts_list = self.verify_claims(premises=premises, claims_list=claims_to_verify)
+        context_verdicts_list = verdicts_list[:num_samples]
+        answer_verdicts_list = verdicts_list[num_samples:] if with_recall else [None] * num_samples
+
+        return [
+            self._score(
+                answer=answer,
+                context=context,
+                answer_claims=answer_claims,
+                context_claims=context_claims,
+                context_verdicts=context_verdicts,
+                answer_verdicts=answer_verdicts,
+                mode=mode,
+                beta=beta,
+                verbose=verbose,
+            )
+            for answer, context, answer_claims, context_claims, context_verdicts, answer_verdicts in zip(
+                answers,
+                contexts,
+                answer_claims_list,
+                context_claims_list,
+                context_verdicts_list,
+                answer_verdicts_list,
+            )
+        ]
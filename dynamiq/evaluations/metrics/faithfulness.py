@@ -1,7 +1,9 @@
+from functools import partial
 from typing import Any
 
-from pydantic import BaseModel, PrivateAttr, field_validator, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 from dynamiq.evaluations import BaseEvaluator
+from dynamiq.evaluations.checkpoint import CheckpointConfig, EvaluationCheckpoint
 from dynamiq.evaluations.llm_evaluator import LLMEvaluator
 from dynamiq.nodes.llms import BaseLLM
 from dynamiq.utils.logger import logger
@@ -175,15 +177,23 @@ class FaithfulnessEvaluator(BaseEvaluator):
 
     Attributes:
         llm (BaseLLM): The language model used for evaluation.
+        max_concurrency (int): The maximum number of LLM calls at the same time.
+        checkpoint (CheckpointConfig | None): Local store of per-sample results and LLM judgments.
+            Reruns skip stored samples. Results are kept in memory only if None.
     """
     name: str = "Faithfulness"
     llm: BaseLLM
+    max_concurrency: int = Field(default=8, ge=1)
+    checkpoint: CheckpointConfig | None = None
 
+    _checkpoint: EvaluationCheckpoint | None = PrivateAttr(default=None)
     _statement_simplifier: LLMEvaluator = PrivateAttr()
     _nli_evaluator: LLMEvaluator = PrivateAttr()
 
     def __init__(self, **data):
         super().__init__(**data)
+        if self.checkpoint is not None:
+            self._checkpoint = EvaluationCheckpoint.get_shared(self.checkpoint)
         self._initialize_evaluators()
 
     def _initialize_evaluators(self):
@@ -224,6 +234,8 @@ class FaithfulnessEvaluator(BaseEvaluator):
                 },
             ],
             llm=self.llm,
+            max_concurrency=self.max_concurrency,
+            checkpoint=self._checkpoint,
         )
         nli_instructions = (
             "Your task is to judge the faithfulness of a series of statements based "
@@ -290,6 +302,8 @@ class FaithfulnessEvaluator(BaseEvaluator):
                 },
             ],
             llm=self.llm,
+            max_concurrency=self.max_concurrency,
+            checkpoint=self._checkpoint,
         )
 
     def simplify_statements(self, questions: list[str], answers: list[str]) -> list[list[str]]:
@@ -401,39 +415,37 @@ class FaithfulnessEvaluator(BaseEvaluator):
 
         return "\n".join(lines)
 
-    def run_single(self, question: str, answer: str, context: str, verbose: bool = False) -> FaithfulnessRunResult:
+    def _score(
+        self,
+        question: str,
+        answer: str,
+        context: str,
+        statements: list[str] | None,
+        nli_results: list[NLIResultItem] | None,
+        verbose: bool = False,
+    ) -> FaithfulnessRunResult:
         """
-        Evaluate the faithfulness for a single sample.
+        Compute the faithfulness score and reasoning of a sample from its statements and NLI results.
 
         Args:
             question (str): The question.
             answer (str): The corresponding answer.
             context (str): The evaluation context.
+            statements (list[str] | None): Simplified statements of the answer.
+            nli_results (list[NLIResultItem] | None): NLI results of the statements.
             verbose (bool): Flag to enable verbose logging.
 
         Returns:
             FaithfulnessRunResult: The result with faithfulness score and detailed reasoning.
         """
-        # Validate the single input using a pydantic model
-        single_input = FaithfulnessRunSingleInput(question=question, answer=answer, context=context, verbose=verbose)
-
-        # Simplify the answer (using question and answer)
-        statements_list = self.simplify_statements([single_input.question], [single_input.answer])
-        if not statements_list or statements_list[0] is None:
-            if single_input.verbose:
-                logger.debug(f"No simplified statements for answer: {single_input.answer}. Using empty list.")
+        if statements is None:
+            if verbose:
+                logger.debug(f"No simplified statements for answer: {answer}. Using empty list.")
             statements = []
-        else:
-            statements = statements_list[0]
-
-        # Evaluate faithfulness via NLI
-        nli_results_list = self.check_faithfulness([single_input.context], [statements])
-        if not nli_results_list or nli_results_list[0] is None:
-            if single_input.verbose:
+        if nli_results is None:
+            if verbose:
                 logger.debug("No NLI results for context or statements. Using empty list for NLI evaluation.")
             nli_results = []
-        else:
-            nli_results = nli_results_list[0]
 
         num_statements = len(nli_results)
         num_faithful = sum(item.verdict for item in nli_results)
@@ -447,18 +459,39 @@ class FaithfulnessEvaluator(BaseEvaluator):
             num_faithful=num_faithful,
             score=score,
         )
-        if single_input.verbose:
-            logger.debug(f"Question: {single_input.question}")
-            logger.debug(f"Answer: {single_input.answer}")
-            logger.debug(f"Context: {single_input.context}")
+        if verbose:
+            logger.debug(f"Question: {question}")
+            logger.debug(f"Answer: {answer}")
+            logger.debug(f"Context: {context}")
             logger.debug("Simplified Statements:")
             logger.debug(statements)
             logger.debug("NLI Results:")
             logger.debug([item.model_dump() for item in nli_results])
             logger.debug(reasoning)
             logger.debug("-" * 50)
-        result_item = FaithfulnessRunResult(score=score, reasoning=reasoning)
-        return result_item
+        return FaithfulnessRunResult(score=score, reasoning=reasoning)
+
+    def run_single(self, question: str, answer: str, context: str, verbose: bool = False) -> FaithfulnessRunResult:
+        """
+        Evaluate the faithfulness for a single sample.
+
+        Args:
+            question (str): The question.
+            answer (str): The corresponding answer.
+            context (str): The evaluation context.
+            verbose (bool): Flag to enable verbose logging.
+
+        Returns:
+            FaithfulnessRunResult: The result with faithfulness score and detailed reasoning.
+        """
+        # Validate the single input using a pydantic model
+        single_input = FaithfulnessRunSingleInput(question=question, answer=answer, context=context, verbose=verbose)
+        return self.run(
+            questions=[single_input.question],
+            answers=[single_input.answer],
+            contexts=[single_input.context],
+            verbose=single_input.verbose,
+        ).results[0]
 
     def run(
         self,
@@ -476,6 +509,8 @@ class FaithfulnessEvaluator(BaseEvaluator):
         3) Compute the faithfulness score as the ratio of faithful statements.
         4) Generate detailed reasoning explaining the process and final score.
 
+        Every step evaluates all samples at once, with up to `max_concurrency` LLM calls at the same time.
+
         Args:
             questions (list[str]): List of questions.
             answers (list[str]): List of corresponding answers.
@@ -486,12 +521,41 @@ class FaithfulnessEvaluator(BaseEvaluator):
             RunOutput: Contains a list of FaithfulnessRunResult.
         """
         input_data = RunInput(questions=questions, answers=answers, contexts=contexts, verbose=verbose)
-        results_out = []
-        for idx in range(len(input_data.questions)):
-            question = input_data.questions[idx]
-            answer = input_data.answers[idx]
-            context = input_data.contexts[idx]
-            result_item = self.run_single(question=question, answer=answer, context=context, verbose=input_data.verbose)
-            results_out.append(result_item)
-        output_data = RunOutput(results=results_out)
-        return output_data
+        results_out = self._run_with_checkpoint(
+            self._checkpoint,
+            inputs={"questions": input_data.questions, "answers": input_data.answers, "contexts": input_data.contexts},
+            evaluate=partial(self._evaluate, verbose=input_data.verbose),
+            result_type=FaithfulnessRunResult,
+        )
+        return RunOutput(results=results_out)
+
+    def _evaluate(
+        self, questions: list[str], answers: list[str], contexts: list[str], verbose: bool = False
+    ) -> list[FaithfulnessRunResult]:
+        """
+        Evaluate the faithfulness of samples missing in the checkpoint.
+
+        Args:
+            questions (list[str]): List of questions.
+            answers (list[str]): List of corresponding answers.
+            contexts (list[str]): List of context texts.
+            verbose (bool): Flag to enable verbose logging.
+
+        Returns:
+            list[FaithfulnessRunResult]: Results in the order of the samples.
+        """
+        statements_list = self.simplify_statements(questions, answers)
+        nli_results_list = self.check_faithfulness(contexts, statements_list)
+        return [
+            self._score(
+                question=question,
+                answer=answer,
+                context=context,
+                statements=statements,
+                nli_results=nli_results,
+                verbose=verbose,
+            )
+            for question, answer, context, statements, nli_results in zip(
+                questions, answers, contexts, statements_list, nli_results_list
+            )
+        ]
@@ -1,9 +1,12 @@
 from enum import Enum
+from functools import lru_cache
 from typing import Callable
 
-from pydantic import BaseModel, PrivateAttr, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 from dynamiq.evaluations import BaseEvaluator
 
+STEM_CACHE_SIZE = 2**16
+
 
 class RougeType(str, Enum):
     """
@@ -85,6 +88,34 @@ class RunSingleOutput(BaseModel):
     score: float
 
 
+class StemCachingTokenizer:
+    """
+    Tokenizer of the rouge_score library that memoizes Porter stems of words.
+
+    Tokens match the default rouge_score tokenizer with stemming. Stemming dominates tokenization and
+    words repeat across texts, so every distinct word is stemmed once.
+    """
+
+    def __init__(self):
+        from nltk.stem import porter
+        from rouge_score import tokenize
+
+        self._tokenize = tokenize.tokenize
+        self.stem = lru_cache(maxsize=STEM_CACHE_SIZE)(porter.PorterStemmer().stem)
+
+    def tokenize(self, text: str) -> list[str]:
+        """
+        Tokenize text into lowercase alphanumeric tokens, stemming words longer than 3 characters.
+
+        Args:
+            text (str): The text to tokenize.
+
+        Returns:
+            list[str]: Tokens of the text.
+        """
+        return self._tokenize(text, self)
+
+
 class RougeScoreEvaluator(BaseEvaluator):
     """
     Evaluates ROUGE scores using the rouge_score library.
@@ -93,10 +124,12 @@ class RougeScoreEvaluator(BaseEvaluator):
         name (str): Name of the evaluator. Defaults to "RougeScore".
         rouge_type (RougeType): ROUGE variant to compute. Defaults to RougeType.rougeL.
         measure_type (MeasureType): The field of the metric to retrieve. Defaults to MeasureType.fmeasure.
+        workers (int): Number of processes scoring pairs in `run`. Small batches are scored in the calling process.
     """
     name: str = "RougeScore"
     rouge_type: RougeType = RougeType.rougeL
     measure_type: MeasureType = MeasureType.fmeasure
+    workers: int = Field(default=1, ge=1)
 
     _scorer: Callable = PrivateAttr()
 
@@ -107,7 +140,7 @@ class RougeScoreEvaluator(BaseEvaluator):
     def _initialize_rouge(self) -> None:
         from rouge_score import rouge_scorer
 
-        self._scorer = rouge_scorer.RougeScorer([self.rouge_type.value], use_stemmer=True)
+        self._scorer = rouge_scorer.RougeScorer([self.rouge_type.value], tokenizer=StemCachingTokenizer())
 
     def run_single(self, ground_truth_answer: str, answer: str) -> float:
         """
@@ -133,6 +166,8 @@ class RougeScoreEvaluator(BaseEvaluator):
         """
         Compute ROUGE scores for each reference-response pair in batch.
 
+        Large batches are split across `workers` processes.
+
         Args:
             ground_truth_answers (list[str]): List of reference strings.
             answers (list[str]): List of candidate strings.
@@ -141,9 +176,21 @@ class RougeScoreEvaluator(BaseEvaluator):
             list[float]: List of computed ROUGE scores.
         """
         input_data = RunInput(ground_truth_answers=ground_truth_answers, answers=answers)
-        scores = []
-        for gt, ans in zip(input_data.ground_truth_answers, input_data.answers):
-            score = self.run_single(ground_truth_answer=gt, answer=ans)
-            scores.append(score)
-        output_data = RunOutput(scores=scores)
-        return output_data.scores
+        return self._score_pairs_in_processes(input_data.ground_truth_answers, input_data.answers, self.workers)
+
+    def _score_pairs(self, ground_truth_answers: list[str], answers: list[str]) -> list[float]:
+        """
+        Compute ROUGE scores of pairs in the current process.
+
+        Args:
+            ground_truth_answers (list[str]): List of reference strings.
+            answers (list[str]): List of candidate strings.
+
+        Returns:
+            list[float]: List of computed ROUGE scores.
+        """
+        rouge_type, measure_type = self.rouge_type.value, self.measure_type.value
+        return [
+            round(float(getattr(self._scorer.score(gt, ans)[rouge_type], measure_type)), 2)
+            for gt, ans in zip(ground_truth_answers, answers)
+        ]
@@ -1,7 +1,8 @@
 from enum import Enum
 from typing import Callable
 
-from pydantic import BaseModel, PrivateAttr, model_validator
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 from dynamiq.evaluations import BaseEvaluator
 from dynamiq.utils.logger import logger
 
@@ -86,12 +87,7 @@ class ExactMatchEvaluator(BaseEvaluator):
 
     def run(self, ground_truth_answers: list[str], answers: list[str]) -> list[float]:
         input_data = RunInput(ground_truth_answers=ground_truth_answers, answers=answers)
-        scores = []
-        for gt, ans in zip(input_data.ground_truth_answers, input_data.answers):
-            score = self.run_single(ground_truth_answer=gt, answer=ans)
-            scores.append(score)
-        output_data = RunOutput(scores=scores)
-        return output_data.scores
+        return [float(gt == ans) for gt, ans in zip(input_data.ground_truth_answers, input_data.answers)]
 
 
 class StringPresenceEvaluator(BaseEvaluator):
@@ -111,12 +107,7 @@ class StringPresenceEvaluator(BaseEvaluator):
 
     def run(self, ground_truth_answers: list[str], answers: list[str]) -> list[float]:
         input_data = RunInput(ground_truth_answers=ground_truth_answers, answers=answers)
-        scores = []
-        for gt, ans in zip(input_data.ground_truth_answers, input_data.answers):
-            score = self.run_single(ground_truth_answer=gt, answer=ans)
-            scores.append(score)
-        output_data = RunOutput(scores=scores)
-        return output_data.scores
+        return [float(gt in ans) for gt, ans in zip(input_data.ground_truth_answers, input_data.answers)]
 
 
 class StringSimilarityEvaluator(BaseEvaluator):
@@ -127,11 +118,14 @@ class StringSimilarityEvaluator(BaseEvaluator):
     Attributes:
         name (str): Name of the evaluator. Defaults to "non_llm_string_similarity".
         distance_measure (DistanceMeasure): Which distance measure to use. Defaults to DistanceMeasure.LEVENSHTEIN.
+        workers (int): Number of threads computing similarities in `run`. -1 uses all CPU cores.
     """
     name: str = "non_llm_string_similarity"
     distance_measure: DistanceMeasure = DistanceMeasure.LEVENSHTEIN
+    workers: int = Field(default=1, ge=-1)
 
     _distance_map: dict[DistanceMeasure, Callable] = PrivateAttr()
+    _cpdist: Callable = PrivateAttr()
 
     def __init__(self, **data):
         super().__init__(**data)
@@ -139,6 +133,9 @@ class StringSimilarityEvaluator(BaseEvaluator):
 
     def _initialize_distance_map(self) -> None:
         from rapidfuzz import distance as rapidfuzz_distance
+        from rapidfuzz.process import cpdist
+
+        self._cpdist = cpdist
         self._distance_map = {
             DistanceMeasure.LEVENSHTEIN: rapidfuzz_distance.Levenshtein,
             DistanceMeasure.HAMMING: rapidfuzz_distance.Hamming,
@@ -162,10 +159,25 @@ class StringSimilarityEvaluator(BaseEvaluator):
         return output.score
 
     def run(self, ground_truth_answers: list[str], answers: list[str]) -> list[float]:
+        """
+        Compute similarity scores of all pairs in one vectorised RapidFuzz call.
+
+        Args:
+            ground_truth_answers (list[str]): List of reference strings.
+            answers (list[str]): List of candidate strings.
+
+        Returns:
+            list[float]: Similarity scores rounded to two decimals.
+        """
         input_data = RunInput(ground_truth_answers=ground_truth_answers, answers=answers)
-        scores = []
-        for gt, ans in zip(input_data.ground_truth_answers, input_data.answers):
-            score = self.run_single(ground_truth_answer=gt, answer=ans)
-            scores.append(score)
-        output_data = RunOutput(scores=scores)
-        return output_data.scores
+        if not input_data.answers:
+            return []
+        distance_function = self._distance_map[self.distance_measure]
+        normalized_distances = self._cpdist(
+            input_data.ground_truth_answers,
+            input_data.answers,
+            scorer=distance_function.normalized_distance,
+            dtype=np.float64,
+            workers=self.workers,
+        )
+        return [round(1 - distance, 2) for distance in normalized_distances.tolist()]
@@ -4,7 +4,13 @@ from typing import Any
 from pydantic import BaseModel, Field, model_validator
 
 from dynamiq.evaluations import BaseEvaluator
-from dynamiq.nodes.tools.python import compile_and_execute, get_restricted_globals
+from dynamiq.nodes.tools.python import (
+    PythonExecutionError,
+    PythonProcessPool,
+    PythonProcessPoolConfig,
+    compile_and_execute,
+    get_restricted_globals,
+)
 from dynamiq.utils.logger import logger
 
 
@@ -79,9 +85,12 @@ class PythonEvaluator(BaseEvaluator):
     Attributes:
         name (str): Evaluator name; defaults to "python_metric".
         code (str): The user-defined Python code as a string.
+        process_pool (PythonProcessPoolConfig | None): Warm worker processes evaluating batches in chunks.
+            Batches are evaluated in the calling thread if None.
     """
     name: str = "python_metric"
     code: str = Field(..., description="User-defined Python code as a string.")
+    process_pool: PythonProcessPoolConfig | None = None
 
     def __init__(self, **data: Any):
         super().__init__(**data)
@@ -189,19 +198,37 @@ class PythonEvaluator(BaseEvaluator):
             logger.error(f"Error during evaluation: {func_error}")
             raise ValueError(f"Error during evaluation: {func_error}") from func_error
 
+        score = self._to_score(result)
+        logger.debug(f"Computed score: {score} for input: {input_data}")
+        return score
+
+    @staticmethod
+    def _to_score(result: Any) -> float:
+        """
+        Convert the value returned by the user-defined function to a score.
+
+        Args:
+            result (Any): Value returned by the "evaluate" function.
+
+        Returns:
+            float: The score rounded to two decimals.
+
+        Raises:
+            ValueError: If the value is None or non-numeric.
+        """
         if result is None:
             raise ValueError("User-defined 'evaluate' function returned no value.")
         try:
-            score = round(float(result), 2)
+            return round(float(result), 2)
         except (TypeError, ValueError) as conv_err:
             raise ValueError("User-defined function returned a non-numeric value.") from conv_err
 
-        logger.debug(f"Computed score: {score} for input: {input_data}")
-        return score
-
     def run(self, input_data_list: list[dict[str, Any]]) -> list[float]:
         """
-        Evaluate the metric for a list of input dictionaries sequentially.
+        Evaluate the metric for a list of input dictionaries.
+
+        Inputs are evaluated sequentially in the calling thread, or in chunks by worker processes if a process
+        pool is configured and the batch is large or has time limits.
 
         Args:
             input_data_list (list[dict[str, Any]]): A list of input dictionaries.
@@ -213,6 +240,11 @@ class PythonEvaluator(BaseEvaluator):
             ValueError: If input_data_list is empty or any evaluation fails.
         """
         batch_input = PythonEvaluatorInput(data_list=input_data_list)
+        if self.process_pool is not None:
+            pool = PythonProcessPool.get_shared(self.code, "evaluate", self.process_pool)
+            if pool.should_use_workers(len(batch_input.data_list)):
+                return self._run_in_processes(pool, batch_input.data_list)
+
         scores: list[float] = []
         for idx, data_dict in enumerate(batch_input.data_list, start=1):
             try:
@@ -225,3 +257,40 @@ class PythonEvaluator(BaseEvaluator):
 
         output_model = PythonEvaluatorOutput(scores=scores)
         return output_model.scores
+
+    def _run_in_processes(self, pool: PythonProcessPool, data_list: list[dict[str, Any]]) -> list[float]:
+        """
+        Evaluate the metric for a list of input dictionaries in worker processes.
+
+        Args:
+            pool (PythonProcessPool): Worker processes with the compiled user code.
+            data_list (list[dict[str, Any]]): A list of input dictionaries.
+
+        Returns:
+            list[float]: A list of computed metric scores.
+
+        Raises:
+            ValueError: If any evaluation fails.
+        """
+        for idx, data_dict in enumerate(data_list, start=1):
+            try:
+                self._validate_input_keys(set(data_dict.keys()))
+            except ValueError as error:
+                raise ValueError(f"Failed processing input {idx}: {error}") from error
+
+        try:
+            results = pool.map([((), data_dict) for data_dict in data_list])
+        except PythonExecutionError as error:
+            logger.error(f"Failed processing input {error.index + 1}: {error}")
+            raise ValueError(f"Failed processing input {error.index + 1}: Error during evaluation: {error}") from error
+
+        scores: list[float] = []
+        for idx, result in enumerate(results, start=1):
+            try:
+                scores.append(self._to_score(result))
+            except ValueError as error:
+                raise ValueError(f"Failed processing input {idx}: {error}") from error
+        logger.info(f"Processed {len(scores)} inputs in worker processes")
+
+        output_model = PythonEvaluatorOutput(scores=scores)
+        return output_model.scores
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from concurrent import futures
 
 from dynamiq.nodes.node import NodeReadyToRun
 from dynamiq.runnables import RunnableConfig, RunnableResult
@@ -56,3 +57,22 @@ class BaseExecutor(ABC):
             NotImplementedError: This method must be implemented by subclasses.
         """
         raise NotImplementedError
+
+    def run_node(self, ready_node: NodeReadyToRun, config: RunnableConfig = None, **kwargs) -> futures.Future:
+        """
+        Submit a single node for execution without waiting for its completion.
+
+        Used by event-driven flow scheduling, which reacts to each node's future as soon as it is done.
+
+        Args:
+            ready_node (NodeReadyToRun): Node ready to run.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            futures.Future: Future resolving to the node's RunnableResult.
+
+        Raises:
+            NotImplementedError: If the executor does not support single node submission.
+        """
+        raise NotImplementedError
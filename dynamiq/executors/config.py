@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+
+DEFAULT_EXECUTOR_POOL_NAME = "default"
+MAX_WORKERS_TIMEOUT_POOL = 64
+MAX_OVERFLOW_WORKERS = 32
+
+
+class ExecutorPoolConfig(BaseModel):
+    """Configuration for warm executor pools reused across runs.
+
+    Attributes:
+        enabled (bool): Whether flows run nodes on a shared, long-lived thread pool instead of
+            creating a new pool per run.
+        name (str): Registry name of the shared pool. Use a workflow id to get a workflow-scoped pool.
+        max_workers (int | None): Size of the shared pool. Applied only when the pool is created.
+            Defaults to the run `max_node_workers` or the thread executor default.
+        timeout_max_workers (int): Size of the process-wide pool used to enforce node timeouts.
+            Applied only when the pool is created.
+    """
+
+    enabled: bool = False
+    name: str = DEFAULT_EXECUTOR_POOL_NAME
+    max_workers: int | None = None
+    timeout_max_workers: int = MAX_WORKERS_TIMEOUT_POOL
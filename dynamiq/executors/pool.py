@@ -21,6 +21,8 @@ class PoolExecutor(BaseExecutor):
         pool_executor (type): The type of pool executor to use (ThreadPoolExecutor or
             ProcessPoolExecutor).
         max_workers (int, optional): The maximum number of workers in the pool. Defaults to None.
+        pool (futures.Executor, optional): Long-lived pool to reuse instead of creating a new one.
+            A reused pool is not shut down with the executor. Defaults to None.
     """
 
     def __init__(
@@ -29,18 +31,25 @@ class PoolExecutor(BaseExecutor):
             type[futures.ThreadPoolExecutor] | type[futures.ProcessPoolExecutor]
         ),
         max_workers: int | None = None,
+        pool: futures.Executor | None = None,
     ):
         super().__init__(max_workers=max_workers)
-        self.executor = pool_executor(max_workers=max_workers)
+        self.is_shared_pool = pool is not None
+        self.executor = pool if self.is_shared_pool else pool_executor(max_workers=max_workers)
         self.node_by_future = {}
 
     def shutdown(self, wait: bool = True):
         """
-        Shuts down the executor.
+        Shuts down the executor. Shared pools are left running for the next runs.
 
         Args:
             wait (bool, optional): Whether to wait for pending futures to complete. Defaults to True.
         """
+        if self.is_shared_pool:
+            if wait:
+                futures.wait(self.node_by_future.keys())
+            return
+
         self.executor.shutdown(wait=wait)
 
     def execute(
@@ -142,12 +151,13 @@ class ThreadExecutor(PoolExecutor):
 
     Args:
         max_workers (int, optional): The maximum number of worker threads. Defaults to None.
+        pool (futures.ThreadPoolExecutor, optional): Long-lived thread pool to reuse. Defaults to None.
     """
 
-    def __init__(self, max_workers: int | None = None):
+    def __init__(self, max_workers: int | None = None, pool: futures.ThreadPoolExecutor | None = None):
         max_workers = max_workers or MAX_WORKERS_THREAD_POOL_EXECUTOR
         super().__init__(
-            pool_executor=futures.ThreadPoolExecutor, max_workers=max_workers
+            pool_executor=futures.ThreadPoolExecutor, max_workers=max_workers, pool=pool
         )
 
 
@@ -0,0 +1,291 @@
+import os
+import threading
+from collections import deque
+from concurrent import futures
+
+from pydantic import BaseModel, computed_field
+
+from dynamiq.executors.config import (
+    DEFAULT_EXECUTOR_POOL_NAME,
+    MAX_OVERFLOW_WORKERS,
+    MAX_WORKERS_TIMEOUT_POOL,
+)
+from dynamiq.utils.logger import logger
+
+TIMEOUT_EXECUTOR_POOL_NAME = "timeout"
+AGENT_TOOLS_EXECUTOR_POOL_NAME = "agent-tools"
+
+_worker_state = threading.local()
+
+
+class ExecutorPoolMetrics(BaseModel):
+    """
+    Snapshot of a shared executor pool load.
+
+    Attributes:
+        name (str): Registry name of the pool.
+        max_workers (int): Maximum number of running tasks, not counting abandoned ones.
+        active (int): Number of tasks currently running.
+        queue_depth (int): Number of submitted tasks waiting for a free worker.
+        submitted (int): Total number of submitted tasks.
+        completed (int): Total number of finished tasks.
+        abandoned (int): Number of running tasks whose callers stopped waiting for them.
+    """
+
+    name: str
+    max_workers: int
+    active: int
+    queue_depth: int
+    submitted: int
+    completed: int
+    abandoned: int = 0
+
+    @computed_field
+    @property
+    def utilization(self) -> float:
+        """Share of workers that are busy."""
+        return self.active / self.max_workers if self.max_workers else 0.0
+
+
+class MeteredThreadPoolExecutor(futures.ThreadPoolExecutor):
+    """
+    Thread pool that keeps load counters and marks its worker threads.
+
+    The pool tracks its own capacity: tasks wait in a pending queue until one of `max_workers` slots is free.
+    Extra threads, up to `max_overflow_workers`, are kept for tasks whose callers stopped waiting for them and
+    for nested tasks submitted by the pool workers.
+
+    Args:
+        name (str): Name of the pool, used for thread names and metrics.
+        max_workers (int | None, optional): The maximum number of running tasks. Defaults to None.
+        max_overflow_workers (int, optional): The maximum number of abandoned or nested tasks running
+            beyond `max_workers`. Defaults to MAX_OVERFLOW_WORKERS.
+    """
+
+    def __init__(self, name: str, max_workers: int | None = None, max_overflow_workers: int = MAX_OVERFLOW_WORKERS):
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        super().__init__(
+            max_workers=max_workers + max_overflow_workers,
+            thread_name_prefix=f"dynamiq-{name}",
+            initializer=self._init_worker,
+        )
+        self.name = name
+        self.max_workers = max_workers
+        self.max_overflow_workers = max_overflow_workers
+        self.is_shutdown = False
+        self._overflow = futures.ThreadPoolExecutor(
+            max_workers=max(max_overflow_workers, 1),
+            thread_name_prefix=f"dynamiq-{name}-nested",
+            initializer=self._init_worker,
+        )
+        self._metrics_lock = threading.RLock()
+        self._pending: deque[tuple] = deque()
+        self._abandoned_futures: set[futures.Future] = set()
+        self._shutdown_when_drained = False
+        self._dispatched = 0
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+
+    def _init_worker(self):
+        _worker_state.pool = self
+
+    def _run_task(self, future: futures.Future, fn, args, kwargs):
+        result, error = None, None
+        if future.set_running_or_notify_cancel():
+            with self._metrics_lock:
+                self._active += 1
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                error = e
+            with self._metrics_lock:
+                self._active -= 1
+                self._completed += 1
+
+        with self._metrics_lock:
+            self._dispatched -= 1
+            self._abandoned_futures.discard(future)
+            self._dispatch()
+
+        if future.cancelled():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _dispatch(self):
+        """Start pending tasks while there are free slots. Must be called with the metrics lock held."""
+        while self._pending and self._dispatched < self.max_workers + len(self._abandoned_futures):
+            task = self._pending.popleft()
+            try:
+                super().submit(self._run_task, *task)
+            except RuntimeError as e:
+                if task[0].set_running_or_notify_cancel():
+                    task[0].set_exception(e)
+                continue
+            self._dispatched += 1
+        if self._shutdown_when_drained and not self._pending:
+            self._shutdown_when_drained = False
+            super().shutdown(wait=False)
+
+    def submit(self, fn, /, *args, **kwargs) -> futures.Future:
+        future = futures.Future()
+        with self._metrics_lock:
+            if self.is_shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._submitted += 1
+            self._pending.append((future, fn, args, kwargs))
+            self._dispatch()
+        return future
+
+    def submit_outside(self, fn, /, *args, **kwargs) -> futures.Future:
+        """
+        Run a task in the overflow threads, which are marked as workers of this pool.
+
+        Used for tasks submitted by the pool workers, which could otherwise wait in the queue for the
+        workers held by their callers. At most `max_overflow_workers` such tasks run at once, the rest wait
+        for a free overflow thread.
+
+        Returns:
+            futures.Future: Future of the task result.
+        """
+        return self._overflow.submit(fn, *args, **kwargs)
+
+    def abandon(self, future: futures.Future) -> None:
+        """
+        Stop counting a task that its caller stopped waiting for against the pool size.
+
+        A queued task is cancelled. A running task can't be interrupted, so it frees its slot and keeps
+        running on an overflow thread until it finishes. When all overflow threads are taken, the task keeps
+        its slot.
+
+        Args:
+            future (futures.Future): Future returned by `submit`.
+        """
+        if future.cancel():
+            return
+        with self._metrics_lock:
+            if future.done() or future in self._abandoned_futures:
+                return
+            if len(self._abandoned_futures) >= self.max_overflow_workers:
+                logger.debug(f"Executor pool {self.name}: no overflow workers left for an abandoned task.")
+                return
+            self._abandoned_futures.add(future)
+            self._dispatch()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._metrics_lock:
+            self.is_shutdown = True
+            if cancel_futures:
+                for future, *_ in self._pending:
+                    future.cancel()
+                self._pending.clear()
+            pending = [future for future, *_ in self._pending]
+            if not wait and pending:
+                self._shutdown_when_drained = True
+
+        self._overflow.shutdown(wait=wait, cancel_futures=cancel_futures)
+        if wait:
+            futures.wait(pending)
+        if wait or not pending:
+            super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def is_current_thread_worker(self) -> bool:
+        """Check whether the calling thread is one of this pool workers."""
+        return getattr(_worker_state, "pool", None) is self
+
+    def get_metrics(self) -> ExecutorPoolMetrics:
+        """
+        Get a snapshot of the pool load.
+
+        Returns:
+            ExecutorPoolMetrics: Current pool metrics.
+        """
+        with self._metrics_lock:
+            return ExecutorPoolMetrics(
+                name=self.name,
+                max_workers=self.max_workers,
+                active=self._active,
+                queue_depth=len(self._pending) + self._dispatched - self._active,
+                submitted=self._submitted,
+                completed=self._completed,
+                abandoned=len(self._abandoned_futures),
+            )
+
+
+class ExecutorPoolRegistry:
+    """Process-wide registry of named thread pools that stay warm across runs."""
+
+    _pools: dict[str, MeteredThreadPoolExecutor] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_pool(
+        cls, name: str = DEFAULT_EXECUTOR_POOL_NAME, max_workers: int | None = None
+    ) -> MeteredThreadPoolExecutor:
+        """
+        Get a pool by name, creating it on first use.
+
+        Args:
+            name (str, optional): Registry name of the pool. Defaults to 'default'.
+            max_workers (int | None, optional): Pool size used if the pool is created. Defaults to None.
+
+        Returns:
+            MeteredThreadPoolExecutor: Shared pool instance.
+        """
+        with cls._lock:
+            pool = cls._pools.get(name)
+            if pool is None or pool.is_shutdown:
+                pool = MeteredThreadPoolExecutor(name=name, max_workers=max_workers)
+                cls._pools[name] = pool
+                logger.debug(f"Executor pool {name}: created with {pool.max_workers} workers.")
+            return pool
+
+    @classmethod
+    def get_timeout_pool(cls, max_workers: int = MAX_WORKERS_TIMEOUT_POOL) -> MeteredThreadPoolExecutor:
+        """
+        Get the pool used to enforce node execution timeouts.
+
+        Args:
+            max_workers (int, optional): Pool size used if the pool is created.
+
+        Returns:
+            MeteredThreadPoolExecutor: Shared timeout pool instance.
+        """
+        return cls.get_pool(name=TIMEOUT_EXECUTOR_POOL_NAME, max_workers=max_workers)
+
+    @classmethod
+    def get_metrics(cls) -> dict[str, ExecutorPoolMetrics]:
+        """
+        Get metrics of all registered pools.
+
+        Returns:
+            dict[str, ExecutorPoolMetrics]: Metrics by pool name.
+        """
+        with cls._lock:
+            pools = list(cls._pools.values())
+        return {pool.name: pool.get_metrics() for pool in pools}
+
+    @classmethod
+    def shutdown(cls, name: str | None = None, wait: bool = True):
+        """
+        Shut down and unregister pools.
+
+        Args:
+            name (str | None, optional): Name of the pool to shut down. All pools if None. Defaults to None.
+            wait (bool, optional): Whether to wait for running tasks to complete. Defaults to True.
+        """
+        with cls._lock:
+            if name is None:
+                pools = list(cls._pools.values())
+                cls._pools.clear()
+            else:
+                pools = [pool] if (pool := cls._pools.pop(name, None)) else []
+
+        for pool in pools:
+            pool.shutdown(wait=wait)
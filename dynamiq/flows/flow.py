@@ -1,5 +1,8 @@
 import asyncio
+import threading
 from datetime import datetime
+from enum import Enum
+from functools import partial
 from graphlib import CycleError, TopologicalSorter
 from io import BytesIO
 from typing import Any
@@ -10,6 +13,7 @@ from pydantic import Field, field_validator
 from dynamiq.connections.managers import ConnectionManager
 from dynamiq.executors.base import BaseExecutor
 from dynamiq.executors.pool import ThreadExecutor
+from dynamiq.executors.registry import ExecutorPoolRegistry
 from dynamiq.flows.base import BaseFlow
 from dynamiq.nodes.node import Node, NodeReadyToRun
 from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
@@ -17,6 +21,21 @@ from dynamiq.utils.duration import format_duration
 from dynamiq.utils.logger import logger
 
 
+class FlowSchedulingMode(str, Enum):
+    """
+    Enumeration of flow node scheduling modes.
+
+    Attributes:
+        BATCH: Nodes are dispatched in waves. Each wave waits for at least one running node to finish
+            and rescans the graph for nodes that became ready.
+        EVENT_DRIVEN: A node is dispatched from the completion callback of its last dependency,
+            so downstream nodes start as soon as their own inputs are available.
+    """
+
+    BATCH = "batch"
+    EVENT_DRIVEN = "event_driven"
+
+
 class Flow(BaseFlow):
     """
     A class for managing and executing a graph-like structure of nodes.
@@ -25,12 +44,14 @@ class Flow(BaseFlow):
         nodes (list[Node]): List of nodes in the flow.
         executor (type[BaseExecutor]): Executor class for running nodes. Defaults to ThreadExecutor.
         max_node_workers (int | None): Maximum number of concurrent node workers. Defaults to None.
+        scheduling_mode (FlowSchedulingMode): Strategy used to dispatch ready nodes. Defaults to BATCH.
         connection_manager (ConnectionManager): Manager for handling connections. Defaults to ConnectionManager().
     """
 
     nodes: list[Node] = []
     executor: type[BaseExecutor] = ThreadExecutor
     max_node_workers: int | None = None
+    scheduling_mode: FlowSchedulingMode = FlowSchedulingMode.BATCH
     connection_manager: ConnectionManager = Field(default_factory=ConnectionManager)
 
     def __init__(self, **kwargs):
@@ -106,6 +127,32 @@ class Flow(BaseFlow):
             if node.is_postponed_component_init:
                 node.init_components(self.connection_manager)
 
+    def _get_node_ready_to_run(self, node: Node, input_data: Any) -> NodeReadyToRun:
+        """
+        Builds the ready to run representation of a node from the results of its dependencies.
+
+        Args:
+            node (Node): Node to prepare.
+            input_data (Any): Input data for the node.
+
+        Returns:
+            NodeReadyToRun: Node with its dependencies results and readiness flag.
+        """
+        depends_result = {}
+        is_ready = True
+        for dep in node.depends:
+            if (dep_result := self._results.get(dep.node.id)) and dep_result.status != RunnableStatus.UNDEFINED:
+                depends_result[dep.node.id] = dep_result
+            else:
+                is_ready = False
+
+        return NodeReadyToRun(
+            node=node,
+            is_ready=is_ready,
+            input_data=input_data,
+            depends_result=depends_result,
+        )
+
     def _get_nodes_ready_to_run(self, input_data: Any) -> list[NodeReadyToRun]:
         """
         Gets the list of nodes that are ready to run.
@@ -116,29 +163,215 @@ class Flow(BaseFlow):
         Returns:
             list[NodeReadyToRun]: List of nodes ready to run.
         """
-        ready_ts_nodes = self._ts.get_ready()
-        ready_nodes = []
-        for node_id in ready_ts_nodes:
-            node = self._node_by_id[node_id]
-            depends_result = {}
-            is_ready = True
+        return [
+            self._get_node_ready_to_run(node=self._node_by_id[node_id], input_data=input_data)
+            for node_id in self._ts.get_ready()
+        ]
+
+    def _get_nodes_dependants(self) -> tuple[dict[str, list[str]], dict[str, int]]:
+        """
+        Builds the reverse dependency index used by event-driven scheduling.
+
+        Returns:
+            tuple[dict[str, list[str]], dict[str, int]]: Ids of the nodes that depend on each node and
+                the number of unfinished dependencies of each node.
+
+        Raises:
+            ValueError: If a node depends on a node that is not present in the flow.
+        """
+        dependants = {node.id: [] for node in self.nodes}
+        pending_depends = {}
+        for node in self.nodes:
+            pending_depends[node.id] = len(node.depends)
             for dep in node.depends:
-                if (
-                    dep_result := self._results.get(dep.node.id)
-                ) and dep_result.status != RunnableStatus.UNDEFINED:
-                    depends_result[dep.node.id] = dep_result
-                else:
-                    is_ready = False
-
-            ready_node = NodeReadyToRun(
-                node=node,
-                is_ready=is_ready,
-                input_data=input_data,
-                depends_result=depends_result,
+                if dep.node.id not in dependants:
+                    raise ValueError(
+                        f"Flow node '{node.id}' depends on node '{dep.node.id}' that is not present in the flow."
+                    )
+                dependants[dep.node.id].append(node.id)
+
+        return dependants, pending_depends
+
+    def _get_run_executor(self, config: RunnableConfig = None) -> BaseExecutor:
+        """
+        Creates the executor for a run, backed by a shared warm pool when it is enabled in the config.
+
+        A fresh pool is used when the flow itself runs inside a shared pool worker (nested flows),
+        so that outer nodes waiting for inner ones can not exhaust the pool.
+
+        Args:
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+
+        Returns:
+            BaseExecutor: Executor instance for the run.
+        """
+        max_workers = config.max_node_workers if config else self.max_node_workers
+        if config and config.executor_pool.enabled and issubclass(self.executor, ThreadExecutor):
+            pool = ExecutorPoolRegistry.get_pool(
+                name=config.executor_pool.name,
+                max_workers=config.executor_pool.max_workers or max_workers,
             )
-            ready_nodes.append(ready_node)
+            if not pool.is_current_thread_worker():
+                return self.executor(max_workers=max_workers, pool=pool)
 
-        return ready_nodes
+            logger.debug(f"Flow {self.id}: nested run inside executor pool {pool.name}, using dedicated pool.")
+
+        return self.executor(max_workers=max_workers)
+
+    def _run_nodes_batch(self, input_data: Any, run_executor: BaseExecutor, config: RunnableConfig = None, **kwargs):
+        """
+        Runs flow nodes in waves, waiting for executor results before dispatching newly ready nodes.
+
+        Args:
+            input_data (Any): Input data for the flow.
+            run_executor (BaseExecutor): Executor used to run nodes.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+        """
+        while self._ts.is_active():
+            ready_nodes = self._get_nodes_ready_to_run(input_data=input_data)
+            results = run_executor.execute(ready_nodes=ready_nodes, config=config, **kwargs)
+            self._results.update(results)
+            self._ts.done(*results.keys())
+
+    def _run_nodes_event_driven(
+        self, input_data: Any, run_executor: BaseExecutor, config: RunnableConfig = None, **kwargs
+    ):
+        """
+        Runs flow nodes submitting each node from the completion callback of its last dependency.
+
+        Args:
+            input_data (Any): Input data for the flow.
+            run_executor (BaseExecutor): Executor used to run nodes.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Raises:
+            Exception: If a node could not be submitted to the executor.
+        """
+        dependants, pending_depends = self._get_nodes_dependants()
+        lock = threading.Lock()
+        all_done = threading.Event()
+        errors = []
+        remaining = len(self.nodes)
+
+        def submit(node_id: str):
+            ready_node = self._get_node_ready_to_run(node=self._node_by_id[node_id], input_data=input_data)
+            future = run_executor.run_node(ready_node=ready_node, config=config, **kwargs)
+            future.add_done_callback(partial(on_done, node_id))
+
+        def on_done(node_id: str, future):
+            nonlocal remaining
+            try:
+                result = future.result()
+            except Exception as e:
+                node = self._node_by_id[node_id]
+                logger.error(f"Node {node.name} - {node.id}: execution failed due the unexpected error. Error: {e}")
+                result = RunnableResult(status=RunnableStatus.FAILURE)
+
+            with lock:
+                self._results[node_id] = result
+                remaining -= 1
+                ready_ids = []
+                for dependant_id in dependants[node_id]:
+                    pending_depends[dependant_id] -= 1
+                    if pending_depends[dependant_id] == 0:
+                        ready_ids.append(dependant_id)
+                if remaining == 0:
+                    all_done.set()
+
+            # Submit outside the lock: callbacks of already finished futures run in the submitting thread.
+            try:
+                for ready_id in ready_ids:
+                    submit(ready_id)
+            except Exception as e:
+                errors.append(e)
+                all_done.set()
+
+        for node_id, count in list(pending_depends.items()):
+            if count == 0:
+                submit(node_id)
+
+        all_done.wait()
+        if errors:
+            raise errors[0]
+
+    async def _run_nodes_event_driven_async(self, input_data: Any, config: RunnableConfig = None, **kwargs):
+        """
+        Runs flow nodes as asyncio tasks, creating each task from the completion callback of its last dependency.
+
+        Args:
+            input_data (Any): Input data for the flow.
+            config (RunnableConfig, optional): Configuration for the run. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Raises:
+            Exception: If a node task could not be created.
+        """
+        dependants, pending_depends = self._get_nodes_dependants()
+        all_done = asyncio.Event()
+        errors = []
+        tasks = set()
+        remaining = len(self.nodes)
+
+        def submit(node_id: str):
+            ready_node = self._get_node_ready_to_run(node=self._node_by_id[node_id], input_data=input_data)
+            task = asyncio.create_task(
+                ready_node.node.run_async(
+                    input_data=ready_node.input_data,
+                    depends_result=ready_node.depends_result,
+                    config=config,
+                    **kwargs,
+                )
+            )
+            tasks.add(task)
+            task.add_done_callback(partial(on_done, node_id))
+
+        def on_done(node_id: str, task: asyncio.Task):
+            nonlocal remaining
+            tasks.discard(task)
+            # Tasks left over by a finished or cancelled run must not start their dependants
+            if all_done.is_set():
+                return
+
+            if task.cancelled():
+                node = self._node_by_id[node_id]
+                logger.error(f"Node {node.name} - {node.id}: execution was cancelled.")
+                result = RunnableResult(status=RunnableStatus.FAILURE)
+            elif (e := task.exception()) is not None:
+                node = self._node_by_id[node_id]
+                logger.error(f"Node {node.name} - {node.id}: execution failed due the unexpected error. Error: {e}")
+                result = RunnableResult(status=RunnableStatus.FAILURE)
+            else:
+                result = task.result()
+
+            self._results[node_id] = result
+            remaining -= 1
+            try:
+                for dependant_id in dependants[node_id]:
+                    pending_depends[dependant_id] -= 1
+                    if pending_depends[dependant_id] == 0:
+                        submit(dependant_id)
+            except Exception as e:
+                errors.append(e)
+                all_done.set()
+
+            if remaining == 0:
+                all_done.set()
+
+        for node_id, count in list(pending_depends.items()):
+            if count == 0:
+                submit(node_id)
+
+        try:
+            await all_done.wait()
+        finally:
+            all_done.set()
+            for task in list(tasks):
+                task.cancel()
+
+        if errors:
+            raise errors[0]
 
     def _get_output(self) -> dict[str, dict]:
         """
@@ -210,20 +443,18 @@ class Flow(BaseFlow):
 
         try:
             if self.nodes:
-                max_workers = (
-                    config.max_node_workers if config else self.max_node_workers
+                run_executor = self._get_run_executor(config)
+                run_nodes = (
+                    self._run_nodes_event_driven
+                    if self.scheduling_mode == FlowSchedulingMode.EVENT_DRIVEN
+                    else self._run_nodes_batch
+                )
+                run_nodes(
+                    input_data=input_data,
+                    run_executor=run_executor,
+                    config=config,
+                    **(merged_kwargs | {"parent_run_id": run_id}),
                 )
-                run_executor = self.executor(max_workers=max_workers)
-
-                while self._ts.is_active():
-                    ready_nodes = self._get_nodes_ready_to_run(input_data=input_data)
-                    results = run_executor.execute(
-                        ready_nodes=ready_nodes,
-                        config=config,
-                        **(merged_kwargs | {"parent_run_id": run_id}),
-                    )
-                    self._results.update(results)
-                    self._ts.done(*results.keys())
 
                 run_executor.shutdown()
 
@@ -267,7 +498,11 @@ class Flow(BaseFlow):
         time_start = datetime.now()
 
         try:
-            if self.nodes:
+            if self.nodes and self.scheduling_mode == FlowSchedulingMode.EVENT_DRIVEN:
+                await self._run_nodes_event_driven_async(
+                    input_data=input_data, config=config, **(merged_kwargs | {"parent_run_id": run_id})
+                )
+            elif self.nodes:
                 while self._ts.is_active():
                     ready_nodes = self._get_nodes_ready_to_run(input_data=input_data)
                     nodes_to_run = [node for node in ready_nodes if node.is_ready]
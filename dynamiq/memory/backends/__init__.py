@@ -1,5 +1,12 @@
-from .base import MemoryBackend
-from .in_memory import InMemory
-from .pinecone import Pinecone
-from .qdrant import Qdrant
-from .sqlite import SQLite
+from dynamiq.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "MemoryBackend": ".base",
+    "InMemory": ".in_memory",
+    "Pinecone": ".pinecone",
+    "Qdrant": ".qdrant",
+    "SQLite": ".sqlite",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
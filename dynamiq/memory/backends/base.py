@@ -44,6 +44,19 @@ class MemoryBackend(ABC, BaseModel):
         """
         raise NotImplementedError
 
+    def add_many(self, messages: list[Message]) -> None:
+        """
+        Adds multiple messages to the memory storage. Backends override it to store messages in one batch.
+
+        Args:
+            messages: Messages to add to storage
+
+        Raises:
+            MemoryBackendError: If the messages cannot be added
+        """
+        for message in messages:
+            self.add(message)
+
     @abstractmethod
     def get_all(self, limit: int | None = None) -> list[Message]:
         """
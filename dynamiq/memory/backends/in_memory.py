@@ -1,71 +1,207 @@
+import heapq
 import math
+import threading
 from collections import Counter
-from typing import Any
+from typing import Any, Callable
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, Field, PrivateAttr
 
 from dynamiq.memory.backends.base import MemoryBackend
 from dynamiq.prompts import Message
 
 
-class BM25DocumentRanker(BaseModel):
-    """BM25 implementation for scoring documents."""
+def default_tokenizer(text: str) -> list[str]:
+    """Splits text into lowercase terms by whitespace."""
+    return text.lower().split()
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    documents: list[str]
-    k1: float = 1.5
-    b: float = 0.75
-    avg_dl: float = 0.0
+class BM25DocumentRanker:
+    """BM25 ranker over an incrementally maintained inverted index.
 
-    def model_post_init(self, __context) -> None:
-        """Initialize average document length after model creation."""
-        self.avg_dl = self._calculate_avg_dl()
+    Documents are identified by the order they were added in. Term postings, document lengths and
+    document frequencies are updated on add, so a search only visits documents containing the query terms.
+
+    Attributes:
+        k1 (float): Term frequency saturation parameter.
+        b (float): Document length normalization parameter.
+        tokenizer (Callable[[str], list[str]]): Splits text into terms.
+        stemmer (Callable[[str], str] | None): Reduces terms to their stems.
+    """
+
+    def __init__(
+        self,
+        documents: list[str] | None = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+        tokenizer: Callable[[str], list[str]] = default_tokenizer,
+        stemmer: Callable[[str], str] | None = None,
+    ):
+        """Initialize BM25DocumentRanker.
+
+        Args:
+            documents (list[str] | None): Documents to index.
+            k1 (float): Term frequency saturation parameter.
+            b (float): Document length normalization parameter.
+            tokenizer (Callable[[str], list[str]]): Splits text into terms.
+            stemmer (Callable[[str], str] | None): Reduces terms to their stems.
+        """
+        self.k1 = k1
+        self.b = b
+        self.tokenizer = tokenizer
+        self.stemmer = stemmer
+        self._postings: dict[str, dict[int, int]] = {}
+        self._doc_lengths: list[int] = []
+        self._total_length = 0
+        self._lock = threading.Lock()
+        for document in documents or []:
+            self.add(document)
+
+    @property
+    def size(self) -> int:
+        """Number of indexed documents."""
+        return len(self._doc_lengths)
+
+    @property
+    def avg_dl(self) -> float:
+        """Average document length in terms."""
+        return self._total_length / len(self._doc_lengths) if self._doc_lengths else 0.0
+
+    def tokenize(self, text: str) -> list[str]:
+        """Splits text into index terms."""
+        terms = self.tokenizer(text)
+        if self.stemmer:
+            terms = [self.stemmer(term) for term in terms]
+        return terms
 
-    def _calculate_avg_dl(self) -> float:
-        """Calculates the average document length (number of terms per document)."""
-        if not self.documents:
-            return 0.0
-        total_length = sum(len(doc.lower().split()) for doc in self.documents)
-        return total_length / len(self.documents)
+    def add(self, document: str) -> int:
+        """Adds a document to the index.
+
+        Args:
+            document: Document text
+
+        Returns:
+            ID of the document
+        """
+        term_freqs = Counter(self.tokenize(document))
+        with self._lock:
+            doc_id, postings = len(self._doc_lengths), self._postings
+            for term, freq in term_freqs.items():
+                postings.setdefault(term, {})[doc_id] = freq
+            doc_len = sum(term_freqs.values())
+            self._doc_lengths.append(doc_len)
+            self._total_length += doc_len
+        return doc_id
+
+    def clear(self) -> None:
+        """Removes all documents from the index."""
+        with self._lock:
+            self._postings = {}
+            self._doc_lengths = []
+            self._total_length = 0
 
     def _idf(self, term: str, N: int, df: int) -> float:
         """Calculates the IDF (inverse document frequency) of a term."""
         return math.log((N - df + 0.5) / (df + 0.5) + 1)
 
     def score(self, query_terms: list[str], document: str) -> float:
-        """Calculates the BM25 score for a document."""
-        doc_terms = document.lower().split()
-        doc_len = len(doc_terms)
-        doc_term_freqs = Counter(doc_terms)
-        N = len(self.documents)
+        """Calculates the BM25 score of a document against the index statistics."""
+        doc_term_freqs = Counter(self.tokenize(document))
+        doc_len = sum(doc_term_freqs.values())
         score = 0.0
 
-        for term in query_terms:
-            term_freq = doc_term_freqs.get(term, 0)
-            if term_freq == 0:
-                continue
-            df = sum(1 for doc in self.documents if term in doc.lower().split())
-            idf = self._idf(term, N, df)
-            numerator = term_freq * (self.k1 + 1)
-            denominator = term_freq + self.k1 * (1 - self.b + self.b * (doc_len / self.avg_dl))
-            score += idf * (numerator / denominator)
+        with self._lock:
+            N, avg_dl = len(self._doc_lengths), self.avg_dl
+            for term in query_terms:
+                term_freq = doc_term_freqs.get(term, 0)
+                if term_freq == 0:
+                    continue
+                idf = self._idf(term, N, len(self._postings.get(term, ())))
+                numerator = term_freq * (self.k1 + 1)
+                denominator = term_freq + self.k1 * (1 - self.b + self.b * (doc_len / avg_dl))
+                score += idf * (numerator / denominator)
 
         return score
 
+    def search(
+        self, query: str, limit: int | None = None, doc_filter: Callable[[int], bool] | None = None
+    ) -> list[tuple[int, float]]:
+        """Finds documents matching the query.
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results. If None, returns all matching documents.
+            doc_filter: Optional predicate on document IDs to select documents from
+
+        Returns:
+            List of document IDs with positive scores, highest score first. Equal scores keep the order of addition.
+        """
+        scores: dict[int, float] = {}
+        with self._lock:
+            doc_lengths, N, avg_dl = self._doc_lengths, len(self._doc_lengths), self.avg_dl
+            # The BM25 term score is rearranged, so only the term and document frequencies vary per posting
+            length_base, length_weight = self.k1 * (1 - self.b), self.k1 * self.b / avg_dl if avg_dl else 0.0
+            for term in self.tokenize(query):
+                if not (postings := self._postings.get(term)):
+                    continue
+                weight = self._idf(term, N, len(postings)) * (self.k1 + 1)
+                for doc_id, term_freq in postings.items():
+                    term_score = weight * term_freq / (term_freq + length_base + length_weight * doc_lengths[doc_id])
+                    scores[doc_id] = scores.get(doc_id, 0.0) + term_score
+
+        # Documents are ordered by score and then by ID, and the filter is checked only until the limit is reached
+        candidates = [(-score, doc_id) for doc_id, score in scores.items() if score > 0]
+        if not limit:
+            candidates.sort()
+        elif not doc_filter:
+            candidates = heapq.nsmallest(limit, candidates)
+        else:
+            heap = candidates
+            heapq.heapify(heap)
+            candidates = (heapq.heappop(heap) for _ in range(len(heap)))
+
+        results = []
+        for neg_score, doc_id in candidates:
+            if doc_filter and not doc_filter(doc_id):
+                continue
+            results.append((doc_id, -neg_score))
+            if limit and len(results) == limit:
+                break
+        return results
+
 
 class InMemory(MemoryBackend):
-    """In-memory implementation of the memory storage backend."""
+    """In-memory implementation of the memory storage backend.
+
+    Messages are indexed for BM25 search as they are added. Messages appended to `messages` directly and
+    a newly assigned `messages` list are indexed on the next search. Messages replaced in place in the list
+    are not reindexed.
+
+    Attributes:
+        messages (list[Message]): Stored messages.
+        tokenizer (Callable[[str], list[str]]): Splits message content and queries into terms.
+        stemmer (Callable[[str], str] | None): Reduces terms to their stems.
+    """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     name: str = "InMemory"
     messages: list[Message] = Field(default_factory=list)
+    tokenizer: Callable[[str], list[str]] = default_tokenizer
+    stemmer: Callable[[str], str] | None = None
+
+    _index: BM25DocumentRanker = PrivateAttr()
+    _indexed_messages: list[Message] | None = PrivateAttr(default=None)
+    _index_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def model_post_init(self, __context) -> None:
+        """Create the search index after model creation."""
+        self._index = BM25DocumentRanker(tokenizer=self.tokenizer, stemmer=self.stemmer)
+        self._sync_index()
 
     @property
     def to_dict_exclude_params(self) -> dict[str, bool]:
         """Define parameters to exclude during serialization."""
-        return {"messages": True}
+        return {"messages": True, "tokenizer": True, "stemmer": True}
 
     def to_dict(self, include_secure_params: bool = False, **kwargs) -> dict[str, Any]:
         """Converts the instance to a dictionary."""
@@ -82,6 +218,18 @@ class InMemory(MemoryBackend):
             MemoryBackendError: If the message cannot be added
         """
         self.messages.append(message)
+        self._sync_index()
+
+    def _sync_index(self) -> None:
+        """Indexes messages added since the last update, rebuilding the index if messages were replaced."""
+        # Private attributes are read once, as pydantic resolves them slowly
+        index, messages = self._index, self.messages
+        with self._index_lock:
+            if self._indexed_messages is not messages or len(messages) < index.size:
+                index.clear()
+                self._indexed_messages = messages
+            for idx in range(index.size, len(messages)):
+                index.add(messages[idx].content or "")
 
     def get_all(self, limit: int | None = None) -> list[Message]:
         """
@@ -103,6 +251,17 @@ class InMemory(MemoryBackend):
 
         return sorted_messages
 
+    @staticmethod
+    def _matches_filters(message: Message, filters: dict[str, Any]) -> bool:
+        """Checks whether message metadata matches all filters."""
+        for key, value in filters.items():
+            if isinstance(value, list):
+                if message.metadata.get(key) not in value:
+                    return False
+            elif message.metadata.get(key) != value:
+                return False
+        return True
+
     def _apply_filters(self, messages: list[Message], filters: dict[str, Any] | None = None) -> list[Message]:
         """
         Applies metadata filters to the list of messages.
@@ -117,14 +276,7 @@ class InMemory(MemoryBackend):
         if not filters:
             return messages
 
-        filtered_messages = messages
-        for key, value in filters.items():
-            if isinstance(value, list):
-                filtered_messages = [msg for msg in filtered_messages if msg.metadata.get(key) in value]
-            else:
-                filtered_messages = [msg for msg in filtered_messages if msg.metadata.get(key) == value]
-
-        return filtered_messages
+        return [msg for msg in messages if self._matches_filters(msg, filters)]
 
     def search(
         self, query: str | None = None, filters: dict[str, Any] | None = None, limit: int | None = None
@@ -132,6 +284,8 @@ class InMemory(MemoryBackend):
         """
         Searches for messages using BM25 scoring, with optional filters.
 
+        Term statistics are taken from all stored messages, filters only select the returned messages.
+
         Args:
             query: Search query string (optional)
             filters: Optional metadata filters to apply
@@ -143,40 +297,18 @@ class InMemory(MemoryBackend):
         Raises:
             MemoryBackendError: If the search operation fails
         """
-        # Apply filters first to reduce search space
-        filtered_messages = self._apply_filters(self.messages, filters)
-
         # If no query provided, return filtered messages
         if not query:
+            filtered_messages = self._apply_filters(self.messages, filters)
             sorted_messages = sorted(filtered_messages, key=lambda msg: msg.metadata.get("timestamp", 0))
             if limit:
                 return sorted_messages[-limit:]
             return sorted_messages
 
-        # Perform BM25 search with query
-        query_terms = query.lower().split()
-        document_texts = [msg.content for msg in filtered_messages]
-
-        # Handle empty document list
-        if not document_texts:
-            return []
-
-        # Calculate BM25 scores
-        bm25 = BM25DocumentRanker(documents=document_texts)
-        scored_messages = [(msg, bm25.score(query_terms, msg.content)) for msg in filtered_messages]
-
-        # Filter out zero scores
-        scored_messages = [(msg, score) for msg, score in scored_messages if score > 0]
-
-        # Sort by score (descending)
-        scored_messages.sort(key=lambda x: x[1], reverse=True)
-
-        # Apply limit
-        result = [msg for msg, _ in scored_messages]
-        if limit:
-            return result[:limit]
-
-        return result
+        self._sync_index()
+        messages = self._indexed_messages
+        doc_filter = (lambda doc_id: self._matches_filters(messages[doc_id], filters)) if filters else None
+        return [messages[doc_id] for doc_id, _ in self._index.search(query, limit=limit, doc_filter=doc_filter)]
 
     def is_empty(self) -> bool:
         """
@@ -195,3 +327,4 @@ class InMemory(MemoryBackend):
             MemoryBackendError: If the memory cannot be cleared
         """
         self.messages = []
+        self._sync_index()
@@ -1,14 +1,19 @@
 import json
+import os
 import re
 import sqlite3
+import threading
 import uuid
-from typing import ClassVar
+import weakref
+from contextlib import contextmanager, nullcontext
+from typing import Any, ClassVar, Iterator
 
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, PrivateAttr
 from typing_extensions import Annotated
 
 from dynamiq.memory.backends.base import MemoryBackend
 from dynamiq.prompts import Message
+from dynamiq.utils.logger import logger
 
 
 class SQLiteError(Exception):
@@ -17,14 +22,34 @@ class SQLiteError(Exception):
     pass
 
 
+class _Connection(sqlite3.Connection):
+    """Connection that can be weakly referenced, so connections of finished threads are garbage collected."""
+
+
 class SQLite(MemoryBackend):
-    """SQLite implementation of the memory storage backend."""
+    """SQLite implementation of the memory storage backend.
+
+    Connections are reused per thread, and file databases use WAL journaling so reads do not block writes.
+    Message content is indexed with FTS5 and searched with BM25 ranking. The `user_id` and `session_id`
+    metadata fields are stored in indexed generated columns for fast filtering.
+
+    Attributes:
+        db_path (str): Path to the database file.
+        index_name (str): Name of the messages table.
+        wal_enabled (bool): Whether to use WAL journaling for file databases.
+        full_text_search (bool): Whether to search with an FTS5 index. Substring search is used if disabled
+            or if SQLite is built without FTS5.
+    """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     name: str = "SQLite"
     db_path: Annotated[str, Field(default="conversations.db")]
     index_name: Annotated[str, Field(default="conversations")]
+    wal_enabled: bool = True
+    full_text_search: bool = True
+
+    INDEXED_METADATA_FIELDS: ClassVar[tuple[str, ...]] = ("user_id", "session_id")
 
     # SQL Query Constants
     CREATE_TABLE_QUERY: ClassVar[
@@ -38,8 +63,38 @@ class SQLite(MemoryBackend):
             timestamp REAL
         )
     """
+    ADD_METADATA_COLUMN_QUERY: ClassVar[str] = (
+        "ALTER TABLE {index_name} ADD COLUMN {field} GENERATED ALWAYS AS (json_extract(metadata, '$.{field}')) VIRTUAL"
+    )
+    CREATE_INDEX_QUERIES: ClassVar[tuple[str, ...]] = (
+        "CREATE INDEX IF NOT EXISTS {index_name}_timestamp_idx ON {index_name} (timestamp)",
+        "CREATE INDEX IF NOT EXISTS {index_name}_user_id_idx ON {index_name} (user_id, timestamp)",
+        "CREATE INDEX IF NOT EXISTS {index_name}_session_id_idx ON {index_name} (session_id, timestamp)",
+    )
+    # The full-text index stores no content, it references table rows by rowid and is updated by triggers
+    CREATE_FTS_QUERIES: ClassVar[tuple[str, ...]] = (
+        "CREATE VIRTUAL TABLE {index_name}_fts USING fts5(content, content='{index_name}', content_rowid='rowid')",
+        """
+        CREATE TRIGGER IF NOT EXISTS {index_name}_fts_insert AFTER INSERT ON {index_name} BEGIN
+            INSERT INTO {index_name}_fts (rowid, content) VALUES (new.rowid, new.content);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS {index_name}_fts_delete AFTER DELETE ON {index_name} BEGIN
+            INSERT INTO {index_name}_fts ({index_name}_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS {index_name}_fts_update AFTER UPDATE OF content ON {index_name} BEGIN
+            INSERT INTO {index_name}_fts ({index_name}_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+            INSERT INTO {index_name}_fts (rowid, content) VALUES (new.rowid, new.content);
+        END
+        """,
+    )
+    REBUILD_FTS_QUERY: ClassVar[str] = "INSERT INTO {index_name}_fts ({index_name}_fts) VALUES ('rebuild')"
 
     VALIDATE_TABLE_QUERY: ClassVar[str] = "SELECT name FROM sqlite_master WHERE type='table' AND name=?"
+    TABLE_COLUMNS_QUERY: ClassVar[str] = "PRAGMA table_xinfo({index_name})"
     INSERT_MESSAGE_QUERY: ClassVar[
         str
     ] = """
@@ -53,26 +108,58 @@ class SQLite(MemoryBackend):
         FROM {index_name}
         ORDER BY timestamp ASC
     """
-    CHECK_IF_EMPTY_QUERY: ClassVar[str] = "SELECT COUNT(*) FROM {index_name}"
+    SELECT_RECENT_MESSAGES_QUERY: ClassVar[
+        str
+    ] = """
+        SELECT id, role, content, metadata, timestamp FROM (
+            SELECT id, role, content, metadata, timestamp
+            FROM {index_name}
+            ORDER BY timestamp DESC
+            LIMIT ?
+        )
+        ORDER BY timestamp ASC
+    """
+    CHECK_IF_EMPTY_QUERY: ClassVar[str] = "SELECT NOT EXISTS (SELECT 1 FROM {index_name})"
     CLEAR_TABLE_QUERY: ClassVar[str] = "DELETE FROM {index_name}"
     SEARCH_MESSAGES_QUERY: ClassVar[
         str
     ] = """
-        SELECT id, role, content, metadata
-        FROM {index_name}
+        SELECT m.id, m.role, m.content, m.metadata
+        FROM {index_name} AS m
+    """
+    FULL_TEXT_SEARCH_QUERY: ClassVar[
+        str
+    ] = """
+        SELECT m.id, m.role, m.content, m.metadata
+        FROM {index_name}_fts AS f
+        JOIN {index_name} AS m ON m.rowid = f.rowid
     """
 
+    _local: threading.local = PrivateAttr(default_factory=threading.local)
+    _connections: weakref.WeakSet = PrivateAttr(default_factory=weakref.WeakSet)
+    _shared_connection: sqlite3.Connection | None = PrivateAttr(default=None)
+    _lock: threading.RLock = PrivateAttr(default_factory=threading.RLock)
+    _fts_enabled: bool = PrivateAttr(default=False)
+
     @property
     def to_dict_exclude_params(self):
         """Define parameters to exclude during serialization."""
         return super().to_dict_exclude_params | {
+            "INDEXED_METADATA_FIELDS": True,
             "CREATE_TABLE_QUERY": True,
+            "ADD_METADATA_COLUMN_QUERY": True,
+            "CREATE_INDEX_QUERIES": True,
+            "CREATE_FTS_QUERIES": True,
+            "REBUILD_FTS_QUERY": True,
             "VALIDATE_TABLE_QUERY": True,
+            "TABLE_COLUMNS_QUERY": True,
             "INSERT_MESSAGE_QUERY": True,
             "SELECT_ALL_MESSAGES_QUERY": True,
+            "SELECT_RECENT_MESSAGES_QUERY": True,
             "CHECK_IF_EMPTY_QUERY": True,
             "CLEAR_TABLE_QUERY": True,
             "SEARCH_MESSAGES_QUERY": True,
+            "FULL_TEXT_SEARCH_QUERY": True,
         }
 
     def to_dict(self, include_secure_params: bool = False, **kwargs) -> dict:
@@ -100,68 +187,155 @@ class SQLite(MemoryBackend):
         except Exception as e:
             raise SQLiteError(f"Error initializing SQLite backend: {e}") from e
 
+    @property
+    def is_in_memory(self) -> bool:
+        """Whether the database is in memory. All threads share one connection, as each would get its own database."""
+        return self.db_path == ":memory:" or self.db_path.startswith("file::memory:")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Returns the connection of the current thread, creating it on first use."""
+        local = self._local
+        conn = getattr(local, "connection", None)
+        # Connections are not reused in forked processes
+        if conn is not None and local.pid == os.getpid():
+            return conn
+
+        with self._lock:
+            if self.is_in_memory and self._shared_connection is not None:
+                conn = self._shared_connection
+            else:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, factory=_Connection)
+                if self.wal_enabled and not self.is_in_memory:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                if self.is_in_memory:
+                    self._shared_connection = conn
+                self._connections.add(conn)
+        local.connection, local.pid = conn, os.getpid()
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Yields a cursor of the thread connection, committing on success and rolling back on errors."""
+        conn = self._get_connection()
+        with self._lock if self.is_in_memory else nullcontext():
+            with conn:
+                yield conn.cursor()
+
+    def close(self) -> None:
+        """Closes connections of all threads."""
+        with self._lock:
+            for conn in list(self._connections):
+                conn.close()
+            self._connections = weakref.WeakSet()
+            self._shared_connection = None
+            self._local = threading.local()
+
     def _validate_table_name(self, create_if_not_exists: bool = False) -> None:
         """Validates the table name to prevent SQL injection and optionally creates it."""
         if not re.match(r"^[A-Za-z0-9_]+$", self.index_name):
             raise SQLiteError(f"Invalid table name: '{self.index_name}'")
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._transaction() as cursor:
                 cursor.execute(self.VALIDATE_TABLE_QUERY, (self.index_name,))
                 result = cursor.fetchone()
 
-                if result is None:
-                    if create_if_not_exists:
-                        self._create_table()
-                    else:
-                        raise SQLiteError(f"Table '{self.index_name}' does not exist in the database.")
+            if result is None and not create_if_not_exists:
+                raise SQLiteError(f"Table '{self.index_name}' does not exist in the database.")
+            # Tables of earlier versions are migrated to indexed metadata columns and full-text search
+            self._create_table()
 
         except sqlite3.Error as e:
             raise SQLiteError(f"Error validating or creating table: {e}") from e
 
     def _create_table(self) -> None:
-        """Creates the messages table."""
-        query = self.CREATE_TABLE_QUERY.format(index_name=self.index_name)
+        """Creates the messages table with its indexes, adding missing columns to existing tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query)
-                conn.commit()
+            with self._transaction() as cursor:
+                cursor.execute(self.CREATE_TABLE_QUERY.format(index_name=self.index_name))
+                cursor.execute(self.TABLE_COLUMNS_QUERY.format(index_name=self.index_name))
+                columns = {row[1] for row in cursor.fetchall()}
+                for field in self.INDEXED_METADATA_FIELDS:
+                    if field not in columns:
+                        cursor.execute(self.ADD_METADATA_COLUMN_QUERY.format(index_name=self.index_name, field=field))
+                for query in self.CREATE_INDEX_QUERIES:
+                    cursor.execute(query.format(index_name=self.index_name))
+
+            self._fts_enabled = self.full_text_search and self._create_fts()
         except sqlite3.Error as e:
             raise SQLiteError(f"Error creating table: {e}") from e
 
+    def _create_fts(self) -> bool:
+        """Creates the full-text index if it does not exist, indexing stored messages.
+
+        Returns:
+            bool: Whether the full-text index is available.
+        """
+        with self._transaction() as cursor:
+            cursor.execute(self.VALIDATE_TABLE_QUERY, (f"{self.index_name}_fts",))
+            if cursor.fetchone() is not None:
+                return True
+
+            try:
+                cursor.execute(self.CREATE_FTS_QUERIES[0].format(index_name=self.index_name))
+            except sqlite3.OperationalError as e:
+                logger.warning(f"SQLite full-text search is not available, substring search is used instead: {e}")
+                return False
+
+            for query in self.CREATE_FTS_QUERIES[1:]:
+                cursor.execute(query.format(index_name=self.index_name))
+            cursor.execute(self.REBUILD_FTS_QUERY.format(index_name=self.index_name))
+        return True
+
+    @staticmethod
+    def _get_message_row(message: Message) -> tuple:
+        """Converts a message to the values of an inserted row."""
+        metadata = message.metadata or {}
+        return (
+            str(uuid.uuid4()),
+            message.role.value,
+            message.content,
+            json.dumps(metadata),
+            metadata.get("timestamp", 0),
+        )
+
+    @staticmethod
+    def _get_message(row: tuple) -> Message:
+        """Converts a selected row to a message."""
+        return Message(role=row[1], content=row[2], metadata=json.loads(row[3] or "{}"))
+
     def add(self, message: Message) -> None:
         """Stores a message in the SQLite database."""
         try:
             query = self.INSERT_MESSAGE_QUERY.format(index_name=self.index_name)
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                message_id = str(uuid.uuid4())
-                cursor.execute(
-                    query,
-                    (
-                        message_id,
-                        message.role.value,
-                        message.content,
-                        json.dumps(message.metadata),
-                        message.metadata.get("timestamp", 0),
-                    ),
-                )
-                conn.commit()
+            with self._transaction() as cursor:
+                cursor.execute(query, self._get_message_row(message))
 
         except sqlite3.Error as e:
             raise SQLiteError(f"Error adding message to database: {e}") from e
 
-    def get_all(self) -> list[Message]:
-        """Retrieves all messages from the SQLite database."""
+    def add_many(self, messages: list[Message]) -> None:
+        """Stores messages in the SQLite database in one transaction."""
         try:
-            query = self.SELECT_ALL_MESSAGES_QUERY.format(index_name=self.index_name)
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(query)
+            query = self.INSERT_MESSAGE_QUERY.format(index_name=self.index_name)
+            with self._transaction() as cursor:
+                cursor.executemany(query, [self._get_message_row(message) for message in messages])
+
+        except sqlite3.Error as e:
+            raise SQLiteError(f"Error adding messages to database: {e}") from e
+
+    def get_all(self, limit: int | None = None) -> list[Message]:
+        """Retrieves all messages from the SQLite database, or the most recent ones if limit is provided."""
+        try:
+            if limit:
+                query, params = self.SELECT_RECENT_MESSAGES_QUERY.format(index_name=self.index_name), (limit,)
+            else:
+                query, params = self.SELECT_ALL_MESSAGES_QUERY.format(index_name=self.index_name), ()
+            with self._transaction() as cursor:
+                cursor.execute(query, params)
                 rows = cursor.fetchall()
-            return [Message(role=row[1], content=row[2], metadata=json.loads(row[3] or "{}")) for row in rows]
+            return [self._get_message(row) for row in rows]
 
         except sqlite3.Error as e:
             raise SQLiteError(f"Error retrieving messages from database: {e}") from e
@@ -170,11 +344,9 @@ class SQLite(MemoryBackend):
         """Checks if the SQLite database is empty."""
         try:
             query = self.CHECK_IF_EMPTY_QUERY.format(index_name=self.index_name)
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._transaction() as cursor:
                 cursor.execute(query)
-                count = cursor.fetchone()[0]
-            return count == 0
+                return bool(cursor.fetchone()[0])
 
         except sqlite3.Error as e:
             raise SQLiteError(f"Error checking if database is empty: {e}") from e
@@ -183,49 +355,81 @@ class SQLite(MemoryBackend):
         """Clears the SQLite database by deleting all rows in the table."""
         try:
             query = self.CLEAR_TABLE_QUERY.format(index_name=self.index_name)
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._transaction() as cursor:
                 cursor.execute(query)
-                conn.commit()
         except sqlite3.Error as e:
             raise SQLiteError(f"Error clearing database: {e}") from e
 
+    def _get_filter_clauses(self, filters: dict[str, Any]) -> tuple[list[str], list[Any]]:
+        """Builds WHERE clauses for metadata filters, using indexed columns where available."""
+        where_clauses = []
+        params = []
+        for key, value in filters.items():
+            if key in self.INDEXED_METADATA_FIELDS:
+                column = f"m.{key}"
+            else:
+                column = "json_extract(m.metadata, ?)"
+                params.append(f"$.{key}")
+
+            if isinstance(value, list):
+                placeholders = ",".join("?" for _ in value)
+                where_clauses.append(f"{column} IN ({placeholders})")
+                params.extend(value)
+            elif isinstance(value, str) and "%" in value:
+                where_clauses.append(f"{column} LIKE ?")
+                params.append(value)
+            else:
+                where_clauses.append(f"{column} = ?")
+                params.append(value)
+        return where_clauses, params
+
+    @staticmethod
+    def _get_match_query(query: str) -> str:
+        """Converts a search query to an FTS5 query matching any of its terms."""
+        terms = re.findall(r"\w+", query)
+        return " OR ".join('"{}"'.format(term) for term in terms)
+
     def search(self, query: str | None = None, limit: int = 10, filters: dict | None = None) -> list[Message]:
-        """Searches for messages in SQLite based on the query and/or filters."""
+        """Searches for messages in SQLite based on the query and/or filters.
+
+        With a query, messages are ranked by BM25 relevance. Without a query, the most recent messages
+        are returned, oldest first.
+        """
         try:
             where_clauses = []
             params = []
 
-            if query:
-                where_clauses.append("content LIKE ?")
-                params.append(f"%{query}%")
+            full_text = bool(query) and self._fts_enabled
+            if full_text:
+                if not (match_query := self._get_match_query(query)):
+                    return []
+                query_str = self.FULL_TEXT_SEARCH_QUERY.format(index_name=self.index_name)
+                where_clauses.append(f"{self.index_name}_fts MATCH ?")
+                params.append(match_query)
+            else:
+                query_str = self.SEARCH_MESSAGES_QUERY.format(index_name=self.index_name)
+                if query:
+                    where_clauses.append("m.content LIKE ?")
+                    params.append(f"%{query}%")
 
             if filters:
-                for key, value in filters.items():
-                    if isinstance(value, list):
-                        placeholders = ",".join("?" for _ in value)
-                        where_clauses.append(f"json_extract(metadata, '$.{key}') IN ({placeholders})")
-                        params.extend(value)
-                    else:
-                        if isinstance(value, str) and "%" in value:
-                            where_clauses.append(f"json_extract(metadata, '$.{key}') LIKE ?")
-                            params.append(value)
-                        else:
-                            where_clauses.append(f"json_extract(metadata, '$.{key}') = ?")
-                            params.append(value)
-
-            query_str = self.SEARCH_MESSAGES_QUERY.format(index_name=self.index_name)
+                filter_clauses, filter_params = self._get_filter_clauses(filters)
+                where_clauses.extend(filter_clauses)
+                params.extend(filter_params)
+
             if where_clauses:
                 query_str += f" WHERE {' AND '.join(where_clauses)}"
-            query_str += " ORDER BY id DESC LIMIT ?"
-            params.append(limit)
+            query_str += " ORDER BY f.rank" if full_text else " ORDER BY m.timestamp DESC"
+            # A negative limit returns all rows
+            query_str += " LIMIT ?"
+            params.append(limit or -1)
 
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._transaction() as cursor:
                 cursor.execute(query_str, params)
                 rows = cursor.fetchall()
 
-            return [Message(role=row[1], content=row[2], metadata=json.loads(row[3] or "{}")) for row in rows]
+            messages = [self._get_message(row) for row in rows]
+            return messages if query else messages[::-1]
 
         except sqlite3.Error as e:
             raise SQLiteError(f"Error searching in database: {e}") from e
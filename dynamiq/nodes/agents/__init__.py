@@ -1,4 +1,4 @@
-from .base import Agent, AgentManager
+from .base import Agent, AgentManager, AgentRunContext
 from .react import ReActAgent
 from .reflection import ReflectionAgent
 from .simple import SimpleAgent
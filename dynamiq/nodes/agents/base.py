@@ -12,7 +12,12 @@ from dynamiq.connections.managers import ConnectionManager
 from dynamiq.memory import Memory, MemoryRetrievalStrategy
 from dynamiq.nodes import ErrorHandling, Node, NodeGroup
 from dynamiq.nodes.agents.exceptions import AgentUnknownToolException, InvalidActionException, ToolExecutionException
-from dynamiq.nodes.agents.utils import TOOL_MAX_TOKENS, create_message_from_input, process_tool_output_for_agent
+from dynamiq.nodes.agents.utils import (
+    TOOL_MAX_TOKENS,
+    AnswerStreamParser,
+    create_message_from_input,
+    process_tool_output_for_agent,
+)
 from dynamiq.nodes.node import NodeDependency, ensure_config
 from dynamiq.prompts import Message, MessageRole, Prompt, VisionMessage, VisionMessageTextContent
 from dynamiq.runnables import RunnableConfig, RunnableStatus
@@ -86,6 +91,7 @@ class AgentIntermediateStepModelObservation(BaseModel):
     tool_using: str | dict | None = None
     tool_input: str | dict | None = None
     tool_output: Any = None
+    tool_calls: list[dict] | None = None
     updated: str | dict | None = None
 
 
@@ -101,6 +107,32 @@ class ToolParams(BaseModel):
     by_id_params: dict[str, dict[str, Any]] = Field(default_factory=dict, alias="by_id")
 
 
+class AgentRunContext(BaseModel):
+    """
+    State of a single agent run.
+
+    Agent instances keep only configuration and prompt templates, so one agent can serve concurrent runs.
+    Everything a run changes is kept in its context.
+
+    Attributes:
+        prompt (Prompt): Conversation of the run.
+        prompt_blocks (dict[str, str]): Prompt blocks of the run.
+        prompt_variables (dict[str, Any]): Prompt variables of the run.
+        intermediate_steps (dict[int, dict]): Intermediate steps by loop number.
+        run_depends (list[dict]): Dependencies of the next node run.
+        files (list[io.BytesIO | bytes] | None): Files available in the run.
+    """
+
+    prompt: Prompt = Field(default_factory=lambda: Prompt(messages=[]))
+    prompt_blocks: dict[str, str] = Field(default_factory=dict)
+    prompt_variables: dict[str, Any] = Field(default_factory=dict)
+    intermediate_steps: dict[int, dict] = Field(default_factory=dict)
+    run_depends: list[dict] = Field(default_factory=list)
+    files: list[io.BytesIO | bytes] | None = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
 class AgentInputSchema(BaseModel):
     input: str = Field(default="", description="Text input for the agent.")
     images: list[str | bytes | io.BytesIO] | None = Field(
@@ -190,9 +222,6 @@ class Agent(Node):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._intermediate_steps: dict[int, dict] = {}
-        self._run_depends: list[dict] = []
-        self._prompt = Prompt(messages=[])
         self._init_prompt_blocks()
 
     @model_validator(mode="after")
@@ -273,6 +302,25 @@ class Agent(Node):
         """Sets or updates a prompt variable."""
         self._prompt_variables[variable_name] = value
 
+    def create_run_context(self, files: list[io.BytesIO | bytes] | None = None) -> AgentRunContext:
+        """
+        Creates the state of a new run from the agent prompt blocks and variables.
+
+        Args:
+            files (list[io.BytesIO | bytes] | None): Files provided for the run. Agent files are used if None.
+
+        Returns:
+            AgentRunContext: State of the run.
+        """
+        run_context = AgentRunContext(
+            prompt_blocks=self._prompt_blocks.copy(),
+            prompt_variables=self._prompt_variables.copy(),
+            files=files or self.files,
+        )
+        if files:
+            run_context.prompt_variables["file_description"] = self.get_file_description(files)
+        return run_context
+
     def _prepare_metadata(self, input_data: dict) -> dict:
         """
         Prepare metadata from input data.
@@ -323,7 +371,6 @@ class Agent(Node):
             log_data["files"] = [f"file_{i}" for i in range(len(log_data["files"]))]
 
         logger.info(f"Agent {self.name} - {self.id}: started with input {log_data}")
-        self.reset_run_state()
         config = ensure_config(config)
         self.run_on_node_execute_run(config.callbacks, **kwargs)
 
@@ -358,29 +405,25 @@ class Agent(Node):
         else:
             history_messages = None
 
+        run_context = self.create_run_context(files=input_data.files)
         if self.role:
-            self._prompt_blocks["context"] = Template(self.role).render(**dict(input_data))
-
-        files = input_data.files
-        if files:
-            self.files = files
-            self._prompt_variables["file_description"] = self.file_description
+            run_context.prompt_blocks["context"] = Template(self.role).render(**dict(input_data))
 
         if input_data.tool_params:
             kwargs["tool_params"] = input_data.tool_params
 
-        self._prompt_variables.update(dict(input_data))
+        run_context.prompt_variables.update(dict(input_data))
         kwargs = kwargs | {"parent_run_id": kwargs.get("run_id")}
         kwargs.pop("run_depends", None)
 
-        result = self._run_agent(input_message, history_messages, config=config, **kwargs)
+        result = self._run_agent(input_message, history_messages, config=config, run_context=run_context, **kwargs)
 
         if use_memory:
             self.memory.add(role=MessageRole.ASSISTANT, content=result, metadata=custom_metadata)
 
         execution_result = {
             "content": result,
-            "intermediate_steps": self._intermediate_steps,
+            "intermediate_steps": run_context.intermediate_steps,
         }
         logger.info(f"Node {self.name} - {self.id}: finished with RESULT:\n{str(result)[:200]}...")
 
@@ -447,17 +490,30 @@ class Agent(Node):
         logger.info("Agent %s - %s: retrieved %d messages from memory", self.name, self.id, len(history_messages))
         return history_messages
 
-    def _run_llm(self, messages: list[Message | VisionMessage], config: RunnableConfig | None = None, **kwargs) -> str:
+    def _run_llm(
+        self,
+        messages: list[Message | VisionMessage],
+        config: RunnableConfig | None = None,
+        run_context: AgentRunContext | None = None,
+        answer_parser: AnswerStreamParser | None = None,
+        **kwargs,
+    ) -> str:
         """Runs the LLM with a given prompt and handles streaming or full responses."""
+        if run_context is None:
+            run_context = AgentRunContext()
+        if answer_parser:
+            kwargs = kwargs | {"content_handler": answer_parser.feed}
         try:
             llm_result = self.llm.run(
                 input_data={},
                 config=config,
                 prompt=Prompt(messages=messages),
-                run_depends=self._run_depends,
+                run_depends=run_context.run_depends,
                 **kwargs,
             )
-            self._run_depends = [NodeDependency(node=self.llm).to_dict()]
+            if answer_parser:
+                answer_parser.close()
+            run_context.run_depends = [NodeDependency(node=self.llm).to_dict()]
             if llm_result.status != RunnableStatus.SUCCESS:
                 error_message = f"LLM '{self.llm.name}' failed: {llm_result.output.get('content')}"
                 raise ValueError({error_message})
@@ -495,6 +551,36 @@ class Agent(Node):
             return self.stream_by_tokens(content=content, source=source, step=step, config=config, **kwargs)
         return self.stream_response(content=content, source=source, step=step, config=config, **kwargs)
 
+    def create_answer_stream_parser(
+        self,
+        config: RunnableConfig | None = None,
+        start_marker: str | None = None,
+        end_marker: str | None = None,
+        **kwargs,
+    ) -> AnswerStreamParser | None:
+        """
+        Creates a parser that streams the answer from LLM chunks as they arrive.
+
+        Args:
+            config (Optional[RunnableConfig]): Configuration for the runnable.
+            start_marker (str | None): Marker after which the answer starts in the LLM output.
+            end_marker (str | None): Marker at which the answer ends in the LLM output.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            AnswerStreamParser | None: Parser, or None if incremental streaming is disabled.
+        """
+        if not (self.streaming.enabled and self.streaming.incremental):
+            return None
+
+        return AnswerStreamParser(
+            on_answer=lambda text: self.stream_response(
+                content=text, source=self.name, step="answer", config=config, **kwargs
+            ),
+            start_marker=start_marker,
+            end_marker=end_marker,
+        )
+
     def stream_by_tokens(self, content: str, source: str, step: str, config: RunnableConfig | None = None, **kwargs):
         """Streams the input content to the callbacks."""
         if isinstance(content, dict):
@@ -504,14 +590,9 @@ class Agent(Node):
         for token in tokens:
             final_response.append(token)
             token_with_prefix = " " + token
-            token_for_stream = StreamChunk(
-                choices=[
-                    StreamChunkChoice(delta=StreamChunkChoiceDelta(content=token_with_prefix, source=source, step=step))
-                ]
-            )
             self.run_on_node_execute_stream(
                 callbacks=config.callbacks,
-                chunk=token_for_stream.model_dump(),
+                chunk=self._get_stream_chunk_data(token_with_prefix, source, step),
                 **kwargs,
             )
         return " ".join(final_response)
@@ -519,37 +600,48 @@ class Agent(Node):
     def stream_response(
         self, content: str | dict, source: str, step: str, config: RunnableConfig | None = None, **kwargs
     ):
-        response_for_stream = StreamChunk(
-            choices=[StreamChunkChoice(delta=StreamChunkChoiceDelta(content=content, source=source, step=step))]
-        )
-
         self.run_on_node_execute_stream(
             callbacks=config.callbacks,
-            chunk=response_for_stream.model_dump(),
+            chunk=self._get_stream_chunk_data(content, source, step),
             **kwargs,
         )
         return content
 
+    @staticmethod
+    def _get_stream_chunk_data(content: str | dict, source: str, step: str) -> dict:
+        """Get the data of a streamed chunk in the StreamChunk format without building the models."""
+        return {"choices": [{"delta": {"content": content, "source": source, "step": step}}]}
+
     def _run_agent(
         self,
         input_message: Message | VisionMessage,
         history_messages: list[Message] | None = None,
         config: RunnableConfig | None = None,
+        run_context: AgentRunContext | None = None,
         **kwargs,
     ) -> str:
         """Runs the agent with the generated prompt and handles exceptions."""
-        formatted_prompt = self.generate_prompt()
+        if run_context is None:
+            run_context = self.create_run_context()
+        formatted_prompt = self.generate_prompt(run_context=run_context)
         system_message = Message(role=MessageRole.SYSTEM, content=formatted_prompt)
         if history_messages:
-            self._prompt.messages = [system_message, *history_messages, input_message]
+            run_context.prompt.messages = [system_message, *history_messages, input_message]
         else:
-            self._prompt.messages = [system_message, input_message]
+            run_context.prompt.messages = [system_message, input_message]
 
+        answer_parser = self.create_answer_stream_parser(config=config, **kwargs)
         try:
-            llm_result = self._run_llm(self._prompt.messages, config=config, **kwargs).output["content"]
-            self._prompt.messages.append(Message(role=MessageRole.ASSISTANT, content=llm_result))
+            llm_result = self._run_llm(
+                run_context.prompt.messages,
+                config=config,
+                run_context=run_context,
+                answer_parser=answer_parser,
+                **kwargs,
+            ).output["content"]
+            run_context.prompt.messages.append(Message(role=MessageRole.ASSISTANT, content=llm_result))
 
-            if self.streaming.enabled:
+            if self.streaming.enabled and not (answer_parser and answer_parser.has_answer):
                 return self.stream_content(
                     content=llm_result,
                     source=self.name,
@@ -587,11 +679,15 @@ class Agent(Node):
                 merged_input[key] = value
                 debug_info.append(f"  - From {source}: Set {key}={value}")
 
-    def _run_tool(self, tool: Node, tool_input: dict, config, **kwargs) -> Any:
+    def _run_tool(
+        self, tool: Node, tool_input: dict, config, run_context: AgentRunContext | None = None, **kwargs
+    ) -> Any:
         """Runs a specific tool with the given input."""
-        if self.files:
+        if run_context is None:
+            run_context = self.create_run_context()
+        if run_context.files:
             if tool.is_files_allowed is True:
-                tool_input["files"] = self.files
+                tool_input["files"] = run_context.files
 
         merged_input = tool_input.copy() if isinstance(tool_input, dict) else {"input": tool_input}
         raw_tool_params = kwargs.get("tool_params", ToolParams())
@@ -628,10 +724,10 @@ class Agent(Node):
         tool_result = tool.run(
             input_data=merged_input,
             config=config,
-            run_depends=self._run_depends,
+            run_depends=run_context.run_depends,
             **(kwargs | {"recoverable_error": True}),
         )
-        self._run_depends = [NodeDependency(node=tool).to_dict()]
+        run_context.run_depends = [NodeDependency(node=tool).to_dict()]
         if tool_result.status != RunnableStatus.SUCCESS:
             error_message = f"Tool '{tool.name}' failed: {tool_result.output}"
             if tool_result.output["recoverable"]:
@@ -663,9 +759,14 @@ class Agent(Node):
     @property
     def file_description(self) -> str:
         """Returns a description of the files available to the agent."""
-        if self.files:
+        return self.get_file_description(self.files)
+
+    @staticmethod
+    def get_file_description(files: list[io.BytesIO | bytes] | None) -> str:
+        """Returns a description of the given files."""
+        if files:
             file_description = "You can work with the following files:\n"
-            for file in self.files:
+            for file in files:
                 name = getattr(file, "name", "Unnamed file")
                 description = getattr(file, "description", "No description")
                 file_description += f"<file>: {name} - {description} <\\file>\n"
@@ -682,18 +783,17 @@ class Agent(Node):
         """Returns a dictionary mapping tool names to their corresponding Node objects."""
         return {self.sanitize_tool_name(tool.name): tool for tool in self.tools}
 
-    def reset_run_state(self):
-        """Resets the agent's run state."""
-        self._intermediate_steps = {}
-        self._run_depends = []
-
-    def generate_prompt(self, block_names: list[str] | None = None, **kwargs) -> str:
-        """Generates the prompt using specified blocks and variables."""
-        temp_variables = self._prompt_variables.copy()
+    def generate_prompt(
+        self, block_names: list[str] | None = None, run_context: AgentRunContext | None = None, **kwargs
+    ) -> str:
+        """Generates the prompt using specified blocks and variables of the run or the agent."""
+        prompt_blocks = run_context.prompt_blocks if run_context else self._prompt_blocks
+        prompt_variables = run_context.prompt_variables if run_context else self._prompt_variables
+        temp_variables = prompt_variables.copy()
         temp_variables.update(kwargs)
 
         formatted_prompt_blocks = {}
-        for block, content in self._prompt_blocks.items():
+        for block, content in prompt_blocks.items():
             if block_names is None or block in block_names:
 
                 formatted_content = content.format(**temp_variables)
@@ -771,46 +871,50 @@ class AgentManager(Agent):
             log_data["files"] = [f"file_{i}" for i in range(len(log_data["files"]))]
 
         logger.info(f"Agent {self.name} - {self.id}: started with input {log_data}")
-        self.reset_run_state()
         config = config or RunnableConfig()
         self.run_on_node_execute_run(config.callbacks, **kwargs)
 
         action = input_data.action
 
-        self._prompt_variables.update(dict(input_data))
+        run_context = self.create_run_context()
+        run_context.prompt_variables.update(dict(input_data))
 
         kwargs = kwargs | {"parent_run_id": kwargs.get("run_id")}
         kwargs.pop("run_depends", None)
-        _result_llm = self._actions[action](config=config, **kwargs)
+        _result_llm = self._actions[action](config=config, run_context=run_context, **kwargs)
         result = {"action": action, "result": _result_llm}
 
         execution_result = {
             "content": result,
-            "intermediate_steps": self._intermediate_steps,
+            "intermediate_steps": run_context.intermediate_steps,
         }
         logger.info(f"Agent {self.name} - {self.id}: finished with RESULT:\n{str(result)[:200]}...")
 
         return execution_result
 
-    def _plan(self, config: RunnableConfig, **kwargs) -> str:
+    def _plan(self, config: RunnableConfig, run_context: AgentRunContext, **kwargs) -> str:
         """Executes the 'plan' action."""
-        prompt = self._prompt_blocks.get("plan").format(**self._prompt_variables, **kwargs)
-        llm_result = self._run_llm([Message(role=MessageRole.USER, content=prompt)], config, **kwargs).output["content"]
+        prompt = run_context.prompt_blocks.get("plan").format(**run_context.prompt_variables, **kwargs)
+        llm_result = self._run_llm(
+            [Message(role=MessageRole.USER, content=prompt)], config, run_context=run_context, **kwargs
+        ).output["content"]
 
         return llm_result
 
-    def _assign(self, config: RunnableConfig, **kwargs) -> str:
+    def _assign(self, config: RunnableConfig, run_context: AgentRunContext, **kwargs) -> str:
         """Executes the 'assign' action."""
-        prompt = self._prompt_blocks.get("assign").format(**self._prompt_variables, **kwargs)
-        llm_result = self._run_llm([Message(role=MessageRole.USER, content=prompt)], config, **kwargs).output["content"]
+        prompt = run_context.prompt_blocks.get("assign").format(**run_context.prompt_variables, **kwargs)
+        llm_result = self._run_llm(
+            [Message(role=MessageRole.USER, content=prompt)], config, run_context=run_context, **kwargs
+        ).output["content"]
 
         return llm_result
 
-    def _final(self, config: RunnableConfig, **kwargs) -> str:
+    def _final(self, config: RunnableConfig, run_context: AgentRunContext, **kwargs) -> str:
         """Executes the 'final' action."""
-        prompt = self._prompt_blocks.get("final").format(**self._prompt_variables, **kwargs)
+        prompt = run_context.prompt_blocks.get("final").format(**run_context.prompt_variables, **kwargs)
         llm_result = self._run_llm(
-            [Message(role=MessageRole.USER, content=prompt)], config, by_tokens=False, **kwargs
+            [Message(role=MessageRole.USER, content=prompt)], config, run_context=run_context, by_tokens=False, **kwargs
         ).output["content"]
         if self.streaming.enabled:
             return self.stream_content(
@@ -1,4 +1,4 @@
-from dynamiq.nodes.agents.base import AgentManager
+from dynamiq.nodes.agents.base import AgentManager, AgentRunContext
 from dynamiq.prompts import Message, MessageRole
 from dynamiq.runnables import RunnableConfig
 from dynamiq.types.streaming import StreamingMode
@@ -401,10 +401,12 @@ class AdaptiveAgentManager(AgentManager):
         """Return the adaptive reflect prompt template."""
         return PROMPT_TEMPLATE_AGENT_MANAGER_REFLECT
 
-    def _reflect(self, config: RunnableConfig, **kwargs) -> str:
+    def _reflect(self, config: RunnableConfig, run_context: AgentRunContext, **kwargs) -> str:
         """Executes the 'reflect' action."""
-        prompt = self._prompt_blocks.get("reflect").format(**self._prompt_variables, **kwargs)
-        llm_result = self._run_llm([Message(role=MessageRole.USER, content=prompt)], config, **kwargs).output["content"]
+        prompt = run_context.prompt_blocks.get("reflect").format(**run_context.prompt_variables, **kwargs)
+        llm_result = self._run_llm(
+            [Message(role=MessageRole.USER, content=prompt)], config, run_context=run_context, **kwargs
+        ).output["content"]
         if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
             return self.stream_content(
                 content=llm_result,
@@ -416,10 +418,12 @@ class AdaptiveAgentManager(AgentManager):
             )
         return llm_result
 
-    def _respond(self, config: RunnableConfig, **kwargs) -> str:
+    def _respond(self, config: RunnableConfig, run_context: AgentRunContext, **kwargs) -> str:
         """Executes the 'respond' action."""
-        prompt = self._prompt_blocks.get("respond").format(**self._prompt_variables, **kwargs)
-        llm_result = self._run_llm([Message(role=MessageRole.USER, content=prompt)], config, **kwargs).output["content"]
+        prompt = run_context.prompt_blocks.get("respond").format(**run_context.prompt_variables, **kwargs)
+        llm_result = self._run_llm(
+            [Message(role=MessageRole.USER, content=prompt)], config, run_context=run_context, **kwargs
+        ).output["content"]
         if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
             return self.stream_content(
                 content=llm_result, step="manager_response", source=self.name, config=config, by_tokens=False, **kwargs
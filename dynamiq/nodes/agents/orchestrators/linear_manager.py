@@ -1,4 +1,4 @@
-from dynamiq.nodes.agents.base import AgentManager
+from dynamiq.nodes.agents.base import AgentManager, AgentRunContext
 from dynamiq.prompts import Message, MessageRole
 from dynamiq.runnables import RunnableConfig
 
@@ -367,17 +367,17 @@ class LinearAgentManager(AgentManager):
     def _get_linear_handle_input_prompt() -> str:
         return PROMPT_TEMPLATE_AGENT_MANAGER_LINEAR_HANDLE_INPUT
 
-    def _handle_input(self, config: RunnableConfig, **kwargs) -> str:
+    def _handle_input(self, config: RunnableConfig, run_context: AgentRunContext, **kwargs) -> str:
         """
         Executes the single 'handle_input' action to either respond or plan
         based on user request complexity.
         """
-        temp_variables = self._prompt_variables.copy()
+        temp_variables = run_context.prompt_variables.copy()
         temp_variables.update(kwargs)
         _prompt = self._get_linear_handle_input_prompt()
         _prompt = _prompt.replace("task_placeholder", temp_variables.get("task"))
         _prompt = _prompt.replace("agents_placeholder", temp_variables.get("agents"))
-        llm_result = self._run_llm([Message(role=MessageRole.USER, content=_prompt)], config, **kwargs).output[
-            "content"
-        ]
+        llm_result = self._run_llm(
+            [Message(role=MessageRole.USER, content=_prompt)], config, run_context=run_context, **kwargs
+        ).output["content"]
         return llm_result
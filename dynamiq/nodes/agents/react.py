@@ -1,15 +1,21 @@
 import json
 import re
 import types
+from concurrent import futures
 from enum import Enum
 from typing import Any, Union, get_args, get_origin
 
-from litellm import get_supported_openai_params, supports_function_calling
 from pydantic import Field, model_validator
 
-from dynamiq.nodes.agents.base import Agent, AgentIntermediateStep, AgentIntermediateStepModelObservation
+from dynamiq.nodes.agents.base import (
+    Agent,
+    AgentIntermediateStep,
+    AgentIntermediateStepModelObservation,
+    AgentRunContext,
+)
+from dynamiq.executors.registry import AGENT_TOOLS_EXECUTOR_POOL_NAME, ExecutorPoolRegistry
 from dynamiq.nodes.agents.exceptions import ActionParsingException, MaxLoopsExceededException, RecoverableAgentException
-from dynamiq.nodes.node import Node, NodeDependency
+from dynamiq.nodes.node import Node
 from dynamiq.nodes.types import Behavior, InferenceMode
 from dynamiq.prompts import Message, MessageRole, VisionMessage
 from dynamiq.runnables import RunnableConfig
@@ -159,6 +165,8 @@ If the user's request requires the use of specific tools, such as [{tools_name}]
 Only after utilizing the necessary tools and gathering the required information should
  you call `provide_final_answer` to deliver the final response.
 
+When several independent lookups are needed, call all of the required functions at once in a single response.
+
 Make sure to check each request carefully to see if you can answer it right away or if you need to use tools to help.
 """  # noqa: E501
 
@@ -226,6 +234,13 @@ Your response should be clear, concise, and professional.
 """  # noqa: E501
 
 
+# Markers of the final answer in the LLM output by inference mode, used for incremental answer streaming
+REACT_ANSWER_MARKERS = {
+    InferenceMode.DEFAULT: ("Answer:", None),
+    InferenceMode.XML: ("<answer>", "</answer>"),
+}
+
+
 final_answer_function_schema = {
     "type": "function",
     "strict": True,
@@ -267,6 +282,9 @@ class ReActAgent(Agent):
         description="Define behavior when max loops are exceeded. Options are 'raise' or 'return'.",
     )
     format_schema: list = []
+    max_tool_workers: int = Field(
+        default=4, ge=1, description="Maximum number of tool calls of one LLM turn executed concurrently."
+    )
 
     def log_reasoning(self, thought: str, action: str, action_input: str, loop_num: int) -> None:
         """
@@ -306,6 +324,8 @@ class ReActAgent(Agent):
     @model_validator(mode="after")
     def validate_inference_mode(self):
         """Validate whether specified model can be inferenced in provided mode."""
+        from litellm import get_supported_openai_params, supports_function_calling
+
         match self.inference_mode:
             case InferenceMode.FUNCTION_CALLING:
                 if not supports_function_calling(model=self.llm.model):
@@ -420,11 +440,11 @@ class ReActAgent(Agent):
                 recoverable=True,
             )
 
-    def tracing_final(self, loop_num, final_answer, config, kwargs):
-        self._intermediate_steps[loop_num]["final_answer"] = final_answer
+    def tracing_final(self, loop_num, final_answer, config, kwargs, run_context: AgentRunContext):
+        run_context.intermediate_steps[loop_num]["final_answer"] = final_answer
 
-    def tracing_intermediate(self, loop_num, formatted_prompt, llm_generated_output):
-        self._intermediate_steps[loop_num] = AgentIntermediateStep(
+    def tracing_intermediate(self, loop_num, formatted_prompt, llm_generated_output, run_context: AgentRunContext):
+        run_context.intermediate_steps[loop_num] = AgentIntermediateStep(
             input_data={"prompt": formatted_prompt},
             model_observation=AgentIntermediateStepModelObservation(
                 initial=llm_generated_output,
@@ -446,12 +466,14 @@ class ReActAgent(Agent):
         input_message: Message | VisionMessage,
         history_messages: list[Message] | None = None,
         config: RunnableConfig | None = None,
+        run_context: AgentRunContext | None = None,
         **kwargs,
     ) -> str:
         """
         Executes the ReAct strategy by iterating through thought, action, and observation cycles.
         Args:
             config (RunnableConfig | None): Configuration for the agent run.
+            run_context (AgentRunContext | None): State of the agent run.
             **kwargs: Additional parameters for running the agent.
         Returns:
             str: Final answer provided by the agent.
@@ -462,34 +484,47 @@ class ReActAgent(Agent):
         if self.verbose:
             logger.info(f"Agent {self.name} - {self.id}: Running ReAct strategy")
 
+        if run_context is None:
+            run_context = self.create_run_context()
+        prompt = run_context.prompt
+
         system_message = Message(
             role=MessageRole.SYSTEM,
             content=self.generate_prompt(
+                run_context=run_context,
                 tools_name=self.tool_names,
                 input_formats=self.generate_input_formats(self.tools),
             ),
         )
 
         if history_messages:
-            self._prompt.messages = [system_message, *history_messages, input_message]
+            prompt.messages = [system_message, *history_messages, input_message]
         else:
-            self._prompt.messages = [system_message, input_message]
+            prompt.messages = [system_message, input_message]
 
         stop_sequences = []
         if self.inference_mode in [InferenceMode.XML, InferenceMode.DEFAULT]:
             stop_sequences.extend(["Observation: ", "\nObservation:"])
-        self.llm.stop = stop_sequences
+
+        answer_markers = REACT_ANSWER_MARKERS.get(self.inference_mode)
 
         for loop_num in range(1, self.max_loops + 1):
             try:
+                answer_parser = (
+                    self.create_answer_stream_parser(config, *answer_markers, **kwargs) if answer_markers else None
+                )
                 llm_result = self._run_llm(
-                    self._prompt.messages,
+                    prompt.messages,
                     config=config,
+                    run_context=run_context,
+                    answer_parser=answer_parser,
                     schema=self.format_schema,
                     inference_mode=self.inference_mode,
+                    stop=stop_sequences,
                     **kwargs,
                 )
                 action, action_input = None, None
+                function_calls, tool_calls = [], []
                 llm_generated_output = ""
                 llm_reasoning = (
                     llm_result.output.get("content")[:200]
@@ -502,12 +537,12 @@ class ReActAgent(Agent):
                     case InferenceMode.DEFAULT:
                         llm_generated_output = llm_result.output.get("content", "")
 
-                        self.tracing_intermediate(loop_num, self._prompt.messages, llm_generated_output)
+                        self.tracing_intermediate(loop_num, prompt.messages, llm_generated_output, run_context)
 
                         if "Answer:" in llm_generated_output:
                             thought, final_answer = self._extract_final_answer(llm_generated_output)
                             self.log_final_output(thought, final_answer, loop_num)
-                            self.tracing_final(loop_num, final_answer, config, kwargs)
+                            self.tracing_final(loop_num, final_answer, config, kwargs, run_context)
 
                             if self.streaming.enabled:
                                 if self.streaming.mode == StreamingMode.ALL:
@@ -519,13 +554,14 @@ class ReActAgent(Agent):
                                         config=config,
                                         **kwargs,
                                     )
-                                self.stream_content(
-                                    content=final_answer,
-                                    source=self.name,
-                                    step="answer",
-                                    config=config,
-                                    **kwargs,
-                                )
+                                if not answer_parser or not answer_parser.has_answer:
+                                    self.stream_content(
+                                        content=final_answer,
+                                        source=self.name,
+                                        step="answer",
+                                        config=config,
+                                        **kwargs,
+                                    )
 
                             return final_answer
 
@@ -557,19 +593,35 @@ class ReActAgent(Agent):
                                 "Error: No function called, you need to call the correct function."
                             )
 
-                        action = list(llm_result.output["tool_calls"].values())[0]["function"]["name"].strip()
-                        llm_generated_output_json = list(llm_result.output["tool_calls"].values())[0]["function"][
-                            "arguments"
-                        ]
-
-                        llm_generated_output = json.dumps(llm_generated_output_json)
+                        function_calls = list(llm_result.output["tool_calls"].values())
+                        if len(function_calls) == 1:
+                            llm_generated_output = json.dumps(function_calls[0]["function"]["arguments"])
+                        else:
+                            llm_generated_output = json.dumps(
+                                [
+                                    {
+                                        "id": call["id"],
+                                        "name": call["function"]["name"],
+                                        "arguments": call["function"]["arguments"],
+                                    }
+                                    for call in function_calls
+                                ]
+                            )
 
-                        self.tracing_intermediate(loop_num, self._prompt.messages, llm_generated_output)
-                        thought = llm_generated_output_json["thought"]
-                        if action == "provide_final_answer":
-                            final_answer = llm_generated_output_json["answer"]
+                        self.tracing_intermediate(loop_num, prompt.messages, llm_generated_output, run_context)
+                        final_answer_call = next(
+                            (
+                                call
+                                for call in function_calls
+                                if call["function"]["name"].strip() == "provide_final_answer"
+                            ),
+                            None,
+                        )
+                        if final_answer_call:
+                            thought = final_answer_call["function"]["arguments"]["thought"]
+                            final_answer = final_answer_call["function"]["arguments"]["answer"]
                             self.log_final_output(thought, final_answer, loop_num)
-                            self.tracing_final(loop_num, final_answer, config, kwargs)
+                            self.tracing_final(loop_num, final_answer, config, kwargs, run_context)
                             if self.streaming.enabled:
                                 if self.streaming.mode == StreamingMode.ALL:
                                     self.stream_content(
@@ -588,39 +640,34 @@ class ReActAgent(Agent):
                                 )
                             return final_answer
 
-                        action_input = llm_generated_output_json["action_input"]
+                        tool_calls = [self._parse_tool_call(call) for call in function_calls]
+                        for tool_call in tool_calls:
+                            self.log_reasoning(tool_call["thought"], tool_call["name"], tool_call["input"], loop_num)
 
-                        if isinstance(action_input, str):
-                            try:
-                                action_input = json.loads(action_input)
-                            except json.JSONDecodeError as e:
-                                raise ActionParsingException(
-                                    f"Error parsing action_input string. {e}", recoverable=True
+                            if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
+                                self.stream_content(
+                                    content={
+                                        "thought": tool_call["thought"],
+                                        "action": tool_call["name"],
+                                        "action_input": tool_call["input"],
+                                        "loop_num": loop_num,
+                                    },
+                                    source=self.name,
+                                    step="reasoning",
+                                    config=config,
+                                    by_tokens=False,
+                                    **kwargs,
                                 )
 
-                        self.log_reasoning(thought, action, action_input, loop_num)
-
-                        if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
-                            self.stream_content(
-                                content={
-                                    "thought": thought,
-                                    "action": action,
-                                    "action_input": action_input,
-                                    "loop_num": loop_num,
-                                },
-                                source=self.name,
-                                step="reasoning",
-                                config=config,
-                                by_tokens=False,
-                                **kwargs,
-                            )
+                        if len(tool_calls) == 1:
+                            action, action_input = tool_calls[0]["name"], tool_calls[0]["input"]
 
                     case InferenceMode.STRUCTURED_OUTPUT:
                         if self.verbose:
                             logger.info(f"Agent {self.name} - {self.id}: using structured output inference mode")
 
                         llm_generated_output = llm_result.output["content"]
-                        self.tracing_intermediate(loop_num, self._prompt.messages, llm_generated_output)
+                        self.tracing_intermediate(loop_num, prompt.messages, llm_generated_output, run_context)
                         try:
                             llm_generated_output_json = json.loads(llm_generated_output)
                         except json.JSONDecodeError as e:
@@ -632,7 +679,7 @@ class ReActAgent(Agent):
 
                         if action == "finish":
                             self.log_final_output(thought, action_input, loop_num)
-                            self.tracing_final(loop_num, action_input, config, kwargs)
+                            self.tracing_final(loop_num, action_input, config, kwargs, run_context)
                             if self.streaming.enabled:
                                 if self.streaming.mode == StreamingMode.ALL:
                                     self.stream_content(
@@ -679,12 +726,12 @@ class ReActAgent(Agent):
                             logger.info(f"Agent {self.name} - {self.id}: using XML inference mode")
 
                         llm_generated_output = llm_result.output["content"]
-                        self.tracing_intermediate(loop_num, self._prompt.messages, llm_generated_output)
+                        self.tracing_intermediate(loop_num, prompt.messages, llm_generated_output, run_context)
 
                         if "<answer>" in llm_generated_output:
                             thought, final_answer = self.extract_xml_output(llm_generated_output)
                             self.log_final_output(thought, final_answer, loop_num)
-                            self.tracing_final(loop_num, final_answer, config, kwargs)
+                            self.tracing_final(loop_num, final_answer, config, kwargs, run_context)
                             if self.streaming.enabled:
                                 if self.streaming.mode == StreamingMode.ALL:
                                     self.stream_content(
@@ -694,13 +741,14 @@ class ReActAgent(Agent):
                                         config=config,
                                         **kwargs,
                                     )
-                                self.stream_content(
-                                    content=final_answer,
-                                    source=self.name,
-                                    step="answer",
-                                    config=config,
-                                    **kwargs,
-                                )
+                                if not answer_parser or not answer_parser.has_answer:
+                                    self.stream_content(
+                                        content=final_answer,
+                                        source=self.name,
+                                        step="answer",
+                                        config=config,
+                                        **kwargs,
+                                    )
                             return final_answer
 
                         thought, action, action_input = self.parse_xml_and_extract_info(llm_generated_output)
@@ -721,14 +769,28 @@ class ReActAgent(Agent):
                                 **kwargs,
                             )
 
-                self._prompt.messages.append(Message(role=MessageRole.ASSISTANT, content=llm_generated_output))
+                if len(tool_calls) > 1 and self.tools:
+                    prompt.messages.append(
+                        Message(
+                            role=MessageRole.ASSISTANT,
+                            content="",
+                            tool_calls=[self._format_tool_call_message(call) for call in function_calls],
+                        )
+                    )
+                    prompt.messages.extend(
+                        self._run_tool_calls(
+                            tool_calls, loop_num, llm_generated_output, config, run_context=run_context, **kwargs
+                        )
+                    )
+                else:
+                    prompt.messages.append(Message(role=MessageRole.ASSISTANT, content=llm_generated_output))
 
                 if action:
                     if self.tools:
 
                         try:
                             tool = self._get_tool(action)
-                            tool_result = self._run_tool(tool, action_input, config, **kwargs)
+                            tool_result = self._run_tool(tool, action_input, config, run_context=run_context, **kwargs)
 
                         except RecoverableAgentException as e:
                             tool_result = f"{type(e).__name__}: {e}"
@@ -744,7 +806,7 @@ class ReActAgent(Agent):
                                 **kwargs,
                             )
 
-                        self._intermediate_steps[loop_num]["model_observation"].update(
+                        run_context.intermediate_steps[loop_num]["model_observation"].update(
                             AgentIntermediateStepModelObservation(
                                 tool_using=action,
                                 tool_input=action_input,
@@ -752,13 +814,13 @@ class ReActAgent(Agent):
                                 updated=llm_generated_output,
                             ).model_dump()
                         )
-                        self._prompt.messages.append(Message(role=MessageRole.USER, content=observation))
+                        prompt.messages.append(Message(role=MessageRole.USER, content=observation))
 
             except ActionParsingException as e:
-                self._prompt.messages.append(
+                prompt.messages.append(
                     Message(role=MessageRole.ASSISTANT, content="Response is:" + llm_generated_output)
                 )
-                self._prompt.messages.append(
+                prompt.messages.append(
                     Message(
                         role=MessageRole.ASSISTANT,
                         content=f"Fix the reasoning error: {type(e).__name__}: {e}",
@@ -769,12 +831,12 @@ class ReActAgent(Agent):
         if self.behaviour_on_max_loops == Behavior.RAISE:
             error_message = (
                 f"Agent {self.name} (ID: {self.id}) has reached the maximum loop limit of {self.max_loops} without finding a final answer. "  # noqa: E501
-                f"Last response: {self._prompt.messages[-1].content}\n"
+                f"Last response: {prompt.messages[-1].content}\n"
                 f"Consider increasing the maximum number of loops or reviewing the task complexity to ensure completion."  # noqa: E501
             )
             raise MaxLoopsExceededException(message=error_message)
         else:
-            max_loop_final_answer = self._handle_max_loops_exceeded(config, **kwargs)
+            max_loop_final_answer = self._handle_max_loops_exceeded(config, run_context=run_context, **kwargs)
             if self.streaming.enabled:
                 self.stream_content(
                     content=max_loop_final_answer,
@@ -785,13 +847,142 @@ class ReActAgent(Agent):
                 )
             return max_loop_final_answer
 
-    def _handle_max_loops_exceeded(self, config: RunnableConfig | None = None, **kwargs) -> str:
+    def _parse_tool_call(self, call: dict[str, Any]) -> dict[str, Any]:
+        """
+        Extracts the tool name, reasoning and input of a function call.
+
+        Args:
+            call (dict[str, Any]): Tool call returned by the LLM.
+
+        Returns:
+            dict[str, Any]: Call id, tool name, thought and tool input.
+
+        Raises:
+            ActionParsingException: If the tool input is not a valid JSON string.
+        """
+        arguments = call["function"]["arguments"]
+        action_input = arguments["action_input"]
+        if isinstance(action_input, str):
+            try:
+                action_input = json.loads(action_input)
+            except json.JSONDecodeError as e:
+                raise ActionParsingException(f"Error parsing action_input string. {e}", recoverable=True)
+
+        return {
+            "id": call["id"],
+            "name": call["function"]["name"].strip(),
+            "thought": arguments["thought"],
+            "input": action_input,
+        }
+
+    @staticmethod
+    def _format_tool_call_message(call: dict[str, Any]) -> dict[str, Any]:
+        """
+        Formats a tool call returned by the LLM for the assistant message of its turn.
+
+        Args:
+            call (dict[str, Any]): Tool call returned by the LLM.
+
+        Returns:
+            dict[str, Any]: Tool call in the OpenAI message format.
+        """
+        arguments = call["function"]["arguments"]
+        return {
+            "id": call["id"],
+            "type": "function",
+            "function": {
+                "name": call["function"]["name"],
+                "arguments": arguments if isinstance(arguments, str) else json.dumps(arguments),
+            },
+        }
+
+    def _run_tool_calls(
+        self,
+        tool_calls: list[dict[str, Any]],
+        loop_num: int,
+        llm_generated_output: str,
+        config: RunnableConfig | None = None,
+        run_context: AgentRunContext | None = None,
+        **kwargs,
+    ) -> list[Message]:
+        """
+        Runs tool calls of one LLM turn concurrently in the shared agent tools pool.
+
+        Every call starts from the same dependencies, and the next LLM call depends on all of the tools. At most
+        `max_tool_workers` calls of the turn run at once.
+
+        Args:
+            tool_calls (list[dict[str, Any]]): Parsed tool calls.
+            loop_num (int): Number of reasoning loop.
+            llm_generated_output (str): LLM output with the tool calls.
+            config (RunnableConfig | None): Configuration for the agent run.
+            run_context (AgentRunContext | None): State of the agent run.
+            **kwargs: Additional parameters for running the tools.
+
+        Returns:
+            list[Message]: Tool messages with the observation of every tool call by call id.
+        """
+        if run_context is None:
+            run_context = self.create_run_context()
+        call_contexts = [run_context.model_copy() for _ in tool_calls]
+
+        def run_tool_call(tool_call: dict[str, Any], call_context: AgentRunContext) -> Any:
+            try:
+                tool = self._get_tool(tool_call["name"])
+                return self._run_tool(tool, tool_call["input"], config, run_context=call_context, **kwargs)
+            except RecoverableAgentException as e:
+                return f"{type(e).__name__}: {e}"
+
+        # Tool calls of agents running as tools of other agents run outside the pool, as their callers hold workers
+        pool = ExecutorPoolRegistry.get_pool(name=AGENT_TOOLS_EXECUTOR_POOL_NAME)
+        submit = pool.submit_outside if pool.is_current_thread_worker() else pool.submit
+        running = {}
+        tool_results = [None] * len(tool_calls)
+        for idx, args in enumerate(zip(tool_calls, call_contexts)):
+            running[submit(run_tool_call, *args)] = idx
+            if len(running) < self.max_tool_workers:
+                continue
+            done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                tool_results[running.pop(future)] = future.result()
+        for future in futures.as_completed(running):
+            tool_results[running[future]] = future.result()
+
+        run_context.run_depends = [dep for call_context in call_contexts for dep in call_context.run_depends]
+
+        messages = []
+        for tool_call, tool_result in zip(tool_calls, tool_results):
+            tool_call["output"] = tool_result
+            messages.append(Message(role=MessageRole.TOOL, content=str(tool_result), tool_call_id=tool_call["id"]))
+            if self.streaming.enabled and self.streaming.mode == StreamingMode.ALL:
+                self.stream_content(
+                    content={"name": tool_call["name"], "input": tool_call["input"], "result": tool_result},
+                    source=tool_call["name"],
+                    step=f"tool_{loop_num}",
+                    config=config,
+                    by_tokens=False,
+                    **kwargs,
+                )
+
+        run_context.intermediate_steps[loop_num]["model_observation"].update(
+            AgentIntermediateStepModelObservation(tool_calls=tool_calls, updated=llm_generated_output).model_dump(
+                exclude_none=True
+            )
+        )
+        return messages
+
+    def _handle_max_loops_exceeded(
+        self, config: RunnableConfig | None = None, run_context: AgentRunContext | None = None, **kwargs
+    ) -> str:
         """
         Handle the case where max loops are exceeded by crafting a thoughtful response.
         """
-        self._prompt.messages.append(Message(role=MessageRole.USER, content=REACT_MAX_LOOPS_PROMPT))
-        llm_final_attempt = self._run_llm(self._prompt.messages, config=config, **kwargs).output["content"]
-        self._run_depends = [NodeDependency(node=self.llm).to_dict()]
+        if run_context is None:
+            run_context = self.create_run_context()
+        run_context.prompt.messages.append(Message(role=MessageRole.USER, content=REACT_MAX_LOOPS_PROMPT))
+        llm_final_attempt = self._run_llm(
+            run_context.prompt.messages, config=config, run_context=run_context, **kwargs
+        ).output["content"]
         final_answer = self.parse_xml_content(llm_final_attempt, "answer")
 
         return f"{final_answer}"
@@ -1,6 +1,6 @@
 import re
 
-from dynamiq.nodes.agents.base import Agent
+from dynamiq.nodes.agents.base import Agent, AgentRunContext
 from dynamiq.prompts import Message, MessageRole, VisionMessage
 from dynamiq.runnables import RunnableConfig
 from dynamiq.types.streaming import StreamingMode
@@ -75,22 +75,29 @@ class ReflectionAgent(Agent):
         input_message: Message | VisionMessage,
         history_messages: list[Message] | None = None,
         config: RunnableConfig | None = None,
+        run_context: AgentRunContext | None = None,
         **kwargs,
     ) -> str:
+        if run_context is None:
+            run_context = self.create_run_context()
         try:
             system_message = Message(
                 role=MessageRole.SYSTEM,
-                content=self.generate_prompt(block_names=["introduction", "role", "date", "instructions", "context"]),
+                content=self.generate_prompt(
+                    block_names=["introduction", "role", "date", "instructions", "context"], run_context=run_context
+                ),
             )
 
             if history_messages:
-                self._prompt.messages = [system_message, *history_messages, input_message]
+                run_context.prompt.messages = [system_message, *history_messages, input_message]
             else:
-                self._prompt.messages = [system_message, input_message]
+                run_context.prompt.messages = [system_message, input_message]
 
-            result = self._run_llm(self._prompt.messages, config=config, **kwargs).output["content"]
+            result = self._run_llm(
+                run_context.prompt.messages, config=config, run_context=run_context, **kwargs
+            ).output["content"]
 
-            self._prompt.messages.append(Message(role=MessageRole.ASSISTANT, content=result))
+            run_context.prompt.messages.append(Message(role=MessageRole.ASSISTANT, content=result))
 
             output_content = self.extract_tag_content("output", result)
             reflection_content = self.extract_tag_content("reflection", result)
@@ -2,7 +2,7 @@ import base64
 import io
 import json
 import re
-from typing import Any
+from typing import Any, Callable
 
 import filetype
 
@@ -230,3 +230,91 @@ def extract_thought_from_intermediate_steps(intermediate_steps):
                         return thought_match.group(1)
 
     return None
+
+
+class AnswerStreamParser:
+    """
+    Incremental parser that forwards the answer part of LLM output while it is streamed.
+
+    Text before the start marker and after the end marker is skipped. All text is the answer if there is
+    no start marker. Text that may be the beginning of a marker split across chunks is held back until
+    the next chunk.
+
+    Attributes:
+        on_answer (Callable[[str], None]): Called with each new part of the answer.
+        start_marker (str | None): Marker after which the answer starts.
+        end_marker (str | None): Marker at which the answer ends.
+        has_answer (bool): Whether any part of the answer was forwarded.
+    """
+
+    def __init__(
+        self,
+        on_answer: Callable[[str], None],
+        start_marker: str | None = None,
+        end_marker: str | None = None,
+    ):
+        self.on_answer = on_answer
+        self.start_marker = start_marker
+        self.end_marker = end_marker
+        self.has_answer = False
+        self._started = start_marker is None
+        self._finished = False
+        self._buffer = ""
+
+    def feed(self, text: str) -> None:
+        """
+        Processes the next chunk of LLM output.
+
+        Args:
+            text (str): Content of the chunk.
+        """
+        if self._finished:
+            return
+        self._buffer += text
+
+        if not self._started:
+            idx = self._buffer.find(self.start_marker)
+            if idx == -1:
+                held = self._get_held_length(self._buffer, self.start_marker)
+                self._buffer = self._buffer[len(self._buffer) - held :]
+                return
+            self._started = True
+            self._buffer = self._buffer[idx + len(self.start_marker) :]
+
+        if not self.end_marker:
+            self._emit(self._buffer)
+            self._buffer = ""
+            return
+
+        idx = self._buffer.find(self.end_marker)
+        if idx != -1:
+            self._emit(self._buffer[:idx].rstrip())
+            self._finished = True
+            self._buffer = ""
+            return
+
+        held = self._get_held_length(self._buffer, self.end_marker)
+        self._emit(self._buffer[: len(self._buffer) - held])
+        self._buffer = self._buffer[len(self._buffer) - held :]
+
+    def close(self) -> None:
+        """Forwards the text held back at the end of the answer."""
+        if self._started and not self._finished:
+            self._emit(self._buffer.rstrip())
+        self._finished = True
+        self._buffer = ""
+
+    def _emit(self, text: str) -> None:
+        if not self.has_answer:
+            text = text.lstrip()
+        if text:
+            self.has_answer = True
+            self.on_answer(text)
+
+    @staticmethod
+    def _get_held_length(text: str, marker: str) -> int:
+        """Returns the length of the longest text suffix that is a marker prefix."""
+        for length in range(min(len(marker) - 1, len(text)), 0, -1):
+            if text.endswith(marker[:length]):
+                return length
+        return 0
@@ -1,2 +1,11 @@
-from .elevenlabs import ElevenLabsSTS, ElevenLabsTTS, Voices
-from .whisper import WhisperSTT
+from dynamiq.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "ElevenLabsSTS": ".elevenlabs",
+    "ElevenLabsTTS": ".elevenlabs",
+    "Voices": ".elevenlabs",
+    "WhisperSTT": ".whisper",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,6 +1,14 @@
-from .csv import CSVConverter
-from .html import HTMLConverter
-from .llm_text_extractor import LLMImageConverter, LLMPDFConverter
-from .pptx import PPTXFileConverter
-from .pypdf import PyPDFConverter
-from .unstructured import UnstructuredFileConverter
+from dynamiq.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "CSVConverter": ".csv",
+    "HTMLConverter": ".html",
+    "LLMImageConverter": ".llm_text_extractor",
+    "LLMPDFConverter": ".llm_text_extractor",
+    "PPTXFileConverter": ".pptx",
+    "PyPDFConverter": ".pypdf",
+    "UnstructuredFileConverter": ".unstructured",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
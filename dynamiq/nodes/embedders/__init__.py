@@ -1,6 +1,19 @@
-from .bedrock import BedrockDocumentEmbedder, BedrockTextEmbedder
-from .cohere import CohereDocumentEmbedder, CohereTextEmbedder
-from .huggingface import HuggingFaceDocumentEmbedder, HuggingFaceTextEmbedder
-from .mistral import MistralDocumentEmbedder, MistralTextEmbedder
-from .openai import OpenAIDocumentEmbedder, OpenAITextEmbedder
-from .watsonx import WatsonXDocumentEmbedder, WatsonXTextEmbedder
+from dynamiq.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "BedrockDocumentEmbedder": ".bedrock",
+    "BedrockTextEmbedder": ".bedrock",
+    "CohereDocumentEmbedder": ".cohere",
+    "CohereTextEmbedder": ".cohere",
+    "HuggingFaceDocumentEmbedder": ".huggingface",
+    "HuggingFaceTextEmbedder": ".huggingface",
+    "MistralDocumentEmbedder": ".mistral",
+    "MistralTextEmbedder": ".mistral",
+    "OpenAIDocumentEmbedder": ".openai",
+    "OpenAITextEmbedder": ".openai",
+    "WatsonXDocumentEmbedder": ".watsonx",
+    "WatsonXTextEmbedder": ".watsonx",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
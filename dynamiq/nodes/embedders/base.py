@@ -2,6 +2,7 @@ from typing import ClassVar, Literal
 
 from pydantic import BaseModel, Field
 
+from dynamiq.cache.config import EmbeddingCacheConfig
 from dynamiq.components.embedders.base import BaseEmbedder
 from dynamiq.nodes.node import ConnectionNode, NodeGroup, ensure_config
 from dynamiq.runnables import RunnableConfig
@@ -14,14 +15,44 @@ class DocumentEmbedderInputSchema(BaseModel):
 
 
 class DocumentEmbedder(ConnectionNode):
+    """
+    Base class for nodes that compute embeddings for documents.
+
+    Attributes:
+        batch_size (int): The maximum number of documents embedded in a single request.
+        max_batch_tokens (int | None): The approximate maximum number of tokens in a single request.
+        max_concurrent_batches (int): The maximum number of requests sent at the same time.
+        max_retries (int): The number of retries of a request rejected by the provider rate limit.
+        retry_delay (float): The initial delay in seconds before retrying a rate limited request.
+        embedding_cache (EmbeddingCacheConfig | None): The cache of document embeddings. Only documents missing
+            in the cache are sent to the provider.
+    """
+
     group: Literal[NodeGroup.EMBEDDERS] = NodeGroup.EMBEDDERS
     document_embedder: BaseEmbedder | None = None
     input_schema: ClassVar[type[DocumentEmbedderInputSchema]] = DocumentEmbedderInputSchema
+    batch_size: int = Field(default=32, ge=1)
+    max_batch_tokens: int | None = Field(default=None, ge=1)
+    max_concurrent_batches: int = Field(default=4, ge=1)
+    max_retries: int = Field(default=3, ge=0)
+    retry_delay: float = Field(default=1.0, ge=0)
+    embedding_cache: EmbeddingCacheConfig | None = None
 
     @property
     def to_dict_exclude_params(self):
         return super().to_dict_exclude_params | {"document_embedder": True}
 
+    @property
+    def batching_params(self) -> dict:
+        """Parameters of batch embedding passed to the document embedder component."""
+        return {
+            "batch_size": self.batch_size,
+            "max_batch_tokens": self.max_batch_tokens,
+            "max_concurrent_batches": self.max_concurrent_batches,
+            "max_retries": self.max_retries,
+            "retry_delay": self.retry_delay,
+        }
+
     def execute(self, input_data: DocumentEmbedderInputSchema, config: RunnableConfig = None, **kwargs):
         """
         Executes the document embedding process.
@@ -44,15 +75,44 @@ class DocumentEmbedder(ConnectionNode):
 
         return output
 
+    async def execute_async(self, input_data: DocumentEmbedderInputSchema, config: RunnableConfig = None, **kwargs):
+        """
+        Executes the document embedding process asynchronously.
+
+        Args:
+            input_data (DocumentEmbedderInputSchema): An instance containing the documents to embed.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            The output from the document_embedder component, typically the computed embeddings.
+        """
+        config = ensure_config(config)
+        self.run_on_node_execute_run(config.callbacks, **kwargs)
+
+        output = await self.document_embedder.aembed_documents(input_data.documents)
+        logger.debug(f"{self.name} executed successfully.")
+
+        return output
+
 
 class TextEmbedderInputSchema(BaseModel):
     query: str = Field(..., description="Parameter to provide query to find embeddings for.")
 
 
 class TextEmbedder(ConnectionNode):
+    """
+    Base class for nodes that compute embeddings for queries.
+
+    Attributes:
+        embedding_cache (EmbeddingCacheConfig | None): The cache of query embeddings. Repeated queries are
+            not sent to the provider.
+    """
+
     group: Literal[NodeGroup.EMBEDDERS] = NodeGroup.EMBEDDERS
     text_embedder: BaseEmbedder | None = None
     input_schema: ClassVar[type[TextEmbedderInputSchema]] = TextEmbedderInputSchema
+    embedding_cache: EmbeddingCacheConfig | None = None
 
     @property
     def to_dict_exclude_params(self):
@@ -80,3 +140,24 @@ class TextEmbedder(ConnectionNode):
             "embedding": output["embedding"],
             "query": input_data.query,
         }
+
+    async def execute_async(self, input_data: TextEmbedderInputSchema, config: RunnableConfig = None, **kwargs):
+        """
+        Execute the text embedding process asynchronously.
+
+        Args:
+            input_data (TextEmbedderInputSchema): The input data containing the query to embed.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict: A dictionary containing the embedding and the original query.
+        """
+        config = ensure_config(config)
+        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        output = await self.text_embedder.aembed_text(input_data.query)
+        logger.debug(f"{self.name}: {output['meta']}")
+        return {
+            "embedding": output["embedding"],
+            "query": input_data.query,
+        }
@@ -55,7 +55,11 @@ class CohereDocumentEmbedder(DocumentEmbedder):
         super().init_components(connection_manager)
         if self.document_embedder is None:
             self.document_embedder = CohereEmbedderComponent(
-                connection=self.connection, model=self.model, client=self.client
+                connection=self.connection,
+                model=self.model,
+                client=self.client,
+                embedding_cache=self.embedding_cache,
+                **self.batching_params,
             )
 
 
@@ -112,5 +116,5 @@ class CohereTextEmbedder(TextEmbedder):
         super().init_components(connection_manager)
         if self.text_embedder is None:
             self.text_embedder = CohereEmbedderComponent(
-                connection=self.connection, model=self.model, client=self.client
+                connection=self.connection, model=self.model, client=self.client, embedding_cache=self.embedding_cache
             )
@@ -54,7 +54,11 @@ class HuggingFaceDocumentEmbedder(DocumentEmbedder):
         super().init_components(connection_manager)
         if self.document_embedder is None:
             self.document_embedder = HuggingFaceEmbedderComponent(
-                connection=self.connection, model=self.model, client=self.client
+                connection=self.connection,
+                model=self.model,
+                client=self.client,
+                embedding_cache=self.embedding_cache,
+                **self.batching_params,
             )
 
 
@@ -111,5 +115,5 @@ class HuggingFaceTextEmbedder(TextEmbedder):
         super().init_components(connection_manager)
         if self.text_embedder is None:
             self.text_embedder = HuggingFaceEmbedderComponent(
-                connection=self.connection, model=self.model, client=self.client
+                connection=self.connection, model=self.model, client=self.client, embedding_cache=self.embedding_cache
             )
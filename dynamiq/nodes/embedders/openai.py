@@ -64,6 +64,8 @@ class OpenAIDocumentEmbedder(DocumentEmbedder):
                 model=self.model,
                 dimensions=self.dimensions,
                 client=self.client,
+                embedding_cache=self.embedding_cache,
+                **self.batching_params,
             )
 
 
@@ -130,4 +132,5 @@ class OpenAITextEmbedder(TextEmbedder):
                 model=self.model,
                 dimensions=self.dimensions,
                 client=self.client,
+                embedding_cache=self.embedding_cache,
             )
@@ -55,7 +55,11 @@ class WatsonXDocumentEmbedder(DocumentEmbedder):
         super().init_components(connection_manager)
         if self.document_embedder is None:
             self.document_embedder = WatsonXEmbedderComponent(
-                connection=self.connection, model=self.model, client=self.client
+                connection=self.connection,
+                model=self.model,
+                client=self.client,
+                embedding_cache=self.embedding_cache,
+                **self.batching_params,
             )
 
 
@@ -115,5 +119,5 @@ class WatsonXTextEmbedder(TextEmbedder):
         super().init_components(connection_manager)
         if self.text_embedder is None:
             self.text_embedder = WatsonXEmbedderComponent(
-                connection=self.connection, model=self.model, client=self.client
+                connection=self.connection, model=self.model, client=self.client, embedding_cache=self.embedding_cache
             )
@@ -1,26 +1,33 @@
-from .ai21 import AI21
-from .anthropic import Anthropic
-from .anyscale import Anyscale
-from .azureai import AzureAI
-from .base import BaseLLM
-from .bedrock import Bedrock
-from .cerebras import Cerebras
-from .cohere import Cohere
-from .custom_llm import CustomLLM
-from .deepinfra import DeepInfra
-from .deepseek import DeepSeek
-from .fireworksai import FireworksAI
-from .gemini import Gemini
-from .groq import Groq
-from .huggingface import HuggingFace
-from .mistral import Mistral
-from .nvidia_nim import NvidiaNIM
-from .ollama import Ollama
-from .openai import OpenAI
-from .perplexity import Perplexity
-from .replicate import Replicate
-from .sambanova import SambaNova
-from .togetherai import TogetherAI
-from .vertexai import VertexAI
-from .watsonx import WatsonX
-from .xai import xAI
+from dynamiq.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "AI21": ".ai21",
+    "Anthropic": ".anthropic",
+    "Anyscale": ".anyscale",
+    "AzureAI": ".azureai",
+    "BaseLLM": ".base",
+    "Bedrock": ".bedrock",
+    "Cerebras": ".cerebras",
+    "Cohere": ".cohere",
+    "CustomLLM": ".custom_llm",
+    "DeepInfra": ".deepinfra",
+    "DeepSeek": ".deepseek",
+    "FireworksAI": ".fireworksai",
+    "Gemini": ".gemini",
+    "Groq": ".groq",
+    "HuggingFace": ".huggingface",
+    "Mistral": ".mistral",
+    "NvidiaNIM": ".nvidia_nim",
+    "Ollama": ".ollama",
+    "OpenAI": ".openai",
+    "Perplexity": ".perplexity",
+    "Replicate": ".replicate",
+    "SambaNova": ".sambanova",
+    "TogetherAI": ".togetherai",
+    "VertexAI": ".vertexai",
+    "WatsonX": ".watsonx",
+    "xAI": ".xai",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -53,6 +53,11 @@ class BaseLLMInputSchema(BaseModel):
         raise ValueError("Error: Unable to run llm. Prompt was not provided.")
 
 
+def _get_model_fields(model: BaseModel) -> dict[str, Any]:
+    # Attribute access of litellm response models is slow as most fields are stored as extra fields
+    return {**model.__dict__, **(model.__pydantic_extra__ or {})}
+
+
 class BaseLLM(ConnectionNode):
     """Base class for all LLM nodes.
 
@@ -103,6 +108,7 @@ class BaseLLM(ConnectionNode):
         None, description="Schema for structured output or function calling.", alias="schema"
     )
     _completion: Callable = PrivateAttr()
+    _acompletion: Callable = PrivateAttr()
     _stream_chunk_builder: Callable = PrivateAttr()
     input_schema: ClassVar[type[BaseLLMInputSchema]] = BaseLLMInputSchema
 
@@ -130,10 +136,11 @@ class BaseLLM(ConnectionNode):
         super().__init__(**kwargs)
 
         # Save a bit of loading time as litellm is slow
-        from litellm import completion, stream_chunk_builder
+        from litellm import acompletion, completion, stream_chunk_builder
 
         # Avoid the same imports multiple times and for future usage in execute
         self._completion = completion
+        self._acompletion = acompletion
         self._stream_chunk_builder = stream_chunk_builder
 
     def get_context_for_input_schema(self) -> dict:
@@ -208,15 +215,17 @@ class BaseLLM(ConnectionNode):
 
         Returns:
             dict: A dictionary containing the generated content and tool calls if present.
+                Tool calls are keyed by call id in the order returned by the LLM.
         """
         content = response.choices[0].message.content
         result = {"content": content}
         if tool_calls := response.choices[0].message.tool_calls:
             tool_calls_parsed = {}
-            for tc in tool_calls:
+            for idx, tc in enumerate(tool_calls):
                 call = tc.model_dump()
+                call["id"] = call.get("id") or f"call_{idx}"
                 call["function"]["arguments"] = json.loads(call["function"]["arguments"])
-                tool_calls_parsed[call["function"]["name"]] = call
+                tool_calls_parsed[call["id"]] = call
             result["tool_calls"] = tool_calls_parsed
 
         usage_data = self.get_usage_data(model=self.model, completion=response).model_dump()
@@ -224,11 +233,64 @@ class BaseLLM(ConnectionNode):
 
         return result
 
+    @staticmethod
+    def _get_stream_chunk_data(chunk: "ModelResponse") -> dict[str, Any]:
+        """Get the data of a streamed chunk for callbacks.
+
+        Only the chunk fields used by stream consumers are copied, which is several times faster than dumping
+        the whole chunk model. Usage, the system fingerprint and provider-specific fields are kept when set.
+        Other extra fields of provider responses are dropped.
+
+        Args:
+            chunk (ModelResponse): Streamed chunk.
+
+        Returns:
+            dict[str, Any]: Chunk data.
+        """
+        chunk_fields = _get_model_fields(chunk)
+        choices = []
+        for choice in chunk_fields.get("choices") or []:
+            choice_fields = _get_model_fields(choice)
+            delta = _get_model_fields(choice_fields["delta"])
+            function_call, tool_calls = delta.get("function_call"), delta.get("tool_calls")
+            delta_data = {
+                "content": delta.get("content"),
+                "role": delta.get("role"),
+                "function_call": function_call.model_dump() if function_call else None,
+                "tool_calls": [call.model_dump() for call in tool_calls] if tool_calls else None,
+            }
+            if reasoning_content := delta.get("reasoning_content"):
+                delta_data["reasoning_content"] = reasoning_content
+            if provider_fields := delta.get("provider_specific_fields"):
+                delta_data["provider_specific_fields"] = provider_fields
+            choices.append(
+                {
+                    "finish_reason": choice_fields.get("finish_reason"),
+                    "index": choice_fields.get("index"),
+                    "delta": delta_data,
+                }
+            )
+
+        chunk_data = {
+            "id": chunk_fields.get("id"),
+            "created": chunk_fields.get("created"),
+            "model": chunk_fields.get("model"),
+            "object": chunk_fields.get("object"),
+            "system_fingerprint": chunk_fields.get("system_fingerprint"),
+            "choices": choices,
+        }
+        if (usage := chunk_fields.get("usage")) is not None:
+            chunk_data["usage"] = usage.model_dump() if isinstance(usage, BaseModel) else usage
+        if provider_fields := chunk_fields.get("provider_specific_fields"):
+            chunk_data["provider_specific_fields"] = provider_fields
+        return chunk_data
+
     def _handle_streaming_completion_response(
         self,
         response: Union["ModelResponse", "CustomStreamWrapper"],
         messages: list[dict],
         config: RunnableConfig = None,
+        content_handler: Callable[[str], None] | None = None,
         **kwargs,
     ):
         """Handle streaming completion response.
@@ -237,6 +299,7 @@ class BaseLLM(ConnectionNode):
             response (ModelResponse | CustomStreamWrapper): The response from the LLM.
             messages (list[dict]): The messages used for the LLM.
             config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            content_handler (Callable[[str], None], optional): Called with each content delta. Defaults to None.
             **kwargs: Additional keyword arguments.
 
         Returns:
@@ -246,11 +309,50 @@ class BaseLLM(ConnectionNode):
         for chunk in response:
             chunks.append(chunk)
 
-            self.run_on_node_execute_stream(
-                config.callbacks,
-                chunk.model_dump(),
-                **kwargs,
-            )
+            if self.streaming.enabled:
+                self.run_on_node_execute_stream(
+                    config.callbacks,
+                    self._get_stream_chunk_data(chunk),
+                    **kwargs,
+                )
+            if content_handler and chunk.choices and (content := chunk.choices[0].delta.content):
+                content_handler(content)
+
+        full_response = self._stream_chunk_builder(chunks=chunks, messages=messages)
+        return self._handle_completion_response(response=full_response, config=config, **kwargs)
+
+    async def _handle_streaming_completion_response_async(
+        self,
+        response: "CustomStreamWrapper",
+        messages: list[dict],
+        config: RunnableConfig = None,
+        content_handler: Callable[[str], None] | None = None,
+        **kwargs,
+    ):
+        """Handle asynchronous streaming completion response.
+
+        Args:
+            response (CustomStreamWrapper): The async response stream from the LLM.
+            messages (list[dict]): The messages used for the LLM.
+            config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            content_handler (Callable[[str], None], optional): Called with each content delta. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict: A dictionary containing the generated content and tool calls.
+        """
+        chunks = []
+        async for chunk in response:
+            chunks.append(chunk)
+
+            if self.streaming.enabled:
+                self.run_on_node_execute_stream(
+                    config.callbacks,
+                    self._get_stream_chunk_data(chunk),
+                    **kwargs,
+                )
+            if content_handler and chunk.choices and (content := chunk.choices[0].delta.content):
+                content_handler(content)
 
         full_response = self._stream_chunk_builder(chunks=chunks, messages=messages)
         return self._handle_completion_response(response=full_response, config=config, **kwargs)
@@ -300,6 +402,8 @@ class BaseLLM(ConnectionNode):
         prompt: Prompt | None = None,
         schema: dict | None = None,
         inference_mode: InferenceMode | None = None,
+        stop: list[str] | None = None,
+        content_handler: Callable[[str], None] | None = None,
         **kwargs,
     ):
         """Execute the LLM node.
@@ -315,12 +419,130 @@ class BaseLLM(ConnectionNode):
                 Overrides instance schema_ if provided.
             inference_mode (InferenceMode, optional): Mode of inference.
                 Overrides instance inference_mode if provided.
+            stop (list[str], optional): Stop sequences. Overrides instance stop if provided.
+            content_handler (Callable[[str], None], optional): Called with each content delta as it arrives.
+                The completion is streamed if provided.
             **kwargs: Additional keyword arguments.
 
         Returns:
             dict: A dictionary containing the generated content and tool calls.
         """
         config = ensure_config(config)
+        messages, common_params = self._get_completion_params(
+            input_data,
+            config,
+            prompt=prompt,
+            schema=schema,
+            inference_mode=inference_mode,
+            stop=stop,
+            stream=content_handler is not None,
+            **kwargs,
+        )
+
+        response = self._completion(**common_params)
+
+        if common_params["stream"]:
+            return self._handle_streaming_completion_response(
+                response=response,
+                messages=messages,
+                config=config,
+                content_handler=content_handler,
+                input_data=dict(input_data),
+                **kwargs,
+            )
+
+        return self._handle_completion_response(
+            response=response, messages=messages, config=config, input_data=dict(input_data), **kwargs
+        )
+
+    async def execute_async(
+        self,
+        input_data: BaseLLMInputSchema,
+        config: RunnableConfig = None,
+        prompt: Prompt | None = None,
+        schema: dict | None = None,
+        inference_mode: InferenceMode | None = None,
+        stop: list[str] | None = None,
+        content_handler: Callable[[str], None] | None = None,
+        **kwargs,
+    ):
+        """Execute the LLM node asynchronously using the native litellm async completion.
+
+        Initialized synchronous clients can not be awaited, so connection parameters are used instead.
+
+        Args:
+            input_data (BaseLLMInputSchema): The input data for the LLM.
+            config (RunnableConfig, optional): The configuration for the execution. Defaults to None.
+            prompt (Prompt, optional): The prompt to use for this execution. Defaults to None.
+            schema (Dict[str, Any], optional): schema_ for structured output or function calling.
+                Overrides instance schema_ if provided.
+            inference_mode (InferenceMode, optional): Mode of inference.
+                Overrides instance inference_mode if provided.
+            stop (list[str], optional): Stop sequences. Overrides instance stop if provided.
+            content_handler (Callable[[str], None], optional): Called with each content delta as it arrives.
+                The completion is streamed if provided.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict: A dictionary containing the generated content and tool calls.
+        """
+        config = ensure_config(config)
+        messages, common_params = self._get_completion_params(
+            input_data,
+            config,
+            prompt=prompt,
+            schema=schema,
+            inference_mode=inference_mode,
+            stop=stop,
+            stream=content_handler is not None,
+            use_client=False,
+            **kwargs,
+        )
+
+        response = await self._acompletion(**common_params)
+
+        if common_params["stream"]:
+            return await self._handle_streaming_completion_response_async(
+                response=response,
+                messages=messages,
+                config=config,
+                content_handler=content_handler,
+                input_data=dict(input_data),
+                **kwargs,
+            )
+
+        return self._handle_completion_response(
+            response=response, messages=messages, config=config, input_data=dict(input_data), **kwargs
+        )
+
+    def _get_completion_params(
+        self,
+        input_data: BaseLLMInputSchema,
+        config: RunnableConfig,
+        prompt: Prompt | None = None,
+        schema: dict | None = None,
+        inference_mode: InferenceMode | None = None,
+        stop: list[str] | None = None,
+        stream: bool = False,
+        use_client: bool = True,
+        **kwargs,
+    ) -> tuple[list[dict], dict[str, Any]]:
+        """Format the prompt and build the completion parameters.
+
+        Args:
+            input_data (BaseLLMInputSchema): The input data for the LLM.
+            config (RunnableConfig): The configuration for the execution.
+            prompt (Prompt, optional): The prompt to use for this execution. Defaults to None.
+            schema (Dict[str, Any], optional): schema_ for structured output or function calling.
+            inference_mode (InferenceMode, optional): Mode of inference.
+            stop (list[str], optional): Stop sequences. Overrides instance stop if provided.
+            stream (bool): Whether to stream the completion even if node streaming is disabled. Defaults to False.
+            use_client (bool): Whether to pass the initialized client to the completion. Defaults to True.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            tuple[list[dict], dict[str, Any]]: Formatted messages and completion parameters.
+        """
         prompt = prompt or self.prompt or Prompt(messages=[], tools=None)
         messages = self.get_messages(prompt, input_data)
         base_tools = prompt.format_tools(**dict(input_data))
@@ -328,7 +550,7 @@ class BaseLLM(ConnectionNode):
 
         # Use initialized client if it possible
         params = self.connection.conn_params.copy()
-        if self.client and not isinstance(self.connection, HttpApiKey):
+        if use_client and self.client and not isinstance(self.connection, HttpApiKey):
             params.update({"client": self.client})
         if self.thinking_enabled:
             params.update({"thinking": {"type": "enabled", "budget_tokens": self.budget_tokens}})
@@ -339,16 +561,17 @@ class BaseLLM(ConnectionNode):
             inference_mode=current_inference_mode, schema=current_schema
         )
         tools = tools or base_tools
+        current_stop = self.stop if stop is None else stop
 
         common_params: dict[str, Any] = {
             "model": self.model,
             "messages": messages,
-            "stream": self.streaming.enabled,
+            "stream": self.streaming.enabled or stream,
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
             "tools": tools,
             "tool_choice": self.tool_choice,
-            "stop": self.stop if self.stop else None,
+            "stop": current_stop if current_stop else None,
             "top_p": self.top_p,
             "seed": self.seed,
             "presence_penalty": self.presence_penalty,
@@ -358,14 +581,4 @@ class BaseLLM(ConnectionNode):
             **params,
         }
 
-        common_params = self.update_completion_params(common_params)
-
-        response = self._completion(**common_params)
-
-        handle_completion = (
-            self._handle_streaming_completion_response if self.streaming.enabled else self._handle_completion_response
-        )
-
-        return handle_completion(
-            response=response, messages=messages, config=config, input_data=dict(input_data), **kwargs
-        )
+        return messages, self.update_completion_params(common_params)
@@ -2,7 +2,7 @@ import asyncio
 import inspect
 import time
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from concurrent.futures import TimeoutError
 from datetime import datetime
 from functools import cached_property
 from queue import Empty
@@ -12,10 +12,12 @@ from uuid import uuid4
 from jinja2 import Template
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, model_validator
 
+from dynamiq.cache.config import CacheConfig, InMemoryCacheConfig, LocalCacheConfig
 from dynamiq.cache.utils import cache_wf_entity
-from dynamiq.callbacks import BaseCallbackHandler, NodeCallbackHandler
-from dynamiq.connections import BaseConnection
-from dynamiq.connections.managers import ConnectionManager
+from dynamiq.callbacks import BaseCallbackHandler, NodeCallbackEvent, NodeCallbackHandler
+from dynamiq.connections import BaseConnection, BasePooledConnection
+from dynamiq.connections.managers import ConnectionClientInitType, ConnectionManager
+from dynamiq.executors.registry import ExecutorPoolRegistry
 from dynamiq.nodes.exceptions import (
     NodeConditionFailedException,
     NodeConditionSkippedException,
@@ -101,8 +103,11 @@ class CachingConfig(BaseModel):
 
     Attributes:
         enabled (bool): Whether caching is enabled for the node.
+        local_cache (LocalCacheConfig | None): In-process cache for node outputs. Used as a first level
+            in front of the run cache backend, or on its own if the run has no cache configured.
     """
     enabled: bool = False
+    local_cache: LocalCacheConfig | None = None
 
 
 class NodeReadyToRun(BaseModel):
@@ -202,6 +207,9 @@ class Node(BaseModel, Runnable, ABC):
         is_postponed_component_init (bool): Whether component initialization is postponed.
         is_optimized_for_agents (bool): Whether to optimize output for agents. By default is set to False.
         supports_files (bool): Whether the node has access to files. By default is set to False.
+
+    Callbacks get the node serialized once per run. Assigned fields are picked up by the next event, in-place
+    changes of field values only by the next run.
     """
     id: str = Field(default_factory=generate_uuid)
     name: str | None = None
@@ -223,6 +231,7 @@ class Node(BaseModel, Runnable, ABC):
     is_files_allowed: bool = False
 
     _output_references: NodeOutputReferences = PrivateAttr()
+    _callbacks_snapshot: tuple[Any, dict] | None = PrivateAttr(default=None)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
     input_schema: ClassVar[type[BaseModel] | None] = None
@@ -235,6 +244,12 @@ class Node(BaseModel, Runnable, ABC):
 
         self._output_references = NodeOutputReferences(node=self)
 
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        # Changed fields invalidate the serialized node passed to callbacks
+        if name in self.model_fields and (private := getattr(self, "__pydantic_private__", None)) is not None:
+            private["_callbacks_snapshot"] = None
+
     @computed_field
     @cached_property
     def type(self) -> str:
@@ -622,8 +637,6 @@ class Node(BaseModel, Runnable, ABC):
         Returns:
             RunnableResult: Result of the node execution.
         """
-        from dynamiq.nodes.agents.exceptions import RecoverableAgentException
-
         logger.info(f"Node {self.name} - {self.id}: execution started.")
         transformed_input = input_data
         time_start = datetime.now()
@@ -640,58 +653,23 @@ class Node(BaseModel, Runnable, ABC):
                 self.validate_depends(depends_result)
                 input_data = self.get_approved_data_or_origin(input_data, config=config, **merged_kwargs)
             except NodeException as e:
-                transformed_input = input_data | {
-                    k: result.to_tracing_depend_dict() for k, result in depends_result.items()
-                }
-                skip_data = {"failed_dependency": e.failed_depend.to_dict()}
-                self.run_on_node_skip(
-                    callbacks=config.callbacks,
-                    skip_data=skip_data,
-                    input_data=transformed_input,
-                    **merged_kwargs,
-                )
-                logger.info(f"Node {self.name} - {self.id}: execution skipped.")
-                return RunnableResult(
-                    status=RunnableStatus.SKIP,
-                    input=transformed_input,
-                    output=format_value(e, recoverable=e.recoverable)[0],
-                )
+                return self._get_skip_result(e, input_data, depends_result, config, **merged_kwargs)
 
             transformed_input = self.transform_input(input_data=input_data, depends_result=depends_result, **kwargs)
             self.run_on_node_start(config.callbacks, transformed_input, **merged_kwargs)
             cache = cache_wf_entity(
                 entity_id=self.id,
                 cache_enabled=self.caching.enabled,
-                cache_config=config.cache,
+                cache_config=self.get_cache_config(config),
             )
 
             output, from_cache = cache(self.execute_with_retry)(
                 self.validate_input_schema(transformed_input, **kwargs), config, **merged_kwargs
             )
 
-            merged_kwargs["is_output_from_cache"] = from_cache
-            transformed_output = self.transform_output(output)
-
-            self.run_on_node_end(config.callbacks, transformed_output, **merged_kwargs)
-
-            logger.info(
-                f"Node {self.name} - {self.id}: execution succeeded in "
-                f"{format_duration(time_start, datetime.now())}."
-            )
-            return RunnableResult(status=RunnableStatus.SUCCESS, input=transformed_input, output=transformed_output)
+            return self._get_success_result(output, from_cache, transformed_input, time_start, config, **merged_kwargs)
         except Exception as e:
-            self.run_on_node_error(callbacks=config.callbacks, error=e, input_data=transformed_input, **merged_kwargs)
-            logger.error(
-                f"Node {self.name} - {self.id}: execution failed in {e}"
-                f"{format_duration(time_start, datetime.now())}."
-            )
-
-            recoverable = isinstance(e, RecoverableAgentException)
-            return RunnableResult(
-                status=RunnableStatus.FAILURE,
-                input=input_data,
-                output=format_value(e, recoverable=recoverable)[0],
-            )
+            return self._get_failure_result(e, input_data, transformed_input, time_start, config, **merged_kwargs)
 
     async def run_async(
         self,
@@ -702,7 +680,9 @@ class Node(BaseModel, Runnable, ABC):
     ) -> RunnableResult:
         """
         Run the node asynchronously with given input data and configuration.
-        This runs the synchronous implementation in a thread pool to avoid blocking the event loop.
+
+        Nodes with a native `execute_async` implementation run on the event loop. Other nodes run the
+        synchronous implementation in a thread pool to avoid blocking the event loop.
 
         Args:
             input_data (Any): Input data for the node.
@@ -713,8 +693,154 @@ class Node(BaseModel, Runnable, ABC):
         Returns:
             RunnableResult: Result of the node execution.
         """
-        return await asyncio.to_thread(
-            self.run_sync, input_data=input_data, config=config, depends_result=depends_result, **kwargs
+        if not self.is_execute_async_native:
+            return await asyncio.to_thread(
+                self.run_sync, input_data=input_data, config=config, depends_result=depends_result, **kwargs
+            )
+
+        logger.info(f"Node {self.name} - {self.id}: execution started.")
+        transformed_input = input_data
+        time_start = datetime.now()
+
+        config = ensure_config(config)
+
+        run_id = uuid4()
+        merged_kwargs = merge(kwargs, {"run_id": run_id, "parent_run_id": kwargs.get("parent_run_id", run_id)})
+        if depends_result is None:
+            depends_result = {}
+
+        try:
+            try:
+                self.validate_depends(depends_result)
+                if self.approval.enabled:
+                    input_data = await asyncio.to_thread(
+                        self.get_approved_data_or_origin, input_data, config=config, **merged_kwargs
+                    )
+            except NodeException as e:
+                return self._get_skip_result(e, input_data, depends_result, config, **merged_kwargs)
+
+            transformed_input = self.transform_input(input_data=input_data, depends_result=depends_result, **kwargs)
+            self.run_on_node_start(config.callbacks, transformed_input, **merged_kwargs)
+            cache = cache_wf_entity(
+                entity_id=self.id,
+                cache_enabled=self.caching.enabled,
+                cache_config=self.get_cache_config(config),
+            )
+
+            output, from_cache = await cache(self.execute_with_retry_async)(
+                self.validate_input_schema(transformed_input, **kwargs), config, **merged_kwargs
+            )
+
+            return self._get_success_result(output, from_cache, transformed_input, time_start, config, **merged_kwargs)
+        except Exception as e:
+            return self._get_failure_result(e, input_data, transformed_input, time_start, config, **merged_kwargs)
+
+    def _get_skip_result(
+        self,
+        error: NodeException,
+        input_data: Any,
+        depends_result: dict[str, RunnableResult],
+        config: RunnableConfig,
+        **kwargs,
+    ) -> RunnableResult:
+        """
+        Run skip callbacks and build the result of a skipped node run.
+
+        Args:
+            error (NodeException): Reason of the skip.
+            input_data (Any): Input data for the node.
+            depends_result (dict[str, RunnableResult]): Results of dependent nodes.
+            config (RunnableConfig): Configuration for the run.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result with the skip status.
+        """
+        transformed_input = input_data | {k: result.to_tracing_depend_dict() for k, result in depends_result.items()}
+        skip_data = {"failed_dependency": error.failed_depend.to_dict()}
+        self.run_on_node_skip(
+            callbacks=config.callbacks,
+            skip_data=skip_data,
+            input_data=transformed_input,
+            **kwargs,
+        )
+        logger.info(f"Node {self.name} - {self.id}: execution skipped.")
+        return RunnableResult(
+            status=RunnableStatus.SKIP,
+            input=transformed_input,
+            output=format_value(error, recoverable=error.recoverable)[0],
+        )
+
+    def _get_success_result(
+        self,
+        output: Any,
+        from_cache: bool,
+        transformed_input: Any,
+        time_start: datetime,
+        config: RunnableConfig,
+        **kwargs,
+    ) -> RunnableResult:
+        """
+        Transform the node output, run end callbacks and build the result of a successful node run.
+
+        Args:
+            output (Any): Output of the node execution.
+            from_cache (bool): Whether the output was taken from cache.
+            transformed_input (Any): Transformed input data of the node.
+            time_start (datetime): Start time of the run.
+            config (RunnableConfig): Configuration for the run.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result with the success status.
+        """
+        kwargs["is_output_from_cache"] = from_cache
+        transformed_output = self.transform_output(output)
+
+        self.run_on_node_end(config.callbacks, transformed_output, **kwargs)
+
+        logger.info(
+            f"Node {self.name} - {self.id}: execution succeeded in "
+            f"{format_duration(time_start, datetime.now())}."
+        )
+        return RunnableResult(status=RunnableStatus.SUCCESS, input=transformed_input, output=transformed_output)
+
+    def _get_failure_result(
+        self,
+        error: Exception,
+        input_data: Any,
+        transformed_input: Any,
+        time_start: datetime,
+        config: RunnableConfig,
+        **kwargs,
+    ) -> RunnableResult:
+        """
+        Run error callbacks and build the result of a failed node run.
+
+        Args:
+            error (Exception): The error that occurred.
+            input_data (Any): Input data for the node.
+            transformed_input (Any): Transformed input data of the node.
+            time_start (datetime): Start time of the run.
+            config (RunnableConfig): Configuration for the run.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            RunnableResult: Result with the failure status.
+        """
+        from dynamiq.nodes.agents.exceptions import RecoverableAgentException
+
+        self.run_on_node_error(callbacks=config.callbacks, error=error, input_data=transformed_input, **kwargs)
+        logger.error(
+            f"Node {self.name} - {self.id}: execution failed in {error}"
+            f"{format_duration(time_start, datetime.now())}."
+        )
+
+        recoverable = isinstance(error, RecoverableAgentException)
+        return RunnableResult(
+            status=RunnableStatus.FAILURE,
+            input=input_data,
+            output=format_value(error, recoverable=recoverable)[0],
         )
 
     def execute_with_retry(self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs):
@@ -775,6 +901,62 @@ class Node(BaseModel, Runnable, ABC):
         )
         raise error
 
+    async def execute_with_retry_async(
+        self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs
+    ):
+        """
+        Execute the node asynchronously with retry logic.
+
+        Args:
+            input_data (dict[str, Any]): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Any: Result of the node execution.
+
+        Raises:
+            Exception: If all retry attempts fail.
+        """
+        config = ensure_config(config)
+
+        error = None
+        n_attempt = self.error_handling.max_retries + 1
+        for attempt in range(n_attempt):
+            merged_kwargs = merge(kwargs, {"execution_run_id": uuid4()})
+
+            self.run_on_node_execute_start(config.callbacks, input_data, **merged_kwargs)
+
+            try:
+                output = await self.execute_with_timeout_async(
+                    self.error_handling.timeout_seconds,
+                    input_data,
+                    config,
+                    **merged_kwargs,
+                )
+
+                self.run_on_node_execute_end(config.callbacks, output, **merged_kwargs)
+                return output
+            except (TimeoutError, asyncio.TimeoutError) as e:
+                error = e
+                self.run_on_node_execute_error(config.callbacks, error, **merged_kwargs)
+                logger.warning(f"Node {self.name} - {self.id}: timeout.")
+            except Exception as e:
+                error = e
+                self.run_on_node_execute_error(config.callbacks, error, **merged_kwargs)
+                logger.error(f"Node {self.name} - {self.id}: execution error: {e}")
+
+            # do not sleep after the last attempt
+            if attempt < n_attempt - 1:
+                time_to_sleep = self.error_handling.retry_interval_seconds * (
+                    self.error_handling.backoff_rate**attempt
+                )
+                logger.info(f"Node {self.name} - {self.id}: retrying in {time_to_sleep} seconds.")
+                await asyncio.sleep(time_to_sleep)
+
+        logger.error(f"Node {self.name} - {self.id}: execution failed after {n_attempt} attempts.")
+        raise error
+
     def execute_with_timeout(
         self,
         timeout: float | None,
@@ -785,6 +967,11 @@ class Node(BaseModel, Runnable, ABC):
         """
         Execute the node with a timeout.
 
+        Without a timeout the node is executed in the calling thread. Otherwise it is executed
+        on the process-wide timeout pool, so no thread pool is created per call. Nodes executed
+        by nodes with timeouts, e.g. tools of agents, get their own threads, so they never wait
+        for the pool workers held by their parents.
+
         Args:
             timeout (float | None): Timeout duration in seconds.
             input_data (dict[str, Any]): Input data for the node.
@@ -797,20 +984,66 @@ class Node(BaseModel, Runnable, ABC):
         Raises:
             Exception: If execution fails or times out.
         """
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(self.execute, input_data, config=config, **kwargs)
+        if timeout is None:
+            return self.execute(input_data, config=config, **kwargs)
 
-            try:
-                result = future.result(timeout=timeout)
-            except Exception as e:
-                raise e
+        config = ensure_config(config)
+        executor = ExecutorPoolRegistry.get_timeout_pool(max_workers=config.executor_pool.timeout_max_workers)
+        is_nested = executor.is_current_thread_worker()
+        submit = executor.submit_outside if is_nested else executor.submit
+        future = submit(self.execute, input_data, config=config, **kwargs)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            if not is_nested:
+                executor.abandon(future)
+            raise
 
-            return result
+    async def execute_with_timeout_async(
+        self,
+        timeout: float | None,
+        input_data: dict[str, Any] | BaseModel,
+        config: RunnableConfig = None,
+        **kwargs,
+    ):
+        """
+        Execute the node asynchronously with a timeout.
+
+        Args:
+            timeout (float | None): Timeout duration in seconds.
+            input_data (dict[str, Any]): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the runnable.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Any: Result of the execution.
+
+        Raises:
+            Exception: If execution fails or times out.
+        """
+        return await asyncio.wait_for(self.execute_async(input_data, config=config, **kwargs), timeout=timeout)
 
     def get_context_for_input_schema(self) -> dict:
         """Provides context for input schema that is required for proper validation."""
         return {}
 
+    def get_cache_config(self, config: RunnableConfig) -> CacheConfig | None:
+        """
+        Get the cache configuration for the node run, applying the node local cache settings.
+
+        Args:
+            config (RunnableConfig): Configuration for the runnable.
+
+        Returns:
+            CacheConfig | None: Effective cache configuration.
+        """
+        local_cache = self.caching.local_cache
+        if local_cache is None:
+            return config.cache
+        if config.cache is None:
+            return InMemoryCacheConfig(**local_cache.model_dump())
+        return config.cache.model_copy(update={"local_cache": local_cache})
+
     def get_input_streaming_event(
         self,
         event_msg_type: "type[StreamingEventMessage]" = StreamingEventMessage,
@@ -849,6 +1082,59 @@ class Node(BaseModel, Runnable, ABC):
 
         raise ValueError("Input streaming is not enabled.")
 
+    def get_callbacks_snapshot(self, run_id: Any = None) -> dict:
+        """
+        Get the serialized node passed to callbacks.
+
+        The node is serialized once per run and reused by all events of the run until one of its fields
+        is assigned. The snapshot is rebuilt when the run starts. In-place changes of field values during a run,
+        e.g. `node.prompt.messages.append(...)`, are not detected, and later events of the run get the node as
+        it was when the run started. Handlers must treat the snapshot as read-only.
+
+        Args:
+            run_id (Any, optional): ID of the run. Snapshots are not reused if not provided.
+
+        Returns:
+            dict: Serialized node.
+        """
+        snapshot = self._callbacks_snapshot
+        if run_id is not None and snapshot is not None and snapshot[0] == run_id:
+            return snapshot[1]
+
+        serialized = self.to_dict()
+        if run_id is not None:
+            self._callbacks_snapshot = (run_id, serialized)
+        return serialized
+
+    def _run_callbacks(
+        self, event: NodeCallbackEvent, callbacks: list[BaseCallbackHandler], *args: Any, **kwargs
+    ) -> None:
+        """
+        Dispatch a node event to the callback handlers that need it.
+
+        The node is serialized only if at least one handler receives the event.
+
+        Args:
+            event (NodeCallbackEvent): Node callback event.
+            callbacks (list[BaseCallbackHandler]): List of callback handlers.
+            *args: Event arguments passed after the serialized node.
+            **kwargs: Additional keyword arguments.
+        """
+        handlers = [
+            callback
+            for callback in callbacks + self.callbacks
+            if not hasattr(callback, "handles_event") or callback.handles_event(event)
+        ]
+        if not handlers:
+            return
+
+        serialized = self.get_callbacks_snapshot(kwargs.get("run_id"))
+        for callback in handlers:
+            try:
+                getattr(callback, event.value)(serialized, *args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
+
     def run_on_node_start(
         self,
         callbacks: list[BaseCallbackHandler],
@@ -863,12 +1149,8 @@ class Node(BaseModel, Runnable, ABC):
             input_data (dict[str, Any]): Input data for the node.
             **kwargs: Additional keyword arguments.
         """
-
-        for callback in callbacks + self.callbacks:
-            try:
-                callback.on_node_start(self.to_dict(), input_data, **kwargs)
-            except Exception as e:
-                logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
+        self._callbacks_snapshot = None
+        self._run_callbacks(NodeCallbackEvent.NODE_START, callbacks, input_data, **kwargs)
 
     def run_on_node_end(
         self,
@@ -884,11 +1166,7 @@ class Node(BaseModel, Runnable, ABC):
             output_data (dict[str, Any]): Output data from the node.
             **kwargs: Additional keyword arguments.
         """
-        for callback in callbacks + self.callbacks:
-            try:
-                callback.on_node_end(self.model_dump(), output_data, **kwargs)
-            except Exception as e:
-                logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
+        self._run_callbacks(NodeCallbackEvent.NODE_END, callbacks, output_data, **kwargs)
 
     def run_on_node_error(
         self,
@@ -904,11 +1182,7 @@ class Node(BaseModel, Runnable, ABC):
             error (BaseException): The error that occurred.
             **kwargs: Additional keyword arguments.
         """
-        for callback in callbacks + self.callbacks:
-            try:
-                callback.on_node_error(self.to_dict(), error, **kwargs)
-            except Exception as e:
-                logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
+        self._run_callbacks(NodeCallbackEvent.NODE_ERROR, callbacks, error, **kwargs)
 
     def run_on_node_skip(
         self,
@@ -926,11 +1200,7 @@ class Node(BaseModel, Runnable, ABC):
             input_data (dict[str, Any]): Input data for the node.
             **kwargs: Additional keyword arguments.
         """
-        for callback in callbacks + self.callbacks:
-            try:
-                callback.on_node_skip(self.to_dict(), skip_data, input_data, **kwargs)
-            except Exception as e:
-                logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
+        self._run_callbacks(NodeCallbackEvent.NODE_SKIP, callbacks, skip_data, input_data, **kwargs)
 
     def run_on_node_execute_start(
         self,
@@ -949,11 +1219,7 @@ class Node(BaseModel, Runnable, ABC):
         if isinstance(input_data, BaseModel):
             input_data = dict(input_data)
 
-        for callback in callbacks + self.callbacks:
-            try:
-                callback.on_node_execute_start(self.to_dict(), input_data, **kwargs)
-            except Exception as e:
-                logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
+        self._run_callbacks(NodeCallbackEvent.NODE_EXECUTE_START, callbacks, input_data, **kwargs)
 
     def run_on_node_execute_end(
         self,
@@ -969,11 +1235,7 @@ class Node(BaseModel, Runnable, ABC):
             output_data (dict[str, Any]): Output data from the node.
             **kwargs: Additional keyword arguments.
         """
-        for callback in callbacks + self.callbacks:
-            try:
-                callback.on_node_execute_end(self.to_dict(), output_data, **kwargs)
-            except Exception as e:
-                logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
+        self._run_callbacks(NodeCallbackEvent.NODE_EXECUTE_END, callbacks, output_data, **kwargs)
 
     def run_on_node_execute_error(
         self,
@@ -989,11 +1251,7 @@ class Node(BaseModel, Runnable, ABC):
             error (BaseException): The error that occurred.
             **kwargs: Additional keyword arguments.
         """
-        for callback in callbacks + self.callbacks:
-            try:
-                callback.on_node_execute_error(self.model_dump(), error, **kwargs)
-            except Exception as e:
-                logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
+        self._run_callbacks(NodeCallbackEvent.NODE_EXECUTE_ERROR, callbacks, error, **kwargs)
 
     def run_on_node_execute_run(
         self,
@@ -1007,11 +1265,7 @@ class Node(BaseModel, Runnable, ABC):
             callbacks (list[BaseCallbackHandler]): List of callback handlers.
             **kwargs: Additional keyword arguments.
         """
-        for callback in callbacks + self.callbacks:
-            try:
-                callback.on_node_execute_run(self.to_dict(), **kwargs)
-            except Exception as e:
-                logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
+        self._run_callbacks(NodeCallbackEvent.NODE_EXECUTE_RUN, callbacks, **kwargs)
 
     def run_on_node_execute_stream(
         self,
@@ -1027,11 +1281,7 @@ class Node(BaseModel, Runnable, ABC):
             chunk (dict[str, Any]): Chunk of streaming data.
             **kwargs: Additional keyword arguments.
         """
-        for callback in callbacks + self.callbacks:
-            try:
-                callback.on_node_execute_stream(self.to_dict(), chunk, **kwargs)
-            except Exception as e:
-                logger.error(f"Error running callback {callback.__class__.__name__}: {e}")
+        self._run_callbacks(NodeCallbackEvent.NODE_EXECUTE_STREAM, callbacks, chunk, **kwargs)
 
     @abstractmethod
     def execute(self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs) -> Any:
@@ -1047,6 +1297,38 @@ class Node(BaseModel, Runnable, ABC):
         """
         pass
 
+    async def execute_async(
+        self, input_data: dict[str, Any] | BaseModel, config: RunnableConfig = None, **kwargs
+    ) -> Any:
+        """
+        Execute the node asynchronously with the given input.
+
+        Runs `execute` in a worker thread by default. I/O bound nodes override it with a native
+        implementation, which makes `run_async` execute them on the event loop.
+
+        Args:
+            input_data (dict[str, Any]): Input data for the node.
+            config (RunnableConfig, optional): Configuration for the runnable.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Any: Result of the execution.
+        """
+        return await asyncio.to_thread(self.execute, input_data, config, **kwargs)
+
+    @property
+    def is_execute_async_native(self) -> bool:
+        """
+        Whether the node has a native `execute_async` implementation.
+
+        Subclasses that override only `execute` fall back to running it in a thread, so the native
+        implementation of a parent class can not bypass their custom logic.
+        """
+        mro = type(self).__mro__
+        execute_owner = next(cls for cls in mro if "execute" in cls.__dict__)
+        execute_async_owner = next(cls for cls in mro if "execute_async" in cls.__dict__)
+        return execute_async_owner is not Node and issubclass(execute_async_owner, execute_owner)
+
     def depends_on(self, nodes: Union["Node", list["Node"]]):
         """
         Add dependencies for this node. Accepts either a single node or a list of nodes.
@@ -1188,10 +1470,13 @@ class ConnectionNode(Node, ABC):
     Attributes:
         connection (BaseConnection | None): The connection to use.
         client (Any | None): The client instance.
+        supports_connection_pool (ClassVar[bool]): Whether the node can use a pool of connections as the
+            client. Pooled connections get a pool if their `pool_enabled` is set.
     """
 
     connection: BaseConnection | None = None
     client: Any | None = None
+    supports_connection_pool: ClassVar[bool] = False
 
     @model_validator(mode="after")
     def validate_connection_client(self):
@@ -1211,9 +1496,20 @@ class ConnectionNode(Node, ABC):
         super().init_components(connection_manager)
         if self.client is None:
             self.client = connection_manager.get_connection_client(
-                connection=self.connection
+                connection=self.connection, init_type=self.connection_init_type
             )
 
+    @property
+    def connection_init_type(self) -> ConnectionClientInitType:
+        """Initialization type of the client for the node connection."""
+        if (
+            self.supports_connection_pool
+            and isinstance(self.connection, BasePooledConnection)
+            and self.connection.pool_enabled
+        ):
+            return ConnectionClientInitType.POOL
+        return ConnectionClientInitType.DEFAULT
+
 
 class VectorStoreNode(ConnectionNode, BaseVectorStoreParams, ABC):
     vector_store: Any | None = None
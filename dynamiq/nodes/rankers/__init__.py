@@ -1,3 +1,10 @@
-from .cohere import CohereReranker
-from .llm import LLMDocumentRanker
-from .recency import TimeWeightedDocumentRanker
+from dynamiq.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "CohereReranker": ".cohere",
+    "LLMDocumentRanker": ".llm",
+    "TimeWeightedDocumentRanker": ".recency",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,8 +1,15 @@
-from .chroma import ChromaDocumentRetriever
-from .elasticsearch import ElasticsearchDocumentRetriever
-from .milvus import MilvusDocumentRetriever
-from .pgvector import PGVectorDocumentRetriever
-from .pinecone import PineconeDocumentRetriever
-from .qdrant import QdrantDocumentRetriever
-from .retriever import VectorStoreRetriever
-from .weaviate import WeaviateDocumentRetriever
+from dynamiq.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "ChromaDocumentRetriever": ".chroma",
+    "ElasticsearchDocumentRetriever": ".elasticsearch",
+    "MilvusDocumentRetriever": ".milvus",
+    "PGVectorDocumentRetriever": ".pgvector",
+    "PineconeDocumentRetriever": ".pinecone",
+    "QdrantDocumentRetriever": ".qdrant",
+    "VectorStoreRetriever": ".retriever",
+    "WeaviateDocumentRetriever": ".weaviate",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, ClassVar
 
 from dynamiq.components.retrievers.pgvector import PGVectorDocumentRetriever as PGVectorDocumentRetrieverComponent
 from dynamiq.connections import PostgreSQL
@@ -34,6 +34,7 @@ class PGVectorDocumentRetriever(Retriever, PGVectorStoreRetrieverParams):
     connection: PostgreSQL | None = None
     vector_store: PGVectorStore | None = None
     document_retriever: PGVectorDocumentRetrieverComponent | None = None
+    supports_connection_pool: ClassVar[bool] = True
 
     def __init__(self, **kwargs):
         """
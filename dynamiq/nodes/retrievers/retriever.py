@@ -182,3 +182,66 @@ class VectorStoreRetriever(Node):
                 f"Error: {str(e)}. Please analyze the error and take appropriate action.",
                 recoverable=True,
             )
+
+    async def execute_async(
+        self, input_data: VectorStoreRetrieverInputSchema, config: RunnableConfig | None = None, **kwargs
+    ) -> dict[str, Any]:
+        """Execute the retrieval tool asynchronously.
+
+        The query embedding runs on the event loop, the document retriever runs natively
+        if it supports it and in a worker thread otherwise.
+
+        Args:
+            input_data (dict[str, Any]): Input data for the tool.
+            config (RunnableConfig, optional): Configuration for the runnable, including callbacks.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            dict[str, Any]: Result of the retrieval.
+        """
+        logger.info(f"Tool {self.name} - {self.id}: started with INPUT DATA:\n{input_data.model_dump()}")
+        config = ensure_config(config)
+        self.reset_run_state()
+        self.run_on_node_execute_run(config.callbacks, **kwargs)
+
+        filters = input_data.filters or self.filters
+        top_k = input_data.top_k or self.top_k
+
+        alpha = input_data.alpha or self.alpha
+        query = input_data.query
+        try:
+            kwargs = kwargs | {"parent_run_id": kwargs.get("run_id")}
+            kwargs.pop("run_depends", None)
+            text_embedder_output = await self.text_embedder.run_async(
+                input_data={"query": query}, run_depends=self._run_depends, config=config, **kwargs
+            )
+            self._run_depends = [NodeDependency(node=self.text_embedder).to_dict()]
+            embedding = text_embedder_output.output.get("embedding")
+
+            document_retriever_output = await self.document_retriever.run_async(
+                input_data={
+                    "embedding": embedding,
+                    "top_k": top_k,
+                    "filters": filters,
+                    "alpha": alpha,
+                    **({"query": query} if alpha else {}),
+                },
+                run_depends=self._run_depends,
+                config=config,
+                **kwargs,
+            )
+            self._run_depends = [NodeDependency(node=self.document_retriever).to_dict()]
+            retrieved_documents = document_retriever_output.output.get("documents", [])
+            logger.debug(f"Tool {self.name} - {self.id}: retrieved {len(retrieved_documents)} documents")
+
+            result = self.format_content(retrieved_documents)
+            logger.info(f"Tool {self.name} - {self.id}: finished with RESULT:\n{str(result)[:200]}...")
+
+            return {"content": result, "documents": retrieved_documents}
+        except Exception as e:
+            logger.error(f"Tool {self.name} - {self.id}: execution error: {str(e)}", exc_info=True)
+            raise ToolExecutionException(
+                f"Tool '{self.name}' failed to retrieve data using the specified action. "
+                f"Error: {str(e)}. Please analyze the error and take appropriate action.",
+                recoverable=True,
+            )
@@ -1,11 +1,22 @@
-from .e2b_sandbox import E2BInterpreterTool
-from .exa_search import ExaTool
-from .firecrawl import FirecrawlTool
-from .http_api_call import HttpApiCall, ResponseType
-from .jina import JinaResponseFormat, JinaScrapeTool, JinaSearchTool
-from .llm_summarizer import SummarizerTool
-from .python import Python
-from .scale_serp import ScaleSerpTool
-from .sql_executor import SQLExecutor
-from .tavily import TavilyTool
-from .zenrows import ZenRowsTool
+from dynamiq.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "E2BInterpreterTool": ".e2b_sandbox",
+    "ExaTool": ".exa_search",
+    "FirecrawlTool": ".firecrawl",
+    "HttpApiCall": ".http_api_call",
+    "ResponseType": ".http_api_call",
+    "JinaResponseFormat": ".jina",
+    "JinaScrapeTool": ".jina",
+    "JinaSearchTool": ".jina",
+    "SummarizerTool": ".llm_summarizer",
+    "Python": ".python",
+    "PythonProcessPoolConfig": ".python",
+    "ScaleSerpTool": ".scale_serp",
+    "SQLExecutor": ".sql_executor",
+    "TavilyTool": ".tavily",
+    "ZenRowsTool": ".zenrows",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,6 +1,9 @@
+import asyncio
 import enum
 import json
-from typing import Any, ClassVar, Literal
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -11,6 +14,9 @@ from dynamiq.nodes.node import ConnectionNode, ensure_config
 from dynamiq.runnables import RunnableConfig
 from dynamiq.utils.logger import logger
 
+if TYPE_CHECKING:
+    import httpx
+
 DESCRIPTION_HTTP = """## HTTP API Call Tool
 ### Overview
 Make web requests to external APIs and services with support for various HTTP methods, payload formats, and response types.
@@ -65,6 +71,50 @@ Make web requests to external APIs and services with support for various HTTP me
 """  # noqa: E501
 
 
+# Async clients keep pooled connections bound to their event loop, so a client is shared per loop and connection
+# together with the async generator closing it
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, tuple[httpx.AsyncClient, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_clients_lock = threading.Lock()
+
+
+async def _close_on_loop_shutdown(connection_id: str, client: "httpx.AsyncClient"):
+    """Async generator closing the client when the event loop shuts down its async generators."""
+    try:
+        yield
+    finally:
+        with _async_clients_lock:
+            _async_clients.get(asyncio.get_running_loop(), {}).pop(connection_id, None)
+        await client.aclose()
+
+
+async def _get_async_client(connection: HttpConnection) -> "httpx.AsyncClient":
+    """Get the async HTTP client of the connection in the running event loop, creating it on first use.
+
+    Clients are built by the connection and closed when the loop shuts down its async generators, as
+    `asyncio.run` does on exit. Clients of loops closed without it are dropped on the next call.
+
+    Args:
+        connection (HttpConnection): Connection building the client.
+
+    Returns:
+        httpx.AsyncClient: Async HTTP client.
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        for closed_loop in [item for item in _async_clients if item.is_closed()]:
+            del _async_clients[closed_loop]
+        clients = _async_clients.setdefault(loop, {})
+        if (entry := clients.get(connection.id)) is not None:
+            return entry[0]
+        client = connection.connect_async()
+        closer = _close_on_loop_shutdown(connection.id, client)
+        clients[connection.id] = (client, closer)
+    await closer.asend(None)
+    return client
+
+
 class ResponseType(str, enum.Enum):
     TEXT = "text"
     RAW = "raw"
@@ -148,31 +198,68 @@ class HttpApiCall(ConnectionNode):
         self.run_on_node_execute_run(config.callbacks, **kwargs)
         logger.info(f"Tool {self.name} - {self.id}: started with INPUT DATA:\n" f"{input_data.model_dump()}")
 
+        request_params = self._get_request_params(input_data)
+        try:
+            response = self.client.request(**request_params)
+        except Exception as e:
+            self._raise_request_error(e)
+
+        return self._process_response(response)
+
+    async def execute_async(self, input_data: HttpApiCallInputSchema, config: RunnableConfig = None, **kwargs):
+        """Execute the API call asynchronously with the async HTTP client of the connection.
+
+        Args:
+            input_data (dict[str, Any]): The input data containing(optionally) data, headers, payload_type,
+                params for request.
+            config (RunnableConfig, optional): Configuration for the execution. Defaults to None.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+             dict: A dictionary with the following keys:
+                - "content" (bytes|string|dict[str,Any]): Value containing the result of request.
+                - "status_code" (int): The status code of the request.
+        """
+        config = ensure_config(config)
+        self.run_on_node_execute_run(config.callbacks, **kwargs)
+        logger.info(f"Tool {self.name} - {self.id}: started with INPUT DATA:\n" f"{input_data.model_dump()}")
+
+        request_params = self._get_request_params(input_data)
+        try:
+            client = await _get_async_client(self.connection)
+            response = await client.request(**request_params)
+        except Exception as e:
+            self._raise_request_error(e)
+
+        return self._process_response(response)
+
+    def _get_request_params(self, input_data: HttpApiCallInputSchema) -> dict[str, Any]:
+        """Merge connection, node and input request parameters."""
         data = self.connection.data | self.data | input_data.data
         payload_type = input_data.payload_type or self.payload_type
         extras = {"data": data} if payload_type == RequestPayloadType.RAW else {"json": data}
         url = input_data.url or self.url or self.connection.url
         if not url:
             raise ValueError("No url provided.")
-        headers = input_data.headers
-        params = input_data.params
 
-        try:
-            response = self.client.request(
-                method=self.connection.method,
-                url=url,
-                headers=self.connection.headers | self.headers | headers,
-                params=self.connection.params | self.params | params,
-                timeout=self.timeout,
-                **extras,
-            )
-        except Exception as e:
-            logger.error(f"Tool {self.name} - {self.id}: failed to get results. Error: {str(e)}")
-            raise ToolExecutionException(
-                f"Request failed with error: {str(e)}. Please analyze the error and take appropriate action.",
-                recoverable=True,
-            )
+        return {
+            "method": self.connection.method,
+            "url": url,
+            "headers": self.connection.headers | self.headers | input_data.headers,
+            "params": self.connection.params | self.params | input_data.params,
+            "timeout": self.timeout,
+            **extras,
+        }
+
+    def _raise_request_error(self, error: Exception):
+        logger.error(f"Tool {self.name} - {self.id}: failed to get results. Error: {str(error)}")
+        raise ToolExecutionException(
+            f"Request failed with error: {str(error)}. Please analyze the error and take appropriate action.",
+            recoverable=True,
+        )
 
+    def _process_response(self, response: Any) -> dict[str, Any]:
+        """Validate the response status and extract content according to the response type."""
         if response.status_code not in self.success_codes:
             logger.error(f"Tool {self.name} - {self.id}: failed to get results.")
             raise ToolExecutionException(
@@ -1,12 +1,19 @@
 import importlib
 import io
-from typing import Any, ClassVar, Literal
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, ClassVar, Literal
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 from RestrictedPython import compile_restricted, safe_builtins, utility_builtins
 from RestrictedPython.Eval import default_guarded_getattr, default_guarded_getitem, default_guarded_getiter
 from RestrictedPython.Guards import guarded_unpack_sequence
 
+from dynamiq.cache.hashing import canonical_hash
 from dynamiq.nodes import Node, NodeGroup
 from dynamiq.nodes.agents.exceptions import ToolExecutionException
 from dynamiq.nodes.node import ensure_config
@@ -38,6 +45,18 @@ ALLOWED_MODULES = [
     "uuid",
 ]
 
+# Time a worker gets beyond its call time limits before it is killed
+WORKER_KILL_GRACE = 1.0
+# Calls limited only by CPU time may sleep or wait for I/O, so their worker is killed after this multiple of the
+# CPU time limit in wall time
+CPU_TIMEOUT_WALL_FACTOR = 10
+# Workers are spawned instead of forked, since forking a process with running threads can deadlock the child on
+# locks held by other threads. Spawned workers import the modules again, so their startup is not counted in the
+# call time limits
+WORKER_START_METHOD = "spawn"
+WORKER_START_TIMEOUT = 60.0
+HAS_CALL_TIMERS = hasattr(signal, "setitimer")
+
 
 def restricted_import(name: str, globals=None, locals=None, fromlist=(), level=0) -> Any:
     """
@@ -127,6 +146,377 @@ def compile_and_execute(code: str, restricted_globals: dict) -> dict:
         raise
 
 
+def get_python_tool_globals() -> dict:
+    """
+    Return globals dict configured for restricted code execution by the Python tool.
+    """
+    stdout = io.StringIO()
+
+    def safe_print(*args, **kwargs):
+        print(*args, file=stdout, **kwargs)
+
+    def guarded_write(obj, value=None):
+        return value if value is not None else obj
+
+    restricted_globals = get_restricted_globals()
+    restricted_globals.update(
+        {
+            "_inplacevar_": Python._inplacevar,
+            "_iter_unpack_sequence_": guarded_unpack_sequence,
+            "safe_print": safe_print,
+            "_write_": guarded_write,
+        }
+    )
+    return restricted_globals
+
+
+class PythonProcessPoolConfig(BaseModel):
+    """Configuration of warm worker processes executing restricted code.
+
+    Attributes:
+        workers (int): Number of worker processes.
+        chunk_size (int): Maximum number of calls sent to a worker at once.
+        min_calls (int): Batches with fewer calls are executed in the calling thread unless time limits are set.
+        timeout (float | None): Wall time limit of a call in seconds.
+        cpu_timeout (float | None): CPU time limit of a call in seconds. Without a wall time limit, a worker
+            is killed after `CPU_TIMEOUT_WALL_FACTOR` times the CPU time limit in wall time.
+    """
+
+    workers: int = Field(default_factory=lambda: os.cpu_count() or 1, ge=1)
+    chunk_size: int = Field(default=1000, ge=1)
+    min_calls: int = Field(default=1000, ge=1)
+    timeout: float | None = Field(default=None, gt=0)
+    cpu_timeout: float | None = Field(default=None, gt=0)
+
+    @property
+    def has_time_limits(self) -> bool:
+        """Whether calls have time limits."""
+        return self.timeout is not None or self.cpu_timeout is not None
+
+
+class PythonExecutionError(Exception):
+    """Error of restricted code executed by a worker process.
+
+    Attributes:
+        index (int): Index of the failed call in its batch.
+    """
+
+    def __init__(self, message: str, index: int = 0):
+        super().__init__(message)
+        self.index = index
+
+
+class _CallTimeoutError(BaseException):
+    """Error interrupting a call in a worker process that exceeded its time limit.
+
+    It is not an `Exception`, so restricted code catching `Exception` does not swallow it.
+    """
+
+
+# Error of the running call in a worker process that exceeded its time limit, kept if the code swallows it
+_call_timeout_error: str | None = None
+
+
+def _raise_call_timeout(signum: int, frame: Any) -> None:
+    """Signal handler interrupting a call that exceeded its time limit."""
+    global _call_timeout_error
+    limit = "CPU time" if signum == signal.SIGPROF else "time"
+    _call_timeout_error = f"Code execution exceeded the {limit} limit"
+    raise _CallTimeoutError(_call_timeout_error)
+
+
+def _set_call_timers(timeout: float | None, cpu_timeout: float | None) -> None:
+    """Arm the wall and CPU time timers of a call. Timers are disarmed with no limits."""
+    if HAS_CALL_TIMERS:
+        signal.setitimer(signal.ITIMER_REAL, timeout or 0)
+        signal.setitimer(signal.ITIMER_PROF, cpu_timeout or 0)
+
+
+def _call_in_worker(
+    function: Callable, args: tuple, kwargs: dict, timeout: float | None, cpu_timeout: float | None
+) -> tuple[bool, Any]:
+    """Call the function with time limits and return whether it succeeded with its result or error message."""
+    global _call_timeout_error
+    _call_timeout_error = None
+    try:
+        try:
+            _set_call_timers(timeout, cpu_timeout)
+            result = function(*args, **kwargs)
+        finally:
+            _set_call_timers(None, None)
+    except (Exception, _CallTimeoutError) as e:
+        return False, str(e)
+    if _call_timeout_error is not None:
+        return False, _call_timeout_error
+    return True, result
+
+
+def _run_worker(
+    conn: Any,
+    code: str,
+    function_name: str,
+    globals_factory: Callable[[], dict],
+    timeout: float | None,
+    cpu_timeout: float | None,
+) -> None:
+    """Compile the code once and execute chunks of function calls received through the pipe until it is closed."""
+    if HAS_CALL_TIMERS:
+        signal.signal(signal.SIGALRM, _raise_call_timeout)
+        signal.signal(signal.SIGPROF, _raise_call_timeout)
+
+    function, error = None, None
+    try:
+        function = compile_and_execute(code, globals_factory()).get(function_name)
+        if not callable(function):
+            error = f"The '{function_name}' function is not defined in the provided code."
+    except Exception as e:
+        error = f"Code compilation error: {e}"
+    conn.send(None)
+
+    while True:
+        try:
+            calls = conn.recv()
+        except EOFError:
+            return
+        if error:
+            results = [(False, error)] * len(calls)
+        else:
+            results = [_call_in_worker(function, args, kwargs, timeout, cpu_timeout) for args, kwargs in calls]
+        try:
+            conn.send(results)
+        except Exception as e:
+            conn.send([(False, f"Code execution result can not be returned: {e}")] * len(calls))
+
+
+class _PoolWorker:
+    """Worker process of a pool, started on first use and restarted after it is killed."""
+
+    def __init__(self, context: Any, args: tuple):
+        self.context = context
+        self.args = args
+        self.process = None
+        self.conn = None
+
+    def start(self) -> None:
+        """Start the worker process and wait until it compiled the code.
+
+        Raises:
+            PythonExecutionError: If the worker does not start in time or exits.
+        """
+        self.conn, child_conn = self.context.Pipe()
+        self.process = self.context.Process(target=_run_worker, args=(child_conn, *self.args), daemon=True)
+        self.process.start()
+        child_conn.close()
+        try:
+            if self.conn.poll(WORKER_START_TIMEOUT):
+                self.conn.recv()
+                return
+        except EOFError:
+            self.stop()
+            raise PythonExecutionError("Code execution worker exited unexpectedly")
+        self.stop()
+        raise PythonExecutionError("Code execution worker did not start in time")
+
+    def stop(self) -> None:
+        """Kill the worker process."""
+        if self.process is not None:
+            self.process.kill()
+            self.process.join()
+            self.conn.close()
+            self.process, self.conn = None, None
+
+    def run(self, calls: list[tuple[tuple, dict]], wait_timeout: float | None) -> list[tuple[bool, Any]]:
+        """Execute calls in the worker process.
+
+        Args:
+            calls (list[tuple[tuple, dict]]): Positional and keyword arguments of calls.
+            wait_timeout (float | None): Time to wait for the results before the worker is killed.
+
+        Returns:
+            list[tuple[bool, Any]]: Whether each call succeeded with its result or error message.
+
+        Raises:
+            PythonExecutionError: If the results are not returned in time or the worker exits.
+        """
+        if self.process is None or not self.process.is_alive():
+            self.stop()
+            self.start()
+        self.conn.send(calls)
+        try:
+            if self.conn.poll(wait_timeout):
+                return self.conn.recv()
+        except EOFError:
+            self.stop()
+            raise PythonExecutionError("Code execution worker exited unexpectedly")
+        self.stop()
+        raise PythonExecutionError("Code execution exceeded the time limit and the worker was killed")
+
+
+class PythonProcessPool:
+    """Warm worker processes executing a function of restricted code.
+
+    Every worker compiles the code once when it starts and then executes chunks of function calls, so CPU-heavy
+    code runs outside the GIL of the calling process. Calls exceeding their time limits are interrupted in the
+    worker. Workers not returning within the limits of their chunk, e.g. stuck in a C call, are killed and
+    restarted on next use.
+
+    Attributes:
+        code (str): Restricted Python code.
+        function_name (str): Name of the called function.
+        config (PythonProcessPoolConfig): Pool configuration.
+    """
+
+    _shared: ClassVar[dict[str, "PythonProcessPool"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        code: str,
+        function_name: str,
+        config: PythonProcessPoolConfig,
+        globals_factory: Callable[[], dict] = get_restricted_globals,
+    ):
+        """Initialize PythonProcessPool.
+
+        Args:
+            code (str): Restricted Python code.
+            function_name (str): Name of the called function.
+            config (PythonProcessPoolConfig): Pool configuration.
+            globals_factory (Callable[[], dict]): Module level function creating the globals of the code.
+        """
+        self.code = code
+        self.function_name = function_name
+        self.config = config
+        args = (code, function_name, globals_factory, config.timeout, config.cpu_timeout)
+        context = multiprocessing.get_context(WORKER_START_METHOD)
+        self._workers = [_PoolWorker(context, args) for _ in range(config.workers)]
+        self._idle_workers = queue.SimpleQueue()
+        for worker in self._workers:
+            self._idle_workers.put(worker)
+
+    @classmethod
+    def get_shared(
+        cls,
+        code: str,
+        function_name: str,
+        config: PythonProcessPoolConfig,
+        globals_factory: Callable[[], dict] = get_restricted_globals,
+    ) -> "PythonProcessPool":
+        """Get a process-wide pool for the code and configuration, creating it on first use.
+
+        Args:
+            code (str): Restricted Python code.
+            function_name (str): Name of the called function.
+            config (PythonProcessPoolConfig): Pool configuration.
+            globals_factory (Callable[[], dict]): Module level function creating the globals of the code.
+
+        Returns:
+            PythonProcessPool: Shared pool.
+        """
+        factory_name = f"{globals_factory.__module__}.{globals_factory.__qualname__}"
+        key = canonical_hash((code, function_name, factory_name, config.model_dump()))
+        if (pool := cls._shared.get(key)) is None:
+            with cls._shared_lock:
+                if (pool := cls._shared.get(key)) is None:
+                    pool = cls(code, function_name, config, globals_factory)
+                    cls._shared[key] = pool
+        return pool
+
+    @classmethod
+    def clear_shared(cls) -> None:
+        """Shut down and drop all shared pools."""
+        with cls._shared_lock:
+            for pool in cls._shared.values():
+                pool.shutdown()
+            cls._shared.clear()
+
+    def should_use_workers(self, calls_count: int) -> bool:
+        """Whether calls are worth executing in worker processes instead of the calling thread.
+
+        Args:
+            calls_count (int): Number of calls.
+
+        Returns:
+            bool: True for large batches and for calls with time limits.
+        """
+        return calls_count >= self.config.min_calls or self.config.has_time_limits
+
+    def call(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute a single function call in a worker process.
+
+        Returns:
+            Any: Function result.
+
+        Raises:
+            PythonExecutionError: If the call fails.
+        """
+        return self.map([(args, kwargs)])[0]
+
+    def map(self, calls: list[tuple[tuple, dict]]) -> list[Any]:
+        """Execute function calls in chunks spread over the worker processes.
+
+        Args:
+            calls (list[tuple[tuple, dict]]): Positional and keyword arguments of calls.
+
+        Returns:
+            list[Any]: Function results in the order of calls.
+
+        Raises:
+            PythonExecutionError: If a call fails. Its index is the index of the first failed call.
+        """
+        if not calls:
+            return []
+
+        chunk_size = min(self.config.chunk_size, -(-len(calls) // self.config.workers))
+        starts = range(0, len(calls), chunk_size)
+        if len(starts) <= 1:
+            return self._run_chunk(calls, 0)
+
+        with ThreadPoolExecutor(max_workers=min(self.config.workers, len(starts))) as executor:
+            chunks = executor.map(lambda start: self._run_chunk(calls[start : start + chunk_size], start), starts)
+            return [result for chunk in chunks for result in chunk]
+
+    def _run_chunk(self, calls: list[tuple[tuple, dict]], start: int) -> list[Any]:
+        """Execute a chunk of calls in an idle worker process.
+
+        Args:
+            calls (list[tuple[tuple, dict]]): Positional and keyword arguments of calls.
+            start (int): Index of the first call of the chunk in its batch.
+
+        Returns:
+            list[Any]: Function results in the order of calls.
+
+        Raises:
+            PythonExecutionError: If a call fails.
+        """
+        if self.config.timeout is not None:
+            wait_timeout = self.config.timeout * len(calls) + WORKER_KILL_GRACE
+        elif self.config.cpu_timeout is not None:
+            wait_timeout = self.config.cpu_timeout * CPU_TIMEOUT_WALL_FACTOR * len(calls) + WORKER_KILL_GRACE
+        else:
+            wait_timeout = None
+        worker = self._idle_workers.get()
+        try:
+            results = worker.run(calls, wait_timeout)
+        except PythonExecutionError as e:
+            e.index = start
+            raise
+        except Exception as e:
+            raise PythonExecutionError(f"Code execution failed: {e}", index=start) from e
+        finally:
+            self._idle_workers.put(worker)
+
+        for offset, (is_success, result) in enumerate(results):
+            if not is_success:
+                raise PythonExecutionError(result, index=start + offset)
+        return [result for _, result in results]
+
+    def shutdown(self) -> None:
+        """Kill all worker processes. Workers are started again on next use."""
+        for worker in self._workers:
+            worker.stop()
+
+
 class PythonInputSchema(BaseModel):
     model_config = ConfigDict(extra="allow", strict=True, arbitrary_types_allowed=True)
 
@@ -142,6 +532,8 @@ class Python(Node):
       name (str): node name.
       description (str): node description.
       code (str): Python code to execute.
+      process_pool (PythonProcessPoolConfig | None): Warm worker processes executing the code. Code is executed
+        in the calling thread if None.
     """
     group: Literal[NodeGroup.TOOLS] = NodeGroup.TOOLS
     name: str = "Python Code Executor Tool"
@@ -150,8 +542,19 @@ class Python(Node):
         "All arguments are passed as a dictionary to the 'run' main function."
     )
     code: str
+    process_pool: PythonProcessPoolConfig | None = None
     input_schema: ClassVar[type[PythonInputSchema]] = PythonInputSchema
 
+    def get_process_pool(self) -> PythonProcessPool | None:
+        """
+        Get the shared worker processes executing the code.
+        Returns:
+            PythonProcessPool | None: Process pool, or None if the code is executed in the calling thread.
+        """
+        if self.process_pool is None:
+            return None
+        return PythonProcessPool.get_shared(self.code, "run", self.process_pool, get_python_tool_globals)
+
     def execute(self, input_data: PythonInputSchema, config: RunnableConfig = None, **kwargs) -> Any:
         """
         Execute the Python code.
@@ -165,29 +568,16 @@ class Python(Node):
         logger.info(f"Tool {self.name} - {self.id}: started with INPUT DATA:\n" f"{input_data.model_dump()}")
         config = ensure_config(config)
         self.run_on_node_execute_run(config.callbacks, **kwargs)
-        stdout = io.StringIO()
-
-        def safe_print(*args, **kwargs):
-            print(*args, file=stdout, **kwargs)
-
-        def guarded_write(obj, value=None):
-            return value if value is not None else obj
-
-        restricted_globals = get_restricted_globals()
-        restricted_globals.update(
-            {
-                "_inplacevar_": self._inplacevar,
-                "_iter_unpack_sequence_": guarded_unpack_sequence,
-                "safe_print": safe_print,
-                "_write_": guarded_write,
-            }
-        )
 
         try:
-            restricted_globals = compile_and_execute(self.code, restricted_globals)
-            if "run" not in restricted_globals:
-                raise ValueError("The 'run' function is not defined in the provided code.")
-            result = restricted_globals["run"](dict(input_data))
+            pool = self.get_process_pool()
+            if pool is not None and pool.should_use_workers(1):
+                result = pool.call(dict(input_data))
+            else:
+                restricted_globals = compile_and_execute(self.code, get_python_tool_globals())
+                if "run" not in restricted_globals:
+                    raise ValueError("The 'run' function is not defined in the provided code.")
+                result = restricted_globals["run"](dict(input_data))
             if self.is_optimized_for_agents:
                 result = str(result)
         except Exception as e:
@@ -1,8 +1,9 @@
+from contextlib import contextmanager
 from typing import Any, ClassVar, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from dynamiq.connections import AWSRedshift, MySQL, PostgreSQL, Snowflake
+from dynamiq.connections import AWSRedshift, ConnectionPool, MySQL, PostgreSQL, Snowflake
 from dynamiq.nodes import NodeGroup
 from dynamiq.nodes.agents.exceptions import ToolExecutionException
 from dynamiq.nodes.node import ConnectionNode, ensure_config
@@ -36,6 +37,9 @@ class SQLExecutor(ConnectionNode):
         connection (PostgreSQL|MySQL|Snowflake|AWSRedshift): The connection instance for the specified storage.
         query (Optional[str]): The SQL statement to execute.
         input_schema (SQLInputSchema): The input schema for the tool.
+
+    PostgreSQL and MySQL queries run on connections from a pool shared by nodes with the same connection
+    if `pool_enabled` of the connection is set, so concurrent executions don't wait for each other.
     """
 
     group: Literal[NodeGroup.TOOLS] = NodeGroup.TOOLS
@@ -47,6 +51,7 @@ class SQLExecutor(ConnectionNode):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     input_schema: ClassVar[type[SQLInputSchema]] = SQLInputSchema
+    supports_connection_pool: ClassVar[bool] = True
 
     def format_results(self, results: list[dict[str, Any]], query: str) -> str:
         """Format the retrieved results.
@@ -67,6 +72,15 @@ class SQLExecutor(ConnectionNode):
             formatted_results.append(formatted_result)
         return "\n\n".join(formatted_results)
 
+    @contextmanager
+    def get_db_connection(self):
+        """Context manager that yields a database connection, taken from the pool if the client is a pool."""
+        if isinstance(self.client, ConnectionPool):
+            with self.client.connection() as conn:
+                yield conn
+        else:
+            yield self.client
+
     def execute(self, input_data, config: RunnableConfig = None, **kwargs) -> dict[str, Any]:
         logger.info(f"Tool {self.name} - {self.id}: started with input:\n{input_data.model_dump()}")
 
@@ -77,12 +91,17 @@ class SQLExecutor(ConnectionNode):
         try:
             if not query:
                 raise ValueError("Query cannot be empty")
-            cursor = self.client.cursor(
-                **self.connection.cursor_params if not isinstance(self.connection, (PostgreSQL, AWSRedshift)) else {}
-            )
-            cursor.execute(query)
-            output = cursor.fetchall() if cursor.description is not None else []
-            cursor.close()
+            with self.get_db_connection() as conn:
+                cursor = conn.cursor(
+                    **(
+                        self.connection.cursor_params
+                        if not isinstance(self.connection, (PostgreSQL, AWSRedshift))
+                        else {}
+                    )
+                )
+                cursor.execute(query)
+                output = cursor.fetchall() if cursor.description is not None else []
+                cursor.close()
             if self.is_optimized_for_agents:
                 output = self.format_results(output, query)
             return {"content": output}
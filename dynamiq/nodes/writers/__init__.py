@@ -1,7 +1,14 @@
-from .chroma import ChromaDocumentWriter
-from .elasticsearch import ElasticsearchDocumentWriter
-from .milvus import MilvusDocumentWriter
-from .pgvector import PGVectorDocumentWriter
-from .pinecone import PineconeDocumentWriter
-from .qdrant import QdrantDocumentWriter
-from .weaviate import WeaviateDocumentWriter
+from dynamiq.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "ChromaDocumentWriter": ".chroma",
+    "ElasticsearchDocumentWriter": ".elasticsearch",
+    "MilvusDocumentWriter": ".milvus",
+    "PGVectorDocumentWriter": ".pgvector",
+    "PineconeDocumentWriter": ".pinecone",
+    "QdrantDocumentWriter": ".qdrant",
+    "WeaviateDocumentWriter": ".weaviate",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,3 +1,5 @@
+from typing import ClassVar
+
 from dynamiq.connections import PostgreSQL
 from dynamiq.nodes.node import ensure_config
 from dynamiq.nodes.writers.base import Writer, WriterInputSchema
@@ -23,6 +25,7 @@ class PGVectorDocumentWriter(Writer, PGVectorStoreWriterParams):
     name: str = "PGVectorDocumentWriter"
     connection: PostgreSQL | str | None = None
     vector_store: PGVectorStore | None = None
+    supports_connection_pool: ClassVar[bool] = True
 
     def __init__(self, **kwargs):
         """
@@ -7,7 +7,7 @@ from typing import Any
 
 import filetype
 from jinja2 import Environment, meta
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_serializer
 
 from dynamiq.utils import generate_uuid
 
@@ -16,6 +16,7 @@ class MessageRole(str, enum.Enum):
     USER = "user"
     SYSTEM = "system"
     ASSISTANT = "assistant"
+    TOOL = "tool"
 
 
 class VisionMessageType(str, enum.Enum):
@@ -56,10 +57,23 @@ class Message(BaseModel):
         content (str): The content of the message.
         role (MessageRole): The role of the message sender.
         metadata (dict | None): Additional metadata for the message, default is None.
+        tool_calls (list[dict] | None): Tool calls of an assistant message in the OpenAI format, default is None.
+        tool_call_id (str | None): ID of the tool call answered by a tool message, default is None.
     """
     content: str
     role: MessageRole = MessageRole.USER
     metadata: dict | None = None
+    tool_calls: list[dict] | None = None
+    tool_call_id: str | None = None
+
+    @model_serializer(mode="wrap")
+    def serialize_without_empty_tool_fields(self, handler) -> dict:
+        """Serializes the message, leaving out tool fields of messages that are not about tool calls."""
+        data = handler(self)
+        for name in ("tool_calls", "tool_call_id"):
+            if data.get(name) is None:
+                data.pop(name, None)
+        return data
 
     def __init__(self, **data):
         super().__init__(**data)
@@ -73,6 +87,8 @@ class Message(BaseModel):
         return Message(
             role=self.role,
             content=self._Template(self.content).render(**kwargs),
+            tool_calls=self.tool_calls,
+            tool_call_id=self.tool_call_id,
         )
 
 
@@ -7,6 +7,7 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from dynamiq.cache.config import CacheConfig
 from dynamiq.callbacks import BaseCallbackHandler
+from dynamiq.executors.config import ExecutorPoolConfig
 from dynamiq.types.streaming import StreamingConfig
 from dynamiq.utils import format_value, generate_uuid, is_called_from_async_context
 
@@ -23,12 +24,14 @@ class RunnableConfig(BaseModel):
         callbacks (list[BaseCallbackHandler]): List of callback handlers.
         cache (CacheConfig | None): Cache configuration.
         max_node_workers (int | None): Maximum number of node workers.
+        executor_pool (ExecutorPoolConfig): Shared executor pools configuration.
     """
 
     run_id: str | None = Field(default_factory=generate_uuid)
     callbacks: list[BaseCallbackHandler] = []
     cache: CacheConfig | None = None
     max_node_workers: int | None = None
+    executor_pool: ExecutorPoolConfig = Field(default_factory=ExecutorPoolConfig)
     nodes_override: dict[str, NodeRunnableConfig] = {}
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
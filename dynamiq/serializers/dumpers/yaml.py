@@ -126,6 +126,10 @@ class WorkflowYAMLDumper:
         flows_data = {}
         for flow_id, flow in flows.items():
             flow_data = flow.to_dict(exclude={"nodes", "executor", "connection_manager"})
+            flow_data = {
+                param_name: param_data.value if isinstance(param_data, enum.Enum) else param_data
+                for param_name, param_data in flow_data.items()
+            }
             flow_data["nodes"] = [node.id for node in flow.nodes]
             flows_data[flow_id] = flow_data
 
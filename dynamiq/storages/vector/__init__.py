@@ -1,7 +1,14 @@
-from .chroma import ChromaVectorStore
-from .elasticsearch import ElasticsearchVectorStore
-from .milvus import MilvusVectorStore
-from .pgvector import PGVectorStore
-from .pinecone import PineconeVectorStore
-from .qdrant import QdrantVectorStore
-from .weaviate import WeaviateVectorStore
+from dynamiq.utils.lazy_imports import lazy_exports
+
+_EXPORTS = {
+    "ChromaVectorStore": ".chroma",
+    "ElasticsearchVectorStore": ".elasticsearch",
+    "MilvusVectorStore": ".milvus",
+    "PGVectorStore": ".pgvector",
+    "PineconeVectorStore": ".pinecone",
+    "QdrantVectorStore": ".qdrant",
+    "WeaviateVectorStore": ".weaviate",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
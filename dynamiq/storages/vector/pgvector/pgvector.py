@@ -1,8 +1,10 @@
+import weakref
 from contextlib import contextmanager
 from decimal import Decimal
 from enum import Enum
 from typing import Any
 
+import numpy as np
 import psycopg
 from pgvector.psycopg import register_vector
 from psycopg import Cursor
@@ -11,7 +13,7 @@ from psycopg.sql import SQL, Identifier
 from psycopg.sql import Literal as SQLLiteral
 from psycopg.types.json import Jsonb
 
-from dynamiq.connections import PostgreSQL
+from dynamiq.connections import ConnectionPool, PostgreSQL
 from dynamiq.storages.vector.base import BaseVectorStoreParams, BaseWriterVectorStoreParams
 from dynamiq.storages.vector.exceptions import VectorStoreException
 from dynamiq.storages.vector.pgvector.filters import _convert_filters_to_query
@@ -52,6 +54,9 @@ DEFAULT_INDEX_NAME = "dynamiq_index"
 DEFAULT_KEYWORD_INDEX_NAME = "dynamiq_keyword_index"
 DEFAULT_SCHEMA_NAME = "public"
 DEFAULT_LANGUAGE = "english"
+DEFAULT_WRITE_BATCH_SIZE = 1000
+# Smaller batches are upserted with pipelined statements, creating a staging table costs more for them
+MIN_COPY_BATCH_SIZE = 32
 
 
 class PGVectorStoreParams(BaseVectorStoreParams):
@@ -68,6 +73,8 @@ class PGVectorStoreRetrieverParams(PGVectorStoreParams):
 
 class PGVectorStoreWriterParams(PGVectorStoreParams, BaseWriterVectorStoreParams):
     create_if_not_exist: bool = False
+    batch_size: int = DEFAULT_WRITE_BATCH_SIZE
+    defer_index_build: bool = False
 
 
 class PGVectorStore:
@@ -76,7 +83,7 @@ class PGVectorStore:
     def __init__(
         self,
         connection: PostgreSQL | str | None = None,
-        client: PostgreSQL | None = None,
+        client: psycopg.Connection | ConnectionPool | None = None,
         create_extension: bool = True,
         table_name: str = DEFAULT_TABLE_NAME,
         schema_name: str = DEFAULT_SCHEMA_NAME,
@@ -89,13 +96,17 @@ class PGVectorStore:
         embedding_key: str = "embedding",
         keyword_index_name: str = DEFAULT_KEYWORD_INDEX_NAME,
         language: str = DEFAULT_LANGUAGE,
+        batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        defer_index_build: bool = False,
     ):
         """
         Initialize a PGVectorStore instance.
 
         Args:
             connection (PostgreSQL | str): PostgreSQL connection instance. Defaults to None.
-            client (Optional[PostgreSQL]): PostgreSQL client instance. Defaults to None.
+            client (psycopg.Connection | ConnectionPool | None): PostgreSQL connection or pool of connections.
+                Every operation takes its own connection from the pool, so the store can be used from many
+                threads. Defaults to None.
             create_extension (bool): Whether to create the vector extension (if it does not exist). Defaults to True.
             table_name (str): Name of the table in the database. Defaults to None.
             schema_name (str): Name of the schema in the database. Defaults to None.
@@ -108,7 +119,12 @@ class PGVectorStore:
             create_if_not_exist (bool): Whether to create the table and index if they do not exist. Defaults to False.
             content_key (Optional[str]): The field used to store content in the storage. Defaults to 'content'.
             embedding_key (Optional[str]): The field used to store embeddings in the storage. Defaults to 'embedding'.
+            batch_size (int): Maximum number of documents written in one transaction. Defaults to 1000.
+            defer_index_build (bool): Whether to drop the vector index before writing documents and build it
+                after the write. Speeds up initial loads into `ivfflat` and `hnsw` indexed tables. Defaults to False.
         """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive.")
         if vector_function not in PGVectorVectorFunction:
             raise ValueError(f"vector_function must be one of {list(PGVectorVectorFunction)}")
         if index_method is not None and index_method not in PGVectorIndexMethod:
@@ -125,15 +141,29 @@ class PGVectorStore:
                 self.client = self._conn
             else:
                 raise ValueError("connection must be a string or PostgreSQL object")
+        elif isinstance(client, ConnectionPool):
+            self._conn = None
+            self.client = client
         else:
             self._conn = client
+            self.client = client
+
+        # Pooled connections get the vector type registered when they are taken for the first time
+        self._pool = client if isinstance(client, ConnectionPool) else None
+        self._vector_connections = weakref.WeakSet()
 
         self.create_extension = create_extension
-        if self.create_extension:
-            self._conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
-            self._conn.commit()
+        if self._pool is not None:
+            if self.create_extension:
+                with self._pool.connection() as conn:
+                    conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+                    conn.commit()
+        else:
+            if self.create_extension:
+                self._conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
+                self._conn.commit()
 
-        register_vector(self._conn)
+            register_vector(self._conn)
 
         self.table_name = table_name
         self.schema_name = schema_name
@@ -145,6 +175,8 @@ class PGVectorStore:
 
         self.content_key = content_key
         self.embedding_key = embedding_key
+        self.batch_size = batch_size
+        self.defer_index_build = defer_index_build
 
         if (
             self.index_method == PGVectorIndexMethod.IVFFLAT
@@ -162,12 +194,13 @@ class PGVectorStore:
                     self._create_index(conn)
                 self._create_keyword_index(conn)
         else:
-            if not self._check_if_schema_exists(self._conn):
-                msg = f"Schema '{self.schema_name}' does not exist"
-                raise VectorStoreException(msg)
-            if not self._check_if_table_exists(self._conn):
-                msg = f"Table '{self.table_name}' does not exist"
-                raise VectorStoreException(msg)
+            with self._get_connection() as conn:
+                if not self._check_if_schema_exists(conn):
+                    msg = f"Schema '{self.schema_name}' does not exist"
+                    raise VectorStoreException(msg)
+                if not self._check_if_table_exists(conn):
+                    msg = f"Table '{self.table_name}' does not exist"
+                    raise VectorStoreException(msg)
 
         logger.debug(f"PGVectorStore initialized with table_name: {self.table_name}")
 
@@ -177,6 +210,14 @@ class PGVectorStore:
 
         import psycopg
 
+        if self._pool is not None:
+            with self._pool.connection() as conn:
+                if conn not in self._vector_connections:
+                    register_vector(conn)
+                    self._vector_connections.add(conn)
+                yield conn
+            return
+
         if self._conn is None or self._conn.closed:
             if self.client is None:
                 self._conn = psycopg.connect(self.connection_string)
@@ -262,7 +303,7 @@ class PGVectorStore:
         try:
             result = cursor.execute(sql_query, params)
         except Exception as e:
-            self._conn.rollback()
+            cursor.connection.rollback()
             msg = f"Encountered an error while executing SQL query: {sql_query_str} with params: {params}. \nError: {e}"
             raise VectorStoreException(msg)
 
@@ -436,9 +477,10 @@ class PGVectorStore:
 
         query = SQL(
             """
-            DROP INDEX IF EXISTS {index_name};
+            DROP INDEX IF EXISTS {schema_name}.{index_name};
             """
         ).format(
+            schema_name=Identifier(self.schema_name),
             index_name=Identifier(f"{self.table_name}_{self.index_method}_index"),
         )
 
@@ -508,8 +550,13 @@ class PGVectorStore:
         """
         Write documents to the pgvector vector store.
 
+        Documents are upserted in batches of `batch_size`, each batch in its own transaction. Large batches are
+        copied to a temporary staging table in the binary format and upserted with a single statement.
+
         Args:
             documents (list[Document]): List of Document objects to write.
+            content_key (str | None): The field used to store content in the storage. Defaults to None.
+            embedding_key (str | None): The field used to store embeddings in the storage. Defaults to None.
 
         Returns:
             int: Number of documents successfully written.
@@ -528,31 +575,144 @@ class PGVectorStore:
         content_key = content_key or self.content_key
         embedding_key = embedding_key or self.embedding_key
 
+        # A single upsert can't update a row twice, the last document with the same id wins
+        unique_documents = list({doc.id: doc for doc in documents}.values())
+        defer_index = self.defer_index_build and self.index_method in (
+            PGVectorIndexMethod.IVFFLAT,
+            PGVectorIndexMethod.HNSW,
+        )
+
         with self._get_connection() as conn:
-            with conn.cursor() as cur:
-                written = 0
+            if defer_index:
+                self._drop_index(conn)
+            try:
+                for start in range(0, len(unique_documents), self.batch_size):
+                    batch = unique_documents[start : start + self.batch_size]
+                    # Every batch is committed as one transaction in the autocommit mode. Otherwise the
+                    # transaction context is a savepoint of the open transaction, which is committed explicitly.
+                    with conn.transaction(), conn.cursor() as cur:
+                        if len(batch) < MIN_COPY_BATCH_SIZE:
+                            self._upsert_documents(batch, content_key, embedding_key, cursor=cur)
+                        else:
+                            self._copy_upsert_documents(batch, content_key, embedding_key, cursor=cur)
+                    if not conn.autocommit:
+                        conn.commit()
+            finally:
+                if defer_index:
+                    self._create_index(conn, embedding_key=embedding_key)
+
+        return len(documents)
+
+    def _upsert_documents(
+        self, documents: list[Document], content_key: str, embedding_key: str, cursor: Cursor
+    ) -> None:
+        """
+        Internal method to upsert documents with pipelined statements inside the transaction of the cursor.
+
+        Args:
+            documents (list[Document]): Documents with unique ids.
+            content_key (str): The field used to store content in the storage.
+            embedding_key (str): The field used to store embeddings in the storage.
+            cursor (Cursor): The cursor to use for the query.
+
+        Raises:
+            VectorStoreException: If an error occurs while writing documents.
+        """
+        query = SQL(
+            """
+            INSERT INTO {schema_name}.{table_name} (id, {content_key}, metadata, {embedding_key})
+            VALUES (%s, %s, %s, %b)
+            ON CONFLICT (id) DO UPDATE
+            SET {content_key} = EXCLUDED.{content_key},
+            metadata = EXCLUDED.metadata,
+            {embedding_key} = EXCLUDED.{embedding_key};
+            """
+        ).format(
+            schema_name=Identifier(self.schema_name),
+            table_name=Identifier(self.table_name),
+            content_key=Identifier(content_key),
+            embedding_key=Identifier(embedding_key),
+        )
+        params = [
+            (
+                doc.id,
+                doc.content,
+                Jsonb(doc.metadata),
+                None if doc.embedding is None else np.asarray(doc.embedding, dtype=np.float32),
+            )
+            for doc in documents
+        ]
+
+        try:
+            cursor.executemany(query, params)
+        except Exception as e:
+            msg = f"Encountered an error while upserting {len(documents)} documents. \nError: {e}"
+            raise VectorStoreException(msg)
+
+    def _copy_upsert_documents(
+        self, documents: list[Document], content_key: str, embedding_key: str, cursor: Cursor
+    ) -> None:
+        """
+        Internal method to upsert documents through a staging table filled with binary COPY.
+
+        Must run inside a transaction, the staging table is dropped when the transaction commits.
+
+        Args:
+            documents (list[Document]): Documents with unique ids.
+            content_key (str): The field used to store content in the storage.
+            embedding_key (str): The field used to store embeddings in the storage.
+            cursor (Cursor): The cursor to use for the query.
+
+        Raises:
+            VectorStoreException: If an error occurs while writing documents.
+        """
+        staging_table = Identifier(f"{self.table_name}_staging")
+        columns = SQL("id, {content_key}, metadata, {embedding_key}").format(
+            content_key=Identifier(content_key),
+            embedding_key=Identifier(embedding_key),
+        )
+        create_staging_query = SQL(
+            """
+            CREATE TEMP TABLE {staging_table}
+            (LIKE {schema_name}.{table_name} INCLUDING DEFAULTS)
+            ON COMMIT DROP;
+            """
+        ).format(
+            staging_table=staging_table,
+            schema_name=Identifier(self.schema_name),
+            table_name=Identifier(self.table_name),
+        )
+        copy_query = SQL("COPY {staging_table} ({columns}) FROM STDIN WITH (FORMAT BINARY)").format(
+            staging_table=staging_table, columns=columns
+        )
+        upsert_query = SQL(
+            """
+            INSERT INTO {schema_name}.{table_name} ({columns})
+            SELECT {columns} FROM {staging_table}
+            ON CONFLICT (id) DO UPDATE
+            SET {content_key} = EXCLUDED.{content_key},
+            metadata = EXCLUDED.metadata,
+            {embedding_key} = EXCLUDED.{embedding_key};
+            """
+        ).format(
+            schema_name=Identifier(self.schema_name),
+            table_name=Identifier(self.table_name),
+            staging_table=staging_table,
+            columns=columns,
+            content_key=Identifier(content_key),
+            embedding_key=Identifier(embedding_key),
+        )
+
+        try:
+            cursor.execute(create_staging_query)
+            with cursor.copy(copy_query) as copy:
+                copy.set_types(["varchar", "text", "jsonb", "vector"])
                 for doc in documents:
-                    query = SQL(
-                        """
-                        INSERT INTO {schema_name}.{table_name} (id, {content_key}, metadata, {embedding_key})
-                        VALUES (%s, %s, %s, %s)
-                        ON CONFLICT (id) DO UPDATE
-                        SET {content_key} = EXCLUDED.{content_key},
-                        metadata = EXCLUDED.metadata,
-                        {embedding_key} = EXCLUDED.{embedding_key};
-                        """
-                    ).format(
-                        schema_name=Identifier(self.schema_name),
-                        table_name=Identifier(self.table_name),
-                        content_key=Identifier(content_key),
-                        embedding_key=Identifier(embedding_key),
-                    )
-                    self._execute_sql_query(
-                        query, (doc.id, doc.content, Jsonb(doc.metadata), doc.embedding), cursor=cur
-                    )
-                    written += 1
-                conn.commit()
-                return written
+                    copy.write_row((doc.id, doc.content, Jsonb(doc.metadata), doc.embedding))
+            cursor.execute(upsert_query)
+        except Exception as e:
+            msg = f"Encountered an error while copying {len(documents)} documents. \nError: {e}"
+            raise VectorStoreException(msg)
 
     def delete_documents_by_filters(self, filters: dict[str, Any], top_k: int = 1000) -> None:
         """
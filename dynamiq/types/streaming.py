@@ -16,6 +16,14 @@ class StreamingMode(str, Enum):
     ALL = "all"  # Streams all intermediate steps and final output in agents and llms nodes.
 
 
+class StreamingOverflowPolicy(str, Enum):
+    """Behaviour of streaming queue callback handlers when their queue is full."""
+
+    BLOCK = "block"  # Waits for a free queue slot.
+    DROP_NEW = "drop_new"  # Drops new chunks until the queue has free slots.
+    COALESCE = "coalesce"  # Merges new chunks of a stream into one event until the queue has free slots.
+
+
 STREAMING_EVENT = "streaming"
 
 
@@ -77,6 +85,8 @@ class StreamingConfig(BaseModel):
         input_queue_done_event (Event | None): Event to signal input queue completion. Defaults to None.
         mode (StreamingMode): Streaming mode. Defaults to StreamingMode.ANSWER.
         by_tokens (bool): Whether to stream  by tokens. Defaults to False.
+        incremental (bool): Whether agents forward the answer from LLM chunks as they arrive instead of
+            streaming the finished answer. Defaults to False.
     """
     enabled: bool = False
     event: str = STREAMING_EVENT
@@ -85,6 +95,7 @@ class StreamingConfig(BaseModel):
     input_queue_done_event: Event | None = None
     mode: StreamingMode = StreamingMode.FINAL
     by_tokens: bool = True
+    incremental: bool = False
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
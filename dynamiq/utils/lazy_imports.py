@@ -0,0 +1,35 @@
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Create the module `__getattr__` and `__dir__` of a package that imports its exports on first access.
+
+    Packages re-exporting integrations with heavy vendor SDKs map every exported name to the module defining
+    it, so importing the package only imports the modules of the names that are used.
+
+    Args:
+        package (str): Name of the package, usually `__name__`.
+        exports (dict[str, str]): Module paths relative to the package by exported name.
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: Module `__getattr__` and `__dir__` functions.
+
+    Examples:
+        >>> __all__ = ["OpenAI"]
+        >>> __getattr__, __dir__ = lazy_exports(__name__, {"OpenAI": ".openai"})
+    """
+
+    def __getattr__(name: str) -> Any:
+        if (module_path := exports.get(name)) is None:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        value = getattr(importlib.import_module(module_path, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
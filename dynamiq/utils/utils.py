@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import random
 from datetime import date, datetime
 from enum import Enum
 from io import BytesIO
@@ -10,6 +11,7 @@ from uuid import UUID, uuid4
 from pydantic import BaseModel, PydanticUserError, RootModel
 
 TRUNCATE_LIMIT = 20
+MAX_RETRY_DELAY = 60.0
 
 
 def generate_uuid() -> str:
@@ -120,9 +122,6 @@ def format_value(
     Returns:
         Any: Formatted value.
     """
-    from dynamiq.nodes.tools.python import PythonInputSchema
-    from dynamiq.runnables import RunnableResult
-
     if skip_format_types is None:
         skip_format_types = set()
     if force_format_types is None:
@@ -134,6 +133,9 @@ def format_value(
     ):
         return value, truncate_metadata
 
+    # Primitives are returned as is, validating them with a root model gives the same result
+    if value is None or isinstance(value, (str, int, float)):
+        return value, truncate_metadata
     if isinstance(value, BytesIO):
         return getattr(value, "name", None) or encode_bytes(value.getvalue()), truncate_metadata
     if isinstance(value, bytes):
@@ -173,6 +175,9 @@ def format_value(
 
         return type(value)(formatted_list), truncate_metadata
 
+    from dynamiq.nodes.tools.python import PythonInputSchema
+    from dynamiq.runnables import RunnableResult
+
     if isinstance(value, (RunnableResult, PythonInputSchema)):
         return (
             value.to_dict(skip_format_types=skip_format_types, force_format_types=force_format_types),
@@ -252,3 +257,45 @@ def is_called_from_async_context() -> bool:
         return True
     except Exception:
         return False
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether an error is a provider rate limit error.
+
+    Args:
+        error (Exception): Error raised by the provider call.
+
+    Returns:
+        bool: True for rate limit errors and HTTP 429 responses.
+    """
+    if getattr(error, "status_code", None) == 429:
+        return True
+    from litellm.exceptions import RateLimitError
+
+    return isinstance(error, RateLimitError)
+
+
+def get_retry_delay(error: Exception, attempt: int, initial_delay: float, max_delay: float = MAX_RETRY_DELAY) -> float:
+    """Get the delay before retrying a rate limited call.
+
+    The Retry-After header of the provider response is used if set. Otherwise the delay doubles with every
+    attempt and is randomized, so concurrent retries are spread over time.
+
+    Args:
+        error (Exception): Error raised by the provider call.
+        attempt (int): Number of the failed attempt, starting from 0.
+        initial_delay (float): Delay in seconds after the first attempt.
+        max_delay (float): Maximum delay in seconds.
+
+    Returns:
+        float: Delay in seconds.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers:
+        try:
+            return float(headers.get("retry-after"))
+        except (TypeError, ValueError):
+            pass
+    delay = min(initial_delay * 2**attempt, max_delay)
+    # Jitter only spreads retries over time, it does not need a cryptographic generator
+    return random.uniform(delay / 2, delay)  # nosec B311
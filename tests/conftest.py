@@ -6,6 +6,8 @@ from litellm.utils import Delta
 
 from dynamiq import connections, prompts
 from dynamiq.cache.backends import RedisCache
+from dynamiq.cache.embeddings import EmbeddingCache
+from dynamiq.cache.managers import CacheManager
 from dynamiq.clients import BaseTracingClient
 from dynamiq.nodes import llms
 from dynamiq.types.document import Document
@@ -54,7 +56,20 @@ def mock_llm_executor(mocker, mock_llm_response_text):
         model_r["choices"][0]["message"]["content"] = mock_llm_response_text
         return model_r
 
+    async def mock_acompletion_streaming_obj(mock_response):
+        for chunk in mock_response:
+            yield chunk
+
+    async def async_response(*args, **kwargs):
+        model_r = mock_llm(*args, **kwargs)
+        if kwargs.get("stream"):
+            return mock_acompletion_streaming_obj(mock_response=model_r)
+        return model_r
+
     mock_llm = mocker.patch("dynamiq.nodes.llms.base.BaseLLM._completion", side_effect=response)
+    mocker.patch(
+        "dynamiq.nodes.llms.base.BaseLLM._acompletion", new_callable=mocker.AsyncMock, side_effect=async_response
+    )
     yield mock_llm
 
 
@@ -68,10 +83,18 @@ def mock_embedding_executor(mocker):
         embed_r["usage"] = {"usage": {"prompt_tokens": 6, "completion_tokens": 0, "total_tokens": 6}}
         return embed_r
 
+    async def async_response(*args, **kwargs):
+        return mock_llm(*args, **kwargs)
+
     mock_llm = mocker.patch(
         "dynamiq.components.embedders.base.BaseEmbedder._embedding",
         side_effect=response,
     )
+    mocker.patch(
+        "dynamiq.components.embedders.base.BaseEmbedder._aembedding",
+        new_callable=mocker.AsyncMock,
+        side_effect=async_response,
+    )
     yield mock_llm
 
 
@@ -141,10 +164,14 @@ def mock_tracing_client(mocker):
 
 @pytest.fixture
 def mock_redis_backend(mocker, mock_redis):
+    CacheManager.clear_shared()
+    EmbeddingCache.clear_shared()
     yield mocker.patch(
         "dynamiq.cache.backends.RedisCache.from_config",
         return_value=RedisCache(client=mock_redis),
     )
+    CacheManager.clear_shared()
+    EmbeddingCache.clear_shared()
 
 
 @pytest.fixture()
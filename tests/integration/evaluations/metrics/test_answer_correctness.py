@@ -27,84 +27,69 @@ def test_answer_correctness_evaluator(openai_node):
 
     evaluator = AnswerCorrectnessEvaluator(llm=openai_node)
 
-    # Mock extraction: each question calls extract_statements twice:
-    # For question 1: first call for the answer, second call for the ground truth.
-    # For question 2: similarly.
+    # Mock extraction: statements of all answers and then all ground truth answers are extracted in one run.
     evaluator._statement_extractor.run = MagicMock(
-        side_effect=[
-            # Q1: extraction for answer
-            {
-                "results": [
-                    {
-                        "statements": [
-                            "The sun is powered by nuclear fission.",
-                            "Its primary function is to provide light to the solar system.",
-                        ]
-                    }
-                ]
-            },
-            # Q1: extraction for ground truth answer
-            {
-                "results": [
-                    {
-                        "statements": [
-                            "The sun is powered by nuclear fusion.",
-                            "Fusion releases energy.",
-                            "The sun provides heat and light.",
-                        ]
-                    }
-                ]
-            },
-            # Q2: extraction for answer
-            {"results": [{"statements": ["The boiling point of water is 100 degrees Celsius at sea level."]}]},
-            # Q2: extraction for ground truth answer
-            {
-                "results": [
-                    {
-                        "statements": [
-                            "The boiling point of water is 100 degrees Celsius at sea level.",
-                            "Boiling point can change with altitude.",
-                        ]
-                    }
-                ]
-            },
-        ]
+        return_value={
+            "results": [
+                # Q1: extraction for answer
+                {
+                    "statements": [
+                        "The sun is powered by nuclear fission.",
+                        "Its primary function is to provide light to the solar system.",
+                    ]
+                },
+                # Q2: extraction for answer
+                {"statements": ["The boiling point of water is 100 degrees Celsius at sea level."]},
+                # Q1: extraction for ground truth answer
+                {
+                    "statements": [
+                        "The sun is powered by nuclear fusion.",
+                        "Fusion releases energy.",
+                        "The sun provides heat and light.",
+                    ]
+                },
+                # Q2: extraction for ground truth answer
+                {
+                    "statements": [
+                        "The boiling point of water is 100 degrees Celsius at sea level.",
+                        "Boiling point can change with altitude.",
+                    ]
+                },
+            ]
+        }
     )
 
-    # Mock classification: for each candidate statement, the classifier's run method is called.
-    # For Question 1:
-    #   - Two calls for answer statements:
-    #         Call 1 for "The sun is powered by nuclear fission." returns match: False.
-    #         Call 2 for "Its primary function is to provide light to the solar system." returns match: True.
-    #   - Three calls for ground truth statements:
-    #         Call 1 for "The sun is powered by nuclear fusion." returns match: False.
-    #         Call 2 for "Fusion releases energy." returns match: False.
-    #         Call 3 for "The sun provides heat and light." returns match: True.
-    #
-    # For Question 2:
-    #   - One call for answer statement returns match: True.
-    #   - Two calls for ground truth statements:
-    #         Call 1 for "The boiling point of water is 100 degrees Celsius at sea level." returns match: True.
-    #         Call 2 for "Boiling point can change with altitude." returns match: False.
+    # Mock classification: the statements of all questions are classified in one run.
+    # Each question has one input with its answer statements and one with its ground truth statements.
     evaluator._statement_classifier.run = MagicMock(
-        side_effect=[
-            # Q1, answer statement call 1:
-            {"results": [{"match": False, "reasoning": "Mismatch: expected fusion but found fission."}]},
-            # Q1, answer statement call 2:
-            {"results": [{"match": True, "reasoning": "Supported: provides light."}]},
-            # Q1, ground truth statement call 1:
-            {"results": [{"match": False, "reasoning": "Mismatch: answer omits fusion."}]},
-            # Q1, ground truth statement call 2:
-            {"results": [{"match": False, "reasoning": "Answer does not mention energy release."}]},
-            # Q1, ground truth statement call 3:
-            {"results": [{"match": True, "reasoning": "Matches: answer supports the provision of light."}]},
-            # Q2, answer statement call:
-            {"results": [{"match": True, "reasoning": "Correct: statement matches."}]},
-            # Q2, ground truth statement call 1:
-            {"results": [{"match": True, "reasoning": "Exact match."}]},
-            # Q2, ground truth statement call 2:
-            {"results": [{"match": False, "reasoning": "Detail not mentioned in answer."}]},
-        ]
+        return_value={
+            "results": [
+                # Q1, answer statements:
+                {
+                    "classifications": [
+                        {"match": False, "reasoning": "Mismatch: expected fusion but found fission."},
+                        {"match": True, "reasoning": "Supported: provides light."},
+                    ]
+                },
+                # Q1, ground truth statements:
+                {
+                    "classifications": [
+                        {"match": False, "reasoning": "Mismatch: answer omits fusion."},
+                        {"match": False, "reasoning": "Answer does not mention energy release."},
+                        {"match": True, "reasoning": "Matches: answer supports the provision of light."},
+                    ]
+                },
+                # Q2, answer statements:
+                {"classifications": [{"match": True, "reasoning": "Correct: statement matches."}]},
+                # Q2, ground truth statements:
+                {
+                    "classifications": [
+                        {"match": True, "reasoning": "Exact match."},
+                        {"match": False, "reasoning": "Detail not mentioned in answer."},
+                    ]
+                },
+            ]
+        }
     )
 
     # Run the evaluator
@@ -144,3 +129,70 @@ def test_answer_correctness_evaluator(openai_node):
     computed_scores = [result.score for result in correctness_scores.results]
     for computed, expected in zip(computed_scores, expected_scores):
         assert abs(computed - expected) < 0.01, f"Expected {expected}, got {computed}"
+
+    evaluator._statement_extractor.run.assert_called_once_with(
+        questions=questions * 2, texts=answers + ground_truth_answers
+    )
+    evaluator._statement_classifier.run.assert_called_once()
+
+
+def test_answer_correctness_evaluator_batches_statements(openai_node):
+    evaluator = AnswerCorrectnessEvaluator(llm=openai_node, statements_per_prompt=2)
+    answer_statements = [f"Statement {idx}." for idx in range(5)]
+    evaluator._statement_classifier.run = MagicMock(
+        return_value={
+            "results": [
+                {"classifications": [{"match": True, "reasoning": "Supported."}] * 2},
+                {"classifications": [{"match": True, "reasoning": "Supported."}] * 2},
+                # The last batch misses a classification, so its statement is not supported
+                {"classifications": []},
+                {"classifications": [{"match": True, "reasoning": "Supported."}]},
+            ]
+        }
+    )
+
+    classified = evaluator.classify_statements(
+        questions=["Question 1", "Question 2"],
+        statements_list=[answer_statements, ["Statement 5."]],
+        ref_texts=["Reference 1", "Reference 2"],
+    )
+
+    call_kwargs = evaluator._statement_classifier.run.call_args.kwargs
+    assert call_kwargs["answer_statements"] == [
+        ["Statement 0.", "Statement 1."],
+        ["Statement 2.", "Statement 3."],
+        ["Statement 4."],
+        ["Statement 5."],
+    ]
+    assert call_kwargs["question"] == ["Question 1", "Question 1", "Question 1", "Question 2"]
+    assert [match for match, _ in classified[0]] == [True, True, True, True, False]
+    assert classified[1] == [(True, "Supported.")]
+
+
+def test_answer_correctness_evaluator_matches_classifications_by_statement(openai_node):
+    evaluator = AnswerCorrectnessEvaluator(llm=openai_node, statements_per_prompt=3)
+    evaluator._statement_classifier.run = MagicMock(
+        return_value={
+            "results": [
+                {
+                    "classifications": [
+                        {"statement": "statement 2.", "match": True, "reasoning": "Second."},
+                        {"statement": "Unknown statement.", "match": True, "reasoning": "Unknown."},
+                        {"match": True, "reasoning": "Third by position."},
+                    ]
+                },
+            ]
+        }
+    )
+
+    classified = evaluator.classify_statements(
+        questions=["Question"],
+        statements_list=[["Statement 1.", "Statement 2.", "Statement 3."]],
+        ref_texts=["Reference"],
+    )
+
+    assert classified[0] == [
+        (False, "No classification returned for the statement."),
+        (True, "Second."),
+        (True, "Third by position."),
+    ]
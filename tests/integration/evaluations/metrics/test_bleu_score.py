@@ -27,3 +27,29 @@ def test_bleu_score_evaluator():
     expected_scores = [1.0, 0.37, 0.26]  # Replace with actual printed scores
     for computed, expected in zip(bleu_scores, expected_scores):
         assert abs(computed - expected) < 0.01, f"Expected {expected}, got {computed}"
+
+
+def test_bleu_score_evaluator_batch_matches_single_runs(monkeypatch):
+    """
+    Test that batch BLEU scores computed in worker processes match scores of single pairs.
+    """
+    monkeypatch.setattr("dynamiq.evaluations.base_evaluator.MIN_PAIRS_PER_PROCESS", 2)
+    ground_truth_answers = [
+        "The cat sits on the mat. It is sleeping.",
+        "snake_case names are common in Python. They use underscores.",
+        "Paris is the capital of France!",
+        "Water boils at 100 degrees Celsius? Yes, at sea level.",
+    ]
+    answers = [
+        "The cat sleeps on the mat. It is tired.",
+        "snake_case names are popular in Python.",
+        "The capital of France is Paris.",
+        "Water boils at 100 degrees. Only at sea level.",
+    ]
+    bleu_evaluator = BleuScoreEvaluator(workers=2)
+
+    bleu_scores = bleu_evaluator.run(ground_truth_answers=ground_truth_answers, answers=answers)
+
+    assert bleu_scores == [
+        bleu_evaluator.run_single(ground_truth_answer=gt, answer=ans) for gt, ans in zip(ground_truth_answers, answers)
+    ]
@@ -121,7 +121,10 @@ def test_context_precision_evaluator(openai_node):
         },
     ]
 
-    evaluator._context_precision_evaluator.run = MagicMock(side_effect=mocked_run_results)
+    # All inputs are evaluated in one run
+    evaluator._context_precision_evaluator.run = MagicMock(
+        return_value={"results": [result for run_result in mocked_run_results for result in run_result["results"]]}
+    )
 
     output = evaluator.run(
         questions=questions,
@@ -176,7 +179,10 @@ def test_context_precision_evaluator_single_list_of_contexts(openai_node):
         },
     ]
 
-    evaluator._context_precision_evaluator.run = MagicMock(side_effect=mocked_run_results)
+    # All inputs are evaluated in one run
+    evaluator._context_precision_evaluator.run = MagicMock(
+        return_value={"results": [result for run_result in mocked_run_results for result in run_result["results"]]}
+    )
 
     output = evaluator.run(
         questions=question,
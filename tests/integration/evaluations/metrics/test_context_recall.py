@@ -33,8 +33,7 @@ def test_context_recall_evaluator(openai_node):
 
     evaluator = ContextRecallEvaluator(llm=openai_node)
 
-    # Prepare the mocked results for each classification call.
-    # There will be one call per question.
+    # Prepare the mocked classification results, one per question.
     mocked_run_results = [
         # For the first question:
         {
@@ -91,7 +90,10 @@ def test_context_recall_evaluator(openai_node):
         },
     ]
 
-    evaluator._classification_evaluator.run = MagicMock(side_effect=mocked_run_results)
+    # All inputs are evaluated in one run
+    evaluator._classification_evaluator.run = MagicMock(
+        return_value={"results": [result for run_result in mocked_run_results for result in run_result["results"]]}
+    )
 
     output = evaluator.run(
         questions=questions,
@@ -201,7 +203,10 @@ def test_context_recall_evaluator_with_list_of_lists_of_contexts(openai_node):
         },
     ]
 
-    evaluator._classification_evaluator.run = MagicMock(side_effect=mocked_run_results)
+    # All inputs are evaluated in one run
+    evaluator._classification_evaluator.run = MagicMock(
+        return_value={"results": [result for run_result in mocked_run_results for result in run_result["results"]]}
+    )
 
     output = evaluator.run(
         questions=questions,
@@ -39,96 +39,84 @@ def test_faithfulness_evaluator(openai_node):
 
     # Mock the statement simplifier
     evaluator._statement_simplifier.run = MagicMock(
-        side_effect=[
-            # First call: simplify statements for the first answer
-            {
-                "results": [
-                    {
-                        "statements": [
-                            "Albert Einstein was a German-born theoretical physicist.",
-                            "He is widely acknowledged to be one of the greatest and "
-                            "most influential physicists of all time.",
-                            "He was best known for developing the theory of relativity.",
-                            "He also made important contributions to the development of "
-                            "the theory of quantum mechanics.",
-                        ]
-                    }
-                ]
-            },
-            # Second call: simplify statements for the second answer
-            {
-                "results": [
-                    {
-                        "statements": [
-                            "The Great Wall of China is a large wall in China.",
-                            "It was built to keep out invaders.",
-                            "It is visible from space.",
-                        ]
-                    }
-                ]
-            },
-        ]
+        return_value={
+            "results": [
+                # Statements of the first answer
+                {
+                    "statements": [
+                        "Albert Einstein was a German-born theoretical physicist.",
+                        "He is widely acknowledged to be one of the greatest and "
+                        "most influential physicists of all time.",
+                        "He was best known for developing the theory of relativity.",
+                        "He also made important contributions to the development of "
+                        "the theory of quantum mechanics.",
+                    ]
+                },
+                # Statements of the second answer
+                {
+                    "statements": [
+                        "The Great Wall of China is a large wall in China.",
+                        "It was built to keep out invaders.",
+                        "It is visible from space.",
+                    ]
+                },
+            ]
+        }
     )
 
     # Mock the NLI evaluator
     evaluator._nli_evaluator.run = MagicMock(
-        side_effect=[
-            # First call: Check faithfulness for the first question
-            {
-                "results": [
-                    {
-                        "results": [
-                            {
-                                "statement": "Albert Einstein was a German-born theoretical physicist.",
-                                "verdict": "1",
-                                "reason": "This is mentioned in the context.",
-                            },
-                            {
-                                "statement": "He is widely acknowledged to be one of the greatest and "
-                                "most influential physicists of all time.",
-                                "verdict": "1",
-                                "reason": "This is mentioned in the context.",
-                            },
-                            {
-                                "statement": "He was best known for developing the theory of relativity.",
-                                "verdict": "1",
-                                "reason": "This is mentioned in the context.",
-                            },
-                            {
-                                "statement": "He also made important contributions to the development of "
-                                "the theory of quantum mechanics.",
-                                "verdict": "1",
-                                "reason": "This is mentioned in the context.",
-                            },
-                        ]
-                    }
-                ]
-            },
-            # Second call: Check faithfulness for the second question
-            {
-                "results": [
-                    {
-                        "results": [
-                            {
-                                "statement": "The Great Wall of China is a large wall in China.",
-                                "verdict": "1",
-                                "reason": "This is consistent with the context.",
-                            },
-                            {
-                                "statement": "It was built to keep out invaders.",
-                                "verdict": "1",
-                                "reason": "This is mentioned in the context.",
-                            },
-                            {
-                                "statement": "It is visible from space.",
-                                "verdict": "0",
-                                "reason": "The context does not mention this, and it is a common myth.",
-                            },
-                        ]
-                    }
-                ]
-            },
-        ]
+        return_value={
+            "results": [
+                # Faithfulness of the first answer
+                {
+                    "results": [
+                        {
+                            "statement": "Albert Einstein was a German-born theoretical physicist.",
+                            "verdict": "1",
+                            "reason": "This is mentioned in the context.",
+                        },
+                        {
+                            "statement": "He is widely acknowledged to be one of the greatest and "
+                            "most influential physicists of all time.",
+                            "verdict": "1",
+                            "reason": "This is mentioned in the context.",
+                        },
+                        {
+                            "statement": "He was best known for developing the theory of relativity.",
+                            "verdict": "1",
+                            "reason": "This is mentioned in the context.",
+                        },
+                        {
+                            "statement": "He also made important contributions to the development of "
+                            "the theory of quantum mechanics.",
+                            "verdict": "1",
+                            "reason": "This is mentioned in the context.",
+                        },
+                    ]
+                },
+                # Faithfulness of the second answer
+                {
+                    "results": [
+                        {
+                            "statement": "The Great Wall of China is a large wall in China.",
+                            "verdict": "1",
+                            "reason": "This is consistent with the context.",
+                        },
+                        {
+                            "statement": "It was built to keep out invaders.",
+                            "verdict": "1",
+                            "reason": "This is mentioned in the context.",
+                        },
+                        {
+                            "statement": "It is visible from space.",
+                            "verdict": "0",
+                            "reason": "The context does not mention this, and it is a common myth.",
+                        },
+                    ]
+                },
+            ]
+        }
     )
 
     # Run the evaluator
@@ -187,94 +175,82 @@ def test_faithfulness_evaluator_with_list_of_lists(openai_node):
 
     # Mock the statement simplifier
     evaluator._statement_simplifier.run = MagicMock(
-        side_effect=[
-            # First call: simplify statements for the first answer
-            {
-                "results": [
-                    {
-                        "statements": [
-                            "Albert Einstein was a German-born theoretical physicist.",
-                            "He is widely acknowledged to be one of the most influential physicists of all time.",
-                            "He was best known for developing the theory of relativity.",
-                            "He made important contributions to the development of the theory of quantum mechanics.",
-                        ]
-                    }
-                ]
-            },
-            # Second call: simplify statements for the second answer
-            {
-                "results": [
-                    {
-                        "statements": [
-                            "The Great Wall of China is a large wall in China.",
-                            "It was built to keep out invaders.",
-                            "It is visible from space.",
-                        ]
-                    }
-                ]
-            },
-        ]
+        return_value={
+            "results": [
+                # Statements of the first answer
+                {
+                    "statements": [
+                        "Albert Einstein was a German-born theoretical physicist.",
+                        "He is widely acknowledged to be one of the most influential physicists of all time.",
+                        "He was best known for developing the theory of relativity.",
+                        "He made important contributions to the development of the theory of quantum mechanics.",
+                    ]
+                },
+                # Statements of the second answer
+                {
+                    "statements": [
+                        "The Great Wall of China is a large wall in China.",
+                        "It was built to keep out invaders.",
+                        "It is visible from space.",
+                    ]
+                },
+            ]
+        }
     )
 
     # Mock the NLI evaluator
     evaluator._nli_evaluator.run = MagicMock(
-        side_effect=[
-            # First call: Check faithfulness for the first question
-            {
-                "results": [
-                    {
-                        "results": [
-                            {
-                                "statement": "Albert Einstein was a German-born theoretical physicist.",
-                                "verdict": "1",
-                                "reason": "This is mentioned in the context.",
-                            },
-                            {
-                                "statement": "He is widely acknowledged to be one of the greatest and "
-                                "most influential physicists of all time.",
-                                "verdict": "1",
-                                "reason": "This is mentioned in the context.",
-                            },
-                            {
-                                "statement": "He was best known for developing the theory of relativity.",
-                                "verdict": "1",
-                                "reason": "This is mentioned in the context.",
-                            },
-                            {
-                                "statement": "He also made important contributions to the development of "
-                                "the theory of quantum mechanics.",
-                                "verdict": "1",
-                                "reason": "This is mentioned in the context.",
-                            },
-                        ]
-                    }
-                ]
-            },
-            # Second call: Check faithfulness for the second question
-            {
-                "results": [
-                    {
-                        "results": [
-                            {
-                                "statement": "The Great Wall of China is a large wall in China.",
-                                "verdict": "1",
-                                "reason": "This is consistent with the context.",
-                            },
-                            {
-                                "statement": "It was built to keep out invaders.",
-                                "verdict": "1",
-                                "reason": "This is mentioned in the context.",
-                            },
-                            {
-                                "statement": "It is visible from space.",
-                                "verdict": "0",
-                                "reason": "The context does not mention this, and it is a common myth.",
-                            },
-                        ]
-                    }
-                ]
-            },
-        ]
+        return_value={
+            "results": [
+                # Faithfulness of the first answer
+                {
+                    "results": [
+                        {
+                            "statement": "Albert Einstein was a German-born theoretical physicist.",
+                            "verdict": "1",
+                            "reason": "This is mentioned in the context.",
+                        },
+                        {
+                            "statement": "He is widely acknowledged to be one of the greatest and "
+                            "most influential physicists of all time.",
+                            "verdict": "1",
+                            "reason": "This is mentioned in the context.",
+                        },
+                        {
+                            "statement": "He was best known for developing the theory of relativity.",
+                            "verdict": "1",
+                            "reason": "This is mentioned in the context.",
+                        },
+                        {
+                            "statement": "He also made important contributions to the development of "
+                            "the theory of quantum mechanics.",
+                            "verdict": "1",
+                            "reason": "This is mentioned in the context.",
+                        },
+                    ]
+                },
+                # Faithfulness of the second answer
+                {
+                    "results": [
+                        {
+                            "statement": "The Great Wall of China is a large wall in China.",
+                            "verdict": "1",
+                            "reason": "This is consistent with the context.",
+                        },
+                        {
+                            "statement": "It was built to keep out invaders.",
+                            "verdict": "1",
+                            "reason": "This is mentioned in the context.",
+                        },
+                        {
+                            "statement": "It is visible from space.",
+                            "verdict": "0",
+                            "reason": "The context does not mention this, and it is a common myth.",
+                        },
+                    ]
+                },
+            ]
+        }
     )
 
     # Run the evaluator with contexts passed as list[list[str]]
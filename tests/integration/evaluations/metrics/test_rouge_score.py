@@ -64,3 +64,32 @@ def test_rouge_score_evaluator_empty_strings():
 
     for computed, expected in zip(rouge_scores, expected_scores):
         assert abs(computed - expected) < 0.01, f"Expected {expected}, got {computed}"
+
+
+def test_rouge_score_evaluator_batch_matches_rouge_scorer(monkeypatch):
+    """
+    Test that batch ROUGE scores computed in worker processes match the default rouge_score scorer.
+    """
+    from rouge_score import rouge_scorer
+
+    monkeypatch.setattr("dynamiq.evaluations.base_evaluator.MIN_PAIRS_PER_PROCESS", 2)
+    ground_truth_answers = [
+        "The runners were running quickly through the generously sized park.",
+        "Artificial intelligence is transforming the world.",
+        "Stemming reduces inflected words to their stems.",
+        "",
+    ]
+    answers = [
+        "A runner runs quick in the park.",
+        "AI transforms the world.",
+        "Stemmers reduce inflections of words.",
+        "Nothing to compare.",
+    ]
+    scorer = rouge_scorer.RougeScorer(["rougeL"], use_stemmer=True)
+    rouge_evaluator = RougeScoreEvaluator(workers=2)
+
+    rouge_scores = rouge_evaluator.run(ground_truth_answers=ground_truth_answers, answers=answers)
+
+    assert rouge_scores == [
+        round(scorer.score(gt, ans)["rougeL"].fmeasure, 2) for gt, ans in zip(ground_truth_answers, answers)
+    ]
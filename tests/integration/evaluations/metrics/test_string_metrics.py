@@ -1,3 +1,5 @@
+import pytest
+
 from dynamiq.evaluations.metrics import (
     DistanceMeasure,
     ExactMatchEvaluator,
@@ -178,3 +180,20 @@ def test_string_similarity_evaluator_jaro_winkler():
     expected_scores = [1.0, 0.81, 0.89]
     for computed, expected in zip(similarity_scores, expected_scores):
         assert abs(computed - expected) < 0.01, f"Expected {expected}, got {computed}"
+
+
+@pytest.mark.parametrize("distance_measure", list(DistanceMeasure))
+def test_string_similarity_evaluator_batch_matches_single_runs(distance_measure):
+    """
+    Test that vectorised similarity scores of the batch run match scores of single pairs.
+    """
+    ground_truth_answers = ["The cat sits on the mat.", "Kitten", "", "Hamming distance", "Paris"]
+    answers = ["The cat sat on a mat.", "Sitting", "", "Hamming distances", "London"]
+    evaluator = StringSimilarityEvaluator(distance_measure=distance_measure, workers=2)
+
+    similarity_scores = evaluator.run(ground_truth_answers=ground_truth_answers, answers=answers)
+
+    assert similarity_scores == [
+        evaluator.run_single(ground_truth_answer=gt, answer=ans) for gt, ans in zip(ground_truth_answers, answers)
+    ]
+    assert evaluator.run(ground_truth_answers=[], answers=[]) == []
@@ -0,0 +1,108 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from dynamiq.cache import FileCacheConfig, SQLiteCacheConfig
+from dynamiq.evaluations import CheckpointConfig, EvaluationCheckpoint, LLMEvaluator
+from dynamiq.evaluations.metrics import ContextRecallEvaluator, FactualCorrectnessEvaluator
+from dynamiq.nodes.llms import BaseLLM
+
+QUESTIONS = ["Who wrote Hamlet?", "What is the capital of France?", "When did World War II end?"]
+CONTEXTS = ["Hamlet was written by Shakespeare.", "Paris is the capital of France.", "World War II ended in 1945."]
+ANSWERS = ["Shakespeare wrote Hamlet.", "The capital of France is Paris.", "It ended in 1945."]
+
+
+def classify(question, context, answer):
+    # Attribute every answer to the context
+    return {
+        "results": [
+            {"classifications": [{"statement": text, "reason": "Supported by the context.", "attributed": 1}]}
+            for text in answer
+        ]
+    }
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def checkpoint_config(request, tmp_path):
+    if request.param == "sqlite":
+        return CheckpointConfig(backend=SQLiteCacheConfig(db_path=str(tmp_path / "evaluations.db")), chunk_size=1)
+    return CheckpointConfig(backend=FileCacheConfig(directory=str(tmp_path / "evaluations")), chunk_size=1)
+
+
+def test_rerun_skips_stored_samples(openai_node, checkpoint_config):
+    evaluator = ContextRecallEvaluator(llm=openai_node, checkpoint=checkpoint_config)
+    evaluator._classification_evaluator.run = MagicMock(side_effect=classify)
+    first_output = evaluator.run(questions=QUESTIONS[:2], contexts=CONTEXTS[:2], answers=ANSWERS[:2])
+
+    evaluator = ContextRecallEvaluator(llm=openai_node, checkpoint=checkpoint_config)
+    evaluator._classification_evaluator.run = MagicMock(side_effect=classify)
+    output = evaluator.run(questions=QUESTIONS, contexts=CONTEXTS, answers=ANSWERS)
+
+    # Only the new sample is evaluated
+    evaluator._classification_evaluator.run.assert_called_once_with(
+        question=QUESTIONS[2:], context=CONTEXTS[2:], answer=ANSWERS[2:]
+    )
+    assert output.results[:2] == first_output.results
+    assert [result.score for result in output.results] == [1.0, 1.0, 1.0]
+
+
+def test_failed_run_keeps_completed_chunks(openai_node, checkpoint_config):
+    evaluator = ContextRecallEvaluator(llm=openai_node, checkpoint=checkpoint_config)
+    evaluator._classification_evaluator.run = MagicMock(
+        side_effect=[
+            classify(question=QUESTIONS[:1], context=CONTEXTS[:1], answer=ANSWERS[:1]),
+            ValueError("Rate limit exceeded"),
+        ]
+    )
+
+    with pytest.raises(ValueError):
+        evaluator.run(questions=QUESTIONS, contexts=CONTEXTS, answers=ANSWERS)
+
+    evaluator._classification_evaluator.run = MagicMock(side_effect=classify)
+    output = evaluator.run(questions=QUESTIONS, contexts=CONTEXTS, answers=ANSWERS)
+
+    assert [call.kwargs["question"] for call in evaluator._classification_evaluator.run.call_args_list] == [
+        QUESTIONS[1:2],
+        QUESTIONS[2:],
+    ]
+    assert len(output.results) == 3
+
+
+def test_results_depend_on_run_settings(openai_node, checkpoint_config):
+    evaluator = FactualCorrectnessEvaluator(llm=openai_node, checkpoint=checkpoint_config)
+    evaluator._claim_decomposer.run = MagicMock(
+        return_value={"results": [{"claims": ["Shakespeare wrote Hamlet."]}] * 2}
+    )
+    evaluator._nli_evaluator.run = MagicMock(
+        return_value={"results": [{"results": [{"claim": "Shakespeare wrote Hamlet.", "verdict": "1", "reason": ""}]}]}
+    )
+
+    evaluator.run(answers=ANSWERS[:1], contexts=CONTEXTS[:1], mode="precision")
+    evaluator.run(answers=ANSWERS[:1], contexts=CONTEXTS[:1], mode="precision")
+    evaluator._nli_evaluator.run.return_value = {"results": evaluator._nli_evaluator.run.return_value["results"] * 2}
+    evaluator.run(answers=ANSWERS[:1], contexts=CONTEXTS[:1], mode="recall")
+
+    assert evaluator._claim_decomposer.run.call_count == 2
+
+
+def test_llm_judgments_are_memoized(checkpoint_config):
+    mock_llm = MagicMock(spec=BaseLLM)
+    mock_llm.execute.return_value = {"content": '{"score": 1}'}
+
+    def make_evaluator():
+        return LLMEvaluator(
+            instructions="Is the answer correct?",
+            inputs=[{"name": "answers", "type": list[str]}],
+            outputs=[{"name": "score", "type": int}],
+            llm=mock_llm,
+            checkpoint=EvaluationCheckpoint.get_shared(checkpoint_config),
+        )
+
+    make_evaluator().run(answers=ANSWERS[:2])
+    results = make_evaluator().run(answers=ANSWERS)
+
+    assert results == {"results": [{"score": 1}] * 3}
+    assert mock_llm.execute.call_count == 3
+    assert [call.kwargs["input_data"] for call in mock_llm.execute.call_args_list] == [
+        {"answers": answer} for answer in ANSWERS
+    ]
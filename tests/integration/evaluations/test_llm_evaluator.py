@@ -1,5 +1,9 @@
+import random
+import time
 from unittest.mock import MagicMock
 
+from litellm.exceptions import RateLimitError
+
 from dynamiq.evaluations.llm_evaluator import LLMEvaluator
 from dynamiq.nodes.llms import BaseLLM
 
@@ -217,3 +221,49 @@ def test_llm_evaluator_with_placeholders_no_inputs_without_examples():
     expected_results = {"results": [{"quote": "Believe in yourself and all that you are."}]}
 
     assert results == expected_results
+
+
+def test_llm_evaluator_concurrent_inputs_keep_order():
+    # Mock LLM returning the input answer as the score after a random delay
+    def execute(input_data, prompt):
+        time.sleep(0.01 * random.random())
+        return {"content": f'{{"score": {input_data["answers"]}}}'}
+
+    mock_llm = MagicMock(spec=BaseLLM)
+    mock_llm.execute.side_effect = execute
+
+    evaluator = LLMEvaluator(
+        instructions="Return the answer as the score.",
+        inputs=[{"name": "answers", "type": list[str]}],
+        outputs=[{"name": "score", "type": int}],
+        llm=mock_llm,
+        max_concurrency=4,
+    )
+
+    results = evaluator.run(answers=[str(idx) for idx in range(20)])
+
+    assert results == {"results": [{"score": idx} for idx in range(20)]}
+    assert mock_llm.execute.call_count == 20
+
+
+def test_llm_evaluator_retries_rate_limited_calls():
+    # Mock LLM rejecting the first two calls with a rate limit error
+    mock_llm = MagicMock(spec=BaseLLM)
+    mock_llm.execute.side_effect = [
+        RateLimitError(message="Rate limit exceeded", llm_provider="openai", model="gpt-4o"),
+        RateLimitError(message="Rate limit exceeded", llm_provider="openai", model="gpt-4o"),
+        {"content": '{"score": 1}'},
+    ]
+
+    evaluator = LLMEvaluator(
+        instructions="Is the answer correct?",
+        inputs=[{"name": "answers", "type": list[str]}],
+        outputs=[{"name": "score", "type": int}],
+        llm=mock_llm,
+        retry_delay=0,
+    )
+
+    results = evaluator.run(answers=["Kyiv is the capital of Ukraine"])
+
+    assert results == {"results": [{"score": 1}]}
+    assert mock_llm.execute.call_count == 3
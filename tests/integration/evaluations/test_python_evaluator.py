@@ -1,6 +1,13 @@
 import pytest
 
 from dynamiq.evaluations import PythonEvaluator
+from dynamiq.nodes.tools.python import PythonProcessPool, PythonProcessPoolConfig
+
+
+@pytest.fixture
+def shared_pools():
+    yield
+    PythonProcessPool.clear_shared()
 
 
 def test_python_evaluator_perfect_matches():
@@ -99,3 +106,66 @@ def evaluate(answer, expected):
     evaluator = PythonEvaluator(code=user_code)
     with pytest.raises(ValueError, match="non-numeric"):
         evaluator.run_single(input_data)
+
+
+def test_python_evaluator_process_pool_matches_in_thread(shared_pools):
+    user_code = """
+import math
+
+def evaluate(answer, expected=1):
+    return math.sqrt(answer) / expected
+"""
+    input_data_list = [{"answer": idx, "expected": idx % 3 + 1} for idx in range(20)]
+    process_pool = PythonProcessPoolConfig(workers=2, chunk_size=3, min_calls=1)
+
+    scores = PythonEvaluator(code=user_code, process_pool=process_pool).run(input_data_list=input_data_list)
+
+    assert scores == PythonEvaluator(code=user_code).run(input_data_list=input_data_list)
+
+
+def test_python_evaluator_process_pool_reports_failed_input(shared_pools):
+    user_code = """
+def evaluate(answer):
+    return 1.0 / answer
+"""
+    evaluator = PythonEvaluator(code=user_code, process_pool=PythonProcessPoolConfig(workers=2, min_calls=1))
+
+    with pytest.raises(ValueError, match="Failed processing input 4: Error during evaluation: float division by zero"):
+        evaluator.run(input_data_list=[{"answer": answer} for answer in [1, 2, 3, 0, 5]])
+
+
+def test_python_evaluator_process_pool_small_batch_runs_in_thread(shared_pools):
+    user_code = """
+def evaluate(answer):
+    return answer
+"""
+    evaluator = PythonEvaluator(code=user_code, process_pool=PythonProcessPoolConfig(min_calls=10))
+
+    assert evaluator.run(input_data_list=[{"answer": 1}, {"answer": 2}]) == [1.0, 2.0]
+    assert all(worker.process is None for pool in PythonProcessPool._shared.values() for worker in pool._workers)
+
+
+def test_python_evaluator_process_pool_cpu_timeout(shared_pools):
+    user_code = """
+def evaluate(answer):
+    while answer:
+        pass
+    return 1.0
+"""
+    evaluator = PythonEvaluator(code=user_code, process_pool=PythonProcessPoolConfig(workers=1, cpu_timeout=0.2))
+
+    with pytest.raises(ValueError, match="Failed processing input 2: .*CPU time limit"):
+        evaluator.run(input_data_list=[{"answer": 0}, {"answer": 1}])
+    assert evaluator.run(input_data_list=[{"answer": 0}]) == [1.0]
+
+
+def test_python_evaluator_process_pool_kills_stuck_worker(shared_pools):
+    user_code = """
+def evaluate(answer):
+    return sum(range(answer))
+"""
+    evaluator = PythonEvaluator(code=user_code, process_pool=PythonProcessPoolConfig(workers=1, timeout=0.1))
+
+    with pytest.raises(ValueError, match="worker was killed"):
+        evaluator.run(input_data_list=[{"answer": 10**12}])
+    assert evaluator.run(input_data_list=[{"answer": 3}]) == [3.0]
@@ -1,4 +1,6 @@
+import asyncio
 import json
+import time
 import uuid
 from io import BytesIO
 from unittest import mock
@@ -9,7 +11,10 @@ import pytest
 from dynamiq import Workflow, flows
 from dynamiq.callbacks import TracingCallbackHandler
 from dynamiq.callbacks.tracing import RunStatus
-from dynamiq.nodes.node import NodeDependency
+from dynamiq.executors.config import ExecutorPoolConfig
+from dynamiq.executors.registry import TIMEOUT_EXECUTOR_POOL_NAME, ExecutorPoolRegistry
+from dynamiq.nodes import NodeGroup
+from dynamiq.nodes.node import ErrorHandling, Node, NodeDependency
 from dynamiq.nodes.utils import Output
 from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
 from dynamiq.utils import format_value
@@ -282,7 +287,6 @@ async def test_workflow_with_depend_nodes_with_tracing_async(
             frequency_penalty=None,
             top_p=None,
             api_key=openai_node.connection.api_key,
-            client=ANY,
             response_format=None,
             drop_params=True,
             api_base="https://api.openai.com/v1",
@@ -585,3 +589,178 @@ def test_workflow_with_input_mappings(
 
     assert response == RunnableResult(status=RunnableStatus.SUCCESS, input=input_data, output=expected_output)
     assert json.dumps({"runs": [run.to_dict() for run in tracing.runs.values()]}, cls=JsonWorkflowEncoder)
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+def test_workflow_with_event_driven_scheduling(
+    openai_node,
+    anthropic_node_with_dependency,
+    output_node,
+    mock_llm_response_text,
+    mock_llm_executor,
+    is_async,
+):
+    input_data = {"a": 1}
+    batch_wf = Workflow(flow=flows.Flow(nodes=[openai_node, anthropic_node_with_dependency, output_node]))
+    event_driven_wf = Workflow(
+        flow=flows.Flow(
+            nodes=[openai_node, anthropic_node_with_dependency, output_node],
+            scheduling_mode=flows.FlowSchedulingMode.EVENT_DRIVEN,
+        )
+    )
+
+    if is_async:
+        expected_response = asyncio.run(batch_wf.run_async(input_data=input_data))
+        response = asyncio.run(event_driven_wf.run_async(input_data=input_data))
+    else:
+        expected_response = batch_wf.run_sync(input_data=input_data)
+        response = event_driven_wf.run_sync(input_data=input_data)
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response == expected_response
+    assert mock_llm_executor.call_count == 4
+
+
+class SleepNode(Node):
+    group: NodeGroup = NodeGroup.UTILS
+    delay: float = 0
+
+    def execute(self, input_data, config=None, **kwargs):
+        time.sleep(self.delay)
+        return {"finished_at": time.monotonic()}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("scheduling_mode", "is_dependant_waiting"),
+    [(flows.FlowSchedulingMode.BATCH, True), (flows.FlowSchedulingMode.EVENT_DRIVEN, False)],
+)
+async def test_flow_async_event_driven_scheduling_does_not_wait_for_wave(scheduling_mode, is_dependant_waiting):
+    fast_node = SleepNode(delay=0.01)
+    slow_node = SleepNode(delay=0.3)
+    dependant_node = SleepNode(delay=0).depends_on(fast_node)
+    flow = flows.Flow(nodes=[fast_node, slow_node, dependant_node], scheduling_mode=scheduling_mode)
+
+    response = await flow.run_async(input_data={})
+
+    assert response.status == RunnableStatus.SUCCESS
+    slow_finished_at = response.output[slow_node.id]["output"]["finished_at"]
+    dependant_finished_at = response.output[dependant_node.id]["output"]["finished_at"]
+    assert (dependant_finished_at > slow_finished_at) is is_dependant_waiting
+
+
+def test_flow_event_driven_scheduling_with_executor_failure(mocker):
+    first_node = SleepNode()
+    second_node = SleepNode().depends_on(first_node)
+    flow = flows.Flow(nodes=[first_node, second_node], scheduling_mode=flows.FlowSchedulingMode.EVENT_DRIVEN)
+    mocker.patch.object(SleepNode, "run_sync", side_effect=ValueError("Error"))
+
+    response = flow.run_sync(input_data={})
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[first_node.id]["status"] == RunnableStatus.FAILURE.value
+    assert response.output[second_node.id]["status"] == RunnableStatus.FAILURE.value
+
+
+class CancelledNode(SleepNode):
+    async def run_async(self, *args, **kwargs):
+        raise asyncio.CancelledError
+
+
+@pytest.mark.asyncio
+async def test_flow_async_event_driven_scheduling_with_cancelled_node():
+    first_node = CancelledNode()
+    second_node = SleepNode().depends_on(first_node)
+    flow = flows.Flow(nodes=[first_node, second_node], scheduling_mode=flows.FlowSchedulingMode.EVENT_DRIVEN)
+
+    response = await asyncio.wait_for(flow.run_async(input_data={}), timeout=5)
+
+    assert response.status == RunnableStatus.SUCCESS
+    assert response.output[first_node.id]["status"] == RunnableStatus.FAILURE.value
+    assert second_node.id in response.output
+
+
+def test_flow_event_driven_scheduling_with_dependency_outside_flow():
+    outside_node = SleepNode()
+    node = SleepNode()
+    flow = flows.Flow(nodes=[node], scheduling_mode=flows.FlowSchedulingMode.EVENT_DRIVEN)
+    node.depends_on(outside_node)
+
+    with pytest.raises(ValueError, match="not present in the flow"):
+        flow._get_nodes_dependants()
+
+
+def test_flow_with_shared_executor_pool():
+    first_node = SleepNode()
+    second_node = SleepNode().depends_on(first_node)
+    flow = flows.Flow(nodes=[first_node, second_node])
+    config = RunnableConfig(executor_pool=ExecutorPoolConfig(enabled=True, name="test-flow", max_workers=2))
+
+    try:
+        for _ in range(3):
+            response = flow.run_sync(input_data={}, config=config)
+            assert response.status == RunnableStatus.SUCCESS
+
+        pool = ExecutorPoolRegistry.get_pool(name="test-flow")
+        metrics = pool.get_metrics()
+        assert not pool.is_shutdown
+        assert metrics.max_workers == 2
+        assert metrics.submitted == 6
+        assert metrics.completed == 6
+    finally:
+        ExecutorPoolRegistry.shutdown(name="test-flow")
+
+
+def test_node_timeout_uses_shared_timeout_pool():
+    node = SleepNode(delay=1, error_handling=ErrorHandling(timeout_seconds=0.05))
+    submitted = ExecutorPoolRegistry.get_timeout_pool().get_metrics().submitted
+
+    time_start = time.monotonic()
+    response = node.run_sync(input_data={})
+
+    assert response.status == RunnableStatus.FAILURE
+    assert response.output["error_type"] == "TimeoutError"
+    assert time.monotonic() - time_start < 1
+    assert ExecutorPoolRegistry.get_timeout_pool().get_metrics().submitted == submitted + 1
+
+
+class ParentNode(Node):
+    group: NodeGroup = NodeGroup.UTILS
+    child: Node
+
+    def execute(self, input_data, config=None, **kwargs):
+        return self.child.run_sync(input_data={}, config=config).output
+
+
+def test_nested_node_timeouts_do_not_wait_for_parent_worker():
+    config = RunnableConfig(executor_pool=ExecutorPoolConfig(timeout_max_workers=1))
+    child = SleepNode(delay=0.05, error_handling=ErrorHandling(timeout_seconds=1))
+    parent = ParentNode(child=child, error_handling=ErrorHandling(timeout_seconds=3))
+    ExecutorPoolRegistry.shutdown(name=TIMEOUT_EXECUTOR_POOL_NAME)
+
+    try:
+        response = parent.run_sync(input_data={}, config=config)
+
+        assert response.status == RunnableStatus.SUCCESS
+        assert "finished_at" in response.output
+    finally:
+        ExecutorPoolRegistry.shutdown(name=TIMEOUT_EXECUTOR_POOL_NAME)
+
+
+def test_timed_out_node_does_not_hold_timeout_pool_worker():
+    config = RunnableConfig(executor_pool=ExecutorPoolConfig(timeout_max_workers=1))
+    slow_node = SleepNode(delay=0.5, error_handling=ErrorHandling(timeout_seconds=0.05))
+    fast_node = SleepNode(delay=0, error_handling=ErrorHandling(timeout_seconds=0.2))
+    ExecutorPoolRegistry.shutdown(name=TIMEOUT_EXECUTOR_POOL_NAME)
+
+    try:
+        slow_response = slow_node.run_sync(input_data={}, config=config)
+        fast_response = fast_node.run_sync(input_data={}, config=config)
+        metrics = ExecutorPoolRegistry.get_timeout_pool().get_metrics()
+
+        assert slow_response.status == RunnableStatus.FAILURE
+        assert fast_response.status == RunnableStatus.SUCCESS
+        assert metrics.abandoned == 1
+        assert metrics.max_workers == 1
+    finally:
+        ExecutorPoolRegistry.shutdown(name=TIMEOUT_EXECUTOR_POOL_NAME)
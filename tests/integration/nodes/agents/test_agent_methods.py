@@ -1,14 +1,22 @@
+import json
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar, Literal
 from unittest.mock import MagicMock
 
 import pytest
+from litellm import ModelResponse
+from litellm.types.utils import ChatCompletionMessageToolCall, Function
+from pydantic import BaseModel, Field, PrivateAttr
 
 from dynamiq import connections, prompts
+from dynamiq.nodes import Node, NodeGroup
 from dynamiq.nodes.agents.exceptions import ActionParsingException
 from dynamiq.nodes.agents.react import ReActAgent
 from dynamiq.nodes.llms import OpenAI
 from dynamiq.nodes.types import InferenceMode
-from dynamiq.runnables import RunnableStatus
+from dynamiq.runnables import RunnableConfig, RunnableStatus
 
 
 @pytest.fixture
@@ -213,3 +221,128 @@ def test_set_prompt_variable(openai_node, mock_llm_executor):
     prompt = agent.generate_prompt()
 
     assert "Today's date is April 1, 2025" in prompt
+
+
+def test_concurrent_runs_are_isolated(openai_node, mocker):
+    """Test that one agent instance serves concurrent runs without sharing run state."""
+    barrier = threading.Barrier(4, timeout=5)
+
+    def completion(messages, stop=None, **kwargs):
+        barrier.wait()
+        user_input = messages[-1]["content"]
+        model_r = ModelResponse()
+        model_r["choices"][0]["message"]["content"] = f"Thought: I know it.\nAnswer: {user_input}"
+        return model_r
+
+    mock_completion = mocker.patch("dynamiq.nodes.llms.base.BaseLLM._completion", side_effect=completion)
+    agent = ReActAgent(
+        name="Shared Agent",
+        llm=openai_node,
+        tools=[],
+        role="Assist user {{user}}.",
+        inference_mode=InferenceMode.DEFAULT,
+    )
+
+    inputs = [f"question {idx}" for idx in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda text: agent.run(input_data={"input": text, "user": text}), inputs))
+
+    for text, result in zip(inputs, results):
+        assert result.status == RunnableStatus.SUCCESS
+        assert result.output["content"] == text
+        steps = result.output["intermediate_steps"]
+        assert list(steps) == [1]
+        system_message, user_message = steps[1]["input_data"]["prompt"][:2]
+        assert user_message["content"] == text
+        assert f"Assist user {text}." in system_message["content"]
+
+    assert all(call.kwargs["stop"] == ["Observation: ", "\nObservation:"] for call in mock_completion.call_args_list)
+    assert openai_node.stop is None
+    assert "context" not in agent._prompt_blocks
+
+
+class LookupInputSchema(BaseModel):
+    query: str = Field(..., description="Value to look up.")
+
+
+class LookupTool(Node):
+    group: Literal[NodeGroup.TOOLS] = NodeGroup.TOOLS
+    name: str = "Lookup"
+    description: str = "Looks up a value."
+    input_schema: ClassVar[type[LookupInputSchema]] = LookupInputSchema
+    _barrier: threading.Barrier | None = PrivateAttr(default=None)
+
+    def execute(self, input_data: LookupInputSchema, config: RunnableConfig = None, **kwargs):
+        if self._barrier:
+            self._barrier.wait()
+        return {"content": f"value of {input_data.query}"}
+
+
+def make_tool_call_response(*calls: tuple[str, str, dict]) -> ModelResponse:
+    model_r = ModelResponse()
+    model_r.choices[0].message.content = None
+    model_r.choices[0].message.tool_calls = [
+        ChatCompletionMessageToolCall(id=call_id, function=Function(name=name, arguments=json.dumps(arguments)))
+        for call_id, name, arguments in calls
+    ]
+    return model_r
+
+
+def test_function_calling_runs_all_tool_calls_concurrently(openai_node, mocker):
+    """Test that all tool calls of one LLM turn run concurrently and keep their call ids."""
+    tool = LookupTool()
+    # Both calls must be in flight at once to pass the barrier
+    tool._barrier = threading.Barrier(2, timeout=5)
+    responses = [
+        make_tool_call_response(
+            ("call_a", "Lookup", {"thought": "Look up a.", "action_input": {"query": "a"}}),
+            ("call_b", "Lookup", {"thought": "Look up b.", "action_input": {"query": "b"}}),
+        ),
+        make_tool_call_response(("call_c", "provide_final_answer", {"thought": "Done.", "answer": "a and b"})),
+    ]
+    mock_completion = mocker.patch("dynamiq.nodes.llms.base.BaseLLM._completion", side_effect=responses)
+    agent = ReActAgent(
+        name="Parallel Agent", llm=openai_node, tools=[tool], inference_mode=InferenceMode.FUNCTION_CALLING
+    )
+
+    result = agent.run(input_data={"input": "What are a and b?"})
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output["content"] == "a and b"
+    assert mock_completion.call_count == 2
+
+    assistant_message, *tool_messages = mock_completion.call_args_list[1].kwargs["messages"][-3:]
+    assert assistant_message["role"] == prompts.MessageRole.ASSISTANT
+    assert [(call["id"], call["function"]["name"]) for call in assistant_message["tool_calls"]] == [
+        ("call_a", "Lookup"),
+        ("call_b", "Lookup"),
+    ]
+    assert json.loads(assistant_message["tool_calls"][0]["function"]["arguments"])["action_input"] == {"query": "a"}
+    assert [(message["role"], message["tool_call_id"], message["content"]) for message in tool_messages] == [
+        (prompts.MessageRole.TOOL, "call_a", "value of a"),
+        (prompts.MessageRole.TOOL, "call_b", "value of b"),
+    ]
+
+    tool_calls = result.output["intermediate_steps"][1]["model_observation"]["tool_calls"]
+    assert [(call["id"], call["input"], call["output"]) for call in tool_calls] == [
+        ("call_a", {"query": "a"}, "value of a"),
+        ("call_b", {"query": "b"}, "value of b"),
+    ]
+
+
+def test_llm_keeps_tool_calls_to_same_function(openai_node, mocker):
+    """Test that tool calls to the same function are all returned by call id."""
+    mocker.patch(
+        "dynamiq.nodes.llms.base.BaseLLM._completion",
+        return_value=make_tool_call_response(
+            ("call_a", "Lookup", {"query": "a"}),
+            ("call_b", "Lookup", {"query": "b"}),
+        ),
+    )
+
+    result = openai_node.run(input_data={"input": "What are a and b?"})
+
+    assert result.status == RunnableStatus.SUCCESS
+    tool_calls = result.output["tool_calls"]
+    assert list(tool_calls) == ["call_a", "call_b"]
+    assert [call["function"]["arguments"] for call in tool_calls.values()] == [{"query": "a"}, {"query": "b"}]
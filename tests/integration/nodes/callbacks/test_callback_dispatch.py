@@ -0,0 +1,155 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from dynamiq import Workflow
+from dynamiq.callbacks import NodeCallbackEvent, NodeCallbackHandler, TracingCallbackHandler
+from dynamiq.callbacks.tracing import RunType
+from dynamiq.clients import BatchTracingClient, FileTracingClient
+from dynamiq.flows import Flow
+from dynamiq.nodes import NodeGroup
+from dynamiq.nodes.node import Node, NodeMetadata
+from dynamiq.runnables import RunnableConfig, RunnableStatus
+
+
+class StreamNode(Node):
+    group: NodeGroup = NodeGroup.UTILS
+    chunks: int = 3
+
+    def execute(self, input_data, config: RunnableConfig = None, **kwargs):
+        for idx in range(self.chunks):
+            self.run_on_node_execute_stream(config.callbacks, {"idx": idx}, **kwargs)
+        return {"chunks": self.chunks}
+
+
+class RecordingHandler(NodeCallbackHandler):
+    def __init__(self):
+        self.events = []
+        self.serialized = []
+
+    def _record(self, event, serialized):
+        self.events.append(event)
+        self.serialized.append(serialized)
+
+    def on_node_start(self, serialized, input_data, **kwargs):
+        self._record(NodeCallbackEvent.NODE_START, serialized)
+
+    def on_node_execute_stream(self, serialized, chunk=None, **kwargs):
+        self._record(NodeCallbackEvent.NODE_EXECUTE_STREAM, serialized)
+
+    def on_node_end(self, serialized, output_data, **kwargs):
+        self._record(NodeCallbackEvent.NODE_END, serialized)
+
+
+class EndHandler(NodeCallbackHandler):
+    def __init__(self):
+        self.calls = 0
+
+    def on_node_end(self, serialized, output_data, **kwargs):
+        self.calls += 1
+
+
+@pytest.fixture
+def to_dict_spy(mocker):
+    return mocker.spy(StreamNode, "to_dict")
+
+
+def test_no_callbacks_skip_serialization(to_dict_spy):
+    result = StreamNode().run(input_data={})
+
+    assert result.status == RunnableStatus.SUCCESS
+    to_dict_spy.assert_not_called()
+
+
+def test_node_serialized_once_per_run(to_dict_spy):
+    handler = RecordingHandler()
+    node = StreamNode(callbacks=[handler, EndHandler()])
+
+    node.run(input_data={})
+
+    assert to_dict_spy.call_count == 1
+    assert len(handler.events) == 5
+    assert all(serialized is handler.serialized[0] for serialized in handler.serialized)
+    assert handler.serialized[0]["id"] == node.id
+
+    node.run(input_data={})
+
+    assert to_dict_spy.call_count == 2
+
+
+def test_node_changes_invalidate_snapshot():
+    handler = RecordingHandler()
+    node = StreamNode(callbacks=[handler])
+    run_id = "run"
+
+    snapshot = node.get_callbacks_snapshot(run_id)
+    assert node.get_callbacks_snapshot(run_id) is snapshot
+
+    node.name = "renamed"
+    updated = node.get_callbacks_snapshot(run_id)
+
+    assert updated is not snapshot
+    assert updated["name"] == "renamed"
+    assert node.get_callbacks_snapshot("other-run") is not updated
+
+
+def test_node_start_rebuilds_snapshot_after_in_place_changes():
+    handler = RecordingHandler()
+    node = StreamNode(callbacks=[handler], metadata=NodeMetadata(label="first"))
+    node.run_on_node_start([], {}, run_id="run")
+
+    node.metadata.label = "second"
+    node.run_on_node_start([], {}, run_id="run")
+
+    assert [serialized["metadata"]["label"] for serialized in handler.serialized] == ["first", "second"]
+
+
+def test_handlers_receive_only_needed_events(to_dict_spy):
+    handler = EndHandler()
+    node = StreamNode(callbacks=[handler])
+
+    node.run(input_data={})
+
+    assert handler.calls == 1
+    assert to_dict_spy.call_count == 1
+    assert NodeCallbackHandler().handles_event(NodeCallbackEvent.NODE_END) is False
+
+
+def test_handlers_declared_events():
+    class DeclaredHandler(NodeCallbackHandler):
+        handled_events = {NodeCallbackEvent.NODE_START}
+
+        def __init__(self):
+            self.mock = MagicMock()
+
+        def on_node_start(self, serialized, input_data, **kwargs):
+            self.mock("start")
+
+        def on_node_end(self, serialized, output_data, **kwargs):
+            self.mock("end")
+
+    handler = DeclaredHandler()
+
+    StreamNode(callbacks=[handler]).run(input_data={})
+
+    handler.mock.assert_called_once_with("start")
+
+
+def test_tracing_exports_completed_runs(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    exporter = BatchTracingClient(FileTracingClient(path=str(path)), flush_interval=0.01)
+    tracing = TracingCallbackHandler(client=exporter, export_completed_runs=True)
+    first, second = StreamNode(), StreamNode()
+    second.depends_on(first)
+    wf = Workflow(flow=Flow(nodes=[first, second]))
+
+    result = wf.run(input_data={}, config=RunnableConfig(callbacks=[tracing]))
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert tracing.runs == {}
+    assert exporter.flush(timeout=5)
+    runs = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [run["type"] for run in runs] == [RunType.NODE, RunType.NODE, RunType.FLOW, RunType.WORKFLOW]
+    assert runs[0]["metadata"]["node"]["id"] == first.id
+    exporter.shutdown(timeout=5)
@@ -0,0 +1,166 @@
+import asyncio
+import time
+from unittest.mock import ANY, AsyncMock
+
+import httpx
+import pytest
+
+from dynamiq import connections, prompts
+from dynamiq.components.embedders.base import BaseEmbedder
+from dynamiq.nodes import ErrorHandling, NodeGroup
+from dynamiq.nodes.embedders import OpenAIDocumentEmbedder, OpenAITextEmbedder
+from dynamiq.nodes.llms import OpenAI
+from dynamiq.nodes.llms.base import BaseLLM
+from dynamiq.nodes.node import Node
+from dynamiq.nodes.tools import HttpApiCall
+from dynamiq.nodes.tools.http_api_call import _get_async_client
+from dynamiq.runnables import RunnableConfig, RunnableStatus
+from dynamiq.types import Document
+
+
+class SleepNode(Node):
+    group: NodeGroup = NodeGroup.UTILS
+    delay: float = 0.2
+
+    def execute(self, input_data, config: RunnableConfig = None, **kwargs):
+        time.sleep(self.delay)
+        return {"sync": True}
+
+
+class AsyncSleepNode(SleepNode):
+    async def execute_async(self, input_data, config: RunnableConfig = None, **kwargs):
+        await asyncio.sleep(self.delay)
+        return {"sync": False}
+
+
+class SyncOverrideNode(AsyncSleepNode):
+    def execute(self, input_data, config: RunnableConfig = None, **kwargs):
+        return {"override": True}
+
+
+@pytest.fixture
+def openai_node():
+    return OpenAI(
+        model="gpt-4o-mini",
+        connection=connections.OpenAI(api_key="api_key"),
+        prompt=prompts.Prompt(messages=[prompts.Message(role="user", content="{{question}}")]),
+    )
+
+
+def test_native_async_detection():
+    assert not SleepNode().is_execute_async_native
+    assert AsyncSleepNode().is_execute_async_native
+    assert not SyncOverrideNode().is_execute_async_native
+
+
+@pytest.mark.asyncio
+async def test_run_async_native_runs_on_event_loop():
+    nodes = [AsyncSleepNode(delay=0.2) for _ in range(20)]
+
+    started_at = time.monotonic()
+    results = await asyncio.gather(*(node.run_async(input_data={}) for node in nodes))
+
+    assert time.monotonic() - started_at < 1
+    assert all(result.status == RunnableStatus.SUCCESS for result in results)
+    assert all(result.output == {"sync": False} for result in results)
+
+
+@pytest.mark.asyncio
+async def test_run_async_falls_back_to_sync_execute():
+    result = await SyncOverrideNode().run_async(input_data={})
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output == {"override": True}
+
+
+@pytest.mark.asyncio
+async def test_run_async_native_timeout_and_retry(mocker):
+    node = AsyncSleepNode(
+        delay=0.5, error_handling=ErrorHandling(timeout_seconds=0.05, max_retries=1, retry_interval_seconds=0)
+    )
+    execute_async_spy = mocker.spy(AsyncSleepNode, "execute_async")
+
+    started_at = time.monotonic()
+    result = await node.run_async(input_data={})
+
+    assert time.monotonic() - started_at < 0.5
+    assert result.status == RunnableStatus.FAILURE
+    assert result.output["error_type"] == "TimeoutError"
+    assert execute_async_spy.call_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("streaming", [False, True])
+async def test_llm_run_async_uses_async_completion(openai_node, mock_llm_executor, mock_llm_response_text, streaming):
+    openai_node.streaming.enabled = streaming
+
+    result = await openai_node.run_async(input_data={"question": "What is LLM?"})
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output["content"] == mock_llm_response_text
+    BaseLLM._acompletion.assert_awaited_once()
+    call_kwargs = mock_llm_executor.call_args.kwargs
+    assert "client" not in call_kwargs
+    assert call_kwargs["api_key"] == "api_key"
+
+
+@pytest.mark.asyncio
+async def test_embedders_run_async_use_async_embedding(mock_embedding_executor):
+    connection = connections.OpenAI(api_key="api_key")
+    text_embedder = OpenAITextEmbedder(connection=connection, model="text-embedding-3-small")
+    document_embedder = OpenAIDocumentEmbedder(connection=connection, model="text-embedding-3-small")
+
+    text_result = await text_embedder.run_async(input_data={"query": "I love pizza!"})
+    documents_result = await document_embedder.run_async(input_data={"documents": [Document(content="I love pizza!")]})
+
+    assert text_result.status == RunnableStatus.SUCCESS
+    assert text_result.output == {"query": "I love pizza!", "embedding": [0]}
+    assert documents_result.status == RunnableStatus.SUCCESS
+    assert [doc.embedding for doc in documents_result.output["documents"]] == [[0]]
+    assert BaseEmbedder._aembedding.await_count == 2
+    for call in mock_embedding_executor.call_args_list:
+        assert "client" not in call.kwargs
+        assert call.kwargs["api_key"] == "api_key"
+
+
+@pytest.mark.asyncio
+async def test_http_api_call_run_async(mocker):
+    url = "https://api.example.com/data"
+    request_mock = mocker.patch.object(
+        httpx.AsyncClient,
+        "request",
+        new_callable=AsyncMock,
+        return_value=httpx.Response(200, json={"a": 1}, request=httpx.Request("GET", url)),
+    )
+    node = HttpApiCall(connection=connections.Http(method=connections.HTTPMethod.GET, url=url))
+
+    result = await node.run_async(input_data={"params": {"q": "test"}})
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output == {"content": {"a": 1}, "status_code": 200}
+    request_mock.assert_called_once_with(
+        method=connections.HTTPMethod.GET,
+        url=url,
+        headers=ANY,
+        params={"q": "test"},
+        timeout=node.timeout,
+        data={},
+    )
+
+
+def test_http_api_call_async_client_is_shared_per_event_loop_and_closed_with_it(mocker):
+    connection = connections.Http(method=connections.HTTPMethod.GET)
+    connect_async = mocker.spy(connections.Http, "connect_async")
+
+    async def get_clients():
+        return await _get_async_client(connection), await _get_async_client(connection)
+
+    first_client, second_client = asyncio.run(get_clients())
+    other_loop_client, _ = asyncio.run(get_clients())
+
+    assert first_client is second_client
+    assert first_client.follow_redirects is True
+    assert other_loop_client is not first_client
+    assert connect_async.call_count == 2
+    assert first_client.is_closed
+    assert other_loop_client.is_closed
@@ -2,7 +2,7 @@ from io import BytesIO
 
 import pytest
 
-from dynamiq.cache import RedisCacheConfig
+from dynamiq.cache import LocalCacheConfig, RedisCacheConfig
 from dynamiq.callbacks import TracingCallbackHandler
 from dynamiq.callbacks.tracing import RunType
 from dynamiq.nodes import CachingConfig, NodeGroup
@@ -114,3 +114,20 @@ def test_node_caching(
         ):
             assert bool(run.metadata["is_output_from_cache"]) is is_output_from_cache
             assert len(mock_redis.keys(f"{cache_namespace}:{run.metadata['node']['id']}:*")) == node_redis_keys
+
+
+@pytest.mark.parametrize("use_run_cache", [False, True])
+def test_node_local_caching(openai_node, mock_redis, mock_redis_backend, mock_llm_executor, use_run_cache):
+    openai_node.caching = CachingConfig(enabled=True, local_cache=LocalCacheConfig(max_entries=10))
+    cache_config = RedisCacheConfig(host="redis-test-sv", port=6379, db=0) if use_run_cache else None
+    input_data = {"a": 1}
+
+    for _ in range(2):
+        tracing = TracingCallbackHandler()
+        result = openai_node.run(input_data=input_data, config=RunnableConfig(callbacks=[tracing], cache=cache_config))
+        assert result.status == RunnableStatus.SUCCESS
+
+    node_run = next(run for run in tracing.runs.values() if run.type == RunType.NODE)
+    assert node_run.metadata["is_output_from_cache"]
+    assert mock_llm_executor.call_count == 1
+    assert len(mock_redis.keys(f"{openai_node.id}:*")) == int(use_run_cache)
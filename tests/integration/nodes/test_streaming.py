@@ -3,7 +3,10 @@ from collections import defaultdict
 import pytest
 
 from dynamiq import Workflow, flows
+from dynamiq.callbacks import BaseCallbackHandler
 from dynamiq.callbacks.streaming import StreamingIteratorCallbackHandler
+from dynamiq.nodes.agents import ReActAgent
+from dynamiq.nodes.types import InferenceMode
 from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
 from dynamiq.types.streaming import STREAMING_EVENT, StreamingConfig
 
@@ -61,3 +64,44 @@ def test_node_streaming(
         "".join([content for event, content in node_output]) == mock_llm_response_text
     )
     assert all(event == streaming_custom_event for event, content in node_output)
+
+
+class StreamRecordingHandler(BaseCallbackHandler):
+    def __init__(self):
+        self.chunks = defaultdict(list)
+
+    def on_node_execute_stream(self, serialized, chunk=None, **kwargs):
+        self.chunks[serialized["id"]].append(chunk)
+
+
+@pytest.mark.parametrize(
+    ("inference_mode", "mock_llm_response_text"),
+    [
+        (InferenceMode.DEFAULT, "Thought: It is a greeting.\nAnswer: Hello there, friend!"),
+        (
+            InferenceMode.XML,
+            "<output><thought>It is a greeting.</thought><answer>Hello there, friend!</answer></output>",
+        ),
+    ],
+)
+def test_agent_incremental_streaming(openai_node, mock_llm_executor, inference_mode, mock_llm_response_text):
+    agent = ReActAgent(
+        llm=openai_node,
+        tools=[],
+        inference_mode=inference_mode,
+        streaming=StreamingConfig(enabled=True, incremental=True),
+    )
+    handler = StreamRecordingHandler()
+
+    result = agent.run(input_data={"input": "Hi"}, config=RunnableConfig(callbacks=[handler]))
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output["content"] == "Hello there, friend!"
+    assert mock_llm_executor.call_args.kwargs["stream"] is True
+    assert handler.chunks[openai_node.id] == []
+
+    deltas = [chunk["choices"][0]["delta"] for chunk in handler.chunks[agent.id]]
+    assert all(delta["step"] == "answer" for delta in deltas)
+    # The mocked LLM streams one character per chunk, so the answer arrives in many parts
+    assert len(deltas) > 1
+    assert "".join(delta["content"] for delta in deltas) == "Hello there, friend!"
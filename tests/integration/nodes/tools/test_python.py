@@ -1,12 +1,13 @@
 import json
 from io import BytesIO
 
+import pytest
 from pydantic import ConfigDict
 
 from dynamiq import Workflow
 from dynamiq.callbacks import TracingCallbackHandler
 from dynamiq.flows import Flow
-from dynamiq.nodes.tools.python import Python
+from dynamiq.nodes.tools.python import Python, PythonExecutionError, PythonProcessPool, PythonProcessPoolConfig
 from dynamiq.runnables import RunnableConfig, RunnableResult, RunnableStatus
 from dynamiq.types import Document
 from dynamiq.utils import JsonWorkflowEncoder
@@ -220,3 +221,81 @@ def test_workflow_with_python(openai_node, anthropic_node, mock_llm_executor, mo
     assert response == RunnableResult(status=RunnableStatus.SUCCESS, input=input_data, output=expected_output)
     assert mock_llm_executor.call_count == 2
     assert json.dumps({"runs": [run.to_dict() for run in tracing.runs.values()]}, cls=JsonWorkflowEncoder)
+
+
+def test_python_node_in_process_pool():
+    """Test Python node executing code in worker processes with time limits."""
+    python_code = """
+import time
+
+def run(input_data):
+    total = 0
+    for value in input_data['values']:
+        total += value
+    if input_data.get('sleep'):
+        time.sleep(input_data['sleep'])
+    return {'total': total}
+"""
+    python_node = Python(code=python_code, process_pool=PythonProcessPoolConfig(workers=1, timeout=0.5))
+
+    result = python_node.run({"values": [1, 2, 3]}, None)
+    timed_out_result = python_node.run({"values": [1], "sleep": 10}, None)
+    PythonProcessPool.clear_shared()
+
+    assert result.status == RunnableStatus.SUCCESS
+    assert result.output == {"content": {"total": 6}}
+    assert timed_out_result.status == RunnableStatus.FAILURE
+    assert timed_out_result.output["error_type"] == "ToolExecutionException"
+    assert "exceeded the time limit" in timed_out_result.output["content"]
+
+
+def test_process_pool_timeout_is_not_swallowed_by_code():
+    """Test that code catching Exception does not swallow the time limit of its call."""
+    python_code = """
+def run(input_data):
+    try:
+        while True:
+            pass
+    except Exception:
+        return 1
+"""
+    pool = PythonProcessPool(python_code, "run", PythonProcessPoolConfig(workers=1, cpu_timeout=0.2))
+
+    try:
+        with pytest.raises(PythonExecutionError, match="exceeded the CPU time limit"):
+            pool.call({})
+    finally:
+        pool.shutdown()
+
+
+def test_process_pool_cpu_timeout_does_not_kill_sleeping_call():
+    """Test that a CPU time limit alone does not limit the wall time of a call."""
+    python_code = """
+import time
+
+def run(input_data):
+    time.sleep(1.5)
+    return 1
+"""
+    pool = PythonProcessPool(python_code, "run", PythonProcessPoolConfig(workers=1, cpu_timeout=0.2))
+
+    try:
+        assert pool.map([]) == []
+        assert pool.call({}) == 1
+    finally:
+        pool.shutdown()
+
+
+def test_process_pool_spawns_workers_outside_call_time_limit():
+    """Test that workers are spawned, not forked, and their startup does not count against the time limit."""
+    python_code = """
+def run(input_data):
+    return input_data["value"]
+"""
+    pool = PythonProcessPool(python_code, "run", PythonProcessPoolConfig(workers=1, timeout=0.1))
+
+    try:
+        assert pool.call({"value": 1}) == 1
+        assert pool._workers[0].context.get_start_method() == "spawn"
+    finally:
+        pool.shutdown()
@@ -1,6 +1,9 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from dynamiq.connections import connections
+from dynamiq.connections import ConnectionPool, connections
 from dynamiq.nodes.tools.sql_executor import SQLExecutor
 from dynamiq.runnables import RunnableResult, RunnableStatus
 
@@ -170,3 +173,47 @@ def test_select_execute_for_agents(mock_fetchall_sql_response_for_agents, connec
     mock_cursor_with_select.fetchall.assert_called_once()
     output_dump = result.output
     assert output_dump["content"] == output
+
+
+@pytest.mark.parametrize(
+    "connection",
+    [
+        connections.PostgreSQL(
+            host="test_host", port=5432, database="db", user="user", password="password", pool_enabled=True
+        ),
+        connections.MySQL(host="test_host", database="db", user="user", password="password", pool_enabled=True),
+    ],
+)
+def test_concurrent_executions_use_pooled_connections(mocker, connection):
+    release = threading.Barrier(3)
+
+    def connect(*args, **kwargs):
+        mock_cursor = mocker.Mock()
+        mock_cursor.description = None
+        mock_cursor.execute.side_effect = lambda query: release.wait(timeout=5)
+        mock_connection = mocker.Mock(closed=False, in_transaction=False)
+        mock_connection.cursor.return_value = mock_cursor
+        return mock_connection
+
+    mock_connect = mocker.patch("psycopg.connect", side_effect=connect)
+    mocker.patch("mysql.connector.connect", side_effect=connect)
+    sql_tool = SQLExecutor(connection=connection)
+    assert isinstance(sql_tool.client, ConnectionPool)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(lambda _: sql_tool.run({"query": "select 1"}, None), range(3)))
+
+    assert all(result.status == RunnableStatus.SUCCESS for result in results)
+    assert sql_tool.client.get_stats().size == 3
+    if isinstance(connection, connections.PostgreSQL):
+        assert mock_connect.call_count == 3
+
+
+def test_pool_disabled_by_default_uses_single_connection(mock_cursor_with_select):
+    connection = connections.PostgreSQL(host="test_host")
+    sql_tool = SQLExecutor(connection=connection)
+
+    assert not isinstance(sql_tool.client, ConnectionPool)
+    assert sql_tool.run({"query": "select 1"}, None).status == RunnableStatus.SUCCESS
+    assert not any(name.startswith("pool_") for name in connection.to_dict())
+    assert connections.PostgreSQL(host="test_host", pool_enabled=True).to_dict()["pool_enabled"] is True
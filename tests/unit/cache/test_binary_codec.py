@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from dynamiq.cache import CacheCodec, CacheCompression, RedisCacheConfig
+from dynamiq.cache.codecs import Base64Codec, BinaryCodec
+from dynamiq.cache.managers import WorkflowCacheManager
+from dynamiq.components.serializers import BinarySerializer, JsonSerializer
+from dynamiq.types import Document
+
+VALUE = {
+    "embedding": [random.Random(i).uniform(-1, 1) for i in range(1000)],
+    "ints": list(range(10)),
+    "short": [0.5, 1.5],
+    "nested": [{"content": "text", "scores": [1.0 / (i + 1) for i in range(16)]}],
+    "text": "cached",
+    "empty": None,
+}
+
+
+@pytest.fixture
+def cache_config():
+    return RedisCacheConfig(host="redis-test-sv", port=6379, db=0, namespace="dynamiq")
+
+
+@pytest.mark.parametrize("compression", list(CacheCompression))
+def test_binary_round_trip(compression):
+    if compression == CacheCompression.ZSTD:
+        pytest.importorskip("zstandard")
+    serializer = BinarySerializer()
+    codec = BinaryCodec(compression=compression, compression_threshold=100)
+
+    encoded = codec.encode(serializer.dumps(VALUE))
+
+    assert encoded.startswith(BinaryCodec.MAGIC)
+    assert serializer.loads(codec.decode(encoded)) == VALUE
+
+
+def test_binary_is_smaller_than_json_base64():
+    binary = BinaryCodec().encode(BinarySerializer().dumps(VALUE))
+    legacy = Base64Codec().encode(JsonSerializer().dumps(VALUE))
+    compressed = BinaryCodec(compression=CacheCompression.ZLIB).encode(BinarySerializer().dumps(VALUE))
+
+    assert len(binary) < len(legacy) / 2
+    assert len(compressed) < len(binary)
+
+
+def test_binary_serializer_dumps_models():
+    document = Document(content="text", embedding=[0.25] * 10)
+
+    assert BinarySerializer().loads(BinarySerializer().dumps({"documents": [document]})) == {
+        "documents": [document.model_dump()]
+    }
+
+
+def test_binary_codec_rejects_unknown_version():
+    encoded = bytearray(BinaryCodec().encode(b"payload"))
+    encoded[len(BinaryCodec.MAGIC)] = 99
+
+    with pytest.raises(ValueError):
+        BinaryCodec().decode(bytes(encoded))
+
+
+def test_binary_manager_reads_legacy_entries(mock_redis, mock_redis_backend, cache_config):
+    legacy_manager = WorkflowCacheManager(config=cache_config)
+    binary_manager = WorkflowCacheManager(
+        config=cache_config.model_copy(update={"codec": CacheCodec.Binary, "compression": CacheCompression.ZLIB})
+    )
+    legacy_manager.set_entity_output(entity_id="node", input_data={"a": 1}, output_data=VALUE)
+
+    assert binary_manager.get_entity_output(entity_id="node", input_data={"a": 1}) == VALUE
+
+    binary_manager.set_entity_output(entity_id="node", input_data={"a": 2}, output_data=VALUE)
+    stored = mock_redis.get(f"dynamiq:{binary_manager.get_key(entity_id='node', input_data={'a': 2})}")
+    assert stored.startswith(BinaryCodec.MAGIC)
+    assert binary_manager.get_entity_output(entity_id="node", input_data={"a": 2}) == VALUE
@@ -0,0 +1,47 @@
+import pytest
+
+from dynamiq.cache import RedisCacheConfig
+from dynamiq.cache.managers import CacheManager, WorkflowCacheManager
+
+
+@pytest.fixture
+def cache_config():
+    return RedisCacheConfig(host="redis-test-sv", port=6379, db=0, namespace="dynamiq")
+
+
+def test_get_shared_reuses_manager_per_config(mock_redis_backend, cache_config):
+    manager = WorkflowCacheManager.get_shared(cache_config)
+
+    assert WorkflowCacheManager.get_shared(cache_config.model_copy(update={"id": "other"})) is manager
+    assert WorkflowCacheManager.get_shared(cache_config.model_copy(update={"namespace": "other"})) is not manager
+    assert CacheManager.get_shared(cache_config) is not manager
+    assert mock_redis_backend.call_count == 3
+
+
+def test_get_uses_single_round_trip(mocker, mock_redis_backend, cache_config):
+    manager = CacheManager.get_shared(cache_config)
+    manager.set("key", {"a": 1})
+    get_spy = mocker.spy(manager.cache.client, "get")
+
+    assert manager.get("key") == {"a": 1}
+    assert manager.get("missing") is None
+    assert get_spy.call_count == 2
+
+
+@pytest.mark.parametrize("ttl", [None, 60])
+def test_get_many_set_many(mocker, mock_redis, mock_redis_backend, cache_config, ttl):
+    manager = CacheManager.get_shared(cache_config)
+    get_spy = mocker.spy(manager.cache.client, "get")
+
+    manager.set_many({"a": {"value": 1}, "b": [1, 2]}, ttl=ttl)
+
+    assert manager.get_many(["a", "missing", "b"]) == [{"value": 1}, None, [1, 2]]
+    assert manager.get_many([]) == []
+    assert get_spy.call_count == 0
+    assert mock_redis.ttl("dynamiq:a") in ((ttl - 1, ttl) if ttl else (-1,))
+
+
+def test_redis_client_params(cache_config):
+    from redis import Redis
+
+    assert Redis(**cache_config.client_params).connection_pool.connection_kwargs["host"] == "redis-test-sv"
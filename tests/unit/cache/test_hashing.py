@@ -0,0 +1,113 @@
+import sys
+from functools import cached_property, partial
+from io import BytesIO
+
+import pytest
+from pydantic import BaseModel
+
+from dynamiq.cache.hashing import MEMOIZE_MIN_SIZE, _digest_memo, _DigestMemo, canonical_hash
+from dynamiq.prompts import Message, MessageRole, Prompt
+from dynamiq.types import Document
+
+
+def test_dict_key_order_does_not_matter():
+    assert canonical_hash({"a": 1, "b": {"c": [1, 2], "d": None}}) == canonical_hash(
+        {"b": {"d": None, "c": [1, 2]}, "a": 1}
+    )
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        (1, 1.0),
+        (1, True),
+        (1, "1"),
+        ("", None),
+        (b"a", "a"),
+        ([1.0, 2.0], [1.0, 2]),
+        ([[1], 2], [[1, 2]]),
+        ({"a": "b"}, {"ab": ""}),
+        (["a", "b"], ["ab"]),
+    ],
+)
+def test_different_values_have_different_hashes(first, second):
+    assert canonical_hash(first) != canonical_hash(second)
+
+
+def test_models_are_hashed_by_fields():
+    document = Document(id="1", content="text", embedding=[0.1, 0.2, 0.3])
+
+    assert canonical_hash(document) == canonical_hash(Document(id="1", content="text", embedding=[0.1, 0.2, 0.3]))
+    assert canonical_hash(document) != canonical_hash(Document(id="1", content="text", embedding=[0.1, 0.2, 0.4]))
+    assert canonical_hash(Prompt(messages=[Message(content="a")])) != canonical_hash(
+        Prompt(messages=[Message(content="a", role=MessageRole.SYSTEM)])
+    )
+
+
+def test_bytes_io_is_hashed_by_content():
+    assert canonical_hash(BytesIO(b"content")) == canonical_hash(BytesIO(b"content"))
+    assert canonical_hash(BytesIO(b"content")) != canonical_hash(BytesIO(b"content_"))
+
+
+def test_large_immutable_values_are_memoized():
+    _digest_memo.clear()
+    text = "x" * MEMOIZE_MIN_SIZE
+
+    first = canonical_hash({"text": text})
+    second = canonical_hash({"text": text})
+
+    assert first == second
+    assert _digest_memo.hits == 1
+    assert canonical_hash({"text": text + "y"}) != first
+
+
+def test_digest_memo_is_bounded_by_total_size():
+    values = [str(idx) * MEMOIZE_MIN_SIZE for idx in range(3)]
+    memo = _DigestMemo(max_bytes=sys.getsizeof(values[0]) * 2)
+
+    digests = [memo.digest(value) for value in values]
+    assert [memo.digest(value) for value in values[1:]] == digests[1:]
+    assert memo.hits == 2
+
+    assert memo.digest(values[0]) == digests[0]
+    assert memo.hits == 2
+
+
+def test_models_are_hashed_by_declared_fields_only():
+    class Model(BaseModel):
+        text: str
+
+        @cached_property
+        def length(self) -> int:
+            return len(self.text)
+
+    model = Model(text="text")
+    expected = canonical_hash(model)
+    assert model.length == 4
+
+    assert canonical_hash(model) == expected
+
+
+def first_function():
+    pass
+
+
+def test_callables_are_hashed_by_module_and_qualified_name():
+    class Owner:
+        def first_function(self):
+            pass
+
+    assert canonical_hash(first_function) == canonical_hash(first_function)
+    assert canonical_hash(first_function) != canonical_hash(Owner.first_function)
+    assert canonical_hash(partial(first_function, 1)) != canonical_hash(partial(first_function, 2))
+
+
+def test_lambdas_and_closures_are_refused():
+    value = 1
+
+    def closure():
+        return value
+
+    for function in (lambda: 1, closure):
+        with pytest.raises(TypeError, match="Lambdas and closures"):
+            canonical_hash({"function": function})
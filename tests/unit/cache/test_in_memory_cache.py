@@ -0,0 +1,136 @@
+import pytest
+
+from dynamiq.cache import InMemoryCacheConfig, LocalCacheConfig, RedisCacheConfig
+from dynamiq.cache.backends import InMemoryCache, RedisCache, TieredCache
+from dynamiq.cache.managers import CacheManager
+
+
+@pytest.fixture
+def mock_time(mocker):
+    return mocker.patch("dynamiq.cache.backends.memory.time.monotonic", return_value=100.0)
+
+
+def test_lru_eviction_by_entries():
+    cache = InMemoryCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    stats = cache.get_stats()
+    assert stats.entries == 2
+    assert stats.evictions == 1
+    assert (stats.hits, stats.misses) == (3, 1)
+    assert stats.hit_rate == 0.75
+
+
+def test_eviction_by_bytes():
+    cache = InMemoryCache(max_entries=10, max_bytes=10)
+    cache.set("a", "12345")
+    cache.set("b", "12345")
+    cache.set("c", "123")
+
+    assert cache.get("a") is None
+    assert cache.get_stats().size_bytes == 8
+    assert cache.set("big", "x" * 11) is False
+    assert cache.get("big") is None
+
+
+def test_ttl_expiration(mock_time):
+    cache = InMemoryCache(ttl=10)
+    cache.set("a", "1")
+    cache.set("b", "2", ttl=5)
+    cache.set("c", "3", ttl=60)
+
+    mock_time.return_value = 106.0
+    assert cache.get_many(["a", "b", "c"]) == ["1", None, "3"]
+
+    mock_time.return_value = 111.0
+    assert cache.get("c") is None
+    assert cache.get_stats().expirations == 2
+    assert cache.get_stats().entries == 1
+
+
+def test_overwrite_and_delete():
+    cache = InMemoryCache()
+    cache.set("a", "1")
+    cache.set("a", "22")
+
+    assert cache.get("a") == "22"
+    assert cache.get_stats().size_bytes == 2
+    assert cache.delete("a") == 1
+    assert cache.delete("a") == 0
+    assert cache.get_stats().size_bytes == 0
+
+
+def test_tiered_cache_write_through_and_fill(mock_redis):
+    local = InMemoryCache()
+    remote = RedisCache(client=mock_redis)
+    cache = TieredCache(local=local, remote=remote)
+
+    cache.set("a", "1", ttl=30)
+    assert local.get("a") == "1"
+    assert mock_redis.get("a") == b"1"
+
+    mock_redis.set("b", "2")
+    mock_redis.set("c", "3")
+    assert cache.get("b") == b"2"
+    assert local.get("b") == b"2"
+    assert cache.get_many(["a", "c", "missing"]) == ["1", b"3", None]
+    assert local.get("c") == b"3"
+
+    cache.delete("a")
+    assert local.get("a") is None
+    assert mock_redis.get("a") is None
+
+
+def test_manager_backends(mock_redis_backend):
+    in_memory_manager = CacheManager(config=InMemoryCacheConfig(max_entries=2))
+    tiered_manager = CacheManager(
+        config=RedisCacheConfig(host="redis-test-sv", port=6379, db=0, local_cache=LocalCacheConfig())
+    )
+
+    assert isinstance(in_memory_manager.cache, InMemoryCache)
+    assert in_memory_manager.cache.max_entries == 2
+    assert isinstance(tiered_manager.cache, TieredCache)
+
+    for manager in (in_memory_manager, tiered_manager):
+        manager.set("key", {"a": [1, 2]})
+        assert manager.get("key") == {"a": [1, 2]}
+
+
+def test_tiered_cache_keeps_decoded_values_locally(mock_redis, mocker):
+    local = InMemoryCache()
+    decode = mocker.Mock(side_effect=lambda payload: payload.decode().split(","))
+    cache = TieredCache(
+        local=local, remote=RedisCache(client=mock_redis), decode=decode, encode=lambda value: ",".join(value)
+    )
+
+    cache.set("a", ["x", "y"])
+    mock_redis.set("b", "z")
+
+    assert mock_redis.get("a") == b"x,y"
+    assert cache.get_many(["a", "b", "missing"]) == [["x", "y"], ["z"], None]
+    assert cache.get("b") == ["z"]
+    assert decode.call_count == 1
+    assert local.get_stats().size_bytes == 4
+
+    with pytest.raises(ValueError, match="both decode and encode"):
+        TieredCache(local=local, remote=RedisCache(client=mock_redis), decode=decode)
+
+
+def test_manager_tiered_cache_decodes_remote_hits_once(mock_redis_backend, mocker):
+    manager = CacheManager(
+        config=RedisCacheConfig(host="redis-test-sv", port=6379, db=0, local_cache=LocalCacheConfig())
+    )
+    manager.set("key", {"a": [1, 2]})
+    manager.cache.local.clear()
+    loads = mocker.spy(manager.serializer, "loads")
+
+    assert manager.get("key") == {"a": [1, 2]}
+    assert manager.get_many(["key", "missing"]) == [{"a": [1, 2]}, None]
+    assert loads.call_count == 1
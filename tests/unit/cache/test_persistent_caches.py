@@ -0,0 +1,99 @@
+import sqlite3
+import threading
+
+import pytest
+
+from dynamiq.cache import FileCacheConfig, SQLiteCacheConfig
+from dynamiq.cache.backends import FileCache, SQLiteCache
+from dynamiq.cache.managers import CacheManager
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def config(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteCacheConfig(db_path=str(tmp_path / "cache.db"))
+    return FileCacheConfig(directory=str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def mock_time(mocker):
+    return mocker.patch("time.time", return_value=1000.0)
+
+
+def test_values_persist_across_instances(config):
+    cache = CacheManager(config).cache
+    cache.set("bytes", b"\x00\x01")
+    cache.set("text", "value")
+
+    cache = CacheManager(config).cache
+
+    assert cache.get("bytes") == b"\x00\x01"
+    assert cache.get("text") == "value"
+    assert cache.get("missing") is None
+
+
+def test_get_many_and_set_many(config):
+    cache = CacheManager(config).cache
+    cache.set_many({"a": b"1", "b": b"2"})
+
+    assert cache.get_many(["b", "missing", "a"]) == [b"2", None, b"1"]
+
+
+def test_delete(config):
+    cache = CacheManager(config).cache
+    cache.set("a", b"1")
+
+    assert cache.delete("a") == 1
+    assert cache.delete("a") == 0
+    assert cache.get("a") is None
+
+
+def test_expired_values_are_ignored(config, mock_time):
+    cache = CacheManager(config).cache
+    cache.set("a", b"1", ttl=10)
+    cache.set("b", b"2")
+
+    mock_time.return_value = 1011.0
+
+    assert cache.get_many(["a", "b"]) == [None, b"2"]
+
+
+def test_sqlite_cache_clear_expired(mock_time):
+    cache = SQLiteCache(client=sqlite3.connect(":memory:"))
+    cache.set_many({"a": b"1", "b": b"2"}, ttl=10)
+    cache.set("c", b"3")
+
+    mock_time.return_value = 1011.0
+
+    assert cache.clear_expired() == 2
+    assert cache.get("c") == b"3"
+
+
+def test_sqlite_cache_get_many_over_query_limit():
+    cache = SQLiteCache(client=sqlite3.connect(":memory:"))
+    values = {f"key-{idx}": str(idx).encode() for idx in range(1200)}
+    cache.set_many(values)
+
+    assert cache.get_many(list(values)) == list(values.values())
+
+
+def test_sqlite_cache_invalid_table_name():
+    with pytest.raises(ValueError):
+        SQLiteCache(client=sqlite3.connect(":memory:"), table_name="cache; DROP TABLE cache")
+
+
+def test_file_cache_concurrent_writes(tmp_path):
+    cache = FileCache(client=str(tmp_path))
+
+    def write(idx):
+        for _ in range(20):
+            cache.set("key", str(idx).encode() * 1000)
+
+    threads = [threading.Thread(target=write, args=(idx,)) for idx in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.get("key") in {str(idx).encode() * 1000 for idx in range(4)}
+    assert len(list(tmp_path.rglob("*"))) == 2
@@ -0,0 +1,146 @@
+import threading
+import time
+from queue import Queue
+from uuid import uuid4
+
+import pytest
+from litellm import ModelResponse
+from litellm.types.utils import Delta, Usage
+
+from dynamiq.callbacks.streaming import StreamingIteratorCallbackHandler, merge_stream_chunks
+from dynamiq.nodes.llms.base import BaseLLM
+from dynamiq.types.streaming import StreamingEventMessage, StreamingOverflowPolicy
+
+NODE = {"id": "node", "streaming": {"event": "streaming"}}
+RUN_ID = uuid4()
+
+
+def make_chunk(content: str, step: str | None = None) -> dict:
+    delta = {"content": content, "role": "assistant"}
+    if step:
+        delta.update(source="Agent", step=step)
+    return {"id": "chunk", "choices": [{"index": 0, "delta": delta}]}
+
+
+def stream(handler: StreamingIteratorCallbackHandler, contents: list[str], step: str | None = None) -> None:
+    for content in contents:
+        handler.on_node_execute_stream(NODE, make_chunk(content, step), run_id=RUN_ID)
+
+
+def drain(queue: Queue) -> list[str]:
+    contents = []
+    while not queue.empty():
+        contents.append(queue.get_nowait().data["choices"][0]["delta"]["content"])
+    return contents
+
+
+def test_unbounded_queue_receives_all_chunks():
+    handler = StreamingIteratorCallbackHandler()
+    stream(handler, ["a", "b", "c"])
+
+    assert drain(handler.queue) == ["a", "b", "c"]
+    assert handler.dropped == 0
+
+
+def test_drop_new_policy_drops_chunks_of_full_queue():
+    handler = StreamingIteratorCallbackHandler(max_queue_size=2, overflow_policy=StreamingOverflowPolicy.DROP_NEW)
+    stream(handler, ["a", "b", "c", "d"])
+
+    assert drain(handler.queue) == ["a", "b"]
+    assert handler.dropped == 2
+
+
+def test_block_policy_drops_chunk_after_timeout():
+    handler = StreamingIteratorCallbackHandler(max_queue_size=1, block_timeout=0.01)
+    stream(handler, ["a", "b"])
+
+    assert drain(handler.queue) == ["a"]
+    assert handler.dropped == 1
+
+
+def test_block_policy_waits_for_consumer_to_send_workflow_output():
+    handler = StreamingIteratorCallbackHandler(max_queue_size=1, block_timeout=0.01)
+    handler.on_workflow_start({}, [], run_id=RUN_ID)
+
+    def produce():
+        stream(handler, ["a"])
+        handler.on_node_execute_stream(NODE, event=StreamingEventMessage(entity_id="custom", data={}))
+        handler.on_workflow_end({"id": "workflow"}, {}, run_id=RUN_ID)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    events = []
+    for event in handler:
+        # A slow consumer keeps the queue full longer than the block timeout
+        time.sleep(0.05)
+        events.append(event.entity_id)
+    producer.join()
+
+    assert events == ["node", "custom", "workflow"]
+    assert handler.dropped == 0
+
+
+def test_coalesce_policy_merges_chunks_until_queue_has_free_slot():
+    handler = StreamingIteratorCallbackHandler(max_queue_size=1, overflow_policy=StreamingOverflowPolicy.COALESCE)
+    stream(handler, ["a", "b", "c"])
+    assert drain(handler.queue) == ["a"]
+
+    stream(handler, ["d"])
+    assert drain(handler.queue) == ["bcd"]
+
+    stream(handler, ["e", "f"])
+    assert drain(handler.queue) == ["e"]
+    handler.on_node_end(NODE, {})
+    assert drain(handler.queue) == ["f"]
+    assert handler.dropped == 0
+
+
+def test_coalesce_interval_merges_chunks_and_flushes_on_node_end():
+    handler = StreamingIteratorCallbackHandler(coalesce_interval=60)
+    stream(handler, ["Hello", ",", " world"])
+    assert drain(handler.queue) == ["Hello"]
+
+    handler.on_node_end(NODE, {})
+    assert drain(handler.queue) == [", world"]
+
+
+def test_coalesce_interval_keeps_agent_steps_apart():
+    handler = StreamingIteratorCallbackHandler(coalesce_interval=60)
+    stream(handler, ["a"], step="reasoning")
+    stream(handler, ["b", "c"], step="reasoning")
+    stream(handler, ["d"], step="answer")
+    handler.on_node_end(NODE, {})
+
+    assert drain(handler.queue) == ["a", "bc", "d"]
+
+
+@pytest.mark.parametrize(
+    "previous, current",
+    [
+        (make_chunk("a", step="reasoning"), make_chunk("b", step="answer")),
+        (make_chunk("a"), {"choices": [{"delta": {"content": None, "tool_calls": [{"id": "call"}]}}]}),
+        (make_chunk("a"), {"choices": [{"delta": {"content": {"thought": "b"}}}]}),
+        (make_chunk("a"), "b"),
+    ],
+)
+def test_merge_stream_chunks_skips_incompatible_chunks(previous, current):
+    assert merge_stream_chunks(previous, current) is None
+
+
+def test_merge_stream_chunks_concatenates_content():
+    merged = merge_stream_chunks(make_chunk("a"), make_chunk("b"))
+
+    assert merged == make_chunk("ab")
+
+
+def test_llm_stream_chunk_data_keeps_usage_and_fingerprint():
+    chunk = ModelResponse(stream=True, system_fingerprint="fp_1")
+    chunk.choices[0].delta = Delta(content="text", role="assistant")
+    chunk.usage = Usage(prompt_tokens=1, completion_tokens=2, total_tokens=3)
+
+    data = BaseLLM._get_stream_chunk_data(chunk)
+
+    assert data["system_fingerprint"] == "fp_1"
+    assert data["usage"]["total_tokens"] == 3
+    assert data["choices"][0]["delta"]["content"] == "text"
+    assert "usage" not in BaseLLM._get_stream_chunk_data(ModelResponse(stream=True))
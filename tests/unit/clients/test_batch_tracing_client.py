@@ -0,0 +1,133 @@
+import json
+import threading
+from datetime import datetime
+
+import pytest
+
+from dynamiq.callbacks.tracing import Run, RunType
+from dynamiq.clients import BaseTracingClient, BatchTracingClient, FileTracingClient, OverflowPolicy
+
+
+class RecordingClient(BaseTracingClient):
+    def __init__(self, release: threading.Event | None = None):
+        self.batches = []
+        self.release = release
+
+    def trace(self, runs):
+        if self.release:
+            self.release.wait(timeout=5)
+        self.batches.append([run.id for run in runs])
+
+
+class FailingClient(BaseTracingClient):
+    def trace(self, runs):
+        raise ConnectionError("Tracing backend is down")
+
+
+def make_runs(count: int) -> list[Run]:
+    return [
+        Run(
+            id=f"run-{idx}",
+            name="Node",
+            type=RunType.NODE,
+            trace_id="trace",
+            source_id="source",
+            session_id="session",
+            start_time=datetime(2024, 1, 1),
+        )
+        for idx in range(count)
+    ]
+
+
+def test_batches_by_size():
+    client = RecordingClient()
+    exporter = BatchTracingClient(client, max_batch_size=2, flush_interval=60)
+
+    exporter.trace(make_runs(5))
+
+    assert exporter.flush(timeout=5)
+    assert [len(batch) for batch in client.batches] == [2, 2, 1]
+    assert [run_id for batch in client.batches for run_id in batch] == [f"run-{idx}" for idx in range(5)]
+    assert exporter.get_stats().exported == 5
+    exporter.shutdown(timeout=5)
+
+
+def test_batches_by_time():
+    client = RecordingClient()
+    exporter = BatchTracingClient(client, max_batch_size=100, flush_interval=0.05)
+
+    exporter.trace(make_runs(3))
+
+    assert exporter.flush(timeout=5)
+    assert client.batches == [["run-0", "run-1", "run-2"]]
+    exporter.shutdown(timeout=5)
+
+
+@pytest.mark.parametrize(
+    "policy, expected_ids",
+    [
+        (OverflowPolicy.DROP_NEW, ["run-0", "run-1", "run-2"]),
+        (OverflowPolicy.DROP_OLDEST, ["run-0", "run-3", "run-4"]),
+    ],
+)
+def test_overflow_policy(policy, expected_ids):
+    release = threading.Event()
+    client = RecordingClient(release=release)
+    exporter = BatchTracingClient(
+        client, max_queue_size=2, max_batch_size=1, flush_interval=0.01, overflow_policy=policy
+    )
+    runs = make_runs(5)
+
+    exporter.trace(runs[:1])
+    # Wait for the worker to take the first run, so the queue holds the next ones
+    while exporter._queue.qsize():
+        pass
+    exporter.trace(runs[1:])
+    release.set()
+
+    assert exporter.flush(timeout=5)
+    assert [run_id for batch in client.batches for run_id in batch] == expected_ids
+    assert exporter.get_stats().dropped == 2
+    exporter.shutdown(timeout=5)
+
+
+def test_export_errors_are_counted():
+    exporter = BatchTracingClient(FailingClient(), flush_interval=0.01)
+
+    exporter.trace(make_runs(2))
+
+    assert exporter.flush(timeout=5)
+    stats = exporter.get_stats()
+    assert stats.failed == 2
+    assert stats.exported == 0
+    assert stats.queued == 0
+    exporter.shutdown(timeout=5)
+
+
+def test_shutdown_exports_queued_runs():
+    client = RecordingClient()
+    exporter = BatchTracingClient(client, flush_interval=60)
+
+    exporter.trace(make_runs(3))
+    exporter.shutdown(timeout=5)
+
+    assert client.batches == [["run-0", "run-1", "run-2"]]
+    exporter.trace(make_runs(1))
+    assert exporter.get_stats().exported == 3
+
+
+def test_file_tracing_client(tmp_path):
+    path = tmp_path / "runs.jsonl"
+    client = FileTracingClient(path=str(path))
+
+    client.trace(make_runs(2))
+    client.trace(make_runs(1))
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == ["run-0", "run-1", "run-0"]
+
+
+def test_file_tracing_client_stdout(capsys):
+    FileTracingClient().trace(make_runs(1))
+
+    assert json.loads(capsys.readouterr().out)["name"] == "Node"
@@ -0,0 +1,253 @@
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+from litellm import EmbeddingResponse, Usage
+from litellm.exceptions import BadRequestError, RateLimitError
+
+from dynamiq import connections
+from dynamiq.cache import (
+    EmbeddingCacheConfig,
+    EmbeddingCachePrecision,
+    FileCacheConfig,
+    LocalCacheConfig,
+    RedisCacheConfig,
+    SQLiteCacheConfig,
+)
+from dynamiq.cache.embeddings import EmbeddingCache, pack_embedding, unpack_embedding
+from dynamiq.components.embedders.openai import OpenAIEmbedder
+from dynamiq.types import Document
+
+
+class FakeProvider:
+    """Embeds a text as its index, so the order of embeddings can be checked."""
+
+    def __init__(self, delay: float = 0.0, failures: list[Exception] | None = None):
+        self.delay = delay
+        self.failures = list(failures or [])
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _response(self, input: list[str]) -> EmbeddingResponse:
+        response = EmbeddingResponse()
+        response["data"] = [{"embedding": [float(text.split()[-1])]} for text in input]
+        response["model"] = "model"
+        response["usage"] = Usage(prompt_tokens=len(input), completion_tokens=0, total_tokens=len(input))
+        return response
+
+    def _start(self, input: list[str]) -> None:
+        with self._lock:
+            self.batches.append(input)
+            if self.failures:
+                raise self.failures.pop(0)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _finish(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def embedding(self, model: str, input: list[str], **kwargs) -> EmbeddingResponse:
+        self._start(input)
+        time.sleep(self.delay * random.random())
+        self._finish()
+        return self._response(input)
+
+    async def aembedding(self, model: str, input: list[str], **kwargs) -> EmbeddingResponse:
+        self._start(input)
+        await asyncio.sleep(self.delay * random.random())
+        self._finish()
+        return self._response(input)
+
+
+def make_embedder(provider: FakeProvider, **kwargs) -> OpenAIEmbedder:
+    embedder = OpenAIEmbedder(connection=connections.OpenAI(api_key="api_key"), retry_delay=0, **kwargs)
+    embedder._embedding = provider.embedding
+    embedder._aembedding = provider.aembedding
+    return embedder
+
+
+def make_documents(count: int) -> list[Document]:
+    return [Document(content=f"document {idx}") for idx in range(count)]
+
+
+def rate_limit_error() -> RateLimitError:
+    return RateLimitError(message="Rate limit exceeded", llm_provider="openai", model="model")
+
+
+def test_concurrent_batches_keep_document_order():
+    provider = FakeProvider(delay=0.01)
+    embedder = make_embedder(provider, batch_size=3, max_concurrent_batches=4)
+    documents = make_documents(50)
+
+    result = embedder.embed_documents(documents)
+
+    assert [doc.embedding for doc in result["documents"]] == [[float(idx)] for idx in range(50)]
+    assert len(provider.batches) == 17
+    assert 1 < provider.max_in_flight <= 4
+    assert result["meta"]["usage"]["prompt_tokens"] == 50
+
+
+def test_single_concurrent_batch_is_sequential():
+    provider = FakeProvider()
+    embedder = make_embedder(provider, batch_size=2, max_concurrent_batches=1)
+
+    embedder.embed_documents(make_documents(6))
+
+    assert provider.max_in_flight == 1
+    assert provider.batches == [
+        ["document 0", "document 1"],
+        ["document 2", "document 3"],
+        ["document 4", "document 5"],
+    ]
+
+
+def test_batches_are_packed_by_tokens():
+    provider = FakeProvider()
+    embedder = make_embedder(provider, batch_size=10, max_batch_tokens=10, max_concurrent_batches=1)
+    documents = [Document(content=f"{'x' * length} {idx}") for idx, length in enumerate([10, 10, 30, 60, 2, 2, 2])]
+
+    result = embedder.embed_documents(documents)
+
+    assert [len(batch) for batch in provider.batches] == [2, 1, 1, 3]
+    assert [doc.embedding for doc in result["documents"]] == [[float(idx)] for idx in range(7)]
+
+
+def test_rate_limited_batch_is_retried():
+    provider = FakeProvider(failures=[rate_limit_error(), rate_limit_error()])
+    embedder = make_embedder(provider, batch_size=2)
+
+    result = embedder.embed_documents(make_documents(2))
+
+    assert len(provider.batches) == 3
+    assert [doc.embedding for doc in result["documents"]] == [[0.0], [1.0]]
+
+
+def test_rate_limit_retries_are_limited():
+    provider = FakeProvider(failures=[rate_limit_error() for _ in range(3)])
+    embedder = make_embedder(provider, max_retries=2)
+
+    with pytest.raises(RateLimitError):
+        embedder.embed_documents(make_documents(1))
+
+    assert len(provider.batches) == 3
+
+
+def test_other_errors_are_not_retried():
+    error = BadRequestError(message="Input is too long", llm_provider="openai", model="model")
+    provider = FakeProvider(failures=[error])
+    embedder = make_embedder(provider, batch_size=1)
+
+    with pytest.raises(BadRequestError):
+        embedder.embed_documents(make_documents(3))
+
+    assert provider.batches[0] == ["document 0"]
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_batches_keep_document_order():
+    provider = FakeProvider(delay=0.01, failures=[rate_limit_error()])
+    embedder = make_embedder(provider, batch_size=4, max_concurrent_batches=3)
+
+    result = await embedder.aembed_documents(make_documents(40))
+
+    assert [doc.embedding for doc in result["documents"]] == [[float(idx)] for idx in range(40)]
+    assert len(provider.batches) == 11
+    assert 1 < provider.max_in_flight <= 3
+
+
+def test_cache_embeds_only_missed_texts():
+    provider = FakeProvider()
+    embedder = make_embedder(provider, batch_size=2, embedding_cache=EmbeddingCacheConfig())
+    embedder.embed_documents(make_documents(3))
+
+    documents = [Document(content=f"document {idx}") for idx in [4, 1, 3, 4, 2]]
+    result = embedder.embed_documents(documents)
+
+    assert provider.batches[2:] == [["document 4", "document 3"]]
+    assert [doc.embedding for doc in result["documents"]] == [[4.0], [1.0], [3.0], [4.0], [2.0]]
+    assert result["meta"]["cache_hits"] == 2
+    assert result["meta"]["usage"]["prompt_tokens"] == 2
+
+
+def test_cache_keys_depend_on_model_settings():
+    provider = FakeProvider()
+    config = EmbeddingCacheConfig()
+    make_embedder(provider, embedding_cache=config).embed_text("text 1")
+    make_embedder(provider, embedding_cache=config, dimensions=256).embed_text("text 1")
+
+    result = make_embedder(provider, embedding_cache=config).embed_text("text 1")
+
+    assert len(provider.batches) == 2
+    assert result["embedding"] == [1.0]
+    assert result["meta"] == {
+        "model": "text-embedding-3-small",
+        "usage": {"prompt_tokens": 0, "total_tokens": 0},
+        "cache_hits": 1,
+    }
+
+
+@pytest.mark.parametrize(
+    "backend",
+    [
+        lambda path: SQLiteCacheConfig(db_path=str(path / "cache.db")),
+        lambda path: FileCacheConfig(directory=str(path / "cache")),
+        lambda path: RedisCacheConfig(host="localhost", port=6379, db=0),
+    ],
+)
+def test_persistent_cache(backend, tmp_path):
+    provider = FakeProvider()
+    config = EmbeddingCacheConfig(backend=backend(tmp_path), local_cache=None)
+    make_embedder(provider, embedding_cache=config).embed_documents(make_documents(2))
+
+    EmbeddingCache.clear_shared()
+    result = make_embedder(provider, embedding_cache=config).embed_documents(make_documents(3))
+
+    assert provider.batches == [["document 0", "document 1"], ["document 2"]]
+    assert [doc.embedding for doc in result["documents"]] == [[0.0], [1.0], [2.0]]
+
+
+def test_embeddings_are_packed_as_float64_unless_float32_is_chosen():
+    embedding = [0.1, -2.5, 3e-8]
+
+    data = pack_embedding(embedding)
+    float32_data = pack_embedding(embedding, EmbeddingCachePrecision.FLOAT32)
+
+    assert len(data) == 24
+    assert unpack_embedding(data) == embedding
+    assert len(float32_data) == 12
+    assert unpack_embedding(float32_data, EmbeddingCachePrecision.FLOAT32) == pytest.approx(embedding, rel=1e-6)
+
+
+@pytest.mark.parametrize("local_cache", [LocalCacheConfig(), None])
+def test_cache_hits_return_provider_values(local_cache, tmp_path):
+    config = EmbeddingCacheConfig(
+        backend=SQLiteCacheConfig(db_path=str(tmp_path / "cache.db")), local_cache=local_cache
+    )
+    provider = FakeProvider()
+    embedder = make_embedder(provider, embedding_cache=config)
+    embedded = embedder.embed_text("text 0.1")["embedding"]
+
+    EmbeddingCache.clear_shared()
+    result = make_embedder(provider, embedding_cache=config).embed_text("text 0.1")
+
+    assert result["meta"]["cache_hits"] == 1
+    assert result["embedding"] == embedded == [0.1]
+
+
+@pytest.mark.asyncio
+async def test_async_cache_embeds_only_missed_texts(tmp_path):
+    provider = FakeProvider()
+    config = EmbeddingCacheConfig(backend=SQLiteCacheConfig(db_path=str(tmp_path / "cache.db")))
+    embedder = make_embedder(provider, embedding_cache=config)
+    await embedder.aembed_text("document 1")
+
+    result = await embedder.aembed_documents(make_documents(3))
+
+    assert provider.batches == [["document 1"], ["document 0", "document 2"]]
+    assert [doc.embedding for doc in result["documents"]] == [[0.0], [1.0], [2.0]]
+    assert result["meta"]["cache_hits"] == 1
@@ -0,0 +1,171 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dynamiq.connections import (
+    ConnectionPool,
+    ConnectionPoolException,
+    ConnectionPoolTimeout,
+    PostgreSQL,
+)
+from dynamiq.connections.managers import ConnectionClientInitType, ConnectionManager
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.healthy = True
+
+    def close(self):
+        self.closed = True
+
+
+def check(conn):
+    if not conn.healthy:
+        raise ConnectionError("Connection is broken")
+
+
+def test_pool_reuses_connections():
+    connect = MagicMock(side_effect=FakeConnection)
+    pool = ConnectionPool(connect=connect, max_size=2)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert connect.call_count == 1
+    assert pool.get_stats().model_dump() == {"size": 1, "idle": 1, "discarded": 0}
+
+
+def test_pool_opens_min_size_connections():
+    connect = MagicMock(side_effect=FakeConnection)
+    pool = ConnectionPool(connect=connect, min_size=2, max_size=3)
+
+    assert connect.call_count == 2
+    assert pool.get_stats().idle == 2
+
+
+def test_pool_lends_separate_connections_to_concurrent_threads():
+    pool = ConnectionPool(connect=FakeConnection, max_size=4)
+    barrier = threading.Barrier(4)
+
+    def use_connection(_):
+        with pool.connection() as conn:
+            barrier.wait(timeout=5)
+            return id(conn)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        connection_ids = set(executor.map(use_connection, range(4)))
+
+    assert len(connection_ids) == 4
+    assert pool.get_stats().size == 4
+
+
+def test_pool_waits_for_returned_connection():
+    pool = ConnectionPool(connect=FakeConnection, max_size=1)
+    conn = pool.getconn()
+    threading.Timer(0.05, pool.putconn, args=(conn,)).start()
+
+    assert pool.getconn(timeout=5) is conn
+
+
+def test_pool_timeout():
+    pool = ConnectionPool(connect=FakeConnection, max_size=1)
+    pool.getconn()
+
+    with pytest.raises(ConnectionPoolTimeout):
+        pool.getconn(timeout=0.01)
+
+
+def test_pool_replaces_broken_connection():
+    pool = ConnectionPool(connect=FakeConnection, check=check, max_size=1)
+    with pool.connection() as broken:
+        broken.healthy = False
+
+    with pool.connection() as conn:
+        assert conn is not broken
+
+    assert broken.closed
+    assert pool.get_stats().model_dump() == {"size": 1, "idle": 1, "discarded": 1}
+
+
+def test_pool_checks_only_connections_idle_for_check_idle_time():
+    check_mock = MagicMock(side_effect=check)
+    pool = ConnectionPool(connect=FakeConnection, check=check_mock, max_size=1, check_idle_time=0.05)
+    with pool.connection() as first:
+        pass
+
+    with pool.connection() as conn:
+        assert conn is first
+    check_mock.assert_not_called()
+
+    time.sleep(0.05)
+    with pool.connection() as conn:
+        assert conn is first
+    check_mock.assert_called_once_with(first)
+
+
+def test_pool_discards_connection_failed_to_reset():
+    reset = MagicMock(side_effect=ConnectionError("Connection is lost"))
+    pool = ConnectionPool(connect=FakeConnection, reset=reset)
+
+    with pool.connection() as conn:
+        pass
+
+    assert conn.closed
+    assert pool.get_stats().model_dump() == {"size": 0, "idle": 0, "discarded": 1}
+
+
+def test_pool_releases_slot_when_connect_fails():
+    pool = ConnectionPool(connect=MagicMock(side_effect=[ConnectionError("Refused"), FakeConnection()]), max_size=1)
+
+    with pytest.raises(ConnectionError):
+        pool.getconn()
+
+    assert isinstance(pool.getconn(timeout=0.01), FakeConnection)
+
+
+def test_closed_pool():
+    pool = ConnectionPool(connect=FakeConnection)
+    in_use = pool.getconn()
+    with pool.connection() as idle:
+        pass
+
+    pool.close()
+
+    assert idle.closed
+    with pytest.raises(ConnectionPoolException, match="closed"):
+        pool.getconn()
+    pool.putconn(in_use)
+    assert in_use.closed
+
+
+def test_invalid_pool_size():
+    with pytest.raises(ValueError):
+        ConnectionPool(connect=FakeConnection, max_size=0)
+    with pytest.raises(ValueError):
+        ConnectionPool(connect=FakeConnection, min_size=3, max_size=2)
+
+
+def test_connection_manager_creates_pool_once():
+    connection = PostgreSQL(host="test_host", pool_max_size=3)
+    manager = ConnectionManager()
+
+    with patch.object(PostgreSQL, "connect", side_effect=lambda: MagicMock(closed=False)) as connect:
+        pool = manager.get_connection_client(connection, init_type=ConnectionClientInitType.POOL)
+        assert manager.get_connection_client(connection, init_type=ConnectionClientInitType.POOL) is pool
+        assert isinstance(pool, ConnectionPool)
+        assert pool.max_size == 3
+
+        with pool.connection() as conn:
+            pass
+        connect.assert_called_once()
+
+    manager.close()
+    assert pool.closed
+    conn.close.assert_called_once()
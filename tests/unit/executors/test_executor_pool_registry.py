@@ -0,0 +1,130 @@
+import threading
+import time
+from concurrent import futures
+
+import pytest
+
+from dynamiq.executors.pool import ThreadExecutor
+from dynamiq.executors.registry import TIMEOUT_EXECUTOR_POOL_NAME, ExecutorPoolRegistry, MeteredThreadPoolExecutor
+
+
+@pytest.fixture(autouse=True)
+def shutdown_pools():
+    yield
+    ExecutorPoolRegistry.shutdown()
+
+
+def test_get_pool_returns_same_warm_pool():
+    pool = ExecutorPoolRegistry.get_pool(name="test", max_workers=2)
+
+    assert ExecutorPoolRegistry.get_pool(name="test", max_workers=4) is pool
+    assert ExecutorPoolRegistry.get_timeout_pool() is not pool
+    assert set(ExecutorPoolRegistry.get_metrics()) == {"test", TIMEOUT_EXECUTOR_POOL_NAME}
+
+
+def test_get_pool_recreates_shutdown_pool():
+    pool = ExecutorPoolRegistry.get_pool(name="test")
+    pool.shutdown()
+
+    assert ExecutorPoolRegistry.get_pool(name="test") is not pool
+
+
+def test_pool_metrics():
+    pool = ExecutorPoolRegistry.get_pool(name="test", max_workers=1)
+    started, release = threading.Event(), threading.Event()
+
+    def blocked_task():
+        started.set()
+        release.wait()
+
+    running = pool.submit(blocked_task)
+    queued = pool.submit(lambda: None)
+    started.wait()
+    metrics = pool.get_metrics()
+
+    assert metrics.active == 1
+    assert metrics.queue_depth == 1
+    assert metrics.submitted == 2
+    assert metrics.completed == 0
+    assert metrics.utilization == 1.0
+
+    release.set()
+    running.result()
+    queued.result()
+    metrics = pool.get_metrics()
+
+    assert metrics.active == 0
+    assert metrics.queue_depth == 0
+    assert metrics.completed == 2
+
+
+def test_pool_marks_worker_threads():
+    pool = ExecutorPoolRegistry.get_pool(name="test")
+
+    assert not pool.is_current_thread_worker()
+    assert pool.submit(pool.is_current_thread_worker).result()
+
+
+def test_thread_executor_does_not_shutdown_shared_pool():
+    pool = ExecutorPoolRegistry.get_pool(name="test")
+    executor = ThreadExecutor(pool=pool)
+    executor.shutdown()
+
+    assert not pool.is_shutdown
+    assert pool.submit(lambda: 1).result() == 1
+
+
+def test_submit_outside_runs_in_marked_thread_outside_pool():
+    pool = ExecutorPoolRegistry.get_pool(name="test", max_workers=1)
+
+    future = pool.submit(lambda: pool.submit_outside(lambda: (pool.is_current_thread_worker(), 1)).result())
+
+    assert future.result(timeout=1) == (True, 1)
+    assert pool.get_metrics().submitted == 1
+
+
+def test_submit_outside_caps_overflow_threads():
+    pool = MeteredThreadPoolExecutor(name="test", max_workers=1, max_overflow_workers=1)
+    lock = threading.Lock()
+    running, max_running = 0, 0
+
+    def nested_task():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    try:
+        nested = [pool.submit_outside(nested_task) for _ in range(3)]
+        futures.wait(nested, timeout=1)
+
+        assert max_running == 1
+    finally:
+        pool.shutdown()
+
+
+def test_abandon_frees_slot_within_overflow_limit():
+    pool = MeteredThreadPoolExecutor(name="test", max_workers=1, max_overflow_workers=1)
+    release = threading.Event()
+    try:
+        first = pool.submit(release.wait)
+        pool.abandon(first)
+        second = pool.submit(release.wait)
+        pool.abandon(second)
+        queued = pool.submit(lambda: 1)
+        metrics = pool.get_metrics()
+
+        assert metrics.max_workers == 1
+        assert metrics.abandoned == 1
+        assert metrics.queue_depth == 1
+        assert not queued.done()
+
+        release.set()
+        assert queued.result(timeout=1) == 1
+        assert pool.get_metrics().abandoned == 0
+    finally:
+        release.set()
+        pool.shutdown()
@@ -0,0 +1,73 @@
+import pytest
+
+from dynamiq.memory.backends import InMemory
+from dynamiq.memory.backends.in_memory import BM25DocumentRanker
+from dynamiq.prompts import Message, MessageRole
+
+DOCUMENTS = [
+    "the cat sat on the mat",
+    "dogs and cats are friends",
+    "the dog chased the cat around the cat tree",
+    "weather today is sunny",
+    "a cat",
+]
+
+
+def make_message(content: str, idx: int, user: str = "alice") -> Message:
+    return Message(role=MessageRole.USER, content=content, metadata={"timestamp": idx, "user": user})
+
+
+@pytest.fixture
+def memory():
+    backend = InMemory()
+    for idx, content in enumerate(DOCUMENTS):
+        backend.add(make_message(content, idx, user="alice" if idx % 2 == 0 else "bob"))
+    return backend
+
+
+def test_ranker_search_matches_document_scores():
+    ranker = BM25DocumentRanker(documents=DOCUMENTS)
+
+    results = ranker.search("the cat")
+
+    expected = sorted(
+        ((doc_id, ranker.score(["the", "cat"], doc)) for doc_id, doc in enumerate(DOCUMENTS)),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    assert [doc_id for doc_id, _ in results] == [doc_id for doc_id, score in expected if score > 0]
+    for (_, score), (_, expected_score) in zip(results, expected):
+        assert score == pytest.approx(expected_score)
+
+
+def test_ranker_stemmer_applies_to_documents_and_queries():
+    assert [doc_id for doc_id, _ in BM25DocumentRanker(documents=DOCUMENTS).search("cats")] == [1]
+
+    ranker = BM25DocumentRanker(documents=DOCUMENTS, stemmer=lambda term: term.rstrip("s"))
+    assert [doc_id for doc_id, _ in ranker.search("cats")] == [4, 2, 1, 0]
+
+
+def test_search_with_limit_and_filters(memory):
+    results = memory.search("cat", limit=2, filters={"user": "alice"})
+
+    assert [msg.metadata["timestamp"] for msg in results] == [4, 2]
+    assert memory.search("cat", filters={"user": "nobody"}) == []
+    assert memory.search("unknown") == []
+
+
+def test_search_indexes_messages_added_directly(memory):
+    memory.messages.append(make_message("sunny weather at the lake", 5))
+    assert memory.search("lake")[0].content == "sunny weather at the lake"
+
+    memory.messages = [make_message("new conversation", 0)]
+    assert [msg.content for msg in memory.search("conversation")] == ["new conversation"]
+    assert memory.search("cat") == []
+
+
+def test_clear_resets_index(memory):
+    memory.clear()
+    assert memory.is_empty()
+    assert memory.search("cat") == []
+
+    memory.add(make_message("cat", 0))
+    assert [msg.content for msg in memory.search("cat")] == ["cat"]
@@ -0,0 +1,99 @@
+import sqlite3
+import threading
+
+import pytest
+
+from dynamiq.memory.backends import SQLite
+from dynamiq.prompts import Message, MessageRole
+
+CONTENTS = ["hello world", "the cat sat", "cat and dog", "sunny weather"]
+
+
+def make_messages() -> list[Message]:
+    return [
+        Message(
+            role=MessageRole.USER,
+            content=content,
+            metadata={"timestamp": idx, "user_id": f"user-{idx % 2}", "topic": "pets" if "cat" in content else "misc"},
+        )
+        for idx, content in enumerate(CONTENTS)
+    ]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "memory.db")
+
+
+@pytest.fixture
+def backend(db_path):
+    backend = SQLite(db_path=db_path)
+    backend.add_many(make_messages())
+    yield backend
+    backend.close()
+
+
+def test_search_ranks_full_text_matches(backend):
+    assert [msg.content for msg in backend.search("cat")] == ["the cat sat", "cat and dog"]
+    assert [msg.content for msg in backend.search("dog cat", limit=1)] == ["cat and dog"]
+    assert backend.search("bird") == []
+    assert backend.search('" *') == []
+
+
+def test_search_filters_by_indexed_and_json_metadata(backend):
+    assert [msg.content for msg in backend.search("cat", filters={"user_id": "user-1"})] == ["the cat sat"]
+    assert [msg.content for msg in backend.search(filters={"topic": "misc"})] == ["hello world", "sunny weather"]
+    assert [msg.content for msg in backend.search(filters={"user_id": ["user-0"]}, limit=1)] == ["cat and dog"]
+
+
+def test_search_without_query_returns_recent_messages(backend):
+    assert [msg.content for msg in backend.search(limit=2)] == ["cat and dog", "sunny weather"]
+    assert [msg.content for msg in backend.get_all(limit=2)] == ["cat and dog", "sunny weather"]
+    assert [msg.content for msg in backend.get_all()] == CONTENTS
+
+
+def test_connections_are_reused_per_thread(backend):
+    assert backend._get_connection() is backend._get_connection()
+    assert backend._get_connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def add(idx):
+        backend.add(Message(role=MessageRole.USER, content=f"thread {idx}", metadata={"timestamp": 10 + idx}))
+
+    threads = [threading.Thread(target=add, args=(idx,)) for idx in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(backend.search("thread")) == 4
+
+
+def test_existing_table_is_migrated(db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(SQLite.CREATE_TABLE_QUERY.format(index_name="conversations"))
+        conn.execute(
+            SQLite.INSERT_MESSAGE_QUERY.format(index_name="conversations"),
+            ("id", "user", "legacy cat message", '{"user_id": "user-0", "timestamp": 1}', 1),
+        )
+
+    backend = SQLite(db_path=db_path)
+
+    assert [msg.content for msg in backend.search("cat", filters={"user_id": "user-0"})] == ["legacy cat message"]
+    backend.close()
+
+
+def test_clear_removes_messages_from_full_text_index(backend):
+    backend.clear()
+    assert backend.is_empty()
+    assert backend.search("cat") == []
+
+    backend.add(Message(role=MessageRole.USER, content="new cat", metadata={"timestamp": 0}))
+    assert [msg.content for msg in backend.search("cat")] == ["new cat"]
+
+
+def test_substring_search_without_full_text_index(db_path):
+    backend = SQLite(db_path=db_path, full_text_search=False)
+    backend.add_many(make_messages())
+
+    assert [msg.content for msg in backend.search("at s")] == ["the cat sat"]
+    backend.close()
@@ -0,0 +1,274 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from dynamiq.connections import ConnectionPool
+from dynamiq.storages.vector.exceptions import VectorStoreException
+from dynamiq.storages.vector.pgvector.pgvector import MIN_COPY_BATCH_SIZE, PGVectorIndexMethod, PGVectorStore
+from dynamiq.types import Document
+
+
+@pytest.fixture
+def mock_connection():
+    conn = MagicMock()
+    conn.closed = False
+    return conn
+
+
+@pytest.fixture
+def mock_cursor(mock_connection):
+    return mock_connection.cursor.return_value.__enter__.return_value
+
+
+@pytest.fixture
+def mock_copy(mock_cursor):
+    return mock_cursor.copy.return_value.__enter__.return_value
+
+
+@pytest.fixture
+def make_store(mock_connection):
+    def _make_store(**kwargs):
+        with (
+            patch("dynamiq.storages.vector.pgvector.pgvector.register_vector"),
+            patch.object(PGVectorStore, "_check_if_schema_exists", return_value=True),
+            patch.object(PGVectorStore, "_check_if_table_exists", return_value=True),
+        ):
+            store = PGVectorStore(client=mock_connection, create_extension=False, dimension=2, **kwargs)
+        store._execute_sql_query = MagicMock()
+        mock_connection.reset_mock()
+        return store
+
+    return _make_store
+
+
+def make_documents(count: int) -> list[Document]:
+    return [
+        Document(id=str(idx), content=f"Document {idx}", embedding=[0.1 * idx, 0.2], metadata={"idx": idx})
+        for idx in range(count)
+    ]
+
+
+def test_write_small_batch_uses_pipelined_upsert(make_store, mock_connection, mock_cursor):
+    store = make_store()
+    documents = make_documents(3)
+
+    assert store.write_documents(documents) == 3
+
+    mock_cursor.executemany.assert_called_once()
+    params = mock_cursor.executemany.call_args.args[1]
+    assert [row[0] for row in params] == ["0", "1", "2"]
+    assert isinstance(params[0][3], np.ndarray)
+    mock_cursor.copy.assert_not_called()
+    mock_connection.transaction.assert_called_once()
+
+
+def test_write_large_batch_copies_to_staging_table(make_store, mock_connection, mock_cursor, mock_copy):
+    store = make_store()
+    documents = make_documents(MIN_COPY_BATCH_SIZE)
+
+    assert store.write_documents(documents) == MIN_COPY_BATCH_SIZE
+
+    mock_cursor.executemany.assert_not_called()
+    mock_copy.set_types.assert_called_once_with(["varchar", "text", "jsonb", "vector"])
+    assert mock_copy.write_row.call_count == MIN_COPY_BATCH_SIZE
+    # Staging table creation and a single upsert from it
+    assert mock_cursor.execute.call_count == 2
+    mock_connection.transaction.assert_called_once()
+
+
+def test_write_documents_in_batches(make_store, mock_connection, mock_cursor, mock_copy):
+    store = make_store(batch_size=MIN_COPY_BATCH_SIZE)
+    documents = make_documents(MIN_COPY_BATCH_SIZE * 2 + 1)
+
+    assert store.write_documents(documents) == len(documents)
+
+    assert mock_copy.write_row.call_count == MIN_COPY_BATCH_SIZE * 2
+    mock_cursor.executemany.assert_called_once()
+    assert mock_connection.transaction.call_count == 3
+
+
+def test_write_duplicate_ids_keeps_last_document(make_store, mock_cursor):
+    store = make_store()
+    documents = [
+        Document(id="1", content="old", embedding=[0.1, 0.2]),
+        Document(id="2", content="other", embedding=[0.1, 0.2]),
+        Document(id="1", content="new", embedding=[0.1, 0.2]),
+    ]
+
+    assert store.write_documents(documents) == 3
+
+    params = mock_cursor.executemany.call_args.args[1]
+    assert [(row[0], row[1]) for row in params] == [("1", "new"), ("2", "other")]
+
+
+def test_write_error_rolls_back(make_store, mock_connection, mock_cursor):
+    store = make_store()
+    mock_cursor.executemany.side_effect = Exception("connection lost")
+
+    with pytest.raises(VectorStoreException, match="connection lost"):
+        store.write_documents(make_documents(2))
+
+    # The transaction context rolls back the batch on exit with the error
+    transaction_exit = mock_connection.transaction.return_value.__exit__
+    assert transaction_exit.call_args.args[0] is VectorStoreException
+
+
+def test_write_with_deferred_index_build(make_store, mock_connection):
+    store = make_store(defer_index_build=True, index_method=PGVectorIndexMethod.HNSW)
+    manager = MagicMock()
+    store._drop_index = manager.drop_index
+    store._create_index = manager.create_index
+    mock_connection.transaction = manager.transaction
+
+    store.write_documents(make_documents(2))
+
+    assert [call[0] for call in manager.mock_calls] == [
+        "drop_index",
+        "transaction",
+        "transaction().__enter__",
+        "transaction().__exit__",
+        "create_index",
+    ]
+
+
+class AutocommitConnection:
+    """Connection in the autocommit mode that drops `ON COMMIT DROP` tables when statements run outside
+    a transaction."""
+
+    autocommit = True
+
+    def __init__(self):
+        self.closed = False
+        self.in_transaction = False
+        self.temp_tables = set()
+        self.copied_rows = []
+
+    @contextmanager
+    def transaction(self):
+        self.in_transaction = True
+        try:
+            yield
+        finally:
+            self.in_transaction = False
+            self.temp_tables.clear()
+
+    @contextmanager
+    def cursor(self):
+        yield AutocommitCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+class AutocommitCursor:
+    def __init__(self, connection: AutocommitConnection):
+        self.connection = connection
+
+    def execute(self, query, params=None):
+        query = query.as_string(None)
+        if query.strip().startswith("CREATE TEMP TABLE") and self.connection.in_transaction:
+            self.connection.temp_tables.add(query.split('"')[1])
+        elif query.strip().startswith("INSERT") and not self.connection.temp_tables:
+            raise Exception("relation of the staging table does not exist")
+
+    @contextmanager
+    def copy(self, query):
+        if query.as_string(None).split('"')[1] not in self.connection.temp_tables:
+            raise Exception("relation of the staging table does not exist")
+        copy = MagicMock()
+        copy.write_row.side_effect = self.connection.copied_rows.append
+        yield copy
+
+
+def test_write_large_batch_keeps_staging_table_in_autocommit_mode(make_store):
+    store = make_store()
+    connection = AutocommitConnection()
+    store.client = store._conn = connection
+
+    assert store.write_documents(make_documents(MIN_COPY_BATCH_SIZE)) == MIN_COPY_BATCH_SIZE
+
+    assert len(connection.copied_rows) == MIN_COPY_BATCH_SIZE
+    assert not connection.temp_tables
+
+
+class NonAutocommitConnection:
+    """Connection outside the autocommit mode. A transaction is already open, so `transaction` is a savepoint,
+    and upserted rows are visible to other connections of the database only after `commit`."""
+
+    autocommit = False
+
+    def __init__(self, database: dict):
+        self.closed = False
+        self.database = database
+        self.pending = {}
+
+    @contextmanager
+    def transaction(self):
+        yield
+
+    @contextmanager
+    def cursor(self):
+        cursor = MagicMock()
+        cursor.executemany.side_effect = lambda query, params: self.pending.update((row[0], row) for row in params)
+        yield cursor
+
+    def commit(self):
+        self.database.update(self.pending)
+        self.pending.clear()
+
+    def rollback(self):
+        self.pending.clear()
+
+    def close(self):
+        self.closed = True
+
+
+def test_write_commits_documents_of_non_autocommit_connection(make_store):
+    store = make_store()
+    database = {}
+    store.client = store._conn = NonAutocommitConnection(database)
+
+    assert store.write_documents(make_documents(3)) == 3
+
+    reader = NonAutocommitConnection(database)
+    assert sorted(reader.database) == ["0", "1", "2"]
+
+
+def test_write_without_vector_index_does_not_defer(make_store):
+    store = make_store(defer_index_build=True)
+    store._drop_index = MagicMock()
+    store._create_index = MagicMock()
+
+    store.write_documents(make_documents(2))
+
+    store._drop_index.assert_not_called()
+    store._create_index.assert_not_called()
+
+
+def test_invalid_batch_size(mock_connection):
+    with pytest.raises(ValueError, match="batch_size"):
+        PGVectorStore(client=mock_connection, batch_size=0)
+
+
+def test_store_with_connection_pool_registers_vector_once_per_connection():
+    connections = [MagicMock(closed=False), MagicMock(closed=False)]
+    pool = ConnectionPool(connect=MagicMock(side_effect=connections), max_size=2)
+
+    with (
+        patch("dynamiq.storages.vector.pgvector.pgvector.register_vector") as register_vector,
+        patch.object(PGVectorStore, "_check_if_schema_exists", return_value=True),
+        patch.object(PGVectorStore, "_check_if_table_exists", return_value=True),
+    ):
+        store = PGVectorStore(client=pool, dimension=2)
+        store.write_documents(make_documents(2))
+        with store._get_connection() as first, store._get_connection() as second:
+            assert {first, second} == set(connections)
+
+    assert store.client is pool
+    connections[0].execute.assert_any_call("CREATE EXTENSION IF NOT EXISTS vector")
+    assert [call.args[0] for call in register_vector.call_args_list] == connections
+
+    store.close()
+    assert not pool.closed
@@ -0,0 +1,67 @@
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+from dynamiq import ROOT_PATH
+
+LAZY_PACKAGES = [
+    "dynamiq.memory.backends",
+    "dynamiq.nodes.audio",
+    "dynamiq.nodes.converters",
+    "dynamiq.nodes.embedders",
+    "dynamiq.nodes.llms",
+    "dynamiq.nodes.rankers",
+    "dynamiq.nodes.retrievers",
+    "dynamiq.nodes.tools",
+    "dynamiq.nodes.writers",
+    "dynamiq.storages.vector",
+]
+VENDOR_PACKAGES = [
+    "chromadb",
+    "elasticsearch",
+    "litellm",
+    "pinecone",
+    "psycopg",
+    "pymilvus",
+    "qdrant_client",
+    "weaviate",
+]
+
+
+@pytest.mark.parametrize("package_name", LAZY_PACKAGES)
+def test_lazy_exports_resolve(package_name):
+    package = importlib.import_module(package_name)
+
+    for name in package.__all__:
+        exported = getattr(package, name)
+        assert exported.__name__ == name
+        assert vars(package)[name] is exported
+    assert set(package.__all__) <= set(dir(package))
+
+
+def test_unknown_lazy_export_raises_attribute_error():
+    package = importlib.import_module("dynamiq.nodes.llms")
+
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        package.Unknown
+
+
+def test_cold_import_skips_vendor_packages():
+    code = (
+        "import sys\n"
+        "import dynamiq\n"
+        "from dynamiq.nodes.managers import NodeManager\n"
+        "from dynamiq.serializers.loaders.yaml import WorkflowYAMLLoader\n"
+        "import dynamiq.nodes.agents, dynamiq.evaluations\n"
+        "NodeManager.get_node_by_type('dynamiq.nodes.tools.Python')\n"
+        f"print(sorted(set(sys.modules) & set({VENDOR_PACKAGES!r})))\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=os.path.dirname(ROOT_PATH)
+    )
+
+    assert result.stdout.strip() == "[]"